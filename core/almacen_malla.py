@@ -0,0 +1,266 @@
+"""
+Almacén de mallas en disco por bloques
+Mapas de alta resolución (campos, cuencas, Lyapunov, densidades) en un np.memmap que se llena por bloques y se reanuda
+"""
+
+import json
+import os
+import warnings
+import numpy as np
+
+VERSION_FORMATO = 1
+
+
+class AlmacenMalla:
+    """
+    Malla (ny, nx) sobre [xlim] × [ylim] respaldada por un archivo np.memmap
+
+    Junto al archivo de datos (ruta + '.dat') se guarda un sidecar JSON
+    (ruta + '.json') con la geometría, el tipo de dato, el tamaño de bloque,
+    metadatos libres y la lista de bloques completos. Cada bloque se escribe
+    y se vuelca a disco antes de marcarse completo, así que si el cálculo se
+    interrumpe basta con abrir el almacén y llamar de nuevo a calcular():
+    solo se calculan los bloques pendientes.
+
+    Ni el cálculo ni el dibujo cargan la malla entera en memoria: los
+    núcleos trabajan bloque a bloque y vista_decimada() reduce por bandas de
+    filas, de modo que una malla de 20000×20000 (1.6 GB en float32) se
+    maneja con unos pocos MB de RAM.
+    """
+
+    def __init__(self, ruta, datos, meta):
+        """Usar AlmacenMalla.crear o AlmacenMalla.abrir"""
+        self.ruta = ruta
+        self.datos = datos
+        self.meta = meta
+        self.xlim = tuple(meta['xlim'])
+        self.ylim = tuple(meta['ylim'])
+        self.ny, self.nx = meta['forma']
+        self.bloque = tuple(meta['bloque'])
+        self.n_bloques = (-(-self.ny // self.bloque[0]), -(-self.nx // self.bloque[1]))
+        self._completos = np.zeros(self.n_bloques, dtype=bool)
+        for j, i in meta['completos']:
+            self._completos[j, i] = True
+
+    @staticmethod
+    def _rutas(ruta):
+        ruta = os.fspath(ruta)
+        return ruta + '.dat', ruta + '.json'
+
+    @classmethod
+    def crear(cls, ruta, forma, xlim, ylim, dtype='float32', bloque=(512, 512), relleno=None,
+              metadatos=None):
+        """
+        Crea un almacén nuevo (sobrescribe uno existente en la misma ruta)
+
+        Parámetros:
+        - ruta: ruta base sin extensión
+        - forma: (ny, nx) celdas
+        - xlim, ylim: región cubierta (las celdas son centradas)
+        - dtype: tipo de dato numpy
+        - bloque: (filas, columnas) por bloque
+        - relleno: valor de las celdas pendientes (por defecto NaN en flotantes y
+          el máximo del tipo en enteros, que no coincide con ningún código de clase)
+        - metadatos: dict serializable en JSON (sistema, núcleo, parámetros...)
+
+        Retorna: AlmacenMalla abierto en lectura/escritura
+        """
+        ny, nx = int(forma[0]), int(forma[1])
+        if ny < 1 or nx < 1 or bloque[0] < 1 or bloque[1] < 1:
+            raise ValueError("La forma y el bloque deben ser positivos")
+        if not (xlim[1] > xlim[0] and ylim[1] > ylim[0]):
+            raise ValueError("Los límites deben cumplir min < max")
+        dtype = np.dtype(dtype)
+        if relleno is None:
+            relleno = np.nan if dtype.kind in 'fc' else np.iinfo(dtype).max
+
+        ruta_datos, ruta_meta = cls._rutas(ruta)
+        datos = np.memmap(ruta_datos, dtype=dtype, mode='w+', shape=(ny, nx))
+        if relleno != 0:
+            # Por bandas para no tocar toda la malla de una vez
+            for inicio in range(0, ny, int(bloque[0])):
+                datos[inicio:inicio + int(bloque[0])] = relleno
+        datos.flush()
+
+        meta = {
+            'version': VERSION_FORMATO,
+            'forma': [ny, nx],
+            'dtype': dtype.str,
+            'xlim': [float(xlim[0]), float(xlim[1])],
+            'ylim': [float(ylim[0]), float(ylim[1])],
+            'bloque': [int(bloque[0]), int(bloque[1])],
+            'relleno': None if np.isnan(float(relleno)) else np.asarray(relleno).item(),
+            'metadatos': metadatos or {},
+            'completos': [],
+        }
+        almacen = cls(os.fspath(ruta), datos, meta)
+        almacen._guardar_meta()
+        return almacen
+
+    @classmethod
+    def abrir(cls, ruta, modo='r+'):
+        """
+        Abre un almacén existente
+
+        Parámetros:
+        - ruta: ruta base sin extensión
+        - modo: 'r+' (continuar el cálculo) o 'r' (solo lectura)
+
+        Retorna: AlmacenMalla
+        """
+        ruta_datos, ruta_meta = cls._rutas(ruta)
+        with open(ruta_meta, encoding='utf-8') as archivo:
+            meta = json.load(archivo)
+        if meta.get('version') != VERSION_FORMATO:
+            raise ValueError(f"Versión de almacén no soportada: {meta.get('version')}")
+        datos = np.memmap(ruta_datos, dtype=np.dtype(meta['dtype']), mode=modo, shape=tuple(meta['forma']))
+        return cls(os.fspath(ruta), datos, meta)
+
+    def _guardar_meta(self):
+        """Escritura atómica del sidecar (un corte a mitad no deja JSON inválido)"""
+        _, ruta_meta = self._rutas(self.ruta)
+        self.meta['completos'] = [[int(j), int(i)] for j, i in np.argwhere(self._completos)]
+        temporal = ruta_meta + '.tmp'
+        with open(temporal, 'w', encoding='utf-8') as archivo:
+            json.dump(self.meta, archivo)
+        os.replace(temporal, ruta_meta)
+
+    @property
+    def metadatos(self):
+        return self.meta['metadatos']
+
+    @property
+    def extent(self):
+        """(x_min, x_max, y_min, y_max) para imshow"""
+        return (*self.xlim, *self.ylim)
+
+    @property
+    def completo(self):
+        return bool(self._completos.all())
+
+    @property
+    def progreso(self):
+        """Fracción de bloques completos"""
+        return float(self._completos.mean())
+
+    def x(self, inicio=0, fin=None):
+        """Centros de celda en x de las columnas [inicio, fin)"""
+        fin = self.nx if fin is None else fin
+        paso = (self.xlim[1] - self.xlim[0]) / self.nx
+        return self.xlim[0] + (np.arange(inicio, fin) + 0.5) * paso
+
+    def y(self, inicio=0, fin=None):
+        """Centros de celda en y de las filas [inicio, fin)"""
+        fin = self.ny if fin is None else fin
+        paso = (self.ylim[1] - self.ylim[0]) / self.ny
+        return self.ylim[0] + (np.arange(inicio, fin) + 0.5) * paso
+
+    def rebanadas(self, j, i):
+        """(filas, columnas) del bloque (j, i) como slices"""
+        by, bx = self.bloque
+        return slice(j * by, min((j + 1) * by, self.ny)), slice(i * bx, min((i + 1) * bx, self.nx))
+
+    def pendientes(self):
+        """Bloques (j, i) sin calcular, en orden de filas"""
+        return [tuple(int(k) for k in indice) for indice in np.argwhere(~self._completos)]
+
+    def escribir_bloque(self, j, i, valores):
+        """
+        Guarda un bloque y lo marca completo
+
+        Parámetros:
+        - j, i: índice del bloque
+        - valores: array con la forma del bloque
+        """
+        filas, columnas = self.rebanadas(j, i)
+        self.datos[filas, columnas] = valores
+        self.datos.flush()
+        self._completos[j, i] = True
+        self._guardar_meta()
+
+    def calcular_bloques(self, nucleo):
+        """
+        Generador que calcula los bloques pendientes uno a uno
+
+        Parámetros:
+        - nucleo: función nucleo(x, y) -> array (len(y), len(x)) con x, y los
+          centros de celda del bloque
+
+        Produce: (j, i) de cada bloque recién escrito (permite mostrar
+        progreso o detenerse entre bloques)
+        """
+        if self.datos.mode == 'r':
+            raise ValueError("El almacén está abierto en solo lectura")
+        for j, i in self.pendientes():
+            filas, columnas = self.rebanadas(j, i)
+            valores = nucleo(self.x(columnas.start, columnas.stop), self.y(filas.start, filas.stop))
+            self.escribir_bloque(j, i, valores)
+            yield j, i
+
+    def calcular(self, nucleo):
+        """Calcula todos los bloques pendientes (ver calcular_bloques); retorna self"""
+        for _ in self.calcular_bloques(nucleo):
+            pass
+        return self
+
+    def vista_decimada(self, max_pixeles=(1000, 1000), region=None, reduccion='submuestreo'):
+        """
+        Imagen reducida de la malla o de una región, leída por bandas de filas
+
+        Parámetros:
+        - max_pixeles: (ancho, alto) máximos de la imagen resultante
+        - region: (x_min, x_max, y_min, y_max) opcional; por defecto toda la malla
+        - reduccion: 'submuestreo' (una celda de cada k, adecuado para
+          clases), 'media' o 'maximo' (ignoran las celdas pendientes)
+
+        Retorna: (imagen, extent) con imagen de forma (alto', ancho'); las
+        celdas pendientes quedan como NaN o enmascaradas (np.ma) en enteros
+        """
+        if reduccion not in ('submuestreo', 'media', 'maximo'):
+            raise ValueError(f"Reducción desconocida: {reduccion}")
+        i0, i1, j0, j1 = self._indices_region(region)
+        paso_x = max(-(-(i1 - i0) // int(max_pixeles[0])), 1)
+        paso_y = max(-(-(j1 - j0) // int(max_pixeles[1])), 1)
+        # Se descartan las celdas sobrantes para que cada píxel agrupe paso_y×paso_x celdas
+        ancho = (i1 - i0) // paso_x if reduccion != 'submuestreo' else -(-(i1 - i0) // paso_x)
+        alto = (j1 - j0) // paso_y if reduccion != 'submuestreo' else -(-(j1 - j0) // paso_y)
+        ancho, alto = max(ancho, 1), max(alto, 1)
+        relleno = self.meta.get('relleno')
+
+        if reduccion == 'submuestreo':
+            imagen = np.array(self.datos[j0:j1:paso_y, i0:i1:paso_x])
+            if relleno is not None:
+                imagen = np.ma.masked_equal(imagen, relleno)
+        else:
+            funcion = np.nanmean if reduccion == 'media' else np.nanmax
+            imagen = np.empty((alto, ancho))
+            fin_x = i0 + ancho * paso_x
+            with np.errstate(all='ignore'), warnings.catch_warnings():
+                # nanmean/nanmax avisan en píxeles cuyos bloques aún están vacíos
+                warnings.simplefilter('ignore', RuntimeWarning)
+                for fila in range(alto):
+                    inicio = j0 + fila * paso_y
+                    banda = np.asarray(self.datos[inicio:inicio + paso_y, i0:fin_x], dtype=float)
+                    if relleno is not None:
+                        banda[banda == relleno] = np.nan
+                    imagen[fila] = funcion(banda.reshape(banda.shape[0], ancho, -1), axis=(0, 2))
+            j1, i1 = j0 + alto * paso_y, fin_x
+
+        dx = (self.xlim[1] - self.xlim[0]) / self.nx
+        dy = (self.ylim[1] - self.ylim[0]) / self.ny
+        extent = (self.xlim[0] + i0 * dx, self.xlim[0] + i1 * dx,
+                  self.ylim[0] + j0 * dy, self.ylim[0] + j1 * dy)
+        return imagen, extent
+
+    def _indices_region(self, region):
+        """Columnas [i0, i1) y filas [j0, j1) que cubren la región"""
+        if region is None:
+            return 0, self.nx, 0, self.ny
+        dx = (self.xlim[1] - self.xlim[0]) / self.nx
+        dy = (self.ylim[1] - self.ylim[0]) / self.ny
+        i0 = int(np.clip(np.floor((region[0] - self.xlim[0]) / dx), 0, self.nx - 1))
+        i1 = int(np.clip(np.ceil((region[1] - self.xlim[0]) / dx), i0 + 1, self.nx))
+        j0 = int(np.clip(np.floor((region[2] - self.ylim[0]) / dy), 0, self.ny - 1))
+        j1 = int(np.clip(np.ceil((region[3] - self.ylim[0]) / dy), j0 + 1, self.ny))
+        return i0, i1, j0, j1
+
@@ -29,6 +29,20 @@ class AnalizadorBifurcacion:
         
         self.df_dx = sp.diff(self.f, self.x)
         
+        # Versiones compiladas (vectorizadas) para evaluaciones sobre mallas
+        self.f_lambda = sp.lambdify((self.x, self.r), self.f, 'numpy')
+        self.df_lambda = sp.lambdify((self.x, self.r), self.df_dx, 'numpy')
+        
+        # Derivadas de las condiciones de forma normal, compiladas en un solo lambda
+        self.derivadas_criticas = {
+            'f_r': sp.diff(self.f, self.r),
+            'f_xx': sp.diff(self.df_dx, self.x),
+            'f_xr': sp.diff(self.df_dx, self.r),
+            'f_xxx': sp.diff(self.df_dx, self.x, 2)
+        }
+        self._criticas_lambda = sp.lambdify(
+            (self.x, self.r), [self.f, self.df_dx, *self.derivadas_criticas.values()], 'numpy')
+        
     def encontrar_equilibrios(self, r_value: float = None) -> List[sp.Expr]:
         """
         Encuentra puntos de equilibrio resolviendo f(x, r) = 0
@@ -191,5 +205,153 @@ class AnalizadorBifurcacion:
         Returns:
             Array de valores f(x, r)
         """
-        f_lambda = sp.lambdify((self.x, self.r), self.f, 'numpy')
-        return f_lambda(x_vals, r_value)
+        return self.f_lambda(x_vals, r_value)
+    
+    def evaluar_derivada(self, x_vals: np.ndarray, r_value: float) -> np.ndarray:
+        """
+        Evalúa df/dx (x, r) para un array de valores x
+        
+        Args:
+            x_vals: Array de valores de x
+            r_value: Valor del parámetro r
+            
+        Returns:
+            Array de valores df/dx con la forma de x_vals
+        """
+        x_vals = np.asarray(x_vals, dtype=float)
+        return np.broadcast_to(self.df_lambda(x_vals, r_value), x_vals.shape)
+    
+    def _evaluar_criticas(self, x_vals: np.ndarray, r_vals: np.ndarray) -> np.ndarray:
+        """
+        Evalúa f, f_x, f_r, f_xx, f_xr y f_xxx en bloque
+        
+        Args:
+            x_vals, r_vals: Arrays de la misma forma
+            
+        Returns:
+            Array (6, *forma) en ese orden
+        """
+        x_vals, r_vals = np.broadcast_arrays(np.asarray(x_vals, dtype=float),
+                                             np.asarray(r_vals, dtype=float))
+        with np.errstate(all='ignore'):
+            valores = self._criticas_lambda(x_vals, r_vals)
+        return np.stack([np.broadcast_to(np.asarray(v, dtype=float), x_vals.shape) for v in valores])
+    
+    def encontrar_puntos_criticos(self, r_range: Tuple[float, float], x_range: Tuple[float, float],
+                                  n_malla: int = 120, max_iter: int = 80) -> np.ndarray:
+        """
+        Localiza los puntos (x*, r*) con f = 0 y df/dx = 0
+        
+        Las celdas de una malla (x, r) donde f y f_x cambian ambas de signo se
+        toman como semillas y se refinan juntas con Newton por lotes. Se usa
+        la pseudo-inversa porque en transcríticas y tridentes el Jacobiano
+        [[f_x, f_r], [f_xx, f_xr]] es singular en la solución.
+        
+        Args:
+            r_range: Rango de valores de r (r_min, r_max)
+            x_range: Rango de valores de x (x_min, x_max)
+            n_malla: Nodos por eje de la malla de búsqueda
+            max_iter: Iteraciones máximas de Newton
+            
+        Returns:
+            Array (N, 2) con filas (x*, r*) ordenadas por r
+        """
+        x_vals = np.linspace(x_range[0], x_range[1], n_malla)
+        r_vals = np.linspace(r_range[0], r_range[1], n_malla)
+        X, R = np.meshgrid(x_vals, r_vals, indexing='ij')
+        valores = self._evaluar_criticas(X, R)
+        
+        candidatas = np.ones((n_malla - 1, n_malla - 1), dtype=bool)
+        for signos in np.sign(valores[:2]):
+            vertices = [signos[i:n_malla - 1 + i, j:n_malla - 1 + j] for i in (0, 1) for j in (0, 1)]
+            candidatas &= (np.min(vertices, axis=0) <= 0) & (np.max(vertices, axis=0) >= 0)
+        
+        indices = np.argwhere(candidatas)
+        if len(indices) == 0:
+            return np.empty((0, 2))
+        pasos = np.array([x_vals[1] - x_vals[0], r_vals[1] - r_vals[0]])
+        Z = np.array([x_range[0], r_range[0]]) + (indices + 0.5) * pasos
+        
+        for _ in range(max_iter):
+            f, f_x, f_r, f_xx, f_xr, _ = self._evaluar_criticas(Z[:, 0], Z[:, 1])
+            jacobiano = np.stack([np.stack([f_x, f_r], axis=-1),
+                                  np.stack([f_xx, f_xr], axis=-1)], axis=1)
+            validos = np.all(np.isfinite(jacobiano), axis=(1, 2)) & np.isfinite(f) & np.isfinite(f_x)
+            delta = np.zeros_like(Z)
+            delta[validos] = -(np.linalg.pinv(jacobiano[validos])
+                               @ np.stack([f, f_x], axis=-1)[validos][:, :, None])[:, :, 0]
+            delta[~validos] = np.nan
+            Z = Z + delta
+            if np.all(~validos | (np.max(np.abs(delta), axis=1) < 1e-14 * (1 + np.max(np.abs(Z), axis=1)))):
+                break
+        
+        f, f_x = self._evaluar_criticas(Z[:, 0], Z[:, 1])[:2]
+        escala = 1 + np.max(np.abs(valores[0]))
+        validos = (np.all(np.isfinite(Z), axis=1) & (np.abs(f) < 1e-9 * escala) &
+                   (np.abs(f_x) < 1e-6 * escala) &
+                   (Z[:, 0] >= x_range[0]) & (Z[:, 0] <= x_range[1]) &
+                   (Z[:, 1] >= r_range[0]) & (Z[:, 1] <= r_range[1]))
+        
+        # Varias celdas convergen al mismo punto: se conserva uno por grupo
+        puntos = []
+        for z in Z[validos][np.argsort(Z[validos][:, 1])]:
+            if all(np.max(np.abs(z - p) / pasos) > 1 for p in puntos):
+                puntos.append(z)
+        return np.array(puntos).reshape(-1, 2)
+    
+    def clasificar_bifurcaciones(self, r_range: Tuple[float, float], x_range: Tuple[float, float],
+                                 n_malla: int = 120, tolerancia: float = 1e-6) -> List[Dict]:
+        """
+        Clasifica cada punto crítico según las condiciones de forma normal
+        
+        Con f = f_x = 0 en (x*, r*):
+        - Silla-nodo: f_r ≠ 0 y f_xx ≠ 0
+        - Transcrítica: f_r = 0, f_xx ≠ 0 y f_xr ≠ 0
+        - Tridente: f_r = 0, f_xx = 0, f_xr ≠ 0 y f_xxx ≠ 0; supercrítico si
+          f_xxx·f_xr < 0 y subcrítico si f_xxx·f_xr > 0
+        Cualquier otro caso se informa como degenerado.
+        
+        Args:
+            r_range: Rango de valores de r (r_min, r_max)
+            x_range: Rango de valores de x (x_min, x_max)
+            n_malla: Nodos por eje de la malla de búsqueda
+            tolerancia: Umbral relativo para considerar nula una derivada
+            
+        Returns:
+            Lista de diccionarios con 'x', 'r', 'tipo', 'nombre' y 'derivadas'
+        """
+        puntos = self.encontrar_puntos_criticos(r_range, x_range, n_malla)
+        if len(puntos) == 0:
+            return []
+        
+        _, _, f_r, f_xx, f_xr, f_xxx = self._evaluar_criticas(puntos[:, 0], puntos[:, 1])
+        escala = 1 + np.max(np.abs([f_r, f_xx, f_xr, f_xxx]), axis=0)
+        nulo = lambda v: np.abs(v) < tolerancia * escala
+        
+        nombres = {
+            'silla_nodo': 'Silla-Nodo',
+            'transcritica': 'Transcrítica',
+            'tridente_supercritico': 'Tridente Supercrítico',
+            'tridente_subcritico': 'Tridente Subcrítico',
+            'degenerada': 'Degenerada'
+        }
+        tipos = np.select(
+            [~nulo(f_r) & ~nulo(f_xx),
+             nulo(f_r) & ~nulo(f_xx) & ~nulo(f_xr),
+             nulo(f_r) & nulo(f_xx) & ~nulo(f_xr) & ~nulo(f_xxx) & (f_xxx * f_xr < 0),
+             nulo(f_r) & nulo(f_xx) & ~nulo(f_xr) & ~nulo(f_xxx) & (f_xxx * f_xr > 0)],
+            ['silla_nodo', 'transcritica', 'tridente_supercritico', 'tridente_subcritico'],
+            default='degenerada'
+        )
+        
+        resultados = []
+        for i, (x_val, r_val) in enumerate(puntos):
+            resultados.append({
+                'x': float(x_val),
+                'r': float(r_val),
+                'tipo': str(tipos[i]),
+                'nombre': nombres[str(tipos[i])],
+                'derivadas': {'f_r': float(f_r[i]), 'f_xx': float(f_xx[i]),
+                              'f_xr': float(f_xr[i]), 'f_xxx': float(f_xxx[i])}
+            })
+        return resultados
@@ -0,0 +1,313 @@
+"""
+Análisis de bifurcaciones de equilibrios en sistemas dinámicos 2D
+Continuación por pseudo-longitud de arco con detección de Hopf y pliegues
+"""
+
+import numpy as np
+import sympy as sp
+from core.sistema import SistemaDinamico2D
+
+
+class AnalizadorBifurcacion2D:
+    """
+    Sigue los equilibrios de un SistemaDinamico2D al variar un parámetro
+
+    Todas las ramas avanzan juntas: cada paso de predicción-corrección es un
+    único lote de evaluaciones compiladas (campo, Jacobiano y ∂f/∂p) y un
+    np.linalg.solve sobre matrices (B, 3, 3). Se usa pseudo-longitud de
+    arco en (x, y, p), de modo que las ramas atraviesan los pliegues en lugar
+    de morir en ellos.
+
+    Sobre cada rama se registran traza y determinante del Jacobiano:
+    - Hopf: la traza cambia de signo con det > 0
+    - Pliegue (silla-nodo): el determinante cambia de signo
+    Cada cambio de signo se refina por bisección sobre el tramo de la rama.
+    """
+
+    def __init__(self, sistema, parametro='u'):
+        """
+        Parámetros:
+        - sistema: SistemaDinamico2D con funciones personalizadas
+        - parametro: nombre del parámetro a variar (debe existir en sistema.parametros)
+        """
+        if not sistema.funcion_personalizada or sistema.f1_sym is None:
+            raise ValueError("El análisis requiere un sistema con funciones personalizadas")
+        if parametro not in sistema.parametros:
+            raise ValueError(f"El sistema no tiene el parámetro '{parametro}'")
+
+        self.sistema = sistema
+        self.parametro = parametro
+
+        # ∂f/∂p compilado (el resto lo provee el sistema)
+        simbolo = sistema.param_symbols[parametro]
+        self._df_dp = sp.lambdify(
+            (sistema.x_sym, sistema.y_sym, sistema.t_sym, *sistema.param_symbols.values()),
+            [sp.diff(sistema.f1_sym, simbolo), sp.diff(sistema.f2_sym, simbolo)], 'numpy'
+        )
+
+    # ------------------------------------------------------------------
+    # Evaluaciones por lotes sobre puntos Z = (x, y, p) de forma (B, 3)
+    # ------------------------------------------------------------------
+
+    def _parametros(self, p):
+        return {self.parametro: p}
+
+    def _campo(self, Z):
+        U, V = self.sistema.evaluar_campo(Z[:, 0], Z[:, 1], 0, parametros=self._parametros(Z[:, 2]))
+        return np.column_stack([U, V])
+
+    def _jacobiano(self, Z):
+        return self.sistema.evaluar_jacobiano(Z[:, 0], Z[:, 1], 0,
+                                              parametros=self._parametros(Z[:, 2]))
+
+    def _derivada_parametro(self, Z):
+        valores = self.sistema._valores_parametros(self._parametros(Z[:, 2]))
+        with np.errstate(all='ignore'):
+            dfdp = self._df_dp(Z[:, 0], Z[:, 1], 0, *valores)
+        return np.column_stack([np.broadcast_to(np.asarray(d, dtype=float), (len(Z),))
+                                for d in dfdp])
+
+    def _matriz_extendida(self, Z):
+        """[J | ∂f/∂p] de forma (B, 2, 3)"""
+        return np.concatenate([self._jacobiano(Z), self._derivada_parametro(Z)[:, :, None]], axis=2)
+
+    @staticmethod
+    def _tangentes(extendida, orientacion=None):
+        """Núcleo de [J | f_p]: producto vectorial de sus dos filas, normalizado"""
+        tangente = np.cross(extendida[:, 0, :], extendida[:, 1, :])
+        norma = np.linalg.norm(tangente, axis=1, keepdims=True)
+        tangente = tangente / np.where(norma > 0, norma, 1.0)
+        if orientacion is not None:
+            signo = np.sign(np.sum(tangente * orientacion, axis=1, keepdims=True))
+            tangente = tangente * np.where(signo == 0, 1.0, signo)
+        return tangente
+
+    def _corregir(self, Z, normal, ancla, tolerancia=1e-10, max_iter=8):
+        """
+        Newton por lotes sobre f(Z) = 0, normal·(Z - ancla) = 0
+
+        Retorna: (Z corregido, máscara de convergencia)
+        """
+        Z = Z.copy()
+        convergido = np.zeros(len(Z), dtype=bool)
+        for _ in range(max_iter):
+            extendida = self._matriz_extendida(Z)
+            sistema = np.concatenate([extendida, normal[:, None, :]], axis=1)
+            residuo = np.concatenate([self._campo(Z), np.sum(normal * (Z - ancla), axis=1,
+                                                             keepdims=True)], axis=1)
+            validos = np.all(np.isfinite(sistema), axis=(1, 2)) & np.all(np.isfinite(residuo), axis=1)
+            validos &= np.abs(np.linalg.det(np.where(validos[:, None, None], sistema, np.eye(3)))) > 1e-14
+
+            delta = np.zeros_like(Z)
+            if np.any(validos):
+                delta[validos] = np.linalg.solve(sistema[validos], -residuo[validos][:, :, None])[:, :, 0]
+            delta[~validos] = np.nan
+            Z = Z + delta
+            convergido = np.max(np.abs(delta), axis=1) < tolerancia * np.maximum(1.0, np.max(np.abs(Z), axis=1))
+            if np.all(convergido | ~validos):
+                break
+        return Z, convergido & np.all(np.isfinite(Z), axis=1)
+
+    # ------------------------------------------------------------------
+    # Semillas y continuación
+    # ------------------------------------------------------------------
+
+    def _sistema_en(self, valor):
+        parametros = dict(self.sistema.parametros)
+        parametros[self.parametro] = float(valor)
+        return SistemaDinamico2D(funcion_personalizada=self.sistema.funcion_personalizada,
+                                 parametros=parametros)
+
+    def buscar_semillas(self, rango, xlim, ylim, n_valores=5):
+        """
+        Equilibrios en algunos valores del parámetro (puntos de partida de las ramas)
+
+        Retorna: array (S, 3) con filas (x, y, p)
+        """
+        semillas = []
+        for valor in np.linspace(rango[0], rango[1], n_valores):
+            sistema = self._sistema_en(valor)
+            try:
+                resultado = sistema.encontrar_equilibrios_certificados(xlim, ylim, max_cajas=20000)
+                puntos = [e['punto'] for e in resultado['equilibrios']]
+            except ValueError:
+                puntos = sistema.encontrar_puntos_equilibrio(xlim, ylim)
+            semillas.extend((x, y, valor) for x, y in puntos)
+        return np.array(semillas, dtype=float).reshape(-1, 3)
+
+    def continuar_equilibrios(self, rango, xlim=(-5, 5), ylim=(-5, 5), n_puntos=200,
+                              semillas=None, max_pasos=None):
+        """
+        Traza todas las ramas de equilibrios sobre el rango del parámetro
+
+        Parámetros:
+        - rango: (p_min, p_max)
+        - xlim, ylim: caja de estados donde se buscan y siguen equilibrios
+        - n_puntos: resolución aproximada de cada rama en el parámetro
+        - semillas: array (S, 3) opcional con puntos (x, y, p) de partida
+        - max_pasos: límite de pasos por dirección
+
+        Retorna: dict con
+        - 'ramas': lista de dicts {'puntos' (N, 3), 'traza', 'det', 'estable'}
+        - 'hopf': lista de {'parametro', 'punto', 'frecuencia'}
+        - 'pliegues': lista de {'parametro', 'punto'}
+        """
+        p_min, p_max = min(rango), max(rango)
+        if semillas is None:
+            semillas = self.buscar_semillas((p_min, p_max), xlim, ylim)
+        semillas = np.asarray(semillas, dtype=float).reshape(-1, 3)
+        if len(semillas) == 0:
+            return {'ramas': [], 'hopf': [], 'pliegues': []}
+
+        escala = max(xlim[1] - xlim[0], ylim[1] - ylim[0], p_max - p_min)
+        paso = (p_max - p_min) / n_puntos
+        max_pasos = max_pasos or 6 * n_puntos
+        caja = (xlim[0] - escala, xlim[1] + escala, ylim[0] - escala, ylim[1] + escala)
+
+        # Cada semilla se sigue hacia p creciente y decreciente en el mismo lote
+        tangente = self._tangentes(self._matriz_extendida(semillas))
+        tangente *= np.where(tangente[:, 2:3] < 0, -1.0, 1.0)
+        Z = np.vstack([semillas, semillas])
+        T = np.vstack([tangente, -tangente])
+        h = np.full(len(Z), paso)
+        activas = np.ones(len(Z), dtype=bool)
+        caminos = [[z.copy()] for z in Z]
+
+        for _ in range(max_pasos):
+            if not np.any(activas):
+                break
+            idx = np.flatnonzero(activas)
+            prediccion = Z[idx] + h[idx, None] * T[idx]
+            corregido, ok = self._corregir(prediccion, T[idx], prediccion)
+
+            # Fallos: se reduce el paso; si es muy chico la rama termina
+            for k in idx[~ok]:
+                h[k] /= 2
+                if h[k] < paso / 64:
+                    activas[k] = False
+
+            avanzan = idx[ok]
+            nuevos = corregido[ok]
+            dentro = ((nuevos[:, 2] >= p_min) & (nuevos[:, 2] <= p_max) &
+                      (nuevos[:, 0] >= caja[0]) & (nuevos[:, 0] <= caja[1]) &
+                      (nuevos[:, 1] >= caja[2]) & (nuevos[:, 1] <= caja[3]))
+            activas[avanzan[~dentro]] = False
+
+            # Las ramas que salen por el parámetro se cierran exactamente en el borde
+            salen = avanzan[~dentro & ((nuevos[:, 2] < p_min) | (nuevos[:, 2] > p_max))]
+            if len(salen):
+                borde = Z[salen].copy()
+                borde[:, 2] = np.where(T[salen, 2] > 0, p_max, p_min)
+                normal = np.tile([0.0, 0.0, 1.0], (len(salen), 1))
+                cierre, ok_borde = self._corregir(borde, normal, borde)
+                for k, z in zip(salen[ok_borde], cierre[ok_borde]):
+                    if 1e-12 < np.linalg.norm(z - Z[k]) < 2 * paso:
+                        caminos[k].append(z)
+
+            avanzan, nuevos = avanzan[dentro], nuevos[dentro]
+            if len(avanzan) == 0:
+                continue
+
+            T[avanzan] = self._tangentes(self._matriz_extendida(nuevos), T[avanzan])
+            Z[avanzan] = nuevos
+            h[avanzan] = np.minimum(h[avanzan] * 1.3, paso)
+            for k, z in zip(avanzan, nuevos):
+                caminos[k].append(z)
+                # Rama cerrada (isla): volvió a la semilla
+                if len(caminos[k]) > 3 and np.linalg.norm(z - caminos[k][0]) < 0.5 * paso:
+                    activas[k] = False
+
+        n = len(semillas)
+        ramas_puntos = []
+        for i in range(n):
+            puntos = np.array(caminos[n + i][::-1] + caminos[i][1:])
+            # Las semillas que caen sobre una rama ya trazada se descartan
+            if any(self._distancia_a_rama(semillas[i], otra) < paso
+                   for otra in ramas_puntos):
+                continue
+            ramas_puntos.append(puntos)
+
+        return self._analizar_ramas(ramas_puntos)
+
+    @staticmethod
+    def _distancia_a_rama(punto, rama):
+        """Distancia de un punto (x, y, p) a la poligonal de una rama"""
+        if len(rama) == 1:
+            return float(np.linalg.norm(punto - rama[0]))
+        a, b = rama[:-1], rama[1:]
+        ab = b - a
+        s = np.clip(np.sum((punto - a) * ab, axis=1) / np.maximum(np.sum(ab * ab, axis=1), 1e-30), 0, 1)
+        return float(np.min(np.linalg.norm(a + s[:, None] * ab - punto, axis=1)))
+
+    # ------------------------------------------------------------------
+    # Estabilidad y puntos de bifurcación
+    # ------------------------------------------------------------------
+
+    def _analizar_ramas(self, ramas_puntos):
+        """Traza/determinante de todos los puntos en una sola evaluación y detección"""
+        ramas, hopf, pliegues = [], [], []
+        if not ramas_puntos:
+            return {'ramas': ramas, 'hopf': hopf, 'pliegues': pliegues}
+
+        todos = np.vstack(ramas_puntos)
+        J = self._jacobiano(todos)
+        trazas = J[:, 0, 0] + J[:, 1, 1]
+        dets = J[:, 0, 0] * J[:, 1, 1] - J[:, 0, 1] * J[:, 1, 0]
+
+        inicio = 0
+        for puntos in ramas_puntos:
+            fin = inicio + len(puntos)
+            traza, det = trazas[inicio:fin], dets[inicio:fin]
+            inicio = fin
+            ramas.append({
+                'puntos': puntos,
+                'traza': traza,
+                'det': det,
+                'estable': (det > 0) & (traza < 0)
+            })
+
+            cambio_traza = np.flatnonzero(np.sign(traza[:-1]) * np.sign(traza[1:]) < 0)
+            for i in cambio_traza:
+                if det[i] > 0 and det[i + 1] > 0:
+                    z = self._refinar(puntos[i], puntos[i + 1], 'traza')
+                    J_z = self._jacobiano(z[None, :])[0]
+                    hopf.append({'parametro': float(z[2]), 'punto': (float(z[0]), float(z[1])),
+                                 'frecuencia': float(np.sqrt(max(np.linalg.det(J_z), 0.0)))})
+
+            for i in np.flatnonzero(np.sign(det[:-1]) * np.sign(det[1:]) < 0):
+                z = self._refinar(puntos[i], puntos[i + 1], 'det')
+                pliegues.append({'parametro': float(z[2]), 'punto': (float(z[0]), float(z[1]))})
+
+        return {'ramas': ramas, 'hopf': hopf, 'pliegues': pliegues}
+
+    def _indicador(self, Z, cantidad):
+        J = self._jacobiano(Z[None, :])[0]
+        if cantidad == 'traza':
+            return J[0, 0] + J[1, 1]
+        return J[0, 0] * J[1, 1] - J[0, 1] * J[1, 0]
+
+    def _refinar(self, z_a, z_b, cantidad, max_iter=50, tolerancia=1e-10):
+        """
+        Bisección sobre el tramo [z_a, z_b] de la rama
+
+        Cada punto intermedio se corrige sobre la rama (hiperplano normal a la
+        cuerda), así que funciona también en pliegues donde p no es monótono.
+        """
+        cuerda = z_b - z_a
+        normal = cuerda / np.linalg.norm(cuerda)
+        g_a = self._indicador(z_a, cantidad)
+        izquierda, derecha = 0.0, 1.0
+        z_medio = z_a
+        for _ in range(max_iter):
+            s = 0.5 * (izquierda + derecha)
+            prediccion = (z_a + s * cuerda)[None, :]
+            corregido, ok = self._corregir(prediccion, normal[None, :], prediccion)
+            z_medio = corregido[0] if ok[0] else prediccion[0]
+            g = self._indicador(z_medio, cantidad)
+            if np.sign(g) == np.sign(g_a):
+                izquierda = s
+            else:
+                derecha = s
+            if (derecha - izquierda) * np.linalg.norm(cuerda) < tolerancia:
+                break
+        return z_medio
@@ -0,0 +1,351 @@
+"""
+Análisis de bifurcaciones de codimensión 2 en sistemas dinámicos 1D
+Curvas de pliegue de f(x, r, h) y mapa de regiones en el plano (r, h)
+"""
+
+import sympy as sp
+import numpy as np
+from typing import Dict, List, Tuple
+
+
+class AnalizadorBifurcacionCodim2:
+    """
+    Clase para analizar bifurcaciones de x' = f(x, r, h) en dos parámetros
+
+    Las curvas de pliegue (silla-nodo) son las soluciones de
+
+        f(x, r, h) = 0,   ∂f/∂x (x, r, h) = 0
+
+    que forman curvas en el espacio (x, r, h). Se obtienen por continuación
+    de pseudo-longitud de arco a partir de semillas halladas en una malla
+    gruesa; su proyección sobre (r, h) separa regiones con distinto número
+    de equilibrios. Donde además ∂²f/∂x² cambia de signo la curva tiene una
+    cúspide (punto de codimensión 2).
+
+    Todas las evaluaciones son funciones compiladas sobre arrays: las curvas
+    avanzan juntas en lotes y el mapa de regiones cuenta cambios de signo de
+    f sobre una malla en x, sin resolver nada simbólicamente por celda.
+    """
+
+    def __init__(self, function_str: str, parametro_h: str = 'h'):
+        """
+        Inicializa el analizador con una función f(x, r, h)
+
+        Args:
+            function_str: String de la función, ej: "h + r*x - x**3"
+            parametro_h: Nombre del segundo parámetro
+        """
+        self.x = sp.Symbol('x', real=True)
+        self.r = sp.Symbol('r', real=True)
+        self.h = sp.Symbol(parametro_h, real=True)
+
+        try:
+            local_dict = {'x': self.x, 'r': self.r, parametro_h: self.h}
+            self.f = sp.sympify(function_str, locals=local_dict)
+        except Exception as e:
+            raise ValueError(f"Error al parsear la función: {e}")
+
+        desconocidos = self.f.free_symbols - {self.x, self.r, self.h}
+        if desconocidos:
+            nombres = ', '.join(sorted(str(s) for s in desconocidos))
+            raise ValueError(f"Símbolos no reconocidos en la función: {nombres}")
+
+        variables = (self.x, self.r, self.h)
+        self.df_dx = sp.diff(self.f, self.x)
+        self.d2f_dx2 = sp.diff(self.df_dx, self.x)
+
+        # Gradientes de f y de f_x respecto de (x, r, h), compilados en bloque
+        gradiente_f = [sp.diff(self.f, v) for v in variables]
+        gradiente_fx = [sp.diff(self.df_dx, v) for v in variables]
+        self.f_lambda = sp.lambdify(variables, self.f, 'numpy')
+        self._sistema_lambda = sp.lambdify(variables, [self.f, self.df_dx], 'numpy')
+        self._jacobiano_lambda = sp.lambdify(variables, [gradiente_f, gradiente_fx], 'numpy')
+        self._d2f_lambda = sp.lambdify(variables, self.d2f_dx2, 'numpy')
+
+    # ------------------------------------------------------------------
+    # Evaluaciones por lotes sobre puntos Z = (x, r, h) de forma (B, 3)
+    # ------------------------------------------------------------------
+
+    def evaluar_funcion(self, x_vals, r_vals, h_vals) -> np.ndarray:
+        """
+        Evalúa f(x, r, h) con broadcasting de numpy
+
+        Args:
+            x_vals, r_vals, h_vals: Escalares o arrays compatibles
+
+        Returns:
+            Array con la forma del broadcast de los argumentos
+        """
+        x_vals, r_vals, h_vals = np.broadcast_arrays(
+            *(np.asarray(v, dtype=float) for v in (x_vals, r_vals, h_vals)))
+        with np.errstate(all='ignore'):
+            return np.broadcast_to(self.f_lambda(x_vals, r_vals, h_vals), x_vals.shape)
+
+    def _aplanar(self, valores, n):
+        return np.column_stack([np.broadcast_to(np.asarray(v, dtype=float), (n,)) for v in valores])
+
+    def _sistema(self, Z):
+        """(f, f_x) de forma (B, 2)"""
+        with np.errstate(all='ignore'):
+            return self._aplanar(self._sistema_lambda(Z[:, 0], Z[:, 1], Z[:, 2]), len(Z))
+
+    def _jacobiano(self, Z):
+        """Filas ∇f y ∇f_x de forma (B, 2, 3)"""
+        with np.errstate(all='ignore'):
+            filas = self._jacobiano_lambda(Z[:, 0], Z[:, 1], Z[:, 2])
+        return np.stack([self._aplanar(fila, len(Z)) for fila in filas], axis=1)
+
+    def _curvatura(self, Z):
+        """∂²f/∂x² en cada punto"""
+        with np.errstate(all='ignore'):
+            valores = self._d2f_lambda(Z[:, 0], Z[:, 1], Z[:, 2])
+        return np.broadcast_to(np.asarray(valores, dtype=float), (len(Z),))
+
+    @staticmethod
+    def _tangentes(jacobiano, orientacion=None):
+        """Dirección de la curva: producto vectorial de ∇f y ∇f_x, normalizado"""
+        tangente = np.cross(jacobiano[:, 0, :], jacobiano[:, 1, :])
+        norma = np.linalg.norm(tangente, axis=1, keepdims=True)
+        tangente = tangente / np.where(norma > 0, norma, 1.0)
+        if orientacion is not None:
+            signo = np.sign(np.sum(tangente * orientacion, axis=1, keepdims=True))
+            tangente = tangente * np.where(signo == 0, 1.0, signo)
+        return tangente
+
+    def _corregir(self, Z, normal, ancla, tolerancia=1e-11, max_iter=10):
+        """
+        Newton por lotes sobre f = f_x = 0 restringido al plano normal·(Z - ancla) = 0
+
+        Returns:
+            (Z corregido, máscara de convergencia)
+        """
+        Z = Z.copy()
+        convergido = np.zeros(len(Z), dtype=bool)
+        for _ in range(max_iter):
+            matriz = np.concatenate([self._jacobiano(Z), normal[:, None, :]], axis=1)
+            residuo = np.concatenate([self._sistema(Z),
+                                      np.sum(normal * (Z - ancla), axis=1, keepdims=True)], axis=1)
+            validos = np.all(np.isfinite(matriz), axis=(1, 2)) & np.all(np.isfinite(residuo), axis=1)
+            validos &= np.abs(np.linalg.det(np.where(validos[:, None, None], matriz, np.eye(3)))) > 1e-14
+
+            delta = np.full_like(Z, np.nan)
+            if np.any(validos):
+                delta[validos] = np.linalg.solve(matriz[validos], -residuo[validos][:, :, None])[:, :, 0]
+            Z = Z + delta
+            convergido = np.max(np.abs(delta), axis=1) < tolerancia * np.maximum(1.0, np.max(np.abs(Z), axis=1))
+            if np.all(convergido | ~validos):
+                break
+        return Z, convergido & np.all(np.isfinite(Z), axis=1)
+
+    # ------------------------------------------------------------------
+    # Curvas de pliegue
+    # ------------------------------------------------------------------
+
+    def buscar_semillas(self, r_range: Tuple[float, float], h_range: Tuple[float, float],
+                        x_range: Tuple[float, float], n_malla: int = 24) -> np.ndarray:
+        """
+        Puntos de partida sobre las curvas de pliegue
+
+        Se evalúan f y f_x en una malla (x, r, h) y se toman las celdas donde
+        ambas cambian de signo; sus centros se corrigen con Newton.
+
+        Args:
+            r_range, h_range, x_range: Caja de búsqueda
+            n_malla: Nodos por eje
+
+        Returns:
+            Array (S, 3) con filas (x, r, h) sobre las curvas
+        """
+        ejes = [np.linspace(a, b, n_malla) for a, b in (x_range, r_range, h_range)]
+        X, R, H = np.meshgrid(*ejes, indexing='ij')
+        with np.errstate(all='ignore'):
+            valores = [np.broadcast_to(np.asarray(v, dtype=float), X.shape)
+                       for v in self._sistema_lambda(X, R, H)]
+
+        # Una celda es candidata si f y f_x toman ambos signos en sus 8 vértices
+        candidatas = np.ones((n_malla - 1,) * 3, dtype=bool)
+        for v in valores:
+            signos = np.sign(v)
+            vertices = [signos[i:n_malla - 1 + i, j:n_malla - 1 + j, k:n_malla - 1 + k]
+                        for i in (0, 1) for j in (0, 1) for k in (0, 1)]
+            minimo, maximo = np.min(vertices, axis=0), np.max(vertices, axis=0)
+            candidatas &= (minimo <= 0) & (maximo >= 0)
+
+        indices = np.argwhere(candidatas)
+        if len(indices) == 0:
+            return np.empty((0, 3))
+        pasos = np.array([e[1] - e[0] for e in ejes])
+        centros = np.column_stack([e[0] for e in ejes]) + (indices + 0.5) * pasos
+
+        normal = self._tangentes(self._jacobiano(centros))
+        sin_tangente = np.linalg.norm(normal, axis=1) == 0
+        normal[sin_tangente] = [0.0, 1.0, 0.0]
+        semillas, ok = self._corregir(centros, normal, centros)
+        semillas = semillas[ok & (np.max(np.abs(semillas - centros) / pasos, axis=1) < 2)]
+
+        # Una semilla por grupo de celdas vecinas
+        elegidas = []
+        for z in semillas:
+            if all(np.max(np.abs(z - e) / pasos) > 2 for e in elegidas):
+                elegidas.append(z)
+        return np.array(elegidas).reshape(-1, 3)
+
+    def curvas_pliegue(self, r_range: Tuple[float, float], h_range: Tuple[float, float],
+                       x_range: Tuple[float, float], n_puntos: int = 200,
+                       n_malla: int = 24, max_pasos: int = None) -> Dict:
+        """
+        Traza las curvas de pliegue dentro de la caja (x, r, h)
+
+        Args:
+            r_range, h_range: Rango de los parámetros
+            x_range: Rango de estados
+            n_puntos: Resolución aproximada de cada curva
+            n_malla: Nodos por eje de la malla de semillas
+            max_pasos: Límite de pasos por dirección
+
+        Returns:
+            Diccionario con:
+            - 'curvas': lista de arrays (N, 3) con columnas (x, r, h)
+            - 'cuspides': lista de dicts {'x', 'r', 'h'}
+        """
+        semillas = self.buscar_semillas(r_range, h_range, x_range, n_malla)
+        if len(semillas) == 0:
+            return {'curvas': [], 'cuspides': []}
+
+        minimos = np.array([x_range[0], r_range[0], h_range[0]], dtype=float)
+        maximos = np.array([x_range[1], r_range[1], h_range[1]], dtype=float)
+        paso = np.linalg.norm(maximos - minimos) / n_puntos
+        max_pasos = max_pasos or 6 * n_puntos
+
+        # Cada semilla se sigue en ambos sentidos dentro del mismo lote
+        tangente = self._tangentes(self._jacobiano(semillas))
+        Z = np.vstack([semillas, semillas])
+        T = np.vstack([tangente, -tangente])
+        paso_actual = np.full(len(Z), paso)
+        activas = np.linalg.norm(T, axis=1) > 0
+        caminos = [[z.copy()] for z in Z]
+
+        for _ in range(max_pasos):
+            if not np.any(activas):
+                break
+            idx = np.flatnonzero(activas)
+            prediccion = Z[idx] + paso_actual[idx, None] * T[idx]
+            corregido, ok = self._corregir(prediccion, T[idx], prediccion)
+
+            for k in idx[~ok]:
+                paso_actual[k] /= 2
+                if paso_actual[k] < paso / 64:
+                    activas[k] = False
+
+            avanzan, nuevos = idx[ok], corregido[ok]
+            dentro = np.all((nuevos >= minimos) & (nuevos <= maximos), axis=1)
+            activas[avanzan[~dentro]] = False
+
+            # Las curvas que salen de la caja se cierran exactamente en la cara cruzada
+            for k, z in zip(avanzan[~dentro], nuevos[~dentro]):
+                cara = np.argmax(np.maximum(minimos - z, z - maximos) / (maximos - minimos))
+                borde = Z[k].copy()
+                borde[cara] = minimos[cara] if z[cara] < minimos[cara] else maximos[cara]
+                normal = np.eye(3)[cara][None, :]
+                cierre, ok_borde = self._corregir(borde[None, :], normal, borde[None, :])
+                if ok_borde[0] and 1e-12 < np.linalg.norm(cierre[0] - Z[k]) < 2 * paso:
+                    caminos[k].append(cierre[0])
+
+            avanzan, nuevos = avanzan[dentro], nuevos[dentro]
+            if len(avanzan) == 0:
+                continue
+            T[avanzan] = self._tangentes(self._jacobiano(nuevos), T[avanzan])
+            Z[avanzan] = nuevos
+            paso_actual[avanzan] = np.minimum(paso_actual[avanzan] * 1.3, paso)
+            for k, z in zip(avanzan, nuevos):
+                caminos[k].append(z)
+                # Curva cerrada: volvió a la semilla
+                if len(caminos[k]) > 3 and np.linalg.norm(z - caminos[k][0]) < 0.5 * paso:
+                    activas[k] = False
+
+        n = len(semillas)
+        curvas = []
+        for i in range(n):
+            # Las semillas que caen sobre una curva ya trazada se descartan
+            if any(self._distancia_a_curva(semillas[i], otra) < paso for otra in curvas):
+                continue
+            curvas.append(np.array(caminos[n + i][::-1] + caminos[i][1:]))
+
+        cuspides = []
+        for curva in curvas:
+            curvatura = self._curvatura(curva)
+            for i in np.flatnonzero(np.sign(curvatura[:-1]) * np.sign(curvatura[1:]) < 0):
+                z = self._refinar_cuspide(curva[i], curva[i + 1])
+                cuspides.append({'x': float(z[0]), 'r': float(z[1]), 'h': float(z[2])})
+
+        return {'curvas': curvas, 'cuspides': cuspides}
+
+    @staticmethod
+    def _distancia_a_curva(punto, curva):
+        """Distancia de un punto (x, r, h) a la poligonal de una curva"""
+        if len(curva) == 1:
+            return float(np.linalg.norm(punto - curva[0]))
+        a, b = curva[:-1], curva[1:]
+        ab = b - a
+        s = np.clip(np.sum((punto - a) * ab, axis=1) / np.maximum(np.sum(ab * ab, axis=1), 1e-30), 0, 1)
+        return float(np.min(np.linalg.norm(a + s[:, None] * ab - punto, axis=1)))
+
+    def _refinar_cuspide(self, z_a, z_b, max_iter=60, tolerancia=1e-11):
+        """Bisección de f_xx = 0 sobre el tramo [z_a, z_b] de la curva de pliegue"""
+        cuerda = z_b - z_a
+        normal = (cuerda / np.linalg.norm(cuerda))[None, :]
+        signo_a = np.sign(self._curvatura(z_a[None, :])[0])
+        izquierda, derecha = 0.0, 1.0
+        z_medio = z_a
+        for _ in range(max_iter):
+            s = 0.5 * (izquierda + derecha)
+            prediccion = (z_a + s * cuerda)[None, :]
+            corregido, ok = self._corregir(prediccion, normal, prediccion)
+            z_medio = corregido[0] if ok[0] else prediccion[0]
+            if np.sign(self._curvatura(z_medio[None, :])[0]) == signo_a:
+                izquierda = s
+            else:
+                derecha = s
+            if (derecha - izquierda) * np.linalg.norm(cuerda) < tolerancia:
+                break
+        return z_medio
+
+    # ------------------------------------------------------------------
+    # Mapa de regiones
+    # ------------------------------------------------------------------
+
+    def mapa_regiones(self, r_range: Tuple[float, float], h_range: Tuple[float, float],
+                      x_range: Tuple[float, float], resolucion: Tuple[int, int] = (200, 200),
+                      n_x: int = 400, max_elementos: int = 4_000_000) -> Dict:
+        """
+        Número de equilibrios en cada punto de una malla (r, h)
+
+        Los equilibrios se cuentan como cambios de signo de f sobre una malla
+        de n_x puntos en x_range; el cálculo se hace por bloques de filas de h
+        para acotar la memoria.
+
+        Args:
+            r_range, h_range: Rango de los parámetros
+            x_range: Intervalo de estados donde se cuentan equilibrios
+            resolucion: (n_r, n_h) puntos de la malla de parámetros
+            n_x: Puntos de la malla en x
+            max_elementos: Tamaño máximo de cada bloque (n_h_bloque · n_r · n_x)
+
+        Returns:
+            Diccionario con 'r' (n_r,), 'h' (n_h,) y 'conteo' (n_h, n_r) entero
+        """
+        n_r, n_h = resolucion
+        r_vals = np.linspace(r_range[0], r_range[1], n_r)
+        h_vals = np.linspace(h_range[0], h_range[1], n_h)
+        x_vals = np.linspace(x_range[0], x_range[1], n_x)
+
+        conteo = np.zeros((n_h, n_r), dtype=int)
+        filas = max(1, max_elementos // (n_r * n_x))
+        for inicio in range(0, n_h, filas):
+            h_bloque = h_vals[inicio:inicio + filas]
+            signos = np.sign(self.evaluar_funcion(x_vals[None, None, :], r_vals[None, :, None],
+                                                  h_bloque[:, None, None]))
+            cruces = np.sum(signos[:, :, :-1] * signos[:, :, 1:] < 0, axis=2)
+            conteo[inicio:inicio + filas] = cruces + np.sum(signos == 0, axis=2)
+
+        return {'r': r_vals, 'h': h_vals, 'conteo': conteo}
@@ -0,0 +1,186 @@
+"""
+Ecuaciones diferenciales estocásticas en el plano
+Conjuntos de miles de trayectorias con ruido integrados a la vez y resumidos en histogramas
+"""
+
+import numpy as np
+from core.densidad import HistogramaDensidad
+from core.lotka_volterra import SistemaLotkaVolterra
+
+RUIDOS = ('aditivo', 'multiplicativo')
+METODOS = ('euler_maruyama', 'milstein')
+
+
+class IntegradorEstocastico:
+    """
+    dX = f(X, t)·dt + G(X)·dW con ruido diagonal e independiente por componente
+
+    - aditivo:        G(X) = diag(σ1, σ2)
+    - multiplicativo: G(X) = diag(σ1·x, σ2·y) (interpretación de Itô)
+
+    Todas las trayectorias avanzan como un único array (N, 2) y los
+    incrementos dW se sacan de un np.random.Generator con semilla, así que
+    cada corrida es reproducible. Con ruido diagonal, Milstein solo añade el
+    término ½·g·g'·(dW² − dt), que es nulo en el caso aditivo (ahí coincide
+    con Euler–Maruyama) y vale ½·σ²·x·(dW² − dt) en el multiplicativo.
+
+    No se guardan las trayectorias: iterar() entrega el estado vivo cada
+    cierta cantidad de pasos y histogramas() lo vuelca en un
+    HistogramaDensidad por instante, de modo que la memoria no depende de
+    la duración de la simulación.
+    """
+
+    def __init__(self, campo, sigma, ruido='aditivo', metodo='euler_maruyama', semilla=None):
+        """
+        Parámetros:
+        - campo: función campo(X, t) -> array (N, 2) para X de forma (N, 2)
+        - sigma: intensidad del ruido (escalar o par (σ1, σ2))
+        - ruido: 'aditivo' o 'multiplicativo'
+        - metodo: 'euler_maruyama' o 'milstein'
+        - semilla: semilla del generador aleatorio (None = no reproducible)
+        """
+        if ruido not in RUIDOS:
+            raise ValueError(f"Ruido desconocido: {ruido} (opciones: {', '.join(RUIDOS)})")
+        if metodo not in METODOS:
+            raise ValueError(f"Método desconocido: {metodo} (opciones: {', '.join(METODOS)})")
+        sigma = np.broadcast_to(np.asarray(sigma, dtype=float), (2,)).copy()
+        if np.any(sigma < 0):
+            raise ValueError("La intensidad del ruido debe ser no negativa")
+
+        self.campo = campo
+        self.sigma = sigma
+        self.ruido = ruido
+        self.metodo = metodo
+        self.semilla = semilla
+
+    @classmethod
+    def para_sistema(cls, sistema, sigma, **opciones):
+        """Integrador para un SistemaDinamico2D (usa su campo compilado por lotes)"""
+        return cls(sistema.compilar_funciones_lote()[0], sigma, **opciones)
+
+    @classmethod
+    def para_lotka_volterra(cls, modelo, sigma, ruido='multiplicativo', **opciones):
+        """
+        Integrador para un SistemaLotkaVolterra
+
+        Por defecto el ruido es multiplicativo (fluctuaciones ambientales de
+        las tasas), que conserva el signo de las poblaciones en el límite dt → 0.
+        """
+        def campo(X, t):
+            U, V = modelo.campo_vectorial(X[:, 0], X[:, 1])
+            return np.column_stack([U, V])
+
+        return cls(campo, sigma, ruido=ruido, **opciones)
+
+    def paso(self, X, t, dt, dW):
+        """
+        Avanza un paso de tamaño dt
+
+        Parámetros:
+        - X: estados (N, 2)
+        - t: tiempo actual
+        - dt: paso de tiempo
+        - dW: incrementos brownianos (N, 2) con varianza dt
+
+        Retorna: estados en t + dt (array nuevo)
+        """
+        deriva = self.campo(X, t)
+        if self.ruido == 'aditivo':
+            return X + deriva * dt + self.sigma * dW
+
+        difusion = self.sigma * X
+        siguiente = X + deriva * dt + difusion * dW
+        if self.metodo == 'milstein':
+            siguiente += 0.5 * self.sigma * difusion * (dW * dW - dt)
+        return siguiente
+
+    def iterar(self, semillas, t_max, dt, cada=1):
+        """
+        Generador del estado del conjunto cada `cada` pasos
+
+        Parámetros:
+        - semillas: array (N, 2) de condiciones iniciales
+        - t_max: tiempo final
+        - dt: paso de tiempo
+        - cada: pasos entre entregas
+
+        Produce: (t, X) empezando por t = 0; X es el array vivo (N, 2) y no
+        debe conservarse entre iteraciones sin copiarlo
+        """
+        if dt <= 0 or t_max <= 0 or cada < 1:
+            raise ValueError("t_max, dt y cada deben ser positivos")
+        generador = np.random.default_rng(self.semilla)
+        X = np.array(semillas, dtype=float).reshape(-1, 2)
+        n_pasos = int(round(t_max / dt))
+        escala = np.sqrt(dt)
+        t = 0.0
+
+        with np.errstate(all='ignore'):
+            yield t, X
+            for k in range(1, n_pasos + 1):
+                dW = generador.standard_normal(X.shape)
+                dW *= escala
+                X = self.paso(X, t, dt, dW)
+                t = k * dt
+                if k % cada == 0:
+                    yield t, X
+
+    def histogramas(self, semillas, t_max, dt, xlim, ylim, resolucion=(200, 200), cada=10):
+        """
+        Distribución del conjunto en instantes equiespaciados, sin guardar trayectorias
+
+        Parámetros:
+        - semillas, t_max, dt, cada: como en iterar
+        - xlim, ylim, resolucion: geometría de los histogramas
+
+        Produce: (t, histograma, resumen) con un HistogramaDensidad nuevo por
+        instante y resumen un dict con 'media' y 'desviacion' (2,) de las
+        trayectorias finitas y 'divergentes' (cuántas dejaron de serlo)
+        """
+        for t, X in self.iterar(semillas, t_max, dt, cada):
+            histograma = HistogramaDensidad(xlim, ylim, resolucion)
+            histograma.agregar(X[:, 0], X[:, 1])
+            finitas = X[np.all(np.isfinite(X), axis=1)]
+            resumen = {
+                'media': finitas.mean(axis=0) if len(finitas) else np.full(2, np.nan),
+                'desviacion': finitas.std(axis=0) if len(finitas) else np.full(2, np.nan),
+                'divergentes': len(X) - len(finitas),
+            }
+            yield t, histograma, resumen
+
+    def ocupacion(self, semillas, t_max, dt, xlim, ylim, resolucion=(200, 200), cada=10,
+                  t_transitorio=0.0, histograma=None):
+        """
+        Histograma acumulado de todos los instantes posteriores al transitorio
+
+        Para tiempos largos aproxima la densidad estacionaria del proceso.
+
+        Parámetros:
+        - semillas, t_max, dt, cada: como en iterar
+        - xlim, ylim, resolucion: geometría del histograma
+        - t_transitorio: instantes anteriores que no se cuentan
+        - histograma: HistogramaDensidad existente a continuar (opcional)
+
+        Retorna: HistogramaDensidad
+        """
+        if histograma is None:
+            histograma = HistogramaDensidad(xlim, ylim, resolucion)
+        for t, X in self.iterar(semillas, t_max, dt, cada):
+            if t >= t_transitorio:
+                histograma.agregar(X[:, 0], X[:, 1])
+        return histograma
+
+
+def crear_integrador_estocastico(sistema, sigma, **opciones):
+    """
+    Integrador adecuado al tipo de sistema
+
+    Parámetros:
+    - sistema: SistemaDinamico2D o SistemaLotkaVolterra
+    - sigma, opciones: ver IntegradorEstocastico
+
+    Retorna: IntegradorEstocastico
+    """
+    if isinstance(sistema, SistemaLotkaVolterra):
+        return IntegradorEstocastico.para_lotka_volterra(sistema, sigma, **opciones)
+    return IntegradorEstocastico.para_sistema(sistema, sigma, **opciones)
@@ -0,0 +1,200 @@
+"""
+Análisis de Floquet para sistemas lineales 2D con forzado periódico
+dx/dt = A·x + b·f(t), con f(t) = sin(ωt) o cos(ωt) y A constante
+
+Como A no depende de t, la matriz de monodromía es e^{AT} en forma cerrada
+y la respuesta periódica estacionaria sale de resolver (iωI − A)·c = b; no
+hace falta integrar el transitorio. Todas las funciones aceptan lotes con
+forma (..., 2, 2) para A, (..., 2) para b y (...) para T u ω.
+"""
+
+import numpy as np
+
+
+def exponencial_2x2(A, t):
+    """
+    e^{A·t} en forma cerrada para matrices 2×2
+
+    Con s = tr(A)/2 y q = √(s² − det A):
+        e^{At} = e^{st} [cosh(qt)·I + sinh(qt)/q·(A − sI)]
+    válida también para q complejo (foco) y q → 0 (nodo degenerado).
+
+    Parámetros:
+    - A: array (..., 2, 2)
+    - t: escalar o array compatible con A[..., 0, 0]
+
+    Retorna: array real (..., 2, 2)
+    """
+    A = np.asarray(A, dtype=float)
+    t = np.asarray(t, dtype=float)
+    s = 0.5 * (A[..., 0, 0] + A[..., 1, 1])
+    det = A[..., 0, 0] * A[..., 1, 1] - A[..., 0, 1] * A[..., 1, 0]
+    q = np.sqrt((s * s - det).astype(complex))
+
+    qt = q * t
+    pequeno = np.abs(qt) < 1e-4
+    qt_seguro = np.where(pequeno, 1.0, qt)
+    # sinh(qt)/q con su serie de Taylor cerca de q = 0
+    sinhc = np.where(pequeno, t * (1 + qt * qt / 6), np.sinh(qt_seguro) / np.where(pequeno, 1.0, q))
+    cosh = np.cosh(qt)
+
+    escala = np.exp(s * t)
+    identidad = np.eye(2)
+    B = A - s[..., None, None] * identidad
+    resultado = escala[..., None, None] * (cosh[..., None, None] * identidad + sinhc[..., None, None] * B)
+    return resultado.real
+
+
+def autovalores_2x2(A):
+    """Autovalores (..., 2) complejos por traza y determinante (λ₁ con la mayor parte real)"""
+    A = np.asarray(A, dtype=float)
+    s = 0.5 * (A[..., 0, 0] + A[..., 1, 1])
+    det = A[..., 0, 0] * A[..., 1, 1] - A[..., 0, 1] * A[..., 1, 0]
+    q = np.sqrt((s * s - det).astype(complex))
+    return np.stack([s + q, s - q], axis=-1)
+
+
+def resolvente_2x2(A, omega, b):
+    """
+    Amplitud compleja c = (iωI − A)⁻¹·b con la inversa 2×2 explícita
+
+    Parámetros:
+    - A: array (..., 2, 2)
+    - omega: frecuencias, compatibles con A[..., 0, 0]
+    - b: array (..., 2) de coeficientes del forzado
+
+    Retorna: array complejo (..., 2); NaN donde iω es autovalor (resonancia exacta)
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    iw = 1j * np.asarray(omega, dtype=float)
+    m11, m12 = iw - A[..., 0, 0], -A[..., 0, 1]
+    m21, m22 = -A[..., 1, 0], iw - A[..., 1, 1]
+    det = m11 * m22 - m12 * m21
+    with np.errstate(all='ignore'):
+        det = np.where(np.abs(det) > 1e-14, det, np.nan)
+        c1 = (m22 * b[..., 0] - m12 * b[..., 1]) / det
+        c2 = (m11 * b[..., 1] - m21 * b[..., 0]) / det
+    return np.stack([c1, c2], axis=-1)
+
+
+def respuesta_estacionaria(amplitud, omega, t, tipo='seno'):
+    """
+    Solución periódica x_p(t) a partir de la amplitud compleja c
+
+    x_p(t) = Im(c·e^{iωt}) para forzado seno y Re(c·e^{iωt}) para coseno.
+
+    Parámetros:
+    - amplitud: array complejo (..., 2) de resolvente_2x2
+    - omega: frecuencia
+    - t: escalar o array de tiempos (T,)
+    - tipo: 'seno' o 'coseno'
+
+    Retorna: array (..., 2) para t escalar o (T, ..., 2) para un array de tiempos
+    """
+    t = np.asarray(t, dtype=float)
+    fase = np.exp(1j * np.multiply.outer(t, np.asarray(omega, dtype=float)))
+    valores = amplitud * fase[..., None]
+    return valores.imag if tipo == 'seno' else valores.real
+
+
+def analizar_floquet_lote(A, b, omega, tipo='seno'):
+    """
+    Análisis de Floquet completo para un lote de sistemas forzados
+
+    Parámetros:
+    - A: array (N, 2, 2) (o una sola matriz)
+    - b: array (N, 2) de coeficientes del forzado
+    - omega: array (N,) de frecuencias ω > 0
+    - tipo: 'seno' o 'coseno'
+
+    Retorna: dict con
+    - 'periodo': T = 2π/ω
+    - 'monodromia': e^{AT} (N, 2, 2)
+    - 'multiplicadores': μ = e^{λT} (N, 2) complejos
+    - 'exponentes': Re(λ), exponentes de Floquet (N, 2)
+    - 'radio_espectral': max |μ| (N,)
+    - 'amplitud': c = (iωI − A)⁻¹ b (N, 2) complejo
+    - 'punto_fijo': x_p(0), punto fijo del mapa estroboscópico P(x) = e^{AT}x + ∫ (N, 2)
+    """
+    A = np.asarray(A, dtype=float)
+    omega = np.asarray(omega, dtype=float)
+    if np.any(omega <= 0):
+        raise ValueError("La frecuencia del forzado debe ser positiva")
+    periodo = 2 * np.pi / omega
+
+    autovalores = autovalores_2x2(A)
+    multiplicadores = np.exp(autovalores * periodo[..., None])
+    amplitud = resolvente_2x2(A, omega, b)
+
+    return {
+        'periodo': periodo,
+        'monodromia': exponencial_2x2(A, periodo),
+        'multiplicadores': multiplicadores,
+        'exponentes': autovalores.real,
+        'radio_espectral': np.abs(multiplicadores).max(axis=-1),
+        'amplitud': amplitud,
+        'punto_fijo': respuesta_estacionaria(amplitud, omega, 0.0, tipo),
+    }
+
+
+class AnalizadorFloquet:
+    """
+    Floquet de un SistemaDinamico2D lineal con forzado seno o coseno
+
+    Los multiplicadores μ = e^{λT} deciden la estabilidad de la solución
+    periódica: |μ| < 1 para ambos implica que toda trayectoria converge a
+    x_p(t); si algún |μ| > 1 la respuesta periódica existe pero es inestable.
+    """
+
+    def __init__(self, sistema):
+        """
+        Parámetros:
+        - sistema: SistemaDinamico2D definido por matriz con forzado seno/coseno
+        """
+        if sistema.funcion_personalizada or sistema.A is None:
+            raise ValueError("El análisis de Floquet requiere un sistema lineal definido por matriz")
+        forzado = sistema.termino_forzado
+        if not forzado or forzado.get('tipo') not in ('seno', 'coseno'):
+            raise ValueError("El análisis de Floquet requiere un forzado seno o coseno")
+        omega = abs(float(forzado.get('param', 0)))
+        if omega == 0:
+            raise ValueError("La frecuencia del forzado debe ser distinta de cero")
+
+        self.A = np.asarray(sistema.A, dtype=float)
+        self.b = np.array([forzado['coef1'], forzado['coef2']], dtype=float)
+        self.tipo = forzado['tipo']
+        # sin(−ωt) = −sin(ωt): el signo de ω se traslada a b
+        if float(forzado['param']) < 0 and self.tipo == 'seno':
+            self.b = -self.b
+        self.omega = omega
+
+        resultado = analizar_floquet_lote(self.A, self.b, self.omega, self.tipo)
+        self.periodo = float(resultado['periodo'])
+        self.monodromia = resultado['monodromia']
+        self.multiplicadores = resultado['multiplicadores']
+        self.exponentes = resultado['exponentes']
+        self.radio_espectral = float(resultado['radio_espectral'])
+        self.amplitud = resultado['amplitud']
+        self.punto_fijo = resultado['punto_fijo']
+
+    @property
+    def resonante(self):
+        """True si iω es autovalor de A (no existe respuesta periódica acotada)"""
+        return bool(np.any(~np.isfinite(self.amplitud)))
+
+    def estabilidad(self, tolerancia=1e-9):
+        """'estable', 'neutral' o 'inestable' según el radio espectral de e^{AT}"""
+        if self.radio_espectral < 1 - tolerancia:
+            return 'estable'
+        if self.radio_espectral > 1 + tolerancia:
+            return 'inestable'
+        return 'neutral'
+
+    def estado_periodico(self, t):
+        """x_p(t) evaluada en un escalar o array de tiempos"""
+        return respuesta_estacionaria(self.amplitud, self.omega, t, self.tipo)
+
+    def amplitudes_y_fases(self):
+        """Amplitud |c_i| y fase arg(c_i) (rad) de cada componente respecto al forzado"""
+        return np.abs(self.amplitud), np.angle(self.amplitud)
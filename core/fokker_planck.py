@@ -0,0 +1,191 @@
+"""
+Ecuación de Fokker–Planck en el plano por volúmenes finitos
+Evolución de la densidad de probabilidad de un sistema con ruido aditivo y su estado estacionario
+"""
+
+import numpy as np
+import scipy.sparse as sparse
+from scipy.sparse.linalg import splu, spsolve
+
+
+def _bernoulli(z):
+    """B(z) = z / (e^z − 1), con B(0) = 1"""
+    z = np.asarray(z, dtype=float)
+    pequeno = np.abs(z) < 1e-8
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        valor = z / np.expm1(z)
+    return np.where(pequeno, 1 - z / 2, valor)
+
+
+class FokkerPlanck2D:
+    """
+    ∂p/∂t = −∇·(f·p) + ∇·(D·∇p) con D = diag(σ1², σ2²)/2
+
+    Es la densidad de dX = f(X)·dt + diag(σ1, σ2)·dW (el ruido aditivo de
+    IntegradorEstocastico). Se discretiza por volúmenes finitos en una malla
+    rectilínea: la deriva se evalúa una sola vez en las caras con el campo
+    vectorizado del sistema y el flujo por cada cara es el de
+    Scharfetter–Gummel, que es exacto para deriva constante, pasa a upwind
+    cuando domina la advección y mantiene la positividad. Las caras del
+    borde no tienen flujo, de modo que la masa se conserva exactamente.
+
+    El operador L (dp/dt = L·p) se arma una vez como matriz dispersa; cada
+    paso implícito reutiliza la factorización LU de (I − θ·dt·L) y el
+    estado estacionario es la solución de L·p = 0 normalizada.
+    """
+
+    def __init__(self, sistema, sigma, xlim, ylim, resolucion=(100, 100), t=0.0):
+        """
+        Parámetros:
+        - sistema: SistemaDinamico2D (se usa evaluar_campo)
+        - sigma: intensidad del ruido (escalar o par (σ1, σ2))
+        - xlim, ylim: dominio (la masa no sale de él)
+        - resolucion: (nx, ny) celdas por eje
+        - t: instante en que se congela la deriva si el sistema depende de t
+        """
+        if not (xlim[1] > xlim[0] and ylim[1] > ylim[0]):
+            raise ValueError("Los límites del dominio deben cumplir min < max")
+        self.nx, self.ny = int(resolucion[0]), int(resolucion[1])
+        if self.nx < 2 or self.ny < 2:
+            raise ValueError("Se requieren al menos 2 celdas por eje")
+        sigma = np.broadcast_to(np.asarray(sigma, dtype=float), (2,))
+        if np.any(sigma < 0):
+            raise ValueError("La intensidad del ruido debe ser no negativa")
+
+        self.sistema = sistema
+        self.sigma = sigma.copy()
+        self.xlim = (float(xlim[0]), float(xlim[1]))
+        self.ylim = (float(ylim[0]), float(ylim[1]))
+        self.dx = (self.xlim[1] - self.xlim[0]) / self.nx
+        self.dy = (self.ylim[1] - self.ylim[0]) / self.ny
+        self.x = self.xlim[0] + (np.arange(self.nx) + 0.5) * self.dx
+        self.y = self.ylim[0] + (np.arange(self.ny) + 0.5) * self.dy
+        self.L = self._ensamblar(float(t))
+        self._factorizaciones = {}
+
+    @property
+    def extent(self):
+        """(x_min, x_max, y_min, y_max) para imshow"""
+        return (*self.xlim, *self.ylim)
+
+    @property
+    def area_celda(self):
+        return self.dx * self.dy
+
+    def _ensamblar(self, t):
+        """Operador disperso (N, N) con N = nx·ny, índice k = j·nx + i"""
+        indice = np.arange(self.nx * self.ny).reshape(self.ny, self.nx)
+        Dx, Dy = self.sigma ** 2 / 2
+
+        # Caras interiores verticales (entre i e i+1) y horizontales (entre j y j+1)
+        caras_x = self.xlim[0] + np.arange(1, self.nx) * self.dx
+        caras_y = self.ylim[0] + np.arange(1, self.ny) * self.dy
+        U, _ = self.sistema.evaluar_campo(*np.meshgrid(caras_x, self.y), t)
+        _, V = self.sistema.evaluar_campo(*np.meshgrid(self.x, caras_y), t)
+
+        bloques = []
+        for velocidad, D, h, izquierda, derecha in (
+                (U, Dx, self.dx, indice[:, :-1], indice[:, 1:]),
+                (V, Dy, self.dy, indice[:-1, :], indice[1:, :])):
+            velocidad = np.nan_to_num(velocidad, nan=0.0, posinf=0.0, neginf=0.0).ravel()
+            # Flujo por la cara: Φ = a·p_izq + b·p_der, ya dividido por h
+            if D > 0:
+                peclet = velocidad * h / D
+                a = D / h ** 2 * _bernoulli(-peclet)
+                b = -D / h ** 2 * _bernoulli(peclet)
+            else:
+                a = np.maximum(velocidad, 0) / h
+                b = np.minimum(velocidad, 0) / h
+            izquierda, derecha = izquierda.ravel(), derecha.ravel()
+            bloques.append((np.concatenate([izquierda, izquierda, derecha, derecha]),
+                            np.concatenate([izquierda, derecha, izquierda, derecha]),
+                            np.concatenate([-a, -b, a, b])))
+
+        filas, columnas, valores = (np.concatenate(partes) for partes in zip(*bloques))
+        n = self.nx * self.ny
+        return sparse.csc_matrix((valores, (filas, columnas)), shape=(n, n))
+
+    def normalizar(self, P):
+        """Escala P (ny, nx) para que integre 1"""
+        P = np.asarray(P, dtype=float)
+        masa = P.sum() * self.area_celda
+        if masa <= 0:
+            raise ValueError("La densidad debe tener masa positiva")
+        return P / masa
+
+    def gaussiana(self, centro, ancho):
+        """Densidad inicial gaussiana (ny, nx) centrada en `centro` con desviación `ancho`"""
+        ancho = np.broadcast_to(np.asarray(ancho, dtype=float), (2,))
+        X, Y = np.meshgrid(self.x, self.y)
+        P = np.exp(-0.5 * (((X - centro[0]) / ancho[0]) ** 2 + ((Y - centro[1]) / ancho[1]) ** 2))
+        return self.normalizar(P)
+
+    def _factorizacion(self, dt, theta):
+        clave = (dt, theta)
+        if clave not in self._factorizaciones:
+            identidad = sparse.identity(self.L.shape[0], format='csc')
+            self._factorizaciones[clave] = splu((identidad - theta * dt * self.L).tocsc())
+        return self._factorizaciones[clave]
+
+    def evolucionar(self, P0, t_max, dt, cada=1, theta=1.0):
+        """
+        Generador de la densidad cada `cada` pasos
+
+        theta = 1 es Euler implícito (conserva la positividad);
+        theta = 0.5 es Crank–Nicolson (segundo orden, puede oscilar si dt es grande).
+
+        Parámetros:
+        - P0: densidad inicial (ny, nx)
+        - t_max: tiempo final
+        - dt: paso de tiempo
+        - cada: pasos entre entregas
+        - theta: peso implícito en [0.5, 1]
+
+        Produce: (t, P) empezando por t = 0, con P un array (ny, nx) nuevo
+        """
+        if dt <= 0 or t_max <= 0 or cada < 1:
+            raise ValueError("t_max, dt y cada deben ser positivos")
+        if not 0.5 <= theta <= 1:
+            raise ValueError("theta debe estar en [0.5, 1]")
+        lu = self._factorizacion(float(dt), float(theta))
+        explicito = (sparse.identity(self.L.shape[0], format='csc') + (1 - theta) * dt * self.L
+                     if theta < 1 else None)
+
+        p = np.asarray(P0, dtype=float).ravel().copy()
+        n_pasos = int(round(t_max / dt))
+        yield 0.0, p.reshape(self.ny, self.nx).copy()
+        for k in range(1, n_pasos + 1):
+            p = lu.solve(explicito @ p if explicito is not None else p)
+            if k % cada == 0:
+                yield k * dt, p.reshape(self.ny, self.nx).copy()
+
+    def estacionaria(self):
+        """
+        Densidad estacionaria: L·p = 0 con ∫p = 1
+
+        La condición de normalización reemplaza una ecuación (L es singular:
+        sus columnas suman cero por la conservación de la masa).
+
+        Retorna: array (ny, nx)
+        """
+        A = self.L.tolil()
+        A[0, :] = np.full(self.L.shape[1], self.area_celda)
+        b = np.zeros(self.L.shape[0])
+        b[0] = 1.0
+        p = spsolve(A.tocsc(), b)
+        # Los negativos son error de redondeo en zonas de probabilidad despreciable
+        return self.normalizar(np.maximum(p, 0).reshape(self.ny, self.nx))
+
+    def momentos(self, P):
+        """
+        Media y desviación de la densidad
+
+        Retorna: dict con 'masa', 'media' (2,) y 'desviacion' (2,)
+        """
+        P = np.asarray(P, dtype=float)
+        masa = P.sum() * self.area_celda
+        marginal_x = P.sum(axis=0) * self.area_celda / masa
+        marginal_y = P.sum(axis=1) * self.area_celda / masa
+        media = np.array([marginal_x @ self.x, marginal_y @ self.y])
+        varianza = np.array([marginal_x @ (self.x - media[0]) ** 2, marginal_y @ (self.y - media[1]) ** 2])
+        return {'masa': masa, 'media': media, 'desviacion': np.sqrt(varianza)}
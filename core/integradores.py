@@ -0,0 +1,172 @@
+"""
+Integradores de paso fijo para conjuntos de estados
+Avanzan a la vez todas las filas de un array (N, d) con evaluaciones vectorizadas;
+incluye la selección automática de métodos de solve_ivp según la rigidez
+"""
+
+import numpy as np
+from scipy.integrate import solve_ivp
+
+
+def paso_rk4(f, t, estado, dt):
+    """
+    Un paso de Runge-Kutta clásico de orden 4
+
+    Parámetros:
+    - f: función f(t, estado) -> derivada con la forma de estado
+    - t: tiempo actual (escalar, común a todo el conjunto)
+    - estado: array (N, d) o cualquier forma que acepte f
+    - dt: paso de tiempo
+
+    Retorna: estado en t + dt
+    """
+    k1 = f(t, estado)
+    k2 = f(t + 0.5 * dt, estado + 0.5 * dt * k1)
+    k3 = f(t + 0.5 * dt, estado + 0.5 * dt * k2)
+    k4 = f(t + dt, estado + dt * k3)
+    return estado + (dt / 6.0) * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+
+
+def integrar_rk4(f, t0, estado0, dt, n_pasos):
+    """
+    Integra n_pasos de RK4 y retorna solo el estado final
+
+    Parámetros:
+    - f: función f(t, estado)
+    - t0: tiempo inicial
+    - estado0: estado inicial
+    - dt: paso de tiempo
+    - n_pasos: número de pasos
+
+    Retorna: (t_final, estado_final)
+    """
+    estado = np.array(estado0, dtype=float)
+    with np.errstate(all='ignore'):
+        for k in range(n_pasos):
+            estado = paso_rk4(f, t0 + k * dt, estado, dt)
+    return t0 + n_pasos * dt, estado
+
+
+# Índice de rigidez (tasa disipativa más rápida × horizonte) a partir del cual el
+# paso explícito queda limitado por estabilidad y no por precisión
+UMBRAL_RIGIDEZ = 500
+# A partir de aquí se pasa directamente a un método implícito puro
+UMBRAL_RIGIDEZ_FUERTE = 50000
+# Radau resuelve sistemas de 3n×3n por paso: en dimensión alta conviene BDF
+DIMENSION_MAXIMA_RADAU = 10
+METODOS_EXPLICITOS = ('RK23', 'RK45', 'DOP853')
+
+
+def estimar_rigidez(jacobiano, horizonte, paso=None):
+    """
+    Estima la rigidez a partir del espectro del Jacobiano en un punto
+
+    Los modos oscilatorios (Re λ ≈ 0) no limitan a un método explícito
+    adaptativo; los que sí lo hacen son los que decaen rápido, así que el
+    índice usa la tasa disipativa max(−Re λ) y no el radio espectral.
+
+    Parámetros:
+    - jacobiano: matriz (n, n)
+    - horizonte: duración de la integración
+    - paso: paso fijo opcional para comprobar la estabilidad de Euler explícito
+
+    Retorna: dict con 'radio_espectral' (max |λ|), 'tasa_disipativa',
+    'indice' (tasa · horizonte; NaN si el Jacobiano no es finito) y
+    'euler_estable' (|1 + h·λ| <= 1 en los modos disipativos; None sin paso)
+    """
+    J = np.atleast_2d(np.asarray(jacobiano, dtype=float))
+    if not np.all(np.isfinite(J)):
+        return {'radio_espectral': np.nan, 'tasa_disipativa': np.nan,
+                'indice': np.nan, 'euler_estable': None}
+
+    autovalores = np.linalg.eigvals(J)
+    tasa = max(float(-autovalores.real.min()), 0.0)
+    euler_estable = None
+    if paso is not None:
+        disipativos = autovalores[autovalores.real < 0]
+        euler_estable = bool(np.all(np.abs(1 + abs(paso) * disipativos) <= 1))
+    return {
+        'radio_espectral': float(np.abs(autovalores).max()),
+        'tasa_disipativa': tasa,
+        'indice': tasa * abs(horizonte),
+        'euler_estable': euler_estable,
+    }
+
+
+def seleccionar_metodo(rigidez, dimension=2):
+    """
+    Elige el método de solve_ivp según el índice de estimar_rigidez
+
+    - no rígido: RK45
+    - moderado o desconocido: LSODA (cambia solo entre Adams y BDF si la
+      rigidez aparece más adelante en la trayectoria)
+    - fuerte: Radau, o BDF si la dimensión es grande
+    """
+    indice = rigidez['indice']
+    if not np.isfinite(indice):
+        return 'LSODA'
+    if indice < UMBRAL_RIGIDEZ:
+        return 'RK45'
+    if indice < UMBRAL_RIGIDEZ_FUERTE:
+        return 'LSODA'
+    return 'Radau' if dimension <= DIMENSION_MAXIMA_RADAU else 'BDF'
+
+
+def integrar_con_seleccion(campo, jacobiano, estado0, tiempos, metodo=None, eventos=None,
+                           rtol=1e-6, atol=1e-9):
+    """
+    Integra con solve_ivp eligiendo el método según la rigidez en la semilla
+
+    Los métodos implícitos reciben el Jacobiano analítico, de modo que no
+    aproximan J por diferencias finitas en cada factorización.
+
+    Parámetros:
+    - campo: función campo(X, t) -> array (n,) (convención de odeint)
+    - jacobiano: función jacobiano(X, t) -> array (n, n)
+    - estado0: estado inicial (n,)
+    - tiempos: instantes de salida, monótonos (crecientes o decrecientes)
+    - metodo: fuerza un método de solve_ivp; por defecto se selecciona
+    - eventos: lista de funciones evento(t, X) con atributos terminal/direction
+    - rtol, atol: tolerancias
+
+    Retorna: (t, X, info) con t los instantes alcanzados (se corta en el
+    primer evento terminal), X de forma (len(t), n) e info un dict con
+    'metodo', 'rigidez', 'pasos', 'nfev', 'njev', 'nlu', 'exito',
+    'mensaje' y 'evento' (índice del evento terminal o None)
+    """
+    estado0 = np.asarray(estado0, dtype=float)
+    tiempos = np.asarray(tiempos, dtype=float)
+    t0, tf = float(tiempos[0]), float(tiempos[-1])
+
+    rigidez = None
+    if metodo is None:
+        rigidez = estimar_rigidez(jacobiano(estado0, t0), tf - t0)
+        metodo = seleccionar_metodo(rigidez, len(estado0))
+
+    opciones = {} if metodo in METODOS_EXPLICITOS else {'jac': lambda t, X: jacobiano(X, t)}
+    solucion = solve_ivp(lambda t, X: campo(X, t), (t0, tf), estado0, method=metodo,
+                         dense_output=True, events=eventos, rtol=rtol, atol=atol, **opciones)
+
+    evento = None
+    if solucion.status == 1:
+        evento = next(i for i, te in enumerate(solucion.t_events) if len(te))
+
+    alcanzado = solucion.t[-1]
+    t = tiempos[(tiempos - alcanzado) * np.sign(tf - t0) <= 0]
+    if len(solucion.t) > 1:
+        X = solucion.sol(t).T
+    else:
+        t, X = tiempos[:1], estado0[None, :]
+
+    info = {
+        'metodo': metodo,
+        'rigidez': rigidez,
+        'pasos': len(solucion.t) - 1,
+        'nfev': int(solucion.nfev),
+        'njev': int(solucion.njev),
+        'nlu': int(solucion.nlu),
+        'exito': solucion.status >= 0,
+        'mensaje': solucion.message,
+        'evento': evento,
+    }
+    return t, X, info
@@ -0,0 +1,491 @@
+"""
+Aritmética de intervalos y búsqueda certificada de equilibrios
+Ramificación y poda con el test de Krawczyk sobre el Jacobiano simbólico
+"""
+
+import numpy as np
+import sympy as sp
+
+
+def _abajo(valores):
+    """Redondeo hacia -inf (un ulp) para mantener la inclusión"""
+    return np.nextafter(valores, -np.inf)
+
+
+def _arriba(valores):
+    """Redondeo hacia +inf (un ulp) para mantener la inclusión"""
+    return np.nextafter(valores, np.inf)
+
+
+class Intervalo:
+    """
+    Intervalo cerrado [lo, hi] con extremos vectorizados
+
+    `lo` y `hi` son arrays de la misma forma, de modo que una sola instancia
+    representa un lote de intervalos (uno por caja) y cada operación procesa
+    todas las cajas a la vez. Los resultados se redondean hacia afuera, por lo
+    que el intervalo calculado siempre contiene al rango real.
+    """
+
+    __slots__ = ('lo', 'hi')
+
+    # Que numpy delegue en los operadores reflejados (ndarray * Intervalo)
+    __array_ufunc__ = None
+
+    def __init__(self, lo, hi=None):
+        self.lo = np.asarray(lo, dtype=float)
+        self.hi = self.lo if hi is None else np.asarray(hi, dtype=float)
+
+    @staticmethod
+    def _como_intervalo(otro):
+        if isinstance(otro, Intervalo):
+            return otro
+        return Intervalo(otro)
+
+    @property
+    def ancho(self):
+        return self.hi - self.lo
+
+    @property
+    def medio(self):
+        return 0.5 * (self.lo + self.hi)
+
+    def contiene_cero(self):
+        return (self.lo <= 0) & (self.hi >= 0)
+
+    def __neg__(self):
+        return Intervalo(-self.hi, -self.lo)
+
+    def __add__(self, otro):
+        otro = self._como_intervalo(otro)
+        return Intervalo(_abajo(self.lo + otro.lo), _arriba(self.hi + otro.hi))
+
+    __radd__ = __add__
+
+    def __sub__(self, otro):
+        otro = self._como_intervalo(otro)
+        return Intervalo(_abajo(self.lo - otro.hi), _arriba(self.hi - otro.lo))
+
+    def __rsub__(self, otro):
+        return self._como_intervalo(otro) - self
+
+    def __mul__(self, otro):
+        otro = self._como_intervalo(otro)
+        productos = np.stack(np.broadcast_arrays(self.lo * otro.lo, self.lo * otro.hi,
+                                                 self.hi * otro.lo, self.hi * otro.hi))
+        # 0 * inf da nan: el producto real es 0
+        productos = np.where(np.isnan(productos), 0.0, productos)
+        return Intervalo(_abajo(productos.min(axis=0)), _arriba(productos.max(axis=0)))
+
+    __rmul__ = __mul__
+
+    def reciproco(self):
+        """1/X; si X contiene al cero el resultado es toda la recta"""
+        con_cero = self.contiene_cero()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            lo = np.where(con_cero, -np.inf, _abajo(1.0 / self.hi))
+            hi = np.where(con_cero, np.inf, _arriba(1.0 / self.lo))
+        return Intervalo(lo, hi)
+
+    def __truediv__(self, otro):
+        return self * self._como_intervalo(otro).reciproco()
+
+    def __rtruediv__(self, otro):
+        return self._como_intervalo(otro) * self.reciproco()
+
+    def potencia_entera(self, n):
+        """X**n para n entero (los pares nunca son negativos)"""
+        if n == 0:
+            return Intervalo(np.ones_like(self.lo))
+        if n < 0:
+            return self.potencia_entera(-n).reciproco()
+
+        with np.errstate(over='ignore'):
+            a, b = self.lo ** n, self.hi ** n
+        if n % 2 == 1:
+            return Intervalo(_abajo(a), _arriba(b))
+
+        hi = np.maximum(a, b)
+        lo = np.where(self.contiene_cero(), 0.0, np.minimum(a, b))
+        return Intervalo(np.maximum(_abajo(lo), 0.0), _arriba(hi))
+
+    def interseccion(self, otro):
+        """Intersección elemento a elemento (lo > hi indica vacío)"""
+        return Intervalo(np.maximum(self.lo, otro.lo), np.minimum(self.hi, otro.hi))
+
+    def __repr__(self):
+        return f"Intervalo({self.lo!r}, {self.hi!r})"
+
+
+# ---------------------------------------------------------------------------
+# Funciones elementales
+# ---------------------------------------------------------------------------
+
+def _monotona_creciente(funcion):
+    def aplicar(x):
+        with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+            return Intervalo(_abajo(funcion(x.lo)), _arriba(funcion(x.hi)))
+    return aplicar
+
+
+def _log(x):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        lo = np.where(x.lo > 0, _abajo(np.log(np.maximum(x.lo, 0))), -np.inf)
+        hi = np.where(x.hi > 0, _arriba(np.log(np.maximum(x.hi, 0))), np.nan)
+    return Intervalo(lo, hi)
+
+
+def _sqrt(x):
+    lo = np.where(x.lo > 0, _abajo(np.sqrt(np.maximum(x.lo, 0))), 0.0)
+    hi = np.where(x.hi >= 0, _arriba(np.sqrt(np.maximum(x.hi, 0))), np.nan)
+    return Intervalo(np.maximum(lo, 0.0), hi)
+
+
+def _contiene_punto_periodico(x, fase, periodo):
+    """True si [lo, hi] contiene algún fase + k·periodo"""
+    k = np.ceil((x.lo - fase) / periodo)
+    return fase + k * periodo <= x.hi
+
+
+def _sin(x):
+    amplio = x.ancho >= 2 * np.pi
+    a, b = np.sin(x.lo), np.sin(x.hi)
+    lo = np.where(_contiene_punto_periodico(x, -np.pi / 2, 2 * np.pi), -1.0,
+                  _abajo(np.minimum(a, b)))
+    hi = np.where(_contiene_punto_periodico(x, np.pi / 2, 2 * np.pi), 1.0,
+                  _arriba(np.maximum(a, b)))
+    return Intervalo(np.where(amplio, -1.0, np.maximum(lo, -1.0)),
+                     np.where(amplio, 1.0, np.minimum(hi, 1.0)))
+
+
+def _cos(x):
+    return _sin(x + np.pi / 2)
+
+
+def _tan(x):
+    polo = (x.ancho >= np.pi) | _contiene_punto_periodico(x, np.pi / 2, np.pi)
+    lo = np.where(polo, -np.inf, _abajo(np.tan(x.lo)))
+    hi = np.where(polo, np.inf, _arriba(np.tan(x.hi)))
+    return Intervalo(lo, hi)
+
+
+def _cosh(x):
+    a, b = np.cosh(x.lo), np.cosh(x.hi)
+    lo = np.where(x.contiene_cero(), 1.0, _abajo(np.minimum(a, b)))
+    return Intervalo(np.maximum(lo, 1.0), _arriba(np.maximum(a, b)))
+
+
+def _abs(x):
+    a, b = np.abs(x.lo), np.abs(x.hi)
+    lo = np.where(x.contiene_cero(), 0.0, np.minimum(a, b))
+    return Intervalo(lo, np.maximum(a, b))
+
+
+FUNCIONES_INTERVALO = {
+    sp.exp: _monotona_creciente(np.exp),
+    sp.log: _log,
+    sp.sin: _sin,
+    sp.cos: _cos,
+    sp.tan: _tan,
+    sp.sinh: _monotona_creciente(np.sinh),
+    sp.cosh: _cosh,
+    sp.tanh: _monotona_creciente(np.tanh),
+    sp.atan: _monotona_creciente(np.arctan),
+    sp.Abs: _abs,
+}
+
+
+def _constante(valor):
+    """Intervalo que encierra una constante simbólica (racional, pi, e...)"""
+    aproximado = float(valor)
+    if valor.is_Integer and abs(aproximado) < 2 ** 53:
+        return Intervalo(aproximado)
+    return Intervalo(_abajo(aproximado), _arriba(aproximado))
+
+
+def evaluar_intervalo(expresion, entorno):
+    """
+    Evalúa una expresión de SymPy en aritmética de intervalos
+
+    Parámetros:
+    - expresion: expresión simbólica
+    - entorno: dict {Symbol: Intervalo} con las variables libres
+
+    Retorna: Intervalo que contiene el rango de la expresión sobre las cajas
+
+    Lanza ValueError si la expresión usa una función sin extensión por intervalos.
+    """
+    if expresion in entorno:
+        return entorno[expresion]
+
+    if expresion.is_Number or expresion.is_NumberSymbol:
+        return _constante(expresion)
+
+    if expresion.is_Add:
+        terminos = [evaluar_intervalo(a, entorno) for a in expresion.args]
+        resultado = terminos[0]
+        for termino in terminos[1:]:
+            resultado = resultado + termino
+        return resultado
+
+    if expresion.is_Mul:
+        factores = [evaluar_intervalo(a, entorno) for a in expresion.args]
+        resultado = factores[0]
+        for factor in factores[1:]:
+            resultado = resultado * factor
+        return resultado
+
+    if expresion.is_Pow:
+        base, exponente = expresion.args
+        if exponente.is_Integer:
+            return evaluar_intervalo(base, entorno).potencia_entera(int(exponente))
+        if exponente == sp.Rational(1, 2):
+            return _sqrt(evaluar_intervalo(base, entorno))
+        if exponente == sp.Rational(-1, 2):
+            return _sqrt(evaluar_intervalo(base, entorno)).reciproco()
+        if base == sp.E:
+            return FUNCIONES_INTERVALO[sp.exp](evaluar_intervalo(exponente, entorno))
+        # Caso general: b**e = exp(e·log b) (definido para b > 0)
+        return FUNCIONES_INTERVALO[sp.exp](
+            evaluar_intervalo(exponente, entorno) * _log(evaluar_intervalo(base, entorno))
+        )
+
+    funcion = FUNCIONES_INTERVALO.get(expresion.func)
+    if funcion is not None and len(expresion.args) == 1:
+        return funcion(evaluar_intervalo(expresion.args[0], entorno))
+
+    raise ValueError(f"Sin extensión por intervalos para: {expresion}")
+
+
+# ---------------------------------------------------------------------------
+# Ramificación y poda con Krawczyk
+# ---------------------------------------------------------------------------
+
+class ResolvedorKrawczyk:
+    """
+    Encuentra todas las raíces de F(x, y) = 0 dentro de una caja
+
+    Se trabaja por niveles: todas las cajas vivas se evalúan juntas (arrays
+    de extremos) y en cada nivel se aplica:
+    1. Poda por rango: si 0 ∉ F(X) la caja no tiene raíces.
+    2. Operador de Krawczyk K(X) = m - Y·F(m) + (I - Y·J(X))·(X - m),
+       con Y ≈ J(m)⁻¹. Si K(X) ∩ X = ∅ no hay raíz; si K(X) ⊂ int(X) hay
+       exactamente una, y se contrae iterando X ← K(X) ∩ X.
+    3. Si no se decide, X ← K(X) ∩ X y se biseca por el lado más ancho.
+
+    Todo lo descartado está probado libre de raíces, por lo que el conjunto
+    devuelto es completo salvo que se agote el presupuesto de cajas.
+    """
+
+    # La bisección no cae en el centro exacto: raíces "redondas" (0, 1, ...)
+    # quedarían siempre sobre una arista y nunca en el interior de una caja
+    FRACCION_BISECCION = 0.4990234375
+
+    def __init__(self, funciones, variables, jacobiano=None):
+        """
+        Parámetros:
+        - funciones: [f1, f2] expresiones de SymPy
+        - variables: (x, y) símbolos
+        - jacobiano: matriz simbólica 2x2 (se deriva si es None)
+        """
+        self.funciones = [sp.sympify(f) for f in funciones]
+        self.variables = tuple(variables)
+        if jacobiano is None:
+            jacobiano = sp.Matrix(self.funciones).jacobian(sp.Matrix(self.variables))
+        self.jacobiano = sp.Matrix(jacobiano)
+
+        # Jacobiano puntual compilado para el precondicionador Y
+        self._jacobiano_num = sp.lambdify(self.variables, self.jacobiano, 'numpy')
+
+        # Validar temprano que todo tiene extensión por intervalos
+        prueba = {v: Intervalo(np.zeros(1), np.ones(1)) for v in self.variables}
+        for expr in list(self.funciones) + list(self.jacobiano):
+            evaluar_intervalo(expr, prueba)
+
+    def _entorno(self, lo, hi):
+        return {v: Intervalo(lo[:, i], hi[:, i]) for i, v in enumerate(self.variables)}
+
+    def evaluar_funciones(self, lo, hi):
+        entorno = self._entorno(lo, hi)
+        n = len(lo)
+        return [self._difundir(evaluar_intervalo(f, entorno), n) for f in self.funciones]
+
+    def evaluar_jacobiano(self, lo, hi):
+        entorno = self._entorno(lo, hi)
+        n = len(lo)
+        return [[self._difundir(evaluar_intervalo(self.jacobiano[i, j], entorno), n)
+                 for j in range(2)] for i in range(2)]
+
+    @staticmethod
+    def _difundir(intervalo, n):
+        """Lleva constantes a arrays de largo n"""
+        return Intervalo(np.broadcast_to(intervalo.lo, (n,)), np.broadcast_to(intervalo.hi, (n,)))
+
+    def _precondicionador(self, medio):
+        """Y ≈ J(m)⁻¹ por caja; None en las filas singulares"""
+        n = len(medio)
+        J = np.empty((n, 2, 2))
+        with np.errstate(all='ignore'):
+            for k in range(n):
+                J[k] = np.asarray(self._jacobiano_num(medio[k, 0], medio[k, 1]), dtype=float)
+        det = J[:, 0, 0] * J[:, 1, 1] - J[:, 0, 1] * J[:, 1, 0]
+        regular = np.isfinite(det) & (np.abs(det) > 1e-14)
+        det_seguro = np.where(regular, det, 1.0)
+        Y = np.empty_like(J)
+        Y[:, 0, 0] = J[:, 1, 1] / det_seguro
+        Y[:, 0, 1] = -J[:, 0, 1] / det_seguro
+        Y[:, 1, 0] = -J[:, 1, 0] / det_seguro
+        Y[:, 1, 1] = J[:, 0, 0] / det_seguro
+        return Y, regular
+
+    def krawczyk(self, lo, hi):
+        """
+        Aplica el operador de Krawczyk a un lote de cajas
+
+        Retorna: (k_lo, k_hi, regular) con K(X) como arrays (N, 2)
+        """
+        medio = 0.5 * (lo + hi)
+        Y, regular = self._precondicionador(medio)
+        F_m = self.evaluar_funciones(medio, medio)
+        J_X = self.evaluar_jacobiano(lo, hi)
+        radio = [Intervalo(lo[:, j] - medio[:, j], hi[:, j] - medio[:, j]) for j in range(2)]
+
+        k_lo = np.empty_like(lo)
+        k_hi = np.empty_like(hi)
+        for i in range(2):
+            # m_i - (Y·F(m))_i
+            termino = medio[:, i] - (Y[:, i, 0] * F_m[0] + Y[:, i, 1] * F_m[1])
+            for j in range(2):
+                # (I - Y·J(X))_ij
+                coef = Y[:, i, 0] * J_X[0][j] + Y[:, i, 1] * J_X[1][j]
+                coef = (1.0 if i == j else 0.0) - coef
+                termino = termino + coef * radio[j]
+            k_lo[:, i] = termino.lo
+            k_hi[:, i] = termino.hi
+
+        invalido = np.isnan(k_lo) | np.isnan(k_hi)
+        k_lo[invalido] = -np.inf
+        k_hi[invalido] = np.inf
+        return k_lo, k_hi, regular
+
+    def resolver(self, xlim, ylim, tolerancia=1e-10, ancho_minimo=1e-6, max_cajas=100000,
+                 max_contracciones=60):
+        """
+        Busca todas las raíces en [xlim] × [ylim]
+
+        Parámetros:
+        - xlim, ylim: caja de búsqueda
+        - tolerancia: ancho objetivo de las cajas certificadas
+        - ancho_minimo: cajas no resueltas por debajo de este ancho se
+          reportan como candidatas (raíces múltiples o no aisladas)
+        - max_cajas: presupuesto total de cajas procesadas
+
+        Retorna: dict con
+        - 'raices': lista de dicts {'punto', 'caja', 'unico'}
+        - 'completo': True si se exploró toda la caja dentro del presupuesto
+        - 'cajas_procesadas': cantidad de cajas evaluadas
+        """
+        lo = np.array([[xlim[0], ylim[0]]], dtype=float)
+        hi = np.array([[xlim[1], ylim[1]]], dtype=float)
+        certificadas = []
+        candidatas = []
+        procesadas = 0
+
+        with np.errstate(all='ignore'):
+            while len(lo) and procesadas < max_cajas:
+                procesadas += len(lo)
+
+                # 1. Poda por rango
+                F = self.evaluar_funciones(lo, hi)
+                vivas = F[0].contiene_cero() & F[1].contiene_cero()
+                lo, hi = lo[vivas], hi[vivas]
+                if not len(lo):
+                    break
+
+                # 2. Krawczyk
+                k_lo, k_hi, regular = self.krawczyk(lo, hi)
+                n_lo, n_hi = np.maximum(lo, k_lo), np.minimum(hi, k_hi)
+                vacias = np.any(n_lo > n_hi, axis=1)
+                interior = regular & np.all((k_lo > lo) & (k_hi < hi), axis=1)
+
+                for k in np.flatnonzero(interior & ~vacias):
+                    certificadas.append(self._contraer(k_lo[k], k_hi[k], tolerancia,
+                                                       max_contracciones))
+
+                pendientes = ~vacias & ~interior
+                n_lo, n_hi = n_lo[pendientes], n_hi[pendientes]
+
+                # 3. Cajas diminutas sin decidir: candidatas
+                anchos = n_hi - n_lo
+                diminutas = np.all(anchos < ancho_minimo, axis=1)
+                for k in np.flatnonzero(diminutas):
+                    candidatas.append((n_lo[k].copy(), n_hi[k].copy()))
+                n_lo, n_hi, anchos = n_lo[~diminutas], n_hi[~diminutas], anchos[~diminutas]
+
+                # Bisección por el lado más ancho
+                eje = np.argmax(anchos, axis=1)
+                filas = np.arange(len(n_lo))
+                corte = n_lo[filas, eje] + self.FRACCION_BISECCION * anchos[filas, eje]
+                izq_hi = n_hi.copy()
+                izq_hi[filas, eje] = corte
+                der_lo = n_lo.copy()
+                der_lo[filas, eje] = corte
+                lo = np.vstack([n_lo, der_lo])
+                hi = np.vstack([izq_hi, n_hi])
+
+        completo = len(lo) == 0
+        raices = [self._formatear(c_lo, c_hi, True) for c_lo, c_hi in self._fusionar(certificadas)]
+        for c_lo, c_hi in self._fusionar(candidatas):
+            raices.append(self._verificar_candidata(c_lo, c_hi, tolerancia, max_contracciones))
+        raices.sort(key=lambda r: r['punto'])
+        return {'raices': raices, 'completo': completo, 'cajas_procesadas': procesadas}
+
+    def _contraer(self, lo, hi, tolerancia, max_iter):
+        """Itera X ← K(X) ∩ X sobre una caja ya certificada"""
+        lo, hi = lo[None, :].copy(), hi[None, :].copy()
+        for _ in range(max_iter):
+            if np.all(hi - lo < tolerancia):
+                break
+            k_lo, k_hi, _ = self.krawczyk(lo, hi)
+            nuevo_lo, nuevo_hi = np.maximum(lo, k_lo), np.minimum(hi, k_hi)
+            if np.all(nuevo_lo == lo) and np.all(nuevo_hi == hi):
+                break
+            lo, hi = nuevo_lo, nuevo_hi
+        return lo[0], hi[0]
+
+    def _verificar_candidata(self, lo, hi, tolerancia, max_iter):
+        """
+        Inflación épsilon: si la caja ampliada pasa el test de Krawczyk la raíz
+        queda certificada como única; si no (raíz múltiple), se reporta tal cual
+        """
+        medio = 0.5 * (lo + hi)
+        radio = np.maximum(10 * (hi - lo), 1e-9 * np.maximum(np.abs(medio), 1.0))
+        a_lo, a_hi = (medio - radio)[None, :], (medio + radio)[None, :]
+        with np.errstate(all='ignore'):
+            k_lo, k_hi, regular = self.krawczyk(a_lo, a_hi)
+            if regular[0] and np.all((k_lo > a_lo) & (k_hi < a_hi)):
+                return self._formatear(*self._contraer(k_lo[0], k_hi[0], tolerancia, max_iter), True)
+        return self._formatear(lo, hi, False)
+
+    @staticmethod
+    def _fusionar(cajas):
+        """Une cajas que se tocan (la misma raíz puede quedar en una arista)"""
+        grupos = []
+        for c_lo, c_hi in cajas:
+            for grupo in grupos:
+                if np.all(c_lo <= grupo[1]) and np.all(c_hi >= grupo[0]):
+                    grupo[0] = np.minimum(grupo[0], c_lo)
+                    grupo[1] = np.maximum(grupo[1], c_hi)
+                    break
+            else:
+                grupos.append([np.array(c_lo), np.array(c_hi)])
+        return grupos
+
+    @staticmethod
+    def _formatear(lo, hi, unico):
+        punto = 0.5 * (lo + hi)
+        return {
+            'punto': (float(punto[0]), float(punto[1])),
+            'caja': ((float(lo[0]), float(hi[0])), (float(lo[1]), float(hi[1]))),
+            'unico': unico
+        }
@@ -0,0 +1,167 @@
+"""
+Estimación del mayor exponente de Lyapunov
+Dinámica tangente integrada junto con el estado y renormalización periódica
+"""
+
+import numpy as np
+from core.integradores import paso_rk4, integrar_rk4
+
+
+class EstimadorLyapunov:
+    """
+    Mayor exponente de Lyapunov de un SistemaDinamico2D (autónomo o forzado)
+
+    Cada miembro del conjunto integra el estado x y un vector tangente w:
+
+        x' = f(x, t),   w' = J(x, t) · w
+
+    con RK4 de paso fijo; el campo y el Jacobiano compilados se evalúan una
+    vez por etapa para todo el conjunto. Cada `cada` pasos se acumula
+    log|w| y se renormaliza w, de modo que
+
+        λ ≈ (1 / T) Σ log|w_k|
+
+    Los parámetros del sistema pueden darse como arrays (uno por miembro),
+    lo que permite calcular mapas de λ sobre mallas de parámetros en un
+    único lote.
+    """
+
+    def __init__(self, sistema, dt=0.01, cada=10):
+        """
+        Parámetros:
+        - sistema: SistemaDinamico2D (lineal o con funciones personalizadas)
+        - dt: paso de integración
+        - cada: pasos entre renormalizaciones del vector tangente
+        """
+        if dt <= 0 or cada < 1:
+            raise ValueError("dt debe ser positivo y cada al menos 1")
+        self.sistema = sistema
+        self.dt = float(dt)
+        self.cada = int(cada)
+
+    def _derivadas(self, campo, jacobiano):
+        """f(t, Z) del sistema aumentado con Z = [x, y, w1, w2] de forma (N, 4)"""
+
+        def f(t, Z):
+            X, W = Z[:, :2], Z[:, 2:]
+            J = jacobiano(X, t)
+            derivada = np.empty(Z.shape)
+            derivada[:, :2] = campo(X, t)
+            derivada[:, 2] = J[:, 0, 0] * W[:, 0] + J[:, 0, 1] * W[:, 1]
+            derivada[:, 3] = J[:, 1, 0] * W[:, 0] + J[:, 1, 1] * W[:, 1]
+            return derivada
+
+        return f
+
+    def estimar(self, semillas, t_total=200.0, t_transitorio=50.0, parametros=None,
+                semilla_aleatoria=0, n_lotes=20, tolerancia=0.01):
+        """
+        Estima λ para un conjunto de condiciones iniciales
+
+        Parámetros:
+        - semillas: array (N, 2) de condiciones iniciales
+        - t_total: tiempo de promediado (después del transitorio)
+        - t_transitorio: tiempo que se integra solo el estado antes de medir
+        - parametros: dict opcional de parámetros (escalares o arrays de largo N)
+        - semilla_aleatoria: semilla del generador de vectores tangentes iniciales
+        - n_lotes: lotes en que se divide T para estimar el error (medias por lotes)
+        - tolerancia: error estándar absoluto aceptado cuando λ ≈ 0
+
+        Retorna: dict con
+        - 'exponentes': array (N,) con la estimación final (NaN si diverge)
+        - 'media', 'desviacion': estadísticos sobre los miembros finitos
+        - 'tiempos': array (K,) instantes de renormalización (desde el fin del transitorio)
+        - 'historia': array (K, N) con la estimación acumulada en cada instante
+        - 'error_estandar': array (N,) error de λ por medias de lotes: los
+          exponentes de tiempo finito de cada lote se tratan como muestras
+        - 'convergido': array (N,) bool, error < max(5 % de |λ|, tolerancia)
+        - 'estados_finales': array (N, 2)
+        """
+        X = np.array(semillas, dtype=float).reshape(-1, 2)
+        n = len(X)
+
+        campo, jacobiano = self.sistema.compilar_funciones_lote(parametros)
+        n_transitorio = int(round(t_transitorio / self.dt))
+        t, X = integrar_rk4(lambda t, X: campo(X, t), 0.0, X, self.dt, n_transitorio)
+
+        generador = np.random.default_rng(semilla_aleatoria)
+        W = generador.normal(size=(n, 2))
+        W /= np.linalg.norm(W, axis=1, keepdims=True)
+        Z = np.column_stack([X, W])
+
+        f = self._derivadas(campo, jacobiano)
+        n_bloques = max(n_lotes, int(round(t_total / (self.dt * self.cada))))
+        suma_log = np.zeros(n)
+        historia = np.empty((n_bloques, n))
+        logaritmos = np.empty((n_bloques, n))
+        tiempos = np.arange(1, n_bloques + 1) * self.dt * self.cada
+
+        with np.errstate(all='ignore'):
+            for k in range(n_bloques):
+                for _ in range(self.cada):
+                    Z = paso_rk4(f, t, Z, self.dt)
+                    t += self.dt
+                normas = np.linalg.norm(Z[:, 2:], axis=1)
+                logaritmos[k] = np.log(normas)
+                suma_log += logaritmos[k]
+                Z[:, 2:] /= normas[:, None]
+                historia[k] = suma_log / tiempos[k]
+
+        exponentes = historia[-1].copy()
+        finitos = np.isfinite(exponentes) & np.all(np.isfinite(Z), axis=1)
+        exponentes[~finitos] = np.nan
+
+        # Medias por lotes: exponente de tiempo finito de cada tramo de T
+        duracion = self.dt * self.cada
+        with np.errstate(all='ignore'):
+            locales = np.array([tramo.sum(axis=0) / (len(tramo) * duracion)
+                                for tramo in np.array_split(logaritmos, n_lotes)])
+            error = np.std(locales, axis=0, ddof=1) / np.sqrt(n_lotes)
+        convergido = finitos & (error < np.maximum(0.05 * np.abs(exponentes), tolerancia))
+
+        validos = exponentes[finitos]
+        return {
+            'exponentes': exponentes,
+            'media': float(np.mean(validos)) if validos.size else float('nan'),
+            'desviacion': float(np.std(validos)) if validos.size else float('nan'),
+            'tiempos': tiempos,
+            'historia': historia,
+            'error_estandar': error,
+            'convergido': convergido,
+            'estados_finales': Z[:, :2]
+        }
+
+    def mapa(self, semilla, parametro_x, valores_x, parametro_y=None, valores_y=None, **opciones):
+        """
+        λ sobre una malla de uno o dos parámetros, integrada como un solo conjunto
+
+        Parámetros:
+        - semilla: condición inicial común (x, y)
+        - parametro_x, valores_x: nombre y valores del parámetro horizontal
+        - parametro_y, valores_y: idem para el vertical (opcional)
+        - **opciones: se pasan a estimar (t_total, t_transitorio, ...)
+
+        Retorna: dict con 'x', 'y' (o None), 'exponentes' de forma (ny, nx) o (nx,)
+        y 'convergido' con la misma forma
+        """
+        valores_x = np.asarray(valores_x, dtype=float)
+        if parametro_y is None:
+            parametros = {parametro_x: valores_x}
+            forma = valores_x.shape
+        else:
+            valores_y = np.asarray(valores_y, dtype=float)
+            PX, PY = np.meshgrid(valores_x, valores_y)
+            parametros = {parametro_x: PX.ravel(), parametro_y: PY.ravel()}
+            forma = PX.shape
+
+        n = int(np.prod(forma))
+        semillas = np.tile(np.asarray(semilla, dtype=float), (n, 1))
+        resultado = self.estimar(semillas, parametros=parametros, **opciones)
+        return {
+            'x': valores_x,
+            'y': valores_y if parametro_y is not None else None,
+            'parametro_x': parametro_x,
+            'parametro_y': parametro_y,
+            'exponentes': resultado['exponentes'].reshape(forma),
+            'convergido': resultado['convergido'].reshape(forma)
+        }
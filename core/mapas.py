@@ -0,0 +1,165 @@
+"""
+Análisis de mapas discretos 1D x_{n+1} = g(x_n, r)
+Diagramas de órbitas vectorizados en r y diagramas de telaraña (cobweb)
+"""
+
+import sympy as sp
+import numpy as np
+from typing import Dict, Tuple
+from core.densidad import HistogramaDensidad
+
+
+class AnalizadorMapa:
+    """
+    Clase para analizar mapas discretos x_{n+1} = g(x_n, r)
+
+    El diagrama de órbitas itera a la vez miles de valores de r como un
+    único vector de numpy: tras descartar el transitorio, cada bloque de
+    iteraciones se vuelca en un HistogramaDensidad, así que 10⁷ puntos
+    ocupan solo la memoria de la imagen.
+    """
+
+    def __init__(self, function_str: str):
+        """
+        Inicializa el analizador con un mapa g(x, r)
+
+        Args:
+            function_str: String del mapa, ej: "r*x*(1 - x)"
+        """
+        self.x = sp.Symbol('x', real=True)
+        self.r = sp.Symbol('r', real=True)
+
+        try:
+            local_dict = {'x': self.x, 'r': self.r, 'min': sp.Min, 'max': sp.Max, 'abs': sp.Abs}
+            self.g = sp.sympify(function_str, locals=local_dict)
+        except Exception as e:
+            raise ValueError(f"Error al parsear el mapa: {e}")
+
+        desconocidos = self.g.free_symbols - {self.x, self.r}
+        if desconocidos:
+            nombres = ', '.join(sorted(str(s) for s in desconocidos))
+            raise ValueError(f"Símbolos no reconocidos en el mapa: {nombres}")
+
+        self.dg_dx = sp.diff(self.g, self.x)
+        self.g_lambda = sp.lambdify((self.x, self.r), self.g, 'numpy')
+        self.dg_lambda = sp.lambdify((self.x, self.r), self.dg_dx, 'numpy')
+
+    def evaluar(self, x_vals, r_vals) -> np.ndarray:
+        """
+        Evalúa g(x, r) con broadcasting de numpy
+
+        Args:
+            x_vals, r_vals: Escalares o arrays compatibles
+
+        Returns:
+            Array con la forma del broadcast de los argumentos
+        """
+        x_vals, r_vals = np.broadcast_arrays(np.asarray(x_vals, dtype=float),
+                                             np.asarray(r_vals, dtype=float))
+        with np.errstate(all='ignore'):
+            return np.broadcast_to(self.g_lambda(x_vals, r_vals), x_vals.shape).astype(float)
+
+    def iterar(self, x0, r_vals, n_iteraciones: int) -> np.ndarray:
+        """
+        Órbita completa desde x0
+
+        Args:
+            x0: Condición inicial (escalar o array compatible con r_vals)
+            r_vals: Valor del parámetro (escalar o array)
+            n_iteraciones: Número de iteraciones
+
+        Returns:
+            Array (n_iteraciones + 1, *forma) con x_0, x_1, ..., x_n
+        """
+        x = np.broadcast_to(np.asarray(x0, dtype=float), np.broadcast(x0, r_vals).shape).copy()
+        orbita = np.empty((n_iteraciones + 1,) + x.shape)
+        orbita[0] = x
+        for n in range(1, n_iteraciones + 1):
+            x = self.evaluar(x, r_vals)
+            orbita[n] = x
+        return orbita
+
+    def _descartar_transitorio(self, x, r_vals, n_transitorio):
+        for _ in range(n_transitorio):
+            x = self.evaluar(x, r_vals)
+        return x
+
+    def diagrama_orbitas(self, r_range: Tuple[float, float], x_range: Tuple[float, float] = None,
+                         n_r: int = 2000, n_transitorio: int = 1000, n_iteraciones: int = 5000,
+                         resolucion_x: int = 800, x0: float = 0.5, bloque: int = 128) -> Dict:
+        """
+        Diagrama de órbitas rasterizado en una imagen de densidad
+
+        Args:
+            r_range: Rango de r (r_min, r_max)
+            x_range: Rango de x de la imagen (por defecto, el que ocupa el atractor)
+            n_r: Número de valores de r (una columna de píxeles por valor)
+            n_transitorio: Iteraciones descartadas antes de acumular
+            n_iteraciones: Iteraciones acumuladas por valor de r
+            resolucion_x: Píxeles en el eje x
+            x0: Condición inicial común
+            bloque: Iteraciones que se acumulan en cada volcado al histograma
+
+        Returns:
+            Diccionario con:
+            - 'histograma': HistogramaDensidad con r en el eje horizontal
+            - 'r': valores de r
+            - 'divergentes': máscara de los r cuya órbita escapó a infinito
+        """
+        r_vals = np.linspace(r_range[0], r_range[1], n_r)
+        x = self._descartar_transitorio(np.full(n_r, float(x0)), r_vals, n_transitorio)
+
+        lote = np.empty((bloque, n_r))
+        pendientes = n_iteraciones
+        histograma = None
+        if x_range is not None:
+            histograma = self._crear_histograma(r_vals, x_range, resolucion_x)
+
+        while pendientes > 0:
+            k = min(bloque, pendientes)
+            for i in range(k):
+                x = self.evaluar(x, r_vals)
+                lote[i] = x
+            if histograma is None:
+                # Los límites se toman del primer bloque del atractor
+                histograma = self._crear_histograma(r_vals, self._rango_atractor(lote[:k]),
+                                                    resolucion_x)
+            histograma.agregar(np.broadcast_to(r_vals, (k, n_r)), lote[:k])
+            pendientes -= k
+
+        return {'histograma': histograma, 'r': r_vals, 'divergentes': ~np.isfinite(x)}
+
+    @staticmethod
+    def _crear_histograma(r_vals, x_range, resolucion_x):
+        """Histograma con una columna centrada en cada valor de r"""
+        medio_paso = 0.5 * (r_vals[-1] - r_vals[0]) / max(len(r_vals) - 1, 1) or 0.5
+        return HistogramaDensidad((r_vals[0] - medio_paso, r_vals[-1] + medio_paso), x_range,
+                                  (len(r_vals), resolucion_x))
+
+    @staticmethod
+    def _rango_atractor(lote, margen=0.05):
+        finitos = lote[np.isfinite(lote)]
+        if finitos.size == 0:
+            return (-1.0, 1.0)
+        minimo, maximo = np.percentile(finitos, [0.1, 99.9])
+        ancho = maximo - minimo or max(abs(maximo), 1.0)
+        return (minimo - margen * ancho, maximo + margen * ancho)
+
+    def cobweb(self, r_value: float, x0: float, n_iteraciones: int = 100) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Poligonal del diagrama de telaraña
+
+        Recorre (x0, 0) → (x0, x1) → (x1, x1) → (x1, x2) → ...
+
+        Args:
+            r_value: Valor del parámetro
+            x0: Condición inicial
+            n_iteraciones: Número de iteraciones
+
+        Returns:
+            Tupla (xs, ys) lista para un único plot
+        """
+        orbita = self.iterar(x0, r_value, n_iteraciones)
+        xs = np.repeat(orbita, 2)[:-1]
+        ys = np.concatenate([[0.0], np.repeat(orbita[1:], 2)])
+        return xs, ys
@@ -0,0 +1,276 @@
+"""
+Continuación de órbitas periódicas en un parámetro
+Disparo (shooting) + Newton con matriz de monodromía y arranque en caliente
+"""
+
+import numpy as np
+from scipy.integrate import odeint
+
+
+class ContinuacionOrbitas:
+    """
+    Sigue una familia de ciclos límite de un SistemaDinamico2D al variar un parámetro
+
+    Cada órbita se representa por un punto x0 sobre ella y su período T.
+    Se resuelve con Newton el sistema
+
+        φ_T(x0) - x0 = 0
+        (x0 - x_ref) · f(x_ref) = 0     (condición de fase)
+
+    donde la derivada de φ_T respecto de x0 es la matriz de monodromía M,
+    obtenida integrando las ecuaciones variacionales junto con la órbita.
+    Los autovalores de M son los multiplicadores de Floquet (uno es siempre 1).
+
+    El primer ciclo se obtiene en frío (transitorio + estimación del período);
+    los siguientes parten de una extrapolación secante de los dos anteriores,
+    por lo que cada paso suele converger en 2-3 iteraciones de Newton.
+    """
+
+    MAX_PASOS_INTEGRADOR = 100000
+
+    def __init__(self, sistema, parametro='u', rtol=1e-9, atol=1e-11):
+        """
+        Parámetros:
+        - sistema: SistemaDinamico2D personalizado y autónomo
+        - parametro: nombre del parámetro a variar (debe existir en sistema.parametros)
+        - rtol, atol: tolerancias de integración
+        """
+        if not sistema.funcion_personalizada or sistema.f1_sym is None:
+            raise ValueError("La continuación requiere un sistema con funciones personalizadas")
+        if parametro not in sistema.parametros:
+            raise ValueError(f"El sistema no tiene el parámetro '{parametro}'")
+        if sistema.t_sym in (sistema.f1_sym.free_symbols | sistema.f2_sym.free_symbols):
+            raise ValueError("La continuación de órbitas requiere un sistema autónomo")
+
+        self.sistema = sistema
+        self.parametro = parametro
+        self.rtol = rtol
+        self.atol = atol
+        self._compiladas = {}
+
+    # ------------------------------------------------------------------
+    # Evaluación del flujo
+    # ------------------------------------------------------------------
+
+    def _funciones(self, valor):
+        """(f, J) compiladas para un valor del parámetro (se reutilizan entre llamadas)"""
+        if valor not in self._compiladas:
+            if len(self._compiladas) > 8:
+                self._compiladas.clear()
+            self._compiladas[valor] = self.sistema.compilar_funciones({self.parametro: valor})
+        return self._compiladas[valor]
+
+    def campo(self, x, valor):
+        return self._funciones(valor)[0](x, 0)
+
+    def _integrar(self, rhs, estado0, tiempos):
+        return odeint(rhs, estado0, tiempos, rtol=self.rtol, atol=self.atol,
+                      mxstep=self.MAX_PASOS_INTEGRADOR)
+
+    def flujo_con_monodromia(self, x0, periodo, valor):
+        """
+        Integra la órbita y las ecuaciones variacionales sobre un período
+
+        Retorna: (x(T), M) con M = ∂φ_T/∂x0
+        """
+        f, J = self._funciones(valor)
+
+        def rhs_variacional(estado, t):
+            # d/dt [x, Φ] = [f(x), J(x)·Φ]
+            x = estado[:2]
+            phi = estado[2:].reshape(2, 2)
+            return np.concatenate([f(x, t), (J(x, t) @ phi).ravel()])
+
+        estado0 = np.concatenate([x0, np.eye(2).ravel()])
+        estado = self._integrar(rhs_variacional, estado0, [0.0, periodo])[-1]
+        return estado[:2], estado[2:].reshape(2, 2)
+
+    # ------------------------------------------------------------------
+    # Resolución de una órbita
+    # ------------------------------------------------------------------
+
+    def estimar_orbita(self, valor, semilla, t_transitorio=200.0, t_muestreo=100.0,
+                       n_muestras=20000):
+        """
+        Arranque en frío: integra hasta el atractor y estima x0 y el período
+
+        Solo encuentra ciclos estables (los que atraen a la semilla).
+
+        Retorna: (x0, T) o None si no se detecta oscilación
+        """
+        f = self._funciones(valor)[0]
+        x = self._integrar(f, np.asarray(semilla, dtype=float), [0.0, t_transitorio])[-1]
+
+        t = np.linspace(0, t_muestreo, n_muestras)
+        muestras = self._integrar(f, x, t)
+        if not np.all(np.isfinite(muestras)):
+            return None
+
+        # Sección: recta por el punto final, normal al flujo en ese punto
+        x_ref = muestras[-1]
+        normal = self.campo(x_ref, valor)
+        if np.hypot(*normal) < 1e-10:
+            return None
+        distancia = (muestras - x_ref) @ normal
+        cruces = np.flatnonzero((distancia[:-1] < 0) & (distancia[1:] >= 0))
+        if len(cruces) < 3:
+            return None
+
+        # Interpolación lineal del instante de cruce
+        fraccion = -distancia[cruces] / (distancia[cruces + 1] - distancia[cruces])
+        tiempos = t[cruces] + fraccion * (t[1] - t[0])
+        periodo = float(np.median(np.diff(tiempos[-3:])))
+        return x_ref, periodo
+
+    def corregir(self, x0, periodo, valor, x_ref=None, tolerancia=1e-9, max_iter=12):
+        """
+        Newton sobre (x0, T) para un valor fijo del parámetro
+
+        Parámetros:
+        - x0, periodo: aproximación inicial
+        - valor: valor del parámetro
+        - x_ref: punto de la sección (por defecto x0)
+
+        Retorna: dict con la órbita o None si Newton no converge
+        """
+        x0 = np.asarray(x0, dtype=float).copy()
+        x_ref = x0.copy() if x_ref is None else np.asarray(x_ref, dtype=float)
+        normal = self.campo(x_ref, valor)
+        norma = np.hypot(*normal)
+        if norma < 1e-12 or periodo <= 0:
+            return None
+        normal = normal / norma
+
+        for iteracion in range(1, max_iter + 1):
+            try:
+                xT, M = self.flujo_con_monodromia(x0, periodo, valor)
+            except Exception:
+                return None
+            residuo = np.append(xT - x0, (x0 - x_ref) @ normal)
+            if not np.all(np.isfinite(residuo)):
+                return None
+
+            jacobiano = np.zeros((3, 3))
+            jacobiano[:2, :2] = M - np.eye(2)
+            jacobiano[:2, 2] = self.campo(xT, valor)
+            jacobiano[2, :2] = normal
+            try:
+                paso = np.linalg.solve(jacobiano, -residuo)
+            except np.linalg.LinAlgError:
+                return None
+
+            x0 += paso[:2]
+            periodo += paso[2]
+            if periodo <= 0:
+                return None
+            if np.max(np.abs(paso)) < tolerancia * max(1.0, np.max(np.abs(x0))):
+                return self._describir(x0, periodo, valor, iteracion, M)
+
+        return None
+
+    def _describir(self, x0, periodo, valor, iteraciones, M, n_muestras=400):
+        """Período, amplitud y multiplicadores de Floquet de una órbita convergida"""
+        multiplicadores = np.linalg.eigvals(M)
+        # El multiplicador trivial es el más cercano a 1
+        orden = np.argsort(np.abs(multiplicadores - 1))
+        multiplicadores = multiplicadores[orden]
+
+        orbita = self._integrar(self._funciones(valor)[0], x0, np.linspace(0, periodo, n_muestras))
+        amplitud = 0.5 * (orbita.max(axis=0) - orbita.min(axis=0))
+
+        return {
+            'parametro': float(valor),
+            'x0': x0.copy(),
+            'periodo': float(periodo),
+            'amplitud': (float(amplitud[0]), float(amplitud[1])),
+            'multiplicadores': multiplicadores,
+            'estable': bool(np.abs(multiplicadores[1]) < 1),
+            'iteraciones': iteraciones,
+            'orbita': orbita
+        }
+
+    # ------------------------------------------------------------------
+    # Continuación
+    # ------------------------------------------------------------------
+
+    def continuar(self, valor_inicial, valor_final, semilla=None, orbita_inicial=None,
+                  paso_inicial=None, paso_minimo=None, paso_maximo=None,
+                  amplitud_minima=1e-4, periodo_maximo=1e3, max_pasos=500):
+        """
+        Sigue la familia de ciclos desde valor_inicial hacia valor_final
+
+        Parámetros:
+        - valor_inicial, valor_final: rango del parámetro
+        - semilla: punto inicial para el arranque en frío
+        - orbita_inicial: (x0, T) conocida (evita el arranque en frío)
+        - paso_inicial, paso_minimo, paso_maximo: control adaptativo del paso
+        - amplitud_minima: por debajo se considera que el ciclo colapsó (Hopf)
+        - periodo_maximo: por encima se considera una órbita homoclínica
+
+        Retorna: dict con
+        - 'rama': lista de órbitas (ver corregir)
+        - 'motivo_fin': 'completado', 'colapso', 'periodo_divergente' o 'sin_convergencia'
+        """
+        rango = valor_final - valor_inicial
+        signo = 1.0 if rango >= 0 else -1.0
+        paso_inicial = paso_inicial or abs(rango) / 50 or 1e-2
+        paso_minimo = paso_minimo or paso_inicial / 64
+        paso_maximo = paso_maximo or paso_inicial * 4
+
+        if orbita_inicial is None:
+            if semilla is None:
+                raise ValueError("Se necesita una semilla o una órbita inicial")
+            orbita_inicial = self.estimar_orbita(valor_inicial, semilla)
+            if orbita_inicial is None:
+                return {'rama': [], 'motivo_fin': 'sin_convergencia'}
+
+        actual = self.corregir(orbita_inicial[0], orbita_inicial[1], valor_inicial)
+        if actual is None:
+            return {'rama': [], 'motivo_fin': 'sin_convergencia'}
+
+        rama = [actual]
+        paso = paso_inicial
+        motivo = 'completado'
+
+        for _ in range(max_pasos):
+            restante = (valor_final - actual['parametro']) * signo
+            if restante <= 1e-12:
+                break
+            h = min(paso, restante)
+            valor = actual['parametro'] + signo * h
+
+            # Predictor: secante con las dos últimas órbitas (o la última tal cual)
+            x_pred, T_pred = actual['x0'], actual['periodo']
+            if len(rama) >= 2:
+                anterior = rama[-2]
+                escala = (valor - actual['parametro']) / (actual['parametro'] - anterior['parametro'])
+                x_pred = actual['x0'] + escala * (actual['x0'] - anterior['x0'])
+                T_pred = actual['periodo'] + escala * (actual['periodo'] - anterior['periodo'])
+
+            siguiente = self.corregir(x_pred, T_pred, valor, x_ref=actual['x0'])
+            if siguiente is None and len(rama) >= 2:
+                siguiente = self.corregir(actual['x0'], actual['periodo'], valor)
+
+            if siguiente is None:
+                paso /= 2
+                if paso < paso_minimo:
+                    # Un ciclo que se achica hasta desaparecer es una Hopf, no un fallo
+                    amplitud_maxima = max(max(o['amplitud']) for o in rama)
+                    pequeño = max(actual['amplitud']) < 0.05 * amplitud_maxima
+                    motivo = 'colapso' if pequeño else 'sin_convergencia'
+                    break
+                continue
+
+            rama.append(siguiente)
+            actual = siguiente
+            if siguiente['iteraciones'] <= 3:
+                paso = min(paso * 1.5, paso_maximo)
+
+            if max(siguiente['amplitud']) < amplitud_minima:
+                motivo = 'colapso'
+                break
+            if siguiente['periodo'] > periodo_maximo:
+                motivo = 'periodo_divergente'
+                break
+
+        return {'rama': rama, 'motivo_fin': motivo}
@@ -0,0 +1,121 @@
+"""
+Mapa de Poincaré estroboscópico para sistemas con forzado periódico
+Muestrea el estado cada período T = 2π/ω de muchas semillas integradas juntas
+"""
+
+import numpy as np
+from core.integradores import paso_rk4
+from core.densidad import HistogramaDensidad
+
+
+class MapaPoincare:
+    """
+    Sección estroboscópica P: x(t0) ↦ x(t0 + T) de un SistemaDinamico2D
+
+    Todas las semillas avanzan como un único array (N, 2) con RK4 de paso
+    fijo T / pasos_por_periodo, de modo que cada muestra cae exactamente en
+    t0 + k·T. Solo se guardan los estados muestreados, en un array
+    preasignado, o se vuelcan directamente en un HistogramaDensidad cuando
+    el número de puntos es de millones.
+    """
+
+    def __init__(self, sistema, periodo=None, pasos_por_periodo=64):
+        """
+        Parámetros:
+        - sistema: SistemaDinamico2D
+        - periodo: período del forzado; por defecto 2π/param si el forzado
+          es seno o coseno (obligatorio en otro caso)
+        - pasos_por_periodo: pasos de RK4 por período
+        """
+        if periodo is None:
+            periodo = self.periodo_forzado(sistema)
+            if periodo is None:
+                raise ValueError("Indique el período: el sistema no tiene forzado seno/coseno")
+        if periodo <= 0 or pasos_por_periodo < 1:
+            raise ValueError("El período y los pasos por período deben ser positivos")
+
+        self.sistema = sistema
+        self.periodo = float(periodo)
+        self.pasos_por_periodo = int(pasos_por_periodo)
+        self.dt = self.periodo / self.pasos_por_periodo
+
+    @staticmethod
+    def periodo_forzado(sistema):
+        """2π/ω para forzado seno o coseno con frecuencia ω = param; None en otro caso"""
+        forzado = sistema.termino_forzado
+        if not forzado or forzado.get('tipo') not in ('seno', 'coseno'):
+            return None
+        omega = abs(float(forzado.get('param', 0)))
+        return 2 * np.pi / omega if omega > 0 else None
+
+    def iterar_bloques(self, semillas, n_periodos, n_transitorio=0, fase=0.0, bloque=50):
+        """
+        Generador de bloques de muestras estroboscópicas
+
+        Parámetros:
+        - semillas: array (N, 2) de condiciones iniciales en t = fase
+        - n_periodos: número de muestras por semilla (después del transitorio)
+        - n_transitorio: períodos descartados al inicio
+        - fase: instante t0 de la sección (en unidades de tiempo)
+        - bloque: períodos por bloque entregado
+
+        Produce: arrays (k, N, 2) con k ≤ bloque (reutilizan el mismo buffer)
+        """
+        campo = self.sistema.compilar_funciones_lote()[0]
+        f = lambda t, X: campo(X, t)
+        X = np.array(semillas, dtype=float).reshape(-1, 2)
+        buffer = np.empty((bloque,) + X.shape)
+        t = float(fase)
+
+        with np.errstate(all='ignore'):
+            for _ in range(n_transitorio):
+                for _ in range(self.pasos_por_periodo):
+                    X = paso_rk4(f, t, X, self.dt)
+                    t += self.dt
+
+            pendientes = n_periodos
+            while pendientes > 0:
+                k = min(bloque, pendientes)
+                for i in range(k):
+                    for _ in range(self.pasos_por_periodo):
+                        X = paso_rk4(f, t, X, self.dt)
+                        t += self.dt
+                    buffer[i] = X
+                pendientes -= k
+                yield buffer[:k]
+
+    def calcular(self, semillas, n_periodos, n_transitorio=0, fase=0.0):
+        """
+        Todas las muestras en un array preasignado
+
+        Retorna: dict con
+        - 'puntos': array (n_periodos, N, 2)
+        - 'periodo': T
+        - 'divergentes': máscara (N,) de semillas cuyo estado dejó de ser finito
+        """
+        semillas = np.asarray(semillas, dtype=float).reshape(-1, 2)
+        puntos = np.empty((n_periodos, len(semillas), 2))
+        inicio = 0
+        for muestras in self.iterar_bloques(semillas, n_periodos, n_transitorio, fase):
+            puntos[inicio:inicio + len(muestras)] = muestras
+            inicio += len(muestras)
+        divergentes = ~np.all(np.isfinite(puntos[-1]), axis=1) if n_periodos else np.zeros(len(semillas), bool)
+        return {'puntos': puntos, 'periodo': self.periodo, 'divergentes': divergentes}
+
+    def densidad(self, semillas, n_periodos, xlim, ylim, resolucion=(600, 600),
+                 n_transitorio=0, fase=0.0, histograma=None):
+        """
+        Acumula la sección en un histograma sin guardar los puntos
+
+        Parámetros:
+        - semillas, n_periodos, n_transitorio, fase: como en calcular
+        - xlim, ylim, resolucion: geometría del histograma
+        - histograma: HistogramaDensidad existente a continuar (opcional)
+
+        Retorna: HistogramaDensidad
+        """
+        if histograma is None:
+            histograma = HistogramaDensidad(xlim, ylim, resolucion)
+        for muestras in self.iterar_bloques(semillas, n_periodos, n_transitorio, fase):
+            histograma.agregar(muestras[..., 0], muestras[..., 1])
+        return histograma
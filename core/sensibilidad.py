@@ -0,0 +1,147 @@
+"""
+Sensibilidades de trayectorias respecto de condiciones iniciales y parámetros
+Integración hacia adelante de las ecuaciones variacionales junto con el estado
+"""
+
+import numpy as np
+import sympy as sp
+from scipy.integrate import odeint
+from core.sistema import SistemaDinamico2D
+
+PARAMETROS_MATRIZ = ('a11', 'a12', 'a21', 'a22')
+
+
+class IntegradorSensibilidad:
+    """
+    Integra x(t), S(t) = ∂x/∂x0 y P(t) = ∂x/∂p en una sola pasada
+
+    El estado aumentado [x, S, P] sigue
+
+        x' = f(x, t, p)
+        S' = J(x, t, p)·S,            S(0) = I
+        P' = J(x, t, p)·P + ∂f/∂p,    P(0) = 0
+
+    con el Jacobiano compilado del sistema y las derivadas ∂f/∂p obtenidas
+    simbólicamente con SymPy, así que no hacen falta integraciones extra
+    por diferencias finitas.
+
+    Para sistemas definidos por matriz los parámetros disponibles son los
+    coeficientes a11, a12, a21, a22 (∂f/∂a_ij = e_i·x_j).
+    """
+
+    def __init__(self, sistema, parametros=None, rtol=1e-9, atol=1e-11):
+        """
+        Parámetros:
+        - sistema: SistemaDinamico2D
+        - parametros: nombres de los parámetros a derivar; por defecto todos los
+          de sistema.parametros (o ninguno en sistemas de matriz)
+        - rtol, atol: tolerancias de integración
+        """
+        if sistema.funcion_personalizada:
+            if sistema.f1_sym is None:
+                raise ValueError("Las funciones del sistema no pudieron compilarse")
+            disponibles = tuple(sistema.parametros)
+        else:
+            disponibles = PARAMETROS_MATRIZ
+
+        if parametros is None:
+            parametros = () if not sistema.funcion_personalizada else disponibles
+        parametros = tuple(parametros)
+        desconocidos = set(parametros) - set(disponibles)
+        if desconocidos:
+            raise ValueError(f"Parámetros no definidos en el sistema: {sorted(desconocidos)}")
+
+        self.sistema = sistema
+        self.parametros = parametros
+        self.rtol = rtol
+        self.atol = atol
+        self.campo, self.jacobiano = sistema.compilar_funciones()
+        self._df_dp = self._compilar_derivadas_parametros()
+
+    @classmethod
+    def para_lotka_volterra(cls, modelo, parametros=('alpha', 'beta', 'gamma', 'delta'), **opciones):
+        """
+        Integrador para un SistemaLotkaVolterra con sensibilidades en α, β, γ, δ
+
+        Parámetros:
+        - modelo: SistemaLotkaVolterra
+        - parametros: subconjunto de ('alpha', 'beta', 'gamma', 'delta')
+        """
+        sistema = SistemaDinamico2D(
+            funcion_personalizada={'f1': 'alpha*x - beta*x*y', 'f2': 'gamma*x*y - delta*y',
+                                   'es_lineal': False},
+            parametros={'alpha': modelo.alpha, 'beta': modelo.beta,
+                        'gamma': modelo.gamma, 'delta': modelo.delta})
+        return cls(sistema, parametros, **opciones)
+
+    def _compilar_derivadas_parametros(self):
+        """Función (x, t) -> array (2, P) con ∂f/∂p"""
+        n = len(self.parametros)
+        if n == 0:
+            return lambda x, t: np.zeros((2, 0))
+
+        if not self.sistema.funcion_personalizada:
+            columnas = [PARAMETROS_MATRIZ.index(p) for p in self.parametros]
+
+            def df_dp(x, t):
+                D = np.zeros((2, n))
+                for k, indice in enumerate(columnas):
+                    fila, columna = divmod(indice, 2)
+                    D[fila, k] = x[columna]
+                return D
+            return df_dp
+
+        s = self.sistema
+        simbolos = [s.param_symbols[p] for p in self.parametros]
+        derivadas = [[sp.diff(f, p) for p in simbolos] for f in (s.f1_sym, s.f2_sym)]
+        compilada = sp.lambdify((s.x_sym, s.y_sym, s.t_sym, *s.param_symbols.values()),
+                                derivadas, 'numpy')
+        valores = [float(v) for v in s._valores_parametros()]
+
+        def df_dp(x, t):
+            filas = compilada(x[0], x[1], t, *valores)
+            D = np.empty((2, n))
+            for i in range(2):
+                D[i] = filas[i]
+            return D
+        return df_dp
+
+    def _rhs(self, estado, t):
+        n = len(self.parametros)
+        x = estado[:2]
+        S = estado[2:6].reshape(2, 2)
+        P = estado[6:].reshape(2, n)
+        J = self.jacobiano(x, t)
+        derivada = np.empty_like(estado)
+        derivada[:2] = self.campo(x, t)
+        derivada[2:6] = (J @ S).ravel()
+        derivada[6:] = (J @ P + self._df_dp(x, t)).ravel()
+        return derivada
+
+    def integrar(self, x0, tiempos):
+        """
+        Trayectoria y sensibilidades en los instantes pedidos
+
+        Parámetros:
+        - x0: condición inicial (2,)
+        - tiempos: array (T,) creciente, con tiempos[0] el instante inicial
+
+        Retorna: dict con
+        - 't': tiempos (T,)
+        - 'estados': x(t) (T, 2)
+        - 'sensibilidad_x0': ∂x(t)/∂x0 (T, 2, 2)
+        - 'sensibilidad_parametros': ∂x(t)/∂p (T, 2, P)
+        - 'parametros': nombres de las columnas de sensibilidad_parametros
+        """
+        tiempos = np.asarray(tiempos, dtype=float)
+        n = len(self.parametros)
+        estado0 = np.concatenate([np.asarray(x0, dtype=float).ravel(), np.eye(2).ravel(), np.zeros(2 * n)])
+        solucion = odeint(self._rhs, estado0, tiempos, rtol=self.rtol, atol=self.atol)
+
+        return {
+            't': tiempos,
+            'estados': solucion[:, :2],
+            'sensibilidad_x0': solucion[:, 2:6].reshape(-1, 2, 2),
+            'sensibilidad_parametros': solucion[:, 6:].reshape(-1, 2, n),
+            'parametros': self.parametros,
+        }
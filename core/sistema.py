@@ -3,6 +3,7 @@ Núcleo matemático del sistema dinámico 2D
 Contiene la clase SistemaDinamico2D y su lógica de análisis
 """
 
+import copy
 import numpy as np
 import sympy as sp
 from scipy.integrate import odeint
@@ -88,11 +89,24 @@ class SistemaDinamico2D:
                 [self.df2_dx, self.df2_dy]
             ])
             
+            # Campo compilado para evaluar mallas completas (x, y, t, parámetros)
+            self.t_sym = sp.Symbol('t')
+            self._campo_lambda = sp.lambdify(
+                (self.x_sym, self.y_sym, self.t_sym, *self.param_symbols.values()),
+                [self.f1_sym, self.f2_sym], 'numpy'
+            )
+            self._jacobiano_lambda = sp.lambdify(
+                (self.x_sym, self.y_sym, self.t_sym, *self.param_symbols.values()),
+                self.jacobiano_simbolico.tolist(), 'numpy'
+            )
+            
         except Exception as e:
             print(f"Error al parsear funciones simbólicamente: {e}")
             self.f1_sym = None
             self.f2_sym = None
             self.jacobiano_simbolico = None
+            self._campo_lambda = None
+            self._jacobiano_lambda = None
     
     def calcular_jacobiano_en_punto(self, x, y):
         """
@@ -124,7 +138,22 @@ class SistemaDinamico2D:
         except Exception as e:
             print(f"Error calculando Jacobiano en ({x}, {y}): {e}")
             return None
-    
+
+    def clave_cache(self):
+        """
+        Clave hashable que identifica la definición del sistema
+
+        Dos instancias con la misma matriz, forzado, funciones y parámetros
+        producen la misma clave (útil para reutilizar trayectorias ya integradas).
+        """
+        matriz = None if self.A is None else tuple(self.A.ravel().tolist())
+        forzado = tuple(sorted(self.termino_forzado.items())) if self.termino_forzado else None
+        funciones = None
+        if self.funcion_personalizada:
+            funciones = (self.funcion_personalizada.get('f1'), self.funcion_personalizada.get('f2'))
+        parametros = tuple(sorted(self.parametros.items()))
+        return hash((matriz, forzado, funciones, parametros))
+
     def sistema_ecuaciones(self, X, t):
         """
         Calcula dx/dt = f(x, y, t)
@@ -168,26 +197,287 @@ class SistemaDinamico2D:
             print(f"Error evaluando funciones: {e}")
             return np.array([0.0, 0.0])
     
-    def _agregar_termino_forzado(self, dXdt, t):
-        """Agrega término forzado a la derivada (simplificado con KISS)"""
+    def _factor_forzado(self, t):
+        """Valor escalar de f(t) sin coeficientes (acepta arrays de tiempos)"""
         tipo = self.termino_forzado['tipo']
-        c1, c2 = self.termino_forzado['coef1'], self.termino_forzado['coef2']
         param = self.termino_forzado.get('param', 0)
         
         # Mapeo simplificado de términos forzados
         funciones_forzado = {
-            'constante': lambda t: 1,
+            'constante': lambda t: np.ones_like(t, dtype=float),
             'exponencial': lambda t: np.exp(param * t),
             'seno': lambda t: np.sin(param * t),
             'coseno': lambda t: np.cos(param * t)
         }
         
-        factor = funciones_forzado.get(tipo, lambda t: 0)(t)
+        return funciones_forzado.get(tipo, lambda t: np.zeros_like(t, dtype=float))(t)
+    
+    def _agregar_termino_forzado(self, dXdt, t):
+        """Agrega término forzado a la derivada (simplificado con KISS)"""
+        c1, c2 = self.termino_forzado['coef1'], self.termino_forzado['coef2']
+        factor = self._factor_forzado(t)
         dXdt[0] += c1 * factor
         dXdt[1] += c2 * factor
         
         return dXdt
     
+    def _valores_parametros(self, parametros=None):
+        """
+        Valores de los parámetros en el orden de compilación
+        
+        Parámetros:
+        - parametros: dict que reemplaza valores de self.parametros (admite arrays)
+        
+        Retorna: lista de valores (escalares o arrays)
+        """
+        valores = dict(self.parametros)
+        if parametros:
+            desconocidos = set(parametros) - set(valores)
+            if desconocidos:
+                raise ValueError(f"Parámetros no definidos en el sistema: {sorted(desconocidos)}")
+            valores.update(parametros)
+        return [np.asarray(v, dtype=float) for v in valores.values()]
+    
+    def evaluar_campo(self, X, Y, t=0, incluir_forzado=True, parametros=None):
+        """
+        Evalúa el campo sobre arrays completos en una sola pasada
+        
+        X, Y, t y los parámetros se combinan por broadcasting de numpy, así
+        que con t de forma (nt, 1, 1) y mallas (ny, nx) se obtiene el campo
+        en todos los instantes a la vez.
+        
+        Parámetros:
+        - X, Y: arrays de coordenadas
+        - t: tiempo (escalar o array compatible)
+        - incluir_forzado: si False, en sistemas lineales usa solo A·x
+        - parametros: dict opcional que reemplaza valores de self.parametros
+        
+        Retorna: (U, V) con la forma difundida de X, Y, t y parámetros
+        """
+        X = np.asarray(X, dtype=float)
+        Y = np.asarray(Y, dtype=float)
+        t = np.asarray(t, dtype=float)
+        
+        if self.funcion_personalizada:
+            valores = self._valores_parametros(parametros)
+            forma = np.broadcast_shapes(X.shape, Y.shape, t.shape, *[v.shape for v in valores])
+            if getattr(self, '_campo_lambda', None) is not None:
+                try:
+                    with np.errstate(all='ignore'):
+                        U, V = self._campo_lambda(X, Y, t, *valores)
+                    return (np.broadcast_to(np.asarray(U, dtype=float), forma).copy(),
+                            np.broadcast_to(np.asarray(V, dtype=float), forma).copy())
+                except Exception:
+                    pass
+            
+            # Respaldo: evaluación punto a punto
+            nombres = list(self.parametros)
+            Xb, Yb, tb, *vb = np.broadcast_arrays(X, Y, t, *valores)
+            U = np.empty(forma)
+            V = np.empty(forma)
+            originales = self.parametros
+            try:
+                for indice in np.ndindex(forma):
+                    self.parametros = {n: float(v[indice]) for n, v in zip(nombres, vb)}
+                    U[indice], V[indice] = self._evaluar_funciones_personalizadas(
+                        Xb[indice], Yb[indice], tb[indice])
+            finally:
+                self.parametros = originales
+            return U, V
+        
+        forma = np.broadcast_shapes(X.shape, Y.shape, t.shape)
+        U = self.A[0, 0] * X + self.A[0, 1] * Y
+        V = self.A[1, 0] * X + self.A[1, 1] * Y
+        if self.termino_forzado and incluir_forzado:
+            factor = self._factor_forzado(t)
+            U = U + self.termino_forzado['coef1'] * factor
+            V = V + self.termino_forzado['coef2'] * factor
+        return np.broadcast_to(U, forma).copy(), np.broadcast_to(V, forma).copy()
+    
+    def evaluar_jacobiano(self, X, Y, t=0, parametros=None):
+        """
+        Evalúa la matriz Jacobiana sobre arrays de puntos (versión compilada)
+        
+        Parámetros:
+        - X, Y: arrays de coordenadas
+        - t: tiempo (escalar o array compatible)
+        - parametros: dict opcional que reemplaza valores de self.parametros
+        
+        Retorna: array (..., 2, 2) con la forma difundida de las entradas
+        """
+        X = np.asarray(X, dtype=float)
+        Y = np.asarray(Y, dtype=float)
+        
+        if not self.funcion_personalizada:
+            forma = np.broadcast_shapes(X.shape, Y.shape)
+            return np.broadcast_to(self.A, forma + (2, 2)).copy()
+        
+        if getattr(self, '_jacobiano_lambda', None) is None:
+            raise ValueError("El Jacobiano simbólico no está disponible para este sistema")
+        
+        t = np.asarray(t, dtype=float)
+        valores = self._valores_parametros(parametros)
+        forma = np.broadcast_shapes(X.shape, Y.shape, t.shape, *[v.shape for v in valores])
+        with np.errstate(all='ignore'):
+            filas = self._jacobiano_lambda(X, Y, t, *valores)
+        J = np.empty(forma + (2, 2))
+        for i in range(2):
+            for j in range(2):
+                J[..., i, j] = np.broadcast_to(np.asarray(filas[i][j], dtype=float), forma)
+        return J
+    
+    def compilar_funciones(self, parametros=None):
+        """
+        Retorna funciones rápidas f(X, t) y J(X, t) con los parámetros fijados
+        
+        Pensadas para integradores que llaman miles de veces por segundo:
+        evitan el eval() de sistema_ecuaciones y el armado de diccionarios.
+        
+        Parámetros:
+        - parametros: dict opcional que reemplaza valores de self.parametros
+        
+        Retorna: (campo, jacobiano) con campo(X, t) -> array (2,) y
+        jacobiano(X, t) -> array (2, 2)
+        """
+        if not self.funcion_personalizada:
+            A = self.A
+            
+            def campo(X, t):
+                dXdt = A @ np.asarray(X, dtype=float)
+                if self.termino_forzado:
+                    dXdt = self._agregar_termino_forzado(dXdt, t)
+                return dXdt
+            
+            return campo, lambda X, t: A
+        
+        if getattr(self, '_campo_lambda', None) is None:
+            raise ValueError("Las funciones del sistema no pudieron compilarse")
+        
+        valores = [float(v) for v in self._valores_parametros(parametros)]
+        f_lambda = self._campo_lambda
+        j_lambda = self._jacobiano_lambda
+        
+        def campo(X, t):
+            return np.array(f_lambda(X[0], X[1], t, *valores), dtype=float)
+        
+        def jacobiano(X, t):
+            return np.array(j_lambda(X[0], X[1], t, *valores), dtype=float)
+        
+        return campo, jacobiano
+    
+    def compilar_funciones_lote(self, parametros=None):
+        """
+        Versión por lotes de compilar_funciones para conjuntos de estados
+        
+        Los valores de los parámetros se resuelven una sola vez y el resultado
+        se escribe en arrays preasignados, sin las copias de evaluar_campo.
+        
+        Parámetros:
+        - parametros: dict opcional (escalares o arrays de largo N)
+        
+        Retorna: (campo, jacobiano) con campo(X, t) -> (N, 2) y
+        jacobiano(X, t) -> (N, 2, 2) para X de forma (N, 2)
+        """
+        if not self.funcion_personalizada:
+            A = self.A
+            
+            def campo(X, t):
+                dXdt = X @ A.T
+                if self.termino_forzado:
+                    factor = self._factor_forzado(t)
+                    dXdt[:, 0] += self.termino_forzado['coef1'] * factor
+                    dXdt[:, 1] += self.termino_forzado['coef2'] * factor
+                return dXdt
+            
+            return campo, lambda X, t: np.broadcast_to(A, (len(X), 2, 2))
+        
+        if getattr(self, '_campo_lambda', None) is None or getattr(self, '_jacobiano_lambda', None) is None:
+            raise ValueError("Las funciones del sistema no pudieron compilarse")
+        
+        valores = self._valores_parametros(parametros)
+        f_lambda = self._campo_lambda
+        j_lambda = self._jacobiano_lambda
+        
+        def campo(X, t):
+            U, V = f_lambda(X[:, 0], X[:, 1], t, *valores)
+            salida = np.empty(X.shape)
+            salida[:, 0] = U
+            salida[:, 1] = V
+            return salida
+        
+        def jacobiano(X, t):
+            filas = j_lambda(X[:, 0], X[:, 1], t, *valores)
+            J = np.empty((len(X), 2, 2))
+            for i in range(2):
+                for j in range(2):
+                    J[:, i, j] = filas[i][j]
+            return J
+        
+        return campo, jacobiano
+    
+    def con_parametros(self, **valores):
+        """
+        Copia del sistema con otros valores de parámetros
+        
+        Comparte las funciones compiladas (los parámetros son argumentos en
+        tiempo de ejecución), así que no se vuelve a parsear con SymPy:
+        pensado para deslizadores que cambian u decenas de veces por segundo.
+        
+        Parámetros:
+        - valores: nuevos valores, ej: u=0.3 (deben existir en self.parametros)
+        
+        Retorna: SistemaDinamico2D
+        """
+        desconocidos = set(valores) - set(self.parametros)
+        if desconocidos:
+            raise ValueError(f"Parámetros no definidos en el sistema: {sorted(desconocidos)}")
+        copia = copy.copy(self)
+        copia.parametros = {**self.parametros, **{k: float(v) for k, v in valores.items()}}
+        return copia
+    
+    def refinar_equilibrios(self, puntos, xlim=None, ylim=None, max_iter=25, tolerancia=1e-9):
+        """
+        Newton por lotes desde equilibrios aproximados (arranque en caliente)
+        
+        Al mover un parámetro poco a poco, los equilibrios del valor anterior
+        convergen en 2-3 iteraciones, mucho antes que una búsqueda completa.
+        
+        Parámetros:
+        - puntos: array (N, 2) de aproximaciones iniciales
+        - xlim, ylim: si se indican, se descartan los puntos fuera de la vista
+        - max_iter: iteraciones máximas de Newton
+        - tolerancia: residuo máximo |f(x)| para aceptar un equilibrio
+        
+        Retorna: lista de tuplas (x, y) sin repetidos
+        """
+        P = np.array(puntos, dtype=float).reshape(-1, 2)
+        if len(P) == 0:
+            return []
+        
+        with np.errstate(all='ignore'):
+            for _ in range(max_iter):
+                U, V = self.evaluar_campo(P[:, 0], P[:, 1], 0)
+                if np.all(np.hypot(U, V) < tolerancia):
+                    break
+                J = self.evaluar_jacobiano(P[:, 0], P[:, 1], 0)
+                det = J[:, 0, 0] * J[:, 1, 1] - J[:, 0, 1] * J[:, 1, 0]
+                det = np.where(np.abs(det) > 1e-14, det, np.nan)
+                P[:, 0] -= (J[:, 1, 1] * U - J[:, 0, 1] * V) / det
+                P[:, 1] -= (J[:, 0, 0] * V - J[:, 1, 0] * U) / det
+            U, V = self.evaluar_campo(P[:, 0], P[:, 1], 0)
+            validos = np.isfinite(P).all(axis=1) & (np.hypot(U, V) < np.sqrt(tolerancia))
+        
+        if xlim is not None:
+            validos &= (P[:, 0] >= xlim[0]) & (P[:, 0] <= xlim[1])
+        if ylim is not None:
+            validos &= (P[:, 1] >= ylim[0]) & (P[:, 1] <= ylim[1])
+        
+        equilibrios = []
+        for punto in P[validos]:
+            if self._es_punto_nuevo(punto, equilibrios, 1e-6):
+                equilibrios.append((float(punto[0]), float(punto[1])))
+        return equilibrios
+    
     def clasificar_punto_equilibrio(self, punto_equilibrio=None):
         """
         Clasifica el tipo de punto de equilibrio según autovalores
@@ -348,6 +638,64 @@ class SistemaDinamico2D:
         
         return puntos_equilibrio
     
+    def _ecuaciones_simbolicas_autonomas(self):
+        """
+        Retorna ([f1, f2], (x, y), jacobiano) simbólicos con parámetros sustituidos y t = 0
+        """
+        if self.funcion_personalizada:
+            if self.f1_sym is None:
+                raise ValueError("No se pudieron parsear las funciones del sistema")
+            x, y = self.x_sym, self.y_sym
+            sustituciones = {self.param_symbols[nombre]: valor
+                             for nombre, valor in self.parametros.items()
+                             if nombre in self.param_symbols}
+            sustituciones[sp.Symbol('t')] = 0
+            funciones = [self.f1_sym.subs(sustituciones), self.f2_sym.subs(sustituciones)]
+            jacobiano = self.jacobiano_simbolico.subs(sustituciones)
+            return funciones, (x, y), jacobiano
+
+        x, y = sp.symbols('x y', real=True)
+        A = sp.Matrix(self.A.tolist())
+        funciones = list(A * sp.Matrix([x, y]))
+        if self.termino_forzado:
+            forzado = self._agregar_termino_forzado(np.zeros(2), 0)
+            funciones = [funciones[0] + float(forzado[0]), funciones[1] + float(forzado[1])]
+        return funciones, (x, y), A
+
+    def encontrar_equilibrios_certificados(self, xlim=(-5, 5), ylim=(-5, 5), tolerancia=1e-10,
+                                           max_cajas=100000):
+        """
+        Encuentra todos los equilibrios de la caja con aritmética de intervalos
+
+        A diferencia de encontrar_puntos_equilibrio (semillas fijas + fsolve),
+        la caja completa se divide y poda con el test de Krawczyk: las regiones
+        descartadas están probadas libres de equilibrios y cada equilibrio
+        'unico' tiene una caja que lo contiene y en la que no hay otro.
+        En sistemas no autónomos se usa el campo en t = 0, igual que la búsqueda numérica.
+
+        Parámetros:
+        - xlim, ylim: caja de búsqueda
+        - tolerancia: ancho de las cajas que encierran cada equilibrio
+        - max_cajas: presupuesto de cajas (si se agota, 'completo' es False)
+
+        Retorna: dict con
+        - 'equilibrios': lista de {'punto': (x, y), 'caja': ((x0, x1), (y0, y1)), 'unico': bool}
+        - 'completo': True si se exploró toda la caja
+        - 'cajas_procesadas': número de cajas evaluadas
+
+        Lanza ValueError si las funciones usan operaciones sin extensión por intervalos.
+        """
+        from core.intervalos import ResolvedorKrawczyk
+
+        funciones, variables, jacobiano = self._ecuaciones_simbolicas_autonomas()
+        resolvedor = ResolvedorKrawczyk(funciones, variables, jacobiano)
+        resultado = resolvedor.resolver(xlim, ylim, tolerancia=tolerancia, max_cajas=max_cajas)
+        return {
+            'equilibrios': resultado['raices'],
+            'completo': resultado['completo'],
+            'cajas_procesadas': resultado['cajas_procesadas']
+        }
+
     @staticmethod
     def _generar_puntos_prueba(xlim, ylim):
         """Genera puntos iniciales para búsqueda de equilibrios"""
@@ -0,0 +1,179 @@
+"""
+Sistemas lineales dx/dt = A·x de gran dimensión con A dispersa
+Análisis espectral parcial (ARPACK) y propagación sin formar matrices densas
+"""
+
+import numpy as np
+import scipy.sparse as sparse
+from scipy.sparse.linalg import eigs, eigsh, expm_multiply, ArpackNoConvergence
+
+# Por debajo de este tamaño ARPACK no aplica (requiere k < n - 1) y la matriz densa es trivial
+DIMENSION_DENSA = 16
+
+
+class SistemaLinealDisperso:
+    """
+    Sistema lineal homogéneo con matriz dispersa n×n
+
+    La estabilidad se decide por la abscisa espectral α(A) = max Re(λ),
+    que ARPACK obtiene pidiendo solo los autovalores de mayor parte real
+    (eigs, o eigsh si A es simétrica);
+    la propagación e^{At}·x0 usa expm_multiply, que trabaja con productos
+    matriz-vector. Ninguna operación forma A densa ni e^{At}.
+    """
+
+    def __init__(self, matriz):
+        """
+        Parámetros:
+        - matriz: matriz cuadrada (scipy.sparse o array; se convierte a CSR)
+        """
+        A = sparse.csr_matrix(matriz, dtype=float)
+        if A.shape[0] != A.shape[1]:
+            raise ValueError(f"La matriz debe ser cuadrada, no {A.shape[0]}×{A.shape[1]}")
+        self.A = A
+        self.n = A.shape[0]
+        # Las redes difusivas son simétricas: Lanczos (eigsh) resuelve bien los autovalores múltiples
+        self.simetrica = (A != A.T).nnz == 0
+        self._espectro = {}
+
+    @classmethod
+    def red_difusiva(cls, aristas, n, difusion=1.0, decaimiento=0.1, autoexcitacion=None):
+        """
+        Linealización de una red con acoplamiento difusivo: A = -D·L - γ·I (+ diag)
+
+        Parámetros:
+        - aristas: array (E, 2) de pares (i, j) no dirigidos
+        - n: número de nodos
+        - difusion: intensidad D del acoplamiento
+        - decaimiento: tasa γ de decaimiento propio de cada nodo
+        - autoexcitacion: array (n,) opcional que se suma a la diagonal
+
+        Retorna: SistemaLinealDisperso
+        """
+        aristas = np.asarray(aristas, dtype=int).reshape(-1, 2)
+        filas = np.concatenate([aristas[:, 0], aristas[:, 1]])
+        columnas = np.concatenate([aristas[:, 1], aristas[:, 0]])
+        adyacencia = sparse.csr_matrix((np.ones(len(filas)), (filas, columnas)), shape=(n, n))
+        adyacencia.data[:] = 1.0  # aristas repetidas cuentan una vez
+        grados = np.asarray(adyacencia.sum(axis=1)).ravel()
+        diagonal = -difusion * grados - decaimiento
+        if autoexcitacion is not None:
+            diagonal = diagonal + np.asarray(autoexcitacion, dtype=float)
+        return cls(difusion * adyacencia + sparse.diags(diagonal))
+
+    @classmethod
+    def anillo(cls, n, **opciones):
+        """Red en anillo de n nodos (ver red_difusiva)"""
+        i = np.arange(n)
+        return cls.red_difusiva(np.column_stack([i, (i + 1) % n]), n, **opciones)
+
+    @classmethod
+    def malla(cls, filas, columnas, **opciones):
+        """Red en malla rectangular de filas×columnas nodos (ver red_difusiva)"""
+        indice = np.arange(filas * columnas).reshape(filas, columnas)
+        horizontales = np.column_stack([indice[:, :-1].ravel(), indice[:, 1:].ravel()])
+        verticales = np.column_stack([indice[:-1, :].ravel(), indice[1:, :].ravel()])
+        return cls.red_difusiva(np.vstack([horizontales, verticales]), filas * columnas, **opciones)
+
+    @classmethod
+    def aleatoria(cls, n, grado_medio=4, semilla=0, **opciones):
+        """Red de Erdős–Rényi con el grado medio pedido (ver red_difusiva)"""
+        generador = np.random.default_rng(semilla)
+        m = int(round(n * grado_medio / 2))
+        aristas = generador.integers(0, n, size=(m, 2))
+        aristas = aristas[aristas[:, 0] != aristas[:, 1]]
+        return cls.red_difusiva(aristas, n, **opciones)
+
+    @property
+    def nnz(self):
+        return self.A.nnz
+
+    @property
+    def traza(self):
+        return float(self.A.diagonal().sum())
+
+    def autovalores_dominantes(self, k=6, tol=0, maxiter=None):
+        """
+        Los k autovalores de mayor parte real, ordenados de mayor a menor
+
+        Parámetros:
+        - k: número de autovalores
+        - tol: tolerancia relativa de ARPACK (0 = precisión de máquina, necesaria
+          para separar autovalores múltiples)
+        - maxiter: iteraciones de Arnoldi (por defecto 50·n)
+
+        Retorna: array complejo (m,) con m <= k; si ARPACK no converge
+        para todos, solo los que convergieron
+        """
+        k = int(min(k, self.n))
+        clave = (k, tol)
+        if clave in self._espectro:
+            return self._espectro[clave]
+
+        if self.n <= DIMENSION_DENSA:
+            autovalores = np.linalg.eigvals(self.A.toarray())
+        else:
+            k = min(k, self.n - 2)
+            opciones = dict(k=k, tol=tol, maxiter=maxiter, ncv=min(self.n, max(2 * k + 1, 40)),
+                            return_eigenvectors=False)
+            try:
+                if self.simetrica:
+                    autovalores = eigsh(self.A, which='LA', **opciones).astype(complex)
+                else:
+                    autovalores = eigs(self.A, which='LR', **opciones)
+            except ArpackNoConvergence as e:
+                autovalores = np.asarray(e.eigenvalues, dtype=complex)
+        autovalores = autovalores[np.argsort(-autovalores.real, kind='stable')][:k]
+        self._espectro[clave] = autovalores
+        return autovalores
+
+    def abscisa_espectral(self, **opciones):
+        """α(A) = max Re(λ) (a partir de autovalores_dominantes)"""
+        autovalores = self.autovalores_dominantes(**opciones)
+        if autovalores.size == 0:
+            raise ValueError("ARPACK no convergió para ningún autovalor")
+        return float(autovalores.real.max())
+
+    def clasificar_estabilidad(self, tolerancia=1e-9, k=6):
+        """
+        Estabilidad del origen por la abscisa espectral
+
+        Parámetros:
+        - tolerancia: |α| por debajo de este valor se considera marginal
+        - k: autovalores dominantes a calcular
+
+        Retorna: dict con 'abscisa', 'estabilidad', 'autovalores' y
+        'tiempo_caracteristico' (1/|α|, infinito si es marginal)
+        """
+        autovalores = self.autovalores_dominantes(k=k)
+        alfa = self.abscisa_espectral(k=k)
+        if alfa < -tolerancia:
+            estabilidad = 'Asintóticamente estable'
+        elif alfa > tolerancia:
+            estabilidad = 'Inestable'
+        else:
+            estabilidad = 'Marginal (no concluyente a orden lineal)'
+        return {
+            'abscisa': alfa,
+            'estabilidad': estabilidad,
+            'autovalores': autovalores,
+            'tiempo_caracteristico': 1 / abs(alfa) if abs(alfa) > tolerancia else np.inf,
+        }
+
+    def propagar(self, x0, t_max, t_puntos=101):
+        """
+        x(t) = e^{At}·x0 en instantes equiespaciados de 0 a t_max
+
+        Parámetros:
+        - x0: array (n,) o (n, m) con m condiciones iniciales
+        - t_max: tiempo final
+        - t_puntos: número de instantes
+
+        Retorna: (t, X) con X de forma (t_puntos, n) o (t_puntos, n, m)
+        """
+        x0 = np.asarray(x0, dtype=float)
+        if x0.shape[0] != self.n:
+            raise ValueError(f"La condición inicial debe tener {self.n} filas")
+        t = np.linspace(0, t_max, t_puntos)
+        X = expm_multiply(self.A, x0, start=0, stop=t_max, num=t_puntos, endpoint=True)
+        return t, X
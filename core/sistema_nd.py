@@ -0,0 +1,305 @@
+"""
+Núcleo de sistemas dinámicos de dimensión n
+Campo y Jacobiano compilados con SymPy y evaluados por lotes sobre arrays (..., n)
+"""
+
+import copy
+import numpy as np
+import sympy as sp
+from scipy.integrate import odeint
+from scipy.stats import qmc
+from core.utils import normalizar_funciones, FUNCIONES_SYMPY
+from core.integradores import paso_rk4
+
+
+def nombres_variables(n):
+    """Nombres por defecto: x, y (n=2); x, y, z (n=3); x1..xn en otro caso"""
+    if n == 2:
+        return ('x', 'y')
+    if n == 3:
+        return ('x', 'y', 'z')
+    return tuple(f'x{i + 1}' for i in range(n))
+
+
+class SistemaDinamicoND:
+    """
+    Sistema dx/dt = f(x, t) con x en Rⁿ definido por expresiones
+
+    Las ecuaciones se compilan una vez (con eliminación de subexpresiones
+    comunes) a funciones de numpy que reciben cada coordenada como array,
+    así que el campo sobre N estados cuesta O(N·n) en memoria y tiempo:
+    las coordenadas se pasan como vistas de X[..., i] sin copiar.
+    """
+
+    def __init__(self, ecuaciones, variables=None, parametros=None, nombre=None):
+        """
+        Inicializa el sistema
+
+        Parámetros:
+        - ecuaciones: lista de n expresiones (strings), una por variable
+        - variables: nombres de las variables; por defecto nombres_variables(n)
+        - parametros: dict con valores de parámetros (ej: {'sigma': 10, 'rho': 28})
+        - nombre: nombre descriptivo opcional
+        """
+        self.ecuaciones = [normalizar_funciones(str(e)) for e in ecuaciones]
+        self.n = len(self.ecuaciones)
+        if self.n < 1:
+            raise ValueError("Se requiere al menos una ecuación")
+        self.variables = tuple(variables) if variables else nombres_variables(self.n)
+        if len(self.variables) != self.n:
+            raise ValueError(f"Hay {self.n} ecuaciones y {len(self.variables)} variables")
+        self.parametros = dict(parametros or {})
+        self.nombre = nombre or f'Sistema {self.n}D'
+
+        reservados = set(FUNCIONES_SYMPY) | {'t'}
+        conflictos = ((set(self.variables) | set(self.parametros)) & reservados) | \
+            (set(self.variables) & set(self.parametros))
+        if conflictos:
+            raise ValueError(f"Nombres en conflicto: {sorted(conflictos)}")
+
+        self._compilar()
+
+    def _compilar(self):
+        """Parsea las ecuaciones, deriva el Jacobiano y compila ambos"""
+        self.simbolos = tuple(sp.Symbol(v, real=True) for v in self.variables)
+        self.t_sym = sp.Symbol('t', real=True)
+        self.param_symbols = {p: sp.Symbol(p, real=True) for p in self.parametros}
+        local_dict = {**FUNCIONES_SYMPY, 't': self.t_sym,
+                      **dict(zip(self.variables, self.simbolos)), **self.param_symbols}
+
+        try:
+            self.f_sym = sp.Matrix([sp.sympify(e, locals=local_dict) for e in self.ecuaciones])
+        except (sp.SympifyError, TypeError, SyntaxError) as e:
+            raise ValueError(f"No se pudieron interpretar las ecuaciones: {e}")
+        libres = self.f_sym.free_symbols - set(self.simbolos) - {self.t_sym} - set(self.param_symbols.values())
+        if libres:
+            raise ValueError(f"Símbolos no definidos: {sorted(str(s) for s in libres)}")
+
+        self.jacobiano_simbolico = self.f_sym.jacobian(self.simbolos)
+        argumentos = (*self.simbolos, self.t_sym, *self.param_symbols.values())
+        self._campo_lambda = sp.lambdify(argumentos, list(self.f_sym), 'numpy', cse=True)
+        self._jacobiano_lambda = sp.lambdify(argumentos, self.jacobiano_simbolico.tolist(), 'numpy', cse=True)
+        self.es_autonomo = self.t_sym not in self.f_sym.free_symbols
+
+    def _valores_parametros(self, parametros=None):
+        """Valores de los parámetros en el orden de compilación (admite reemplazos)"""
+        valores = dict(self.parametros)
+        if parametros:
+            desconocidos = set(parametros) - set(valores)
+            if desconocidos:
+                raise ValueError(f"Parámetros no definidos en el sistema: {sorted(desconocidos)}")
+            valores.update(parametros)
+        return [np.asarray(v, dtype=float) for v in valores.values()]
+
+    def con_parametros(self, **valores):
+        """
+        Copia del sistema con otros valores de parámetros (comparte lo compilado)
+
+        Retorna: SistemaDinamicoND
+        """
+        desconocidos = set(valores) - set(self.parametros)
+        if desconocidos:
+            raise ValueError(f"Parámetros no definidos en el sistema: {sorted(desconocidos)}")
+        copia = copy.copy(self)
+        copia.parametros = {**self.parametros, **{k: float(v) for k, v in valores.items()}}
+        return copia
+
+    # ------------------------------------------------------------------
+    # Evaluación por lotes
+    # ------------------------------------------------------------------
+
+    def evaluar_campo(self, X, t=0, parametros=None, salida=None):
+        """
+        Evalúa f sobre un array de estados
+
+        Parámetros:
+        - X: array (..., n)
+        - t: tiempo (escalar o array compatible con X[..., 0])
+        - parametros: dict opcional que reemplaza valores de self.parametros
+        - salida: array (..., n) preasignado donde escribir (opcional)
+
+        Retorna: array (..., n)
+        """
+        X = np.asarray(X, dtype=float)
+        if X.shape[-1] != self.n:
+            raise ValueError(f"Se esperaban estados de dimensión {self.n}, no {X.shape[-1]}")
+        if salida is None:
+            salida = np.empty(X.shape)
+        with np.errstate(all='ignore'):
+            componentes = self._campo_lambda(*(X[..., i] for i in range(self.n)), t,
+                                             *self._valores_parametros(parametros))
+        for i, componente in enumerate(componentes):
+            salida[..., i] = componente
+        return salida
+
+    def evaluar_jacobiano(self, X, t=0, parametros=None):
+        """
+        Evalúa el Jacobiano sobre un array de estados
+
+        Parámetros:
+        - X: array (..., n)
+        - t: tiempo
+        - parametros: dict opcional que reemplaza valores de self.parametros
+
+        Retorna: array (..., n, n)
+        """
+        X = np.asarray(X, dtype=float)
+        J = np.empty(X.shape + (self.n,))
+        with np.errstate(all='ignore'):
+            filas = self._jacobiano_lambda(*(X[..., i] for i in range(self.n)), t,
+                                           *self._valores_parametros(parametros))
+        for i in range(self.n):
+            for j in range(self.n):
+                J[..., i, j] = filas[i][j]
+        return J
+
+    def compilar_funciones(self):
+        """
+        Funciones f(x, t) -> (n,) y J(x, t) -> (n, n) con los parámetros fijados
+
+        Pensadas para odeint/solve_ivp: evitan resolver parámetros en cada llamada.
+        """
+        valores = [float(v) for v in self._valores_parametros()]
+        f_lambda, j_lambda = self._campo_lambda, self._jacobiano_lambda
+
+        def campo(x, t):
+            return np.array(f_lambda(*x, t, *valores), dtype=float)
+
+        def jacobiano(x, t):
+            return np.array(j_lambda(*x, t, *valores), dtype=float)
+
+        return campo, jacobiano
+
+    # ------------------------------------------------------------------
+    # Trayectorias
+    # ------------------------------------------------------------------
+
+    def integrar(self, x0, t_max=50, t_puntos=5000, rtol=1e-8, atol=1e-10):
+        """
+        Integra una trayectoria con paso adaptativo
+
+        Parámetros:
+        - x0: condición inicial (n,)
+        - t_max: tiempo final
+        - t_puntos: instantes guardados
+
+        Retorna: (t, X) con X de forma (t_puntos, n)
+        """
+        x0 = np.asarray(x0, dtype=float).ravel()
+        if x0.size != self.n:
+            raise ValueError(f"La condición inicial debe tener {self.n} componentes")
+        campo, jacobiano = self.compilar_funciones()
+        t = np.linspace(0, t_max, t_puntos)
+        return t, odeint(campo, x0, t, Dfun=jacobiano, rtol=rtol, atol=atol)
+
+    def integrar_lote(self, semillas, t_max, n_pasos, guardar_cada=1):
+        """
+        Integra muchas condiciones iniciales a la vez con RK4 de paso fijo
+
+        Parámetros:
+        - semillas: array (N, n)
+        - t_max: tiempo final
+        - n_pasos: pasos de RK4
+        - guardar_cada: se guarda un estado cada tantos pasos
+
+        Retorna: (t, X) con X de forma (K, N, n), K = n_pasos // guardar_cada + 1
+        """
+        estado = np.array(semillas, dtype=float).reshape(-1, self.n)
+        dt = t_max / n_pasos
+        guardados = n_pasos // guardar_cada + 1
+        X = np.empty((guardados, len(estado), self.n))
+        X[0] = estado
+        f = lambda t, E: self.evaluar_campo(E, t)
+        with np.errstate(all='ignore'):
+            for k in range(1, n_pasos + 1):
+                estado = paso_rk4(f, (k - 1) * dt, estado, dt)
+                if k % guardar_cada == 0:
+                    X[k // guardar_cada] = estado
+        return np.arange(guardados) * dt * guardar_cada, X
+
+    # ------------------------------------------------------------------
+    # Equilibrios
+    # ------------------------------------------------------------------
+
+    def refinar_equilibrios(self, puntos, limites=None, max_iter=40, tolerancia=1e-9):
+        """
+        Newton por lotes: todas las semillas avanzan juntas con un solve (N, n, n)
+
+        Parámetros:
+        - puntos: array (N, n) de aproximaciones iniciales
+        - limites: lista de n pares (min, max); descarta puntos fuera (opcional)
+        - max_iter: iteraciones máximas
+        - tolerancia: residuo máximo |f(x)| para aceptar un equilibrio
+
+        Retorna: array (M, n) de equilibrios distintos
+        """
+        P = np.array(puntos, dtype=float).reshape(-1, self.n)
+        activos = np.ones(len(P), dtype=bool)
+        with np.errstate(all='ignore'):
+            for _ in range(max_iter):
+                F = self.evaluar_campo(P[activos])
+                residuo = np.linalg.norm(F, axis=1)
+                convergidos = residuo < tolerancia
+                indices = np.flatnonzero(activos)
+                activos[indices[convergidos | ~np.isfinite(residuo)]] = False
+                if not activos.any():
+                    break
+                J = self.evaluar_jacobiano(P[activos])
+                F = F[~convergidos & np.isfinite(residuo)]
+                singulares = ~np.isfinite(J).all(axis=(1, 2)) | (np.abs(np.linalg.det(J)) < 1e-14)
+                J[singulares] = np.eye(self.n)
+                F[singulares] = np.nan
+                P[activos] -= np.linalg.solve(J, F[..., None])[..., 0]
+            validos = np.isfinite(P).all(axis=1)
+            validos[validos] = np.linalg.norm(self.evaluar_campo(P[validos]), axis=1) < np.sqrt(tolerancia)
+
+        if limites is not None:
+            limites = np.asarray(limites, dtype=float)
+            validos &= np.all((P >= limites[:, 0]) & (P <= limites[:, 1]), axis=1)
+
+        equilibrios = []
+        for punto in P[validos]:
+            if all(np.linalg.norm(punto - e) > 1e-6 for e in equilibrios):
+                equilibrios.append(punto)
+        return np.array(equilibrios).reshape(-1, self.n)
+
+    def encontrar_puntos_equilibrio(self, limites, n_semillas=None, semilla=0):
+        """
+        Busca equilibrios en una caja n-dimensional
+
+        Las semillas son una secuencia de Halton (baja discrepancia) más el
+        origen y el centro de la caja; su número crece linealmente con n en
+        lugar de exponencialmente como una malla.
+
+        Parámetros:
+        - limites: lista de n pares (min, max)
+        - n_semillas: número de semillas (por defecto 64·n)
+        - semilla: semilla de la secuencia (resultados reproducibles)
+
+        Retorna: array (M, n) de equilibrios dentro de la caja
+        """
+        limites = np.asarray(limites, dtype=float).reshape(self.n, 2)
+        n_semillas = n_semillas or 64 * self.n
+        muestras = qmc.Halton(d=self.n, seed=semilla).random(n_semillas)
+        semillas = np.vstack([np.zeros(self.n), limites.mean(axis=1),
+                              qmc.scale(muestras, limites[:, 0], limites[:, 1])])
+        return self.refinar_equilibrios(semillas, limites)
+
+    def clasificar_equilibrio(self, punto):
+        """
+        Estabilidad lineal de un equilibrio por los autovalores del Jacobiano
+
+        Retorna: dict con 'autovalores', 'estabilidad' y 'dimension_inestable'
+        """
+        autovalores = np.linalg.eigvals(self.evaluar_jacobiano(np.asarray(punto, dtype=float)))
+        reales = autovalores.real
+        inestables = int(np.sum(reales > 1e-9))
+        if np.any(np.abs(reales) <= 1e-9):
+            estabilidad = 'No hiperbólico'
+        elif inestables == 0:
+            estabilidad = 'Estable'
+        elif inestables == self.n:
+            estabilidad = 'Inestable'
+        else:
+            estabilidad = f'Silla ({inestables} dirección(es) inestable(s))'
+        return {'autovalores': autovalores, 'estabilidad': estabilidad, 'dimension_inestable': inestables}
@@ -0,0 +1,215 @@
+"""
+Almacenamiento compacto de trayectorias 2D
+Buffers preallocados que crecen por duplicación y decimación por curvatura
+"""
+
+import numpy as np
+
+
+def decimar_douglas_peucker(puntos, tolerancia):
+    """
+    Simplifica una polilínea con el algoritmo de Douglas-Peucker
+
+    Conserva los puntos donde la curva se aparta más de `tolerancia` de la
+    cuerda, por lo que los tramos rectos quedan con muy pocos vértices y
+    las zonas de alta curvatura conservan su detalle.
+
+    Parámetros:
+    - puntos: array (N, 2)
+    - tolerancia: distancia perpendicular máxima admitida
+
+    Retorna: array (M, 2) con M <= N (siempre incluye extremos)
+    """
+    puntos = np.asarray(puntos, dtype=float)
+    n = len(puntos)
+    if n <= 2 or tolerancia <= 0:
+        return puntos.copy()
+
+    conservar = np.zeros(n, dtype=bool)
+    conservar[0] = conservar[-1] = True
+
+    # Pila explícita de segmentos (evita recursión en trayectorias largas)
+    pila = [(0, n - 1)]
+    while pila:
+        inicio, fin = pila.pop()
+        if fin - inicio < 2:
+            continue
+
+        p0 = puntos[inicio]
+        cuerda = puntos[fin] - p0
+        largo = np.hypot(cuerda[0], cuerda[1])
+        interior = puntos[inicio + 1:fin] - p0
+
+        if largo < 1e-15:
+            distancias = np.hypot(interior[:, 0], interior[:, 1])
+        else:
+            distancias = np.abs(cuerda[0] * interior[:, 1] - cuerda[1] * interior[:, 0]) / largo
+
+        k = int(np.argmax(distancias))
+        if distancias[k] > tolerancia:
+            indice = inicio + 1 + k
+            conservar[indice] = True
+            pila.append((inicio, indice))
+            pila.append((indice, fin))
+
+    return puntos[conservar]
+
+
+class Trayectoria:
+    """
+    Trayectoria 2D almacenada en un buffer contiguo de numpy
+
+    El buffer se preasigna y crece por duplicación, de modo que agregar un
+    punto es O(1) amortizado y no se crean copias por paso. Al superar la
+    capacidad máxima se compacta en el lugar mediante Douglas-Peucker, lo que
+    mantiene acotada la memoria en integraciones largas.
+
+    Se comporta como un array (N, 2): admite len(), indexación y np.asarray().
+    """
+
+    __slots__ = ('_buffer', '_n', 'semilla', 'direccion', 'motivo_fin', 't_final',
+                 'capacidad_maxima', 'tolerancia_compactacion', 'metodo', 'estadisticas')
+
+    CAPACIDAD_INICIAL = 256
+    CAPACIDAD_MAXIMA = 20000
+
+    # Motivos de finalización de la integración
+    MOTIVO_MAX_PASOS = 'max_pasos'
+    MOTIVO_FUERA_LIMITES = 'fuera_de_limites'
+    MOTIVO_DISTANCIA_MINIMA = 'distancia_minima'
+    MOTIVO_ERROR = 'error_numerico'
+
+    def __init__(self, semilla, direccion=1, capacidad=None, capacidad_maxima=None,
+                 tolerancia_compactacion=1e-4):
+        """
+        Inicializa el almacén vacío
+
+        Parámetros:
+        - semilla: condición inicial (x0, y0)
+        - direccion: 1 (adelante) o -1 (atrás)
+        - capacidad: tamaño inicial del buffer
+        - capacidad_maxima: puntos a partir de los cuales se compacta
+        - tolerancia_compactacion: tolerancia inicial de Douglas-Peucker al compactar (> 0)
+        """
+        if not tolerancia_compactacion > 0:
+            raise ValueError("La tolerancia de compactación debe ser positiva")
+        self.semilla = (float(semilla[0]), float(semilla[1]))
+        self.direccion = direccion
+        self.motivo_fin = None
+        self.t_final = 0.0
+        # Integrador usado ('euler' o un método de solve_ivp) y contadores acumulados
+        self.metodo = None
+        self.estadisticas = {}
+        self.capacidad_maxima = capacidad_maxima or self.CAPACIDAD_MAXIMA
+        self.tolerancia_compactacion = tolerancia_compactacion
+        self._buffer = np.empty((capacidad or self.CAPACIDAD_INICIAL, 2), dtype=float)
+        self._n = 0
+
+    @property
+    def puntos(self):
+        """Vista (sin copia) de los puntos almacenados"""
+        return self._buffer[:self._n]
+
+    @property
+    def ultimo(self):
+        """Último punto almacenado (o la semilla si está vacía)"""
+        if self._n == 0:
+            return np.array(self.semilla)
+        return self._buffer[self._n - 1].copy()
+
+    @property
+    def capacidad(self):
+        """Tamaño actual del buffer"""
+        return len(self._buffer)
+
+    def __len__(self):
+        return self._n
+
+    def __getitem__(self, indice):
+        return self.puntos[indice]
+
+    def __array__(self, dtype=None, copy=None):
+        puntos = self.puntos
+        if dtype is not None:
+            puntos = puntos.astype(dtype)
+        return puntos.copy() if copy else puntos
+
+    def agregar(self, punto):
+        """Agrega un punto al final de la trayectoria"""
+        if self._n == len(self._buffer):
+            self._asegurar_capacidad(self._n + 1)
+        self._buffer[self._n, 0] = punto[0]
+        self._buffer[self._n, 1] = punto[1]
+        self._n += 1
+
+    def extender(self, puntos):
+        """Agrega un bloque (M, 2) de puntos"""
+        puntos = np.asarray(puntos, dtype=float).reshape(-1, 2)
+        m = len(puntos)
+        if self._n + m > len(self._buffer):
+            self._asegurar_capacidad(self._n + m)
+        self._buffer[self._n:self._n + m] = puntos
+        self._n += m
+
+    def _asegurar_capacidad(self, requerida):
+        """Compacta o duplica el buffer para alojar `requerida` puntos"""
+        if requerida > self.capacidad_maxima and self._n > 2:
+            extra = requerida - self._n
+            self.compactar()
+            requerida = self._n + extra
+
+        if requerida <= len(self._buffer):
+            return
+
+        nueva = len(self._buffer)
+        while nueva < requerida:
+            nueva *= 2
+        nuevo_buffer = np.empty((nueva, 2), dtype=float)
+        nuevo_buffer[:self._n] = self._buffer[:self._n]
+        self._buffer = nuevo_buffer
+
+    def compactar(self, tolerancia=None):
+        """
+        Decima en el lugar hasta quedar por debajo de la mitad de la capacidad máxima
+
+        La tolerancia se duplica hasta alcanzar el objetivo, por lo que la
+        memoria queda acotada aun en órbitas muy enrolladas.
+
+        Parámetros:
+        - tolerancia: tolerancia inicial (> 0); por defecto la última usada
+        """
+        if tolerancia is None:
+            tolerancia = self.tolerancia_compactacion
+        if not tolerancia > 0:
+            # Con tolerancia nula la duplicación nunca alcanzaría el objetivo
+            raise ValueError("La tolerancia de compactación debe ser positiva")
+        objetivo = max(self.capacidad_maxima // 2, 2)
+
+        reducidos = decimar_douglas_peucker(self.puntos, tolerancia)
+        while len(reducidos) > objetivo:
+            tolerancia *= 2
+            reducidos = decimar_douglas_peucker(reducidos, tolerancia)
+
+        self.tolerancia_compactacion = tolerancia
+        self._n = len(reducidos)
+        self._buffer[:self._n] = reducidos
+
+    def tolerancia_visual(self, fraccion=1e-3):
+        """Tolerancia proporcional a la diagonal de la caja que contiene la curva"""
+        if self._n < 2:
+            return 0.0
+        extension = np.ptp(self.puntos, axis=0)
+        return fraccion * float(np.hypot(extension[0], extension[1]))
+
+    def decimada(self, tolerancia=None):
+        """
+        Retorna una copia simplificada para graficar
+
+        Parámetros:
+        - tolerancia: distancia máxima admitida; por defecto 0.1% de la diagonal
+
+        Retorna: array (M, 2)
+        """
+        if tolerancia is None:
+            tolerancia = self.tolerancia_visual()
+        return decimar_douglas_peucker(self.puntos, tolerancia)
@@ -3,6 +3,8 @@ Utilidades compartidas para el sistema dinámico
 Centraliza funciones reutilizables
 """
 
+import keyword
+import re
 import numpy as np
 import sympy as sp
 from functools import lru_cache
@@ -55,6 +57,112 @@ FUNCIONES_SYMPY = {
 }
 
 
+# Nombres que no pueden usarse como parámetros (variables de estado y funciones)
+NOMBRES_RESERVADOS = {'x', 'y', 't', 'x1', 'x2', 'np', 'sen'} | set(FUNCIONES_SYMPY) | set(FUNCIONES_NUMPY)
+
+
+def parsear_parametros(texto, nombre_defecto='u'):
+    """
+    Interpreta la entrada de parámetros de un sistema personalizado
+    
+    Formatos aceptados (separados por comas):
+    - "0.5"                 → {'u': 0.5} (un número solo es el parámetro por defecto)
+    - "u=0.5, k=2"          → valores con nombre
+    - "u=-1:1:6"            → barrido: 6 valores equiespaciados entre -1 y 1
+    - "k=[0.5, 1, 2]"       → barrido con valores explícitos
+    
+    Parámetros:
+    - texto: string ingresado por el usuario
+    - nombre_defecto: nombre que recibe un número sin nombre
+    
+    Retorna: dict nombre -> float, o array 1D para los barridos
+    """
+    texto = (texto or '').strip()
+    if not texto:
+        return {}
+    
+    try:
+        return {nombre_defecto: float(texto)}
+    except ValueError:
+        pass
+    
+    parametros = {}
+    # Separar por comas que no estén dentro de corchetes
+    for parte in re.split(r',(?![^\[]*\])', texto):
+        parte = parte.strip()
+        if not parte:
+            continue
+        if '=' not in parte:
+            raise ValueError(f"Falta '=' en '{parte}'. Ej: u=0.5, k=2")
+        nombre, valor = (s.strip() for s in parte.split('=', 1))
+        if not nombre.isidentifier() or keyword.iskeyword(nombre) or nombre in NOMBRES_RESERVADOS:
+            raise ValueError(f"Nombre de parámetro inválido: '{nombre}'")
+        if nombre in parametros:
+            raise ValueError(f"Parámetro repetido: '{nombre}'")
+        parametros[nombre] = _parsear_valor_parametro(nombre, valor)
+    return parametros
+
+
+def _parsear_valor_parametro(nombre, valor):
+    """Número, rango inicio:fin:n o lista [v1, v2, ...]"""
+    try:
+        if valor.startswith('[') and valor.endswith(']'):
+            valores = np.array([float(v) for v in valor[1:-1].split(',') if v.strip()])
+            if valores.size == 0:
+                raise ValueError
+            return valores
+        if ':' in valor:
+            inicio, fin, n = valor.split(':')
+            n = int(n)
+            if n < 1:
+                raise ValueError
+            return np.linspace(float(inicio), float(fin), n)
+        return float(valor)
+    except ValueError:
+        raise ValueError(f"Valor inválido para '{nombre}': '{valor}'. "
+                         f"Use un número, inicio:fin:n o [v1, v2, ...]")
+
+
+def separar_barridos(parametros):
+    """
+    Separa valores fijos de barridos y arma su producto cartesiano
+    
+    Parámetros:
+    - parametros: dict de parsear_parametros
+    
+    Retorna: (base, barrido, forma)
+    - base: dict nombre -> float (los barridos toman su primer valor)
+    - barrido: dict nombre -> array (P,) con todas las combinaciones
+      (el primer parámetro barrido varía más rápido)
+    - forma: tupla con el número de valores de cada parámetro barrido
+    """
+    base = {}
+    ejes = {}
+    for nombre, valor in parametros.items():
+        if np.ndim(valor) == 0:
+            base[nombre] = float(valor)
+        else:
+            ejes[nombre] = np.asarray(valor, dtype=float)
+            base[nombre] = float(ejes[nombre][0])
+    
+    if not ejes:
+        return base, {}, ()
+    
+    # Orden inverso con indexing='ij': al aplanar, el primer parámetro varía más rápido
+    nombres = list(ejes)[::-1]
+    mallas = np.meshgrid(*(ejes[n] for n in nombres), indexing='ij')
+    barrido = {nombre: mallas[nombres.index(nombre)].ravel() for nombre in ejes}
+    forma = tuple(len(v) for v in ejes.values())
+    return base, barrido, forma
+
+
+def formatear_parametros(parametros, nombre_defecto='u'):
+    """Inverso de parsear_parametros para valores fijos ("0.5" si solo hay u)"""
+    if list(parametros) == [nombre_defecto]:
+        return f"{parametros[nombre_defecto]:.6g}"
+    return ', '.join(f"{nombre}={valor:.6g}" for nombre, valor in parametros.items())
+
+
 def crear_diccionario_variables_evaluacion(x1, x2, t, parametros=None):
     """
     Crea diccionario completo de variables para evaluar expresiones
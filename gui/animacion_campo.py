@@ -0,0 +1,103 @@
+"""
+Ventana de animación del campo para sistemas con término forzado f(t)
+"""
+
+import tkinter as tk
+import numpy as np
+from tkinter import ttk
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+from ui.estilos import COLORES
+from visualization.animacion_campo import AnimadorCampoTemporal
+
+
+class VentanaAnimacionCampo:
+    """Ventana con el campo f(x, t) animado y un deslizador de tiempo"""
+
+    INTERVALO_MS = 50
+
+    def __init__(self, parent, sistema, xlim, ylim, semilla=None, t_final=None):
+        """
+        Parámetros:
+        - parent: ventana padre
+        - sistema: SistemaDinamico2D con término forzado
+        - xlim, ylim: límites de la vista actual
+        - semilla: condición inicial de la trayectoria superpuesta
+        - t_final: duración (por defecto dos períodos del forzado periódico)
+        """
+        self.reproduciendo = False
+        self._tarea = None
+
+        self.ventana = tk.Toplevel(parent)
+        self.ventana.title("Campo Vectorial en el Tiempo")
+        self.ventana.geometry("800x700")
+        self.ventana.configure(bg=COLORES['fondo'])
+        self.ventana.protocol("WM_DELETE_WINDOW", self._cerrar)
+
+        self.fig = Figure(figsize=(7, 6), dpi=100)
+        self.ax = self.fig.add_subplot(111)
+        self.canvas = FigureCanvasTkAgg(self.fig, self.ventana)
+
+        self.animador = AnimadorCampoTemporal(
+            self.ax, sistema, xlim, ylim,
+            t_final=t_final or self._duracion_sugerida(sistema),
+            semilla=semilla
+        )
+
+        self._crear_controles()
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+        self.canvas.draw()
+        self.animador.mostrar_cuadro(0)
+
+    @staticmethod
+    def _duracion_sugerida(sistema):
+        """Dos períodos para forzados periódicos; 10 unidades en otro caso"""
+        forzado = sistema.termino_forzado or {}
+        omega = abs(forzado.get('param', 0) or 0)
+        if forzado.get('tipo') in ('seno', 'coseno') and omega > 1e-9:
+            return 2 * 2 * np.pi / omega
+        return 10.0
+
+    def _crear_controles(self):
+        """Botón de reproducción y deslizador de tiempo"""
+        controles = ttk.Frame(self.ventana, padding="10")
+        controles.pack(fill=tk.X)
+
+        self.boton_play = ttk.Button(controles, text="▶ Reproducir", command=self._alternar)
+        self.boton_play.pack(side=tk.LEFT, padx=5)
+
+        self.cuadro_var = tk.IntVar(value=0)
+        self.deslizador = ttk.Scale(controles, from_=0, to=self.animador.n_cuadros - 1,
+                                    orient=tk.HORIZONTAL, variable=self.cuadro_var,
+                                    command=self._al_mover_deslizador)
+        self.deslizador.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=10)
+
+        ttk.Button(controles, text="Cerrar", command=self._cerrar).pack(side=tk.RIGHT, padx=5)
+
+    def _al_mover_deslizador(self, valor):
+        """Muestra el cuadro precalculado (no reevalúa el campo)"""
+        indice = int(round(float(valor)))
+        if indice != self.animador.cuadro_actual:
+            self.animador.mostrar_cuadro(indice)
+
+    def _alternar(self):
+        self.reproduciendo = not self.reproduciendo
+        self.boton_play.config(text="⏸ Pausar" if self.reproduciendo else "▶ Reproducir")
+        if self.reproduciendo:
+            self._avanzar()
+        elif self._tarea is not None:
+            self.ventana.after_cancel(self._tarea)
+            self._tarea = None
+
+    def _avanzar(self):
+        if not self.reproduciendo:
+            return
+        indice = self.animador.siguiente_cuadro()
+        self.cuadro_var.set(indice)
+        self._tarea = self.ventana.after(self.INTERVALO_MS, self._avanzar)
+
+    def _cerrar(self):
+        self.reproduciendo = False
+        if self._tarea is not None:
+            self.ventana.after_cancel(self._tarea)
+        self.ventana.destroy()
@@ -0,0 +1,79 @@
+"""
+Ventana de barrido de parámetros: cuadrícula de retratos de fase
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
+from visualization.barrido_parametros import graficar_barrido
+from ui.estilos import COLORES, FUENTES
+
+
+class VentanaBarridoParametros:
+    """Un retrato de fase por combinación de los parámetros barridos"""
+
+    def __init__(self, parent, sistema, barrido, forma, xlim, ylim):
+        """
+        Parámetros:
+        - parent: ventana padre
+        - sistema: SistemaDinamico2D con funciones personalizadas
+        - barrido, forma: resultado de separar_barridos
+        - xlim, ylim: límites comunes de los paneles
+        """
+        self.sistema = sistema
+        self.barrido = barrido
+        self.forma = forma
+
+        self.ventana = tk.Toplevel(parent)
+        self.ventana.title("Barrido de Parámetros")
+        self.ventana.geometry("1000x820")
+        self.ventana.configure(bg=COLORES['fondo'])
+
+        self.xmin_var = tk.DoubleVar(value=xlim[0])
+        self.xmax_var = tk.DoubleVar(value=xlim[1])
+        self.ymin_var = tk.DoubleVar(value=ylim[0])
+        self.ymax_var = tk.DoubleVar(value=ylim[1])
+        self.n_var = tk.IntVar(value=15)
+
+        self._crear_widgets()
+        self._dibujar()
+
+    def _crear_widgets(self):
+        controles = ttk.Frame(self.ventana, padding="10")
+        controles.pack(fill=tk.X)
+
+        for texto, variable in (("x mín:", self.xmin_var), ("x máx:", self.xmax_var),
+                                ("y mín:", self.ymin_var), ("y máx:", self.ymax_var),
+                                ("Flechas/lado:", self.n_var)):
+            ttk.Label(controles, text=texto).pack(side=tk.LEFT)
+            ttk.Entry(controles, textvariable=variable, width=7).pack(side=tk.LEFT, padx=(2, 8))
+        ttk.Button(controles, text="Redibujar", style='Accent.TButton',
+                   command=self._dibujar).pack(side=tk.LEFT, padx=5)
+        ttk.Button(controles, text="Cerrar",
+                   command=self.ventana.destroy).pack(side=tk.RIGHT, padx=5)
+
+        nombres = list(self.barrido)
+        texto = f"Columnas: {nombres[0]}"
+        if len(nombres) > 1:
+            texto += f" | Filas: {nombres[1]}"
+        ttk.Label(self.ventana, text=texto, font=FUENTES['pequena']).pack(anchor=tk.W, padx=10)
+
+        self.fig = Figure(figsize=(9, 7), dpi=100)
+        self.canvas = FigureCanvasTkAgg(self.fig, self.ventana)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        NavigationToolbar2Tk(self.canvas, self.ventana).update()
+
+    def _dibujar(self):
+        try:
+            xlim = (self.xmin_var.get(), self.xmax_var.get())
+            ylim = (self.ymin_var.get(), self.ymax_var.get())
+            if xlim[0] >= xlim[1] or ylim[0] >= ylim[1]:
+                raise ValueError("Los mínimos deben ser menores que los máximos")
+            graficar_barrido(self.fig, self.sistema, self.barrido, self.forma,
+                             xlim, ylim, n_puntos=max(self.n_var.get(), 3))
+        except (ValueError, tk.TclError) as e:
+            messagebox.showerror("Error", f"No se pudo dibujar el barrido:\n{str(e)}")
+            return
+        self.fig.tight_layout()
+        self.canvas.draw()
@@ -2,6 +2,7 @@
 Interfaz gráfica para análisis de bifurcaciones 1D
 """
 
+import re
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import matplotlib.pyplot as plt
@@ -12,6 +13,7 @@ matplotlib.use('TkAgg')
 
 from core.bifurcacion import AnalizadorBifurcacion
 from visualization.bifurcacion import VisualizadorBifurcacion
+from gui.bifurcacion_codim2 import VentanaBifurcacionCodim2
 from input_module.bifurcacion import obtener_nombres_ejemplos_bifurcacion, obtener_ejemplo_bifurcacion
 from ui.estilos import configurar_estilos_ttk, COLORES, FUENTES
 
@@ -151,18 +153,23 @@ class InterfazBifurcacion:
         # Botón de análisis
         ttk.Button(control_frame, text="ANALIZAR", 
                   command=self._analizar, style='Accent.TButton').grid(row=11, column=0, 
-                                                                       pady=15, sticky=(tk.W, tk.E))
+                                                                       pady=(15, 5), sticky=(tk.W, tk.E))
         
-        ttk.Separator(control_frame, orient='horizontal').grid(row=12, column=0, sticky=(tk.W, tk.E), pady=5)
+        # Análisis en dos parámetros f(x, r, h)
+        ttk.Button(control_frame, text="Mapa en Dos Parámetros (r, h)",
+                  command=self._abrir_mapa_codim2).grid(row=12, column=0, pady=(0, 10),
+                                                        sticky=(tk.W, tk.E))
+        
+        ttk.Separator(control_frame, orient='horizontal').grid(row=13, column=0, sticky=(tk.W, tk.E), pady=5)
         
         # Resultados
         ttk.Label(control_frame, text="Resultados:", 
-                 font=FUENTES['titulo_seccion']).grid(row=13, column=0, sticky=tk.W, pady=5)
+                 font=FUENTES['titulo_seccion']).grid(row=14, column=0, sticky=tk.W, pady=5)
         
         self.resultados_text = scrolledtext.ScrolledText(control_frame, width=40, height=15, 
                                                          font=FUENTES['monoespaciada'], wrap=tk.WORD)
-        self.resultados_text.grid(row=14, column=0, pady=5, sticky=(tk.W, tk.E, tk.N, tk.S))
-        control_frame.rowconfigure(14, weight=1)
+        self.resultados_text.grid(row=15, column=0, pady=5, sticky=(tk.W, tk.E, tk.N, tk.S))
+        control_frame.rowconfigure(15, weight=1)
         
     def _crear_panel_graficos(self, parent):
         """Crea panel de gráficos"""
@@ -276,8 +283,19 @@ class InterfazBifurcacion:
                 
                 self.resultados_text.insert(tk.END, "\n")
             
+            bifurcaciones = self.analizador.clasificar_bifurcaciones((r_min, r_max), (x_min, x_max))
+            self.resultados_text.insert(tk.END, "Bifurcaciones detectadas:\n")
+            if bifurcaciones:
+                for b in bifurcaciones:
+                    self.resultados_text.insert(tk.END,
+                                               f"  r* = {b['r']:.4f}, x* = {b['x']:.4f}: {b['nombre']}\n")
+            else:
+                self.resultados_text.insert(tk.END, "  Ninguna en el rango analizado\n")
+            self.resultados_text.insert(tk.END, "\n")
+            
             self.bifurcacion_fig.clear()
-            self.visualizador.graficar_diagrama_bifurcacion((r_min, r_max), self.bifurcacion_fig)
+            self.visualizador.graficar_diagrama_bifurcacion((r_min, r_max), self.bifurcacion_fig,
+                                                            x_range=(x_min, x_max))
             self.bifurcacion_canvas.draw()
             
             self.phase_fig.clear()
@@ -292,3 +310,15 @@ class InterfazBifurcacion:
             messagebox.showerror("Error", f"Error en los parámetros: {e}")
         except Exception as e:
             messagebox.showerror("Error", f"Error durante el análisis: {e}")
+    
+    def _abrir_mapa_codim2(self):
+        """Abre el mapa de regiones (r, h); si la función no usa h se le suma la imperfección"""
+        funcion_str = self.funcion_entry.get().strip() or 'r*x - x**3'
+        if not re.search(r'\bh\b', funcion_str):
+            funcion_str = f"h + {funcion_str}"
+        try:
+            r_range = (float(self.r_min_entry.get()), float(self.r_max_entry.get()))
+            x_range = (float(self.x_min_entry.get()), float(self.x_max_entry.get()))
+        except ValueError:
+            r_range, x_range = (-1.0, 2.0), (-3.0, 3.0)
+        VentanaBifurcacionCodim2(self.root.winfo_toplevel(), funcion_str, r_range, x_range)
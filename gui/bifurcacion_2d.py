@@ -0,0 +1,98 @@
+"""
+Ventana de diagrama de bifurcación de equilibrios para sistemas 2D
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
+from core.bifurcacion_2d import AnalizadorBifurcacion2D
+from visualization.bifurcacion_2d import graficar_diagrama_bifurcacion_2d
+from ui.estilos import COLORES, FUENTES
+
+
+class VentanaBifurcacion2D:
+    """Sigue los equilibrios en el parámetro y marca Hopf y pliegues"""
+
+    def __init__(self, parent, sistema, xlim, ylim, parametro='u'):
+        """
+        Parámetros:
+        - parent: ventana padre
+        - sistema: SistemaDinamico2D con el parámetro definido
+        - xlim, ylim: caja de estados donde se buscan los equilibrios
+        - parametro: nombre del parámetro a variar
+        """
+        self.analizador = AnalizadorBifurcacion2D(sistema, parametro)
+        self.xlim = xlim
+        self.ylim = ylim
+        self.parametro = parametro
+
+        self.ventana = tk.Toplevel(parent)
+        self.ventana.title(f"Bifurcaciones de Equilibrios en {parametro}")
+        self.ventana.geometry("950x800")
+        self.ventana.configure(bg=COLORES['fondo'])
+
+        valor = sistema.parametros[parametro]
+        self.desde_var = tk.DoubleVar(value=valor - 1.0)
+        self.hasta_var = tk.DoubleVar(value=valor + 1.0)
+
+        self._crear_widgets()
+        self._calcular()
+
+    def _crear_widgets(self):
+        controles = ttk.Frame(self.ventana, padding="10")
+        controles.pack(fill=tk.X)
+
+        ttk.Label(controles, text=f"{self.parametro} desde:").pack(side=tk.LEFT)
+        ttk.Entry(controles, textvariable=self.desde_var, width=8).pack(side=tk.LEFT, padx=5)
+        ttk.Label(controles, text="hasta:").pack(side=tk.LEFT)
+        ttk.Entry(controles, textvariable=self.hasta_var, width=8).pack(side=tk.LEFT, padx=5)
+        ttk.Button(controles, text="Calcular", style='Accent.TButton',
+                   command=self._calcular).pack(side=tk.LEFT, padx=10)
+        ttk.Button(controles, text="Cerrar",
+                   command=self.ventana.destroy).pack(side=tk.RIGHT, padx=5)
+
+        self.label_resumen = ttk.Label(self.ventana, text="", font=FUENTES['monoespaciada'],
+                                       padding="10 0")
+        self.label_resumen.pack(fill=tk.X)
+
+        self.fig = Figure(figsize=(9, 7), dpi=100)
+        self.ax_x = self.fig.add_subplot(2, 1, 1)
+        self.ax_y = self.fig.add_subplot(2, 1, 2, sharex=self.ax_x)
+        self.canvas = FigureCanvasTkAgg(self.fig, self.ventana)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10)
+        NavigationToolbar2Tk(self.canvas, self.ventana).update()
+
+    def _calcular(self):
+        try:
+            rango = (self.desde_var.get(), self.hasta_var.get())
+        except tk.TclError:
+            messagebox.showerror("Error", "Ingrese valores numéricos válidos")
+            return
+        if rango[0] == rango[1]:
+            messagebox.showwarning("Valores Inválidos", "El rango del parámetro está vacío")
+            return
+
+        self.ventana.config(cursor='watch')
+        self.ventana.update_idletasks()
+        try:
+            resultado = self.analizador.continuar_equilibrios(rango, self.xlim, self.ylim)
+            graficar_diagrama_bifurcacion_2d(self.ax_x, resultado, 0, self.parametro)
+            graficar_diagrama_bifurcacion_2d(self.ax_y, resultado, 1, self.parametro)
+            self.ax_x.set_title("Diagrama de Bifurcación de Equilibrios",
+                                fontsize=12, fontweight='bold')
+            self.fig.tight_layout()
+            self.canvas.draw()
+            self.label_resumen.config(text=self._resumen(resultado))
+        except Exception as e:
+            messagebox.showerror("Error", f"Error en el análisis:\n{str(e)}")
+        finally:
+            self.ventana.config(cursor='')
+
+    def _resumen(self, resultado):
+        partes = [f"Ramas: {len(resultado['ramas'])}"]
+        for hopf in resultado['hopf']:
+            partes.append(f"Hopf {self.parametro}={hopf['parametro']:.4f} (ω={hopf['frecuencia']:.3f})")
+        for pliegue in resultado['pliegues']:
+            partes.append(f"Pliegue {self.parametro}={pliegue['parametro']:.4f}")
+        return " | ".join(partes)
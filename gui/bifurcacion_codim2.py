@@ -0,0 +1,91 @@
+"""
+Ventana del mapa de regiones (r, h) para bifurcaciones de codimensión 2
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
+
+from core.bifurcacion_codim2 import AnalizadorBifurcacionCodim2
+from visualization.bifurcacion_codim2 import VisualizadorBifurcacionCodim2
+from ui.estilos import COLORES, FUENTES
+
+
+class VentanaBifurcacionCodim2:
+    """Ventana con el mapa de regiones de f(x, r, h) y sus curvas de pliegue"""
+
+    def __init__(self, parent, funcion_str: str = 'h + r*x - x**3',
+                 r_range=(-1.0, 2.0), x_range=(-3.0, 3.0)):
+        """
+        Parámetros:
+        - parent: ventana padre
+        - funcion_str: función inicial f(x, r, h)
+        - r_range, x_range: rangos iniciales (los de la interfaz 1D)
+        """
+        self.ventana = tk.Toplevel(parent)
+        self.ventana.title("Bifurcaciones en Dos Parámetros (r, h)")
+        self.ventana.geometry("1000x780")
+        self.ventana.configure(bg=COLORES['fondo'])
+
+        self.funcion_var = tk.StringVar(value=funcion_str)
+        self.entradas = {}
+        self._crear_widgets({'r': r_range, 'h': (-1.0, 1.0), 'x': x_range})
+
+    def _crear_widgets(self, rangos):
+        controles = ttk.Frame(self.ventana, padding="10")
+        controles.pack(fill=tk.X)
+
+        ttk.Label(controles, text="f(x, r, h) =", font=FUENTES['normal_bold']).grid(
+            row=0, column=0, sticky=tk.W)
+        ttk.Entry(controles, textvariable=self.funcion_var, width=40).grid(
+            row=0, column=1, columnspan=6, sticky=(tk.W, tk.E), padx=5)
+
+        for columna, (nombre, (minimo, maximo)) in enumerate(rangos.items()):
+            marco = ttk.Frame(controles)
+            marco.grid(row=1, column=2 * columna, columnspan=2, sticky=tk.W, pady=5)
+            ttk.Label(marco, text=f"Rango de {nombre}:").pack(side=tk.LEFT)
+            entradas = []
+            for valor in (minimo, maximo):
+                entrada = ttk.Entry(marco, width=7)
+                entrada.insert(0, str(valor))
+                entrada.pack(side=tk.LEFT, padx=2)
+                entradas.append(entrada)
+            self.entradas[nombre] = entradas
+
+        ttk.Button(controles, text="Calcular Mapa", style='Accent.TButton',
+                   command=self._calcular).grid(row=1, column=6, padx=10)
+        ttk.Button(controles, text="Cerrar",
+                   command=self.ventana.destroy).grid(row=1, column=7, padx=5)
+
+        self.fig = Figure(figsize=(9, 6.5), dpi=100)
+        self.canvas = FigureCanvasTkAgg(self.fig, self.ventana)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10)
+        NavigationToolbar2Tk(self.canvas, self.ventana).update()
+
+    def _leer_rango(self, nombre):
+        minimo, maximo = (float(e.get()) for e in self.entradas[nombre])
+        if minimo >= maximo:
+            raise ValueError(f"El rango de {nombre} debe cumplir min < max")
+        return minimo, maximo
+
+    def _calcular(self):
+        try:
+            r_range, h_range, x_range = (self._leer_rango(n) for n in ('r', 'h', 'x'))
+            analizador = AnalizadorBifurcacionCodim2(self.funcion_var.get())
+        except ValueError as e:
+            messagebox.showerror("Error", f"Error en los parámetros: {e}")
+            return
+
+        self.ventana.config(cursor='watch')
+        self.ventana.update_idletasks()
+        try:
+            self.fig.clear()
+            VisualizadorBifurcacionCodim2(analizador).graficar_mapa_regiones(
+                r_range, h_range, x_range, self.fig)
+            self.fig.tight_layout()
+            self.canvas.draw()
+        except Exception as e:
+            messagebox.showerror("Error", f"Error durante el análisis: {e}")
+        finally:
+            self.ventana.config(cursor='')
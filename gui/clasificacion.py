@@ -0,0 +1,84 @@
+"""
+Ventana de clasificación local de la linealización sobre toda la vista
+"""
+
+import time
+import tkinter as tk
+from tkinter import ttk, messagebox
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
+from core.clasificacion import clasificar_malla
+from visualization.clasificacion import graficar_mapa_clasificacion, graficar_mapa_divergencia
+from ui.estilos import COLORES, FUENTES
+
+
+class VentanaClasificacionLocal:
+    """Mapa de tipos (nodo, espiral, silla...) y de divergencia del Jacobiano en cada punto"""
+
+    def __init__(self, parent, sistema, xlim, ylim):
+        """
+        Parámetros:
+        - parent: ventana padre
+        - sistema: SistemaDinamico2D
+        - xlim, ylim: región a clasificar
+        """
+        self.sistema = sistema
+        self.xlim = tuple(xlim)
+        self.ylim = tuple(ylim)
+        self.barra_color = None
+
+        self.ventana = tk.Toplevel(parent)
+        self.ventana.title("Clasificación Local de la Linealización")
+        self.ventana.geometry("1300x650")
+        self.ventana.configure(bg=COLORES['fondo'])
+
+        self.resolucion_var = tk.IntVar(value=500)
+        self.t_var = tk.DoubleVar(value=0.0)
+        self.estado_var = tk.StringVar(value="")
+
+        self._crear_widgets()
+        self._calcular()
+
+    def _crear_widgets(self):
+        controles = ttk.Frame(self.ventana, padding="10")
+        controles.pack(fill=tk.X)
+
+        for columna, (texto, variable) in enumerate((("Celdas/lado:", self.resolucion_var),
+                                                     ("t:", self.t_var))):
+            ttk.Label(controles, text=texto).grid(row=0, column=2 * columna, sticky=tk.W)
+            ttk.Entry(controles, textvariable=variable, width=8).grid(row=0, column=2 * columna + 1,
+                                                                     padx=(2, 10))
+        ttk.Button(controles, text="Calcular", style='Accent.TButton',
+                   command=self._calcular).grid(row=0, column=4, padx=5)
+        ttk.Button(controles, text="Cerrar", command=self.ventana.destroy).grid(row=0, column=5, padx=5)
+        ttk.Label(controles, textvariable=self.estado_var,
+                  font=FUENTES['pequena']).grid(row=0, column=6, padx=10, sticky=tk.W)
+
+        self.fig = Figure(figsize=(12, 5.5), dpi=100)
+        self.ax_clases = self.fig.add_subplot(1, 2, 1)
+        self.ax_divergencia = self.fig.add_subplot(1, 2, 2, sharex=self.ax_clases, sharey=self.ax_clases)
+        self.canvas = FigureCanvasTkAgg(self.fig, self.ventana)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        NavigationToolbar2Tk(self.canvas, self.ventana).update()
+
+    def _calcular(self):
+        try:
+            n = self.resolucion_var.get()
+            if n < 2:
+                raise ValueError("Se requieren al menos 2 celdas por lado")
+            inicio = time.perf_counter()
+            mapa = clasificar_malla(self.sistema, self.xlim, self.ylim, (n, n), t=self.t_var.get())
+            duracion = time.perf_counter() - inicio
+        except (ValueError, tk.TclError) as e:
+            messagebox.showerror("Error", f"No se pudo clasificar:\n{str(e)}")
+            return
+
+        if self.barra_color is not None:
+            self.barra_color.remove()
+            self.barra_color = None
+        graficar_mapa_clasificacion(self.ax_clases, mapa)
+        imagen = graficar_mapa_divergencia(self.ax_divergencia, mapa)
+        self.barra_color = self.fig.colorbar(imagen, ax=self.ax_divergencia, shrink=0.85)
+        self.estado_var.set(f"{n * n:,} celdas en {1000 * duracion:.0f} ms")
+        self.fig.tight_layout()
+        self.canvas.draw()
@@ -0,0 +1,74 @@
+"""
+Ventana de continuación de ciclos límite en el parámetro u
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
+from core.orbitas_periodicas import ContinuacionOrbitas
+from visualization.orbitas_periodicas import graficar_continuacion_orbitas
+from ui.estilos import COLORES
+
+
+class VentanaContinuacionOrbitas:
+    """Calcula y grafica la familia de ciclos que pasa por una semilla"""
+
+    def __init__(self, parent, sistema, semilla, parametro='u'):
+        """
+        Parámetros:
+        - parent: ventana padre
+        - sistema: SistemaDinamico2D con el parámetro definido
+        - semilla: punto desde el que se busca el primer ciclo
+        - parametro: nombre del parámetro a variar
+        """
+        self.continuacion = ContinuacionOrbitas(sistema, parametro)
+        self.semilla = semilla
+        self.parametro = parametro
+
+        self.ventana = tk.Toplevel(parent)
+        self.ventana.title(f"Continuación de Ciclos Límite en {parametro}")
+        self.ventana.geometry("950x800")
+        self.ventana.configure(bg=COLORES['fondo'])
+
+        valor = sistema.parametros[parametro]
+        self.desde_var = tk.DoubleVar(value=valor)
+        self.hasta_var = tk.DoubleVar(value=valor - 1.0 if valor > 0 else valor + 1.0)
+
+        self._crear_widgets()
+
+    def _crear_widgets(self):
+        controles = ttk.Frame(self.ventana, padding="10")
+        controles.pack(fill=tk.X)
+
+        ttk.Label(controles, text=f"{self.parametro} desde:").pack(side=tk.LEFT)
+        ttk.Entry(controles, textvariable=self.desde_var, width=8).pack(side=tk.LEFT, padx=5)
+        ttk.Label(controles, text="hasta:").pack(side=tk.LEFT)
+        ttk.Entry(controles, textvariable=self.hasta_var, width=8).pack(side=tk.LEFT, padx=5)
+        ttk.Button(controles, text="Calcular", style='Accent.TButton',
+                   command=self._calcular).pack(side=tk.LEFT, padx=10)
+        ttk.Button(controles, text="Cerrar",
+                   command=self.ventana.destroy).pack(side=tk.RIGHT, padx=5)
+
+        self.fig = Figure(figsize=(9, 7), dpi=100)
+        self.canvas = FigureCanvasTkAgg(self.fig, self.ventana)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10)
+        NavigationToolbar2Tk(self.canvas, self.ventana).update()
+
+    def _calcular(self):
+        try:
+            desde, hasta = self.desde_var.get(), self.hasta_var.get()
+        except tk.TclError:
+            messagebox.showerror("Error", "Ingrese valores numéricos válidos")
+            return
+
+        self.ventana.config(cursor='watch')
+        self.ventana.update_idletasks()
+        try:
+            resultado = self.continuacion.continuar(desde, hasta, semilla=self.semilla)
+            graficar_continuacion_orbitas(self.fig, resultado, self.parametro)
+            self.canvas.draw()
+        except Exception as e:
+            messagebox.showerror("Error", f"Error en la continuación:\n{str(e)}")
+        finally:
+            self.ventana.config(cursor='')
@@ -0,0 +1,157 @@
+"""
+Ventana de conjuntos estocásticos para sistemas 2D y Lotka-Volterra
+"""
+
+import numpy as np
+import tkinter as tk
+from tkinter import ttk, messagebox
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
+from core.estocastico import crear_integrador_estocastico, RUIDOS, METODOS
+from core.lotka_volterra import SistemaLotkaVolterra
+from visualization.estocastico import graficar_conjunto_estocastico
+from ui.estilos import COLORES, FUENTES
+
+NOMBRES_METODOS = {'euler_maruyama': 'Euler–Maruyama', 'milstein': 'Milstein'}
+
+
+class VentanaEstocastica:
+    """
+    Evolución de la distribución de N trayectorias con ruido
+
+    Todas parten del mismo punto; cada cuadro es el histograma del conjunto
+    en un instante. El cálculo avanza desde el bucle de Tk (after), así que
+    la animación puede detenerse en cualquier momento.
+    """
+
+    def __init__(self, parent, sistema, xlim, ylim, punto_inicial=None):
+        """
+        Parámetros:
+        - parent: ventana padre
+        - sistema: SistemaDinamico2D o SistemaLotkaVolterra
+        - xlim, ylim: región del histograma
+        - punto_inicial: estado común de partida (por defecto el centro de la vista)
+        """
+        self.sistema = sistema
+        self.xlim = tuple(xlim)
+        self.ylim = tuple(ylim)
+        self._generador = None
+        self._tarea = None
+        self._artistas = None
+
+        if punto_inicial is None:
+            punto_inicial = (np.mean(self.xlim), np.mean(self.ylim))
+        lotka_volterra = isinstance(sistema, SistemaLotkaVolterra)
+
+        self.ventana = tk.Toplevel(parent)
+        self.ventana.title("Conjunto Estocástico")
+        self.ventana.geometry("900x820")
+        self.ventana.configure(bg=COLORES['fondo'])
+        self.ventana.protocol("WM_DELETE_WINDOW", self._cerrar)
+
+        self.sigma_var = tk.DoubleVar(value=0.1 if lotka_volterra else 0.3)
+        self.ruido_var = tk.StringVar(value='multiplicativo' if lotka_volterra else 'aditivo')
+        self.metodo_var = tk.StringVar(value=NOMBRES_METODOS['euler_maruyama'])
+        self.n_var = tk.IntVar(value=5000)
+        self.dt_var = tk.DoubleVar(value=0.01)
+        self.t_max_var = tk.DoubleVar(value=30.0)
+        self.x0_var = tk.DoubleVar(value=round(float(punto_inicial[0]), 4))
+        self.y0_var = tk.DoubleVar(value=round(float(punto_inicial[1]), 4))
+        self.semilla_var = tk.IntVar(value=0)
+        self.estado_var = tk.StringVar(value="")
+
+        self._crear_widgets()
+        self._iniciar()
+
+    def _crear_widgets(self):
+        controles = ttk.Frame(self.ventana, padding="10")
+        controles.pack(fill=tk.X)
+
+        ttk.Label(controles, text="Ruido:").grid(row=0, column=0, sticky=tk.W)
+        ttk.Combobox(controles, textvariable=self.ruido_var, values=RUIDOS, state='readonly',
+                     width=14).grid(row=0, column=1, padx=(2, 10), pady=2)
+        ttk.Label(controles, text="Método:").grid(row=0, column=2, sticky=tk.W)
+        ttk.Combobox(controles, textvariable=self.metodo_var, state='readonly', width=14,
+                     values=[NOMBRES_METODOS[m] for m in METODOS]).grid(row=0, column=3, padx=(2, 10))
+        ttk.Label(controles, text="σ:").grid(row=0, column=4, sticky=tk.W)
+        ttk.Entry(controles, textvariable=self.sigma_var, width=9).grid(row=0, column=5, padx=(2, 10))
+
+        campos = (("Trayectorias:", self.n_var), ("dt:", self.dt_var), ("t máx:", self.t_max_var),
+                  ("x₀:", self.x0_var), ("y₀:", self.y0_var), ("Semilla:", self.semilla_var))
+        for indice, (texto, variable) in enumerate(campos):
+            fila, columna = 1 + indice // 3, 2 * (indice % 3)
+            ttk.Label(controles, text=texto).grid(row=fila, column=columna, sticky=tk.W)
+            ttk.Entry(controles, textvariable=variable, width=9).grid(row=fila, column=columna + 1,
+                                                                      padx=(2, 10), pady=2)
+
+        ttk.Button(controles, text="Simular", style='Accent.TButton',
+                   command=self._iniciar).grid(row=0, column=6, padx=5)
+        ttk.Button(controles, text="Detener",
+                   command=self._detener).grid(row=1, column=6, padx=5)
+        ttk.Button(controles, text="Cerrar",
+                   command=self._cerrar).grid(row=2, column=6, padx=5)
+
+        ttk.Label(self.ventana, textvariable=self.estado_var,
+                  font=FUENTES['pequena']).pack(anchor=tk.W, padx=10)
+
+        self.fig = Figure(figsize=(8, 7), dpi=100)
+        self.ax = self.fig.add_subplot(111)
+        self.canvas = FigureCanvasTkAgg(self.fig, self.ventana)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        NavigationToolbar2Tk(self.canvas, self.ventana).update()
+
+    def _iniciar(self):
+        self._detener()
+        try:
+            metodo = next(m for m, nombre in NOMBRES_METODOS.items() if nombre == self.metodo_var.get())
+            integrador = crear_integrador_estocastico(self.sistema, self.sigma_var.get(),
+                                                      ruido=self.ruido_var.get(), metodo=metodo,
+                                                      semilla=self.semilla_var.get())
+            n = self.n_var.get()
+            if n < 1:
+                raise ValueError("Se requiere al menos una trayectoria")
+            dt, t_max = self.dt_var.get(), self.t_max_var.get()
+            semillas = np.tile([self.x0_var.get(), self.y0_var.get()], (n, 1))
+            # ~200 cuadros por corrida, con un mínimo de un paso por cuadro
+            cada = max(int(round(t_max / dt / 200)), 1)
+            self._generador = integrador.histogramas(semillas, t_max, dt, self.xlim, self.ylim,
+                                                     resolucion=(200, 200), cada=cada)
+        except (ValueError, tk.TclError) as e:
+            messagebox.showerror("Error", f"Valores inválidos:\n{str(e)}")
+            return
+
+        self.ax.clear()
+        self._artistas = None
+        self.estado_var.set(f"Integrando {n:,} trayectorias...")
+        self._tarea = self.ventana.after(10, self._avanzar)
+
+    def _avanzar(self):
+        """Dibuja el siguiente instante del conjunto"""
+        self._tarea = None
+        try:
+            t, histograma, resumen = next(self._generador)
+        except StopIteration:
+            self._generador = None
+            return
+        except Exception as e:
+            self._generador = None
+            messagebox.showerror("Error", f"Error en la simulación:\n{str(e)}")
+            return
+
+        self._artistas = graficar_conjunto_estocastico(self.ax, histograma, self._artistas, t, resumen)
+        media, desviacion = resumen['media'], resumen['desviacion']
+        self.estado_var.set(f"t = {t:.3g} | media = ({media[0]:.4g}, {media[1]:.4g}) | "
+                            f"desviación = ({desviacion[0]:.3g}, {desviacion[1]:.3g}) | "
+                            f"fuera de la vista: {histograma.descartados:,}")
+        self.canvas.draw_idle()
+        self._tarea = self.ventana.after(1, self._avanzar)
+
+    def _detener(self):
+        if self._tarea is not None:
+            self.ventana.after_cancel(self._tarea)
+            self._tarea = None
+        self._generador = None
+
+    def _cerrar(self):
+        self._detener()
+        self.ventana.destroy()
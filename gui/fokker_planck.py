@@ -0,0 +1,162 @@
+"""
+Ventana de evolución de densidades (Fokker–Planck) para sistemas 2D con ruido aditivo
+"""
+
+import numpy as np
+import tkinter as tk
+from tkinter import ttk, messagebox
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
+from core.fokker_planck import FokkerPlanck2D
+from visualization.fokker_planck import graficar_densidad
+from ui.estilos import COLORES, FUENTES
+
+
+class VentanaFokkerPlanck:
+    """
+    Densidad de probabilidad sobre la vista actual
+
+    "Evolucionar" anima una gaussiana inicial paso a paso desde el bucle de
+    Tk (after); "Estacionaria" resuelve L·p = 0 directamente. El operador se
+    arma al aplicar cambios de ruido o malla y se reutiliza entre corridas.
+    """
+
+    def __init__(self, parent, sistema, xlim, ylim):
+        """
+        Parámetros:
+        - parent: ventana padre
+        - sistema: SistemaDinamico2D
+        - xlim, ylim: dominio de la densidad
+        """
+        self.sistema = sistema
+        self.xlim = tuple(xlim)
+        self.ylim = tuple(ylim)
+        self.modelo = None
+        self._clave_modelo = None
+        self._generador = None
+        self._tarea = None
+        self._imagen = None
+
+        self.ventana = tk.Toplevel(parent)
+        self.ventana.title("Densidad de Fokker–Planck")
+        self.ventana.geometry("900x820")
+        self.ventana.configure(bg=COLORES['fondo'])
+        self.ventana.protocol("WM_DELETE_WINDOW", self._cerrar)
+
+        self.sigma_x_var = tk.DoubleVar(value=0.3)
+        self.sigma_y_var = tk.DoubleVar(value=0.3)
+        self.celdas_var = tk.IntVar(value=120)
+        self.dt_var = tk.DoubleVar(value=0.02)
+        self.t_max_var = tk.DoubleVar(value=20.0)
+        self.x0_var = tk.DoubleVar(value=round(float(np.mean(self.xlim)), 4))
+        self.y0_var = tk.DoubleVar(value=round(float(np.mean(self.ylim)), 4))
+        self.ancho_var = tk.DoubleVar(value=round(0.05 * (self.xlim[1] - self.xlim[0]), 4))
+        self.estado_var = tk.StringVar(value="")
+
+        self._crear_widgets()
+        self._evolucionar()
+
+    def _crear_widgets(self):
+        controles = ttk.Frame(self.ventana, padding="10")
+        controles.pack(fill=tk.X)
+
+        campos = (("σx:", self.sigma_x_var), ("σy:", self.sigma_y_var), ("Celdas/lado:", self.celdas_var),
+                  ("dt:", self.dt_var), ("t máx:", self.t_max_var), ("Ancho inicial:", self.ancho_var),
+                  ("x₀:", self.x0_var), ("y₀:", self.y0_var))
+        for indice, (texto, variable) in enumerate(campos):
+            fila, columna = indice // 4, 2 * (indice % 4)
+            ttk.Label(controles, text=texto).grid(row=fila, column=columna, sticky=tk.W)
+            ttk.Entry(controles, textvariable=variable, width=8).grid(row=fila, column=columna + 1,
+                                                                      padx=(2, 10), pady=2)
+
+        ttk.Button(controles, text="Evolucionar", style='Accent.TButton',
+                   command=self._evolucionar).grid(row=0, column=8, padx=5)
+        ttk.Button(controles, text="Estacionaria",
+                   command=self._estacionaria).grid(row=1, column=8, padx=5)
+        ttk.Button(controles, text="Detener",
+                   command=self._detener).grid(row=0, column=9, padx=5)
+        ttk.Button(controles, text="Cerrar",
+                   command=self._cerrar).grid(row=1, column=9, padx=5)
+
+        ttk.Label(self.ventana, textvariable=self.estado_var,
+                  font=FUENTES['pequena']).pack(anchor=tk.W, padx=10)
+
+        self.fig = Figure(figsize=(8, 7), dpi=100)
+        self.ax = self.fig.add_subplot(111)
+        self.canvas = FigureCanvasTkAgg(self.fig, self.ventana)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        NavigationToolbar2Tk(self.canvas, self.ventana).update()
+
+    def _obtener_modelo(self):
+        """Reensambla el operador solo si cambió el ruido o la malla"""
+        celdas = self.celdas_var.get()
+        clave = (self.sigma_x_var.get(), self.sigma_y_var.get(), celdas)
+        if clave != self._clave_modelo:
+            self.modelo = FokkerPlanck2D(self.sistema, clave[:2], self.xlim, self.ylim, (celdas, celdas))
+            self._clave_modelo = clave
+        return self.modelo
+
+    def _reiniciar_grafica(self):
+        self.ax.clear()
+        self._imagen = None
+
+    def _evolucionar(self):
+        self._detener()
+        try:
+            modelo = self._obtener_modelo()
+            P0 = modelo.gaussiana((self.x0_var.get(), self.y0_var.get()), self.ancho_var.get())
+            dt, t_max = self.dt_var.get(), self.t_max_var.get()
+            # ~200 cuadros por corrida
+            cada = max(int(round(t_max / dt / 200)), 1)
+            self._generador = modelo.evolucionar(P0, t_max, dt, cada=cada)
+        except (ValueError, tk.TclError) as e:
+            messagebox.showerror("Error", f"Valores inválidos:\n{str(e)}")
+            return
+
+        self._reiniciar_grafica()
+        self.estado_var.set(f"Malla {modelo.nx}×{modelo.ny} | nnz(L) = {modelo.L.nnz:,}")
+        self._tarea = self.ventana.after(10, self._avanzar)
+
+    def _avanzar(self):
+        """Dibuja el siguiente instante de la densidad"""
+        self._tarea = None
+        try:
+            t, P = next(self._generador)
+        except StopIteration:
+            self._generador = None
+            return
+        except Exception as e:
+            self._generador = None
+            messagebox.showerror("Error", f"Error en la evolución:\n{str(e)}")
+            return
+
+        self._imagen = graficar_densidad(self.ax, self.modelo, P, self._imagen, t=t)
+        self.canvas.draw_idle()
+        self._tarea = self.ventana.after(1, self._avanzar)
+
+    def _estacionaria(self):
+        self._detener()
+        try:
+            modelo = self._obtener_modelo()
+            P = modelo.estacionaria()
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudo calcular la densidad estacionaria:\n{str(e)}")
+            return
+
+        self._reiniciar_grafica()
+        self._imagen = graficar_densidad(self.ax, modelo, P, titulo='Densidad estacionaria')
+        desviacion = modelo.momentos(P)['desviacion']
+        self.estado_var.set(f"Malla {modelo.nx}×{modelo.ny} | desviación = "
+                            f"({desviacion[0]:.4g}, {desviacion[1]:.4g}) | "
+                            f"la masa no sale del dominio: amplíe la vista si se acumula en los bordes")
+        self.canvas.draw_idle()
+
+    def _detener(self):
+        if self._tarea is not None:
+            self.ventana.after_cancel(self._tarea)
+            self._tarea = None
+        self._generador = None
+
+    def _cerrar(self):
+        self._detener()
+        self.ventana.destroy()
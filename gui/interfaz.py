@@ -12,14 +12,27 @@ import matplotlib
 matplotlib.use('TkAgg')
 
 from core.sistema import SistemaDinamico2D
-from core.utils import normalizar_funciones
+from core.utils import normalizar_funciones, parsear_parametros, separar_barridos, formatear_parametros
 from visualization.grapher import Grapher
-from visualization.plotter import integrate_trajectory_limited
-from visualization.math_utils import agregar_flechas_trayectoria
+from visualization.cache_trayectorias import CacheTrayectorias
+from visualization.math_utils import calcular_flechas_trayectoria
+from visualization.artistas import dibujar_flechas_lote, marcar_puntos_lote
 from ui.widgets import ToolTip
 from ui.estilos import configurar_estilos_ttk, COLORES, FUENTES
 from input_module.ejemplos import EJEMPLOS_LINEALES
 from gui.popup_analisis import VentanaAnalisisPopup
+from gui.animacion_campo import VentanaAnimacionCampo
+from gui.continuacion_orbitas import VentanaContinuacionOrbitas
+from gui.bifurcacion_2d import VentanaBifurcacion2D
+from gui.lyapunov import VentanaLyapunov
+from gui.poincare import VentanaPoincare
+from gui.estocastico import VentanaEstocastica
+from gui.fokker_planck import VentanaFokkerPlanck
+from gui.clasificacion import VentanaClasificacionLocal
+from gui.plano_traza_determinante import VentanaPlanoTrazaDeterminante
+from gui.respuesta_frecuencia import VentanaRespuestaFrecuencia
+from gui.barrido_parametros import VentanaBarridoParametros
+from gui.sistema_lineal_disperso import VentanaSistemaLinealDisperso
 
 
 class InterfazGrafica:
@@ -82,13 +95,26 @@ class InterfazGrafica:
         self.f2_expr = tk.StringVar(value="-y")
         
         # Variables de parámetros personalizados
-        self.parametros_expr = tk.StringVar(value="")  # Solo el valor de 'u'
+        self.parametros_expr = tk.StringVar(value="")  # "0.5", "u=0.5, k=2" o barridos "u=-1:1:6"
         
         # Variables de visualización
         self.mostrar_nuclinas = tk.BooleanVar(value=False)
         
         # Sistema actual
         self.sistema_actual = None
+        self._barrido_pendiente = None  # (barrido, forma) a mostrar tras analizar
+        self.grapher_actual = None
+        
+        # Deslizador de u en vivo
+        self.u_slider_var = tk.DoubleVar(value=0.0)
+        self._u_pendiente = None
+        self._tarea_slider = None
+        self._tarea_slider_final = None
+        self._fondo_slider = None
+        self._semillas_slider = []
+        
+        # Trayectorias integradas (se reutilizan al redibujar)
+        self.cache_trayectorias = CacheTrayectorias()
     
     def crear_widgets(self):
         """Crea la estructura principal de widgets"""
@@ -218,6 +244,17 @@ class InterfazGrafica:
                                  style='Accent.TButton',
                                  command=self.analizar_sistema)
         btn_analizar.grid(row=3, column=0, columnspan=4, pady=(15, 0), sticky=(tk.W, tk.E))
+        
+        # Sistemas lineales de gran dimensión (matriz dispersa n×n)
+        btn_disperso = ttk.Button(self.matriz_frame, text="Red Lineal Dispersa (n estados)",
+                                  command=self.mostrar_sistema_disperso)
+        btn_disperso.grid(row=4, column=0, columnspan=4, pady=(5, 0), sticky=(tk.W, tk.E))
+        ToolTip(btn_disperso, "dx/dt = A·x con A dispersa de miles de estados")
+        
+        btn_traza_det = ttk.Button(self.matriz_frame, text="Plano Traza–Determinante",
+                                   command=self.mostrar_plano_traza_determinante)
+        btn_traza_det.grid(row=5, column=0, columnspan=4, pady=(5, 0), sticky=(tk.W, tk.E))
+        ToolTip(btn_traza_det, "Ubica A y un barrido de uno de sus elementos en el plano (tr, det)")
     
     def _crear_entrada_funciones(self, parent):
         """Crea frame para entrada de funciones personalizadas"""
@@ -245,8 +282,8 @@ class InterfazGrafica:
                                   width=30, font=FUENTES['monoespaciada'])
         self.entry_f2.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=5)
         
-        # Entrada de parámetro u
-        ttk.Label(self.funciones_frame, text="u (opcional):", 
+        # Entrada de parámetros (con nombre y barridos)
+        ttk.Label(self.funciones_frame, text="Parámetros:", 
                  background='white', font=FUENTES['normal']).grid(
             row=3, column=0, sticky=tk.E, padx=(0, 5), pady=5)
         
@@ -258,7 +295,8 @@ class InterfazGrafica:
         
         # Ayuda
         ayuda_text = "Variables: x, y, t | Funciones: sin(), cos(), exp(), sqrt(), abs()\n"
-        ayuda_text += "Puede usar 'u' como parámetro. Ej: u*x-y con u=0.5\n"
+        ayuda_text += "Parámetros: u=0.5, k=2 (un número solo es u). Ej: u*x-k*y\n"
+        ayuda_text += "Barrido en cuadrícula: u=-1:1:6 o k=[0.5, 1, 2]\n"
         ayuda_text += "Use 'sen' o 'sin' para seno, ambos son válidos"
         ttk.Label(self.funciones_frame, text=ayuda_text,
                  background='white', foreground=COLORES['texto_secundario'],
@@ -297,6 +335,20 @@ class InterfazGrafica:
                                command=lambda f1=f1, f2=f2: self._cargar_ejemplo_funcion(f1, f2, ""))
             btn.grid(row=row, column=col, pady=2, padx=2, sticky=(tk.W, tk.E))
         
+        # Deslizador de u (solo visible si el sistema tiene u)
+        self.slider_u_frame = ttk.Frame(self.funciones_frame)
+        self.slider_u_frame.grid(row=9, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
+        ttk.Label(self.slider_u_frame, text="u en vivo:",
+                 background='white', font=FUENTES['normal']).pack(side=tk.LEFT)
+        self.label_u_vivo = ttk.Label(self.slider_u_frame, text="", width=7,
+                                      background='white', font=FUENTES['monoespaciada'])
+        self.label_u_vivo.pack(side=tk.RIGHT)
+        self.scale_u = ttk.Scale(self.slider_u_frame, from_=-2.0, to=2.0,
+                                 variable=self.u_slider_var, orient=tk.HORIZONTAL,
+                                 command=self._on_slider_u)
+        self.scale_u.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self.slider_u_frame.grid_remove()
+        
         self.funciones_frame.columnconfigure(0, weight=1)
         self.funciones_frame.columnconfigure(1, weight=1)
         
@@ -370,6 +422,16 @@ class InterfazGrafica:
                                 command=self.aplicar_termino_forzado)
         btn_aplicar.grid(row=4, column=0, columnspan=4, pady=(15, 0), sticky=(tk.W, tk.E))
         
+        # Botón Animar (campo dependiente del tiempo)
+        btn_animar = ttk.Button(self.forzado_controls, text="Animar Campo en el Tiempo",
+                               command=self.mostrar_animacion_campo)
+        btn_animar.grid(row=5, column=0, columnspan=4, pady=(5, 0), sticky=(tk.W, tk.E))
+        
+        # Botón Respuesta en Frecuencia (barrido de ω)
+        btn_bode = ttk.Button(self.forzado_controls, text="Respuesta en Frecuencia (Bode)",
+                             command=self.mostrar_respuesta_frecuencia)
+        btn_bode.grid(row=6, column=0, columnspan=4, pady=(5, 0), sticky=(tk.W, tk.E))
+        
         self.forzado_controls.grid_remove()
         self.forzado_frame.grid_remove()
     
@@ -415,6 +477,41 @@ class InterfazGrafica:
             command=self.mostrar_analisis_popup,
             style='Accent.TButton')
         self.btn_analisis_detallado.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        self.btn_continuacion = ttk.Button(
+            resultados_frame, text="🔁 Continuar Ciclos en u",
+            command=self.mostrar_continuacion_orbitas)
+        self.btn_continuacion.pack(fill=tk.X, padx=5, pady=(0, 5))
+        
+        self.btn_bifurcacion = ttk.Button(
+            resultados_frame, text="📈 Bifurcaciones de Equilibrios en u",
+            command=self.mostrar_bifurcacion_2d)
+        self.btn_bifurcacion.pack(fill=tk.X, padx=5, pady=(0, 5))
+        
+        self.btn_lyapunov = ttk.Button(
+            resultados_frame, text="λ Exponente de Lyapunov",
+            command=self.mostrar_lyapunov)
+        self.btn_lyapunov.pack(fill=tk.X, padx=5, pady=(0, 5))
+        
+        self.btn_poincare = ttk.Button(
+            resultados_frame, text="⏱ Mapa de Poincaré Estroboscópico",
+            command=self.mostrar_mapa_poincare)
+        self.btn_poincare.pack(fill=tk.X, padx=5, pady=(0, 5))
+        
+        self.btn_estocastico = ttk.Button(
+            resultados_frame, text="🎲 Conjunto con Ruido (EDE)",
+            command=self.mostrar_conjunto_estocastico)
+        self.btn_estocastico.pack(fill=tk.X, padx=5, pady=(0, 5))
+        
+        self.btn_fokker_planck = ttk.Button(
+            resultados_frame, text="🌫 Densidad de Fokker–Planck",
+            command=self.mostrar_fokker_planck)
+        self.btn_fokker_planck.pack(fill=tk.X, padx=5, pady=(0, 5))
+        
+        self.btn_clasificacion_local = ttk.Button(
+            resultados_frame, text="🗺 Mapa de Linealización Local",
+            command=self.mostrar_clasificacion_local)
+        self.btn_clasificacion_local.pack(fill=tk.X, padx=5, pady=(0, 5))
     
     def _crear_panel_derecho(self, parent):
         """Crea panel derecho con gráfica"""
@@ -625,7 +722,16 @@ class InterfazGrafica:
                 grapher = Grapher(sistema)
                 grapher.crear_grafica(self.ax, xlim=xlim_auto, ylim=ylim_auto, 
                                      mostrar_nuclinas=self.mostrar_nuclinas.get())
+                self.grapher_actual = grapher
+                self._replotear_trayectorias_cacheadas()
                 self.canvas.draw()
+                self._sincronizar_slider_u()
+                
+                if self._barrido_pendiente is not None:
+                    barrido, forma = self._barrido_pendiente
+                    self._barrido_pendiente = None
+                    VentanaBarridoParametros(self._obtener_ventana_root(), sistema,
+                                             barrido, forma, xlim_auto, ylim_auto)
         
         except Exception as e:
             messagebox.showerror("Error", f"Error al analizar el sistema:\n{str(e)}")
@@ -639,6 +745,8 @@ class InterfazGrafica:
             grapher = Grapher(self.sistema_actual)
             grapher.crear_grafica(self.ax, xlim=xlim, ylim=ylim,
                                  mostrar_nuclinas=self.mostrar_nuclinas.get())
+            self.grapher_actual = grapher
+            self._replotear_trayectorias_cacheadas()
             self.canvas.draw()
     
     def _cargar_ejemplo_funcion(self, f1, f2, params=""):
@@ -661,17 +769,18 @@ class InterfazGrafica:
         f1 = normalizar_funciones(f1)
         f2 = normalizar_funciones(f2)
         
-        # Parsear parámetro u
-        parametros = {}
-        params_str = self.parametros_expr.get().strip()
-        if params_str:
-            try:
-                parametros['u'] = float(params_str)
-            except Exception as e:
-                messagebox.showerror("Error en parámetro u",
-                    f"Error al parsear el valor de u:\n{str(e)}\n\n"
-                    f"Ingrese solo el valor numérico. Ej: 0.5")
-                return None
+        # Parsear parámetros; los barridos se dibujan aparte en una cuadrícula
+        self._barrido_pendiente = None
+        try:
+            parametros, barrido, forma = separar_barridos(
+                parsear_parametros(self.parametros_expr.get()))
+        except ValueError as e:
+            messagebox.showerror("Error en parámetros",
+                f"Error al parsear los parámetros:\n{str(e)}\n\n"
+                f"Ej: 0.5 | u=0.5, k=2 | u=-1:1:6")
+            return None
+        if barrido:
+            self._barrido_pendiente = (barrido, forma)
         
         # Crear sistema directamente (la validación se hace en core.sistema)
         return SistemaDinamico2D(
@@ -710,50 +819,144 @@ class InterfazGrafica:
             return
         
         try:
-            condicion_inicial = [event.xdata, event.ydata]
-            
             # Obtener límites actuales de la vista (para pan/zoom)
-            xlim = self.ax.get_xlim()
-            ylim = self.ax.get_ylim()
-            
-            # Calcular trayectorias hacia adelante y atrás con límites dinámicos
-            solucion_fw = integrate_trajectory_limited(
-                self.sistema_actual, condicion_inicial, direccion=1,
-                xlim=xlim, ylim=ylim)
-            solucion_bw = integrate_trajectory_limited(
-                self.sistema_actual, condicion_inicial, direccion=-1,
-                xlim=xlim, ylim=ylim)
-            
-            # Dibujar con flechas direccionales
-            if len(solucion_fw) > 1:
-                self.ax.plot(solucion_fw[:, 0], solucion_fw[:, 1], 
-                           'b-', linewidth=2, alpha=0.8)
-                # Agregar flechas a la trayectoria hacia adelante
-                self._agregar_flechas_a_trayectoria(self.ax, solucion_fw, 'b', direccion=1)
-            
-            if len(solucion_bw) > 1:
-                self.ax.plot(solucion_bw[:, 0], solucion_bw[:, 1], 
-                           'b-', linewidth=2, alpha=0.8)
-                # Agregar flechas a la trayectoria hacia atrás (invertir dirección)
-                self._agregar_flechas_a_trayectoria(self.ax, solucion_bw, 'b', direccion=-1)
-            
-            # Marcar punto inicial
-            self.ax.plot(event.xdata, event.ydata, 'ro', markersize=8,
-                        markeredgecolor='darkred', markeredgewidth=2)
-            
+            self._dibujar_trayectorias([(event.xdata, event.ydata)],
+                                       self.ax.get_xlim(), self.ax.get_ylim())
             self.canvas.draw()
         except Exception as e:
             print(f"Error al crear trayectoria: {e}")
     
-    def _agregar_flechas_a_trayectoria(self, ax, trayectoria, color, direccion=1):
-        """Agrega flechas direccionales a una trayectoria"""
-        agregar_flechas_trayectoria(ax, trayectoria, color, num_flechas=5, direccion=direccion)
+    def _replotear_trayectorias_cacheadas(self):
+        """Vuelve a dibujar las trayectorias ya integradas del sistema actual"""
+        if self.sistema_actual is None:
+            return
+        semillas = self.cache_trayectorias.semillas(self.sistema_actual)
+        if semillas:
+            self._dibujar_trayectorias(semillas, self.ax.get_xlim(), self.ax.get_ylim())
+    
+    def _dibujar_trayectorias(self, semillas, xlim, ylim):
+        """
+        Dibuja las trayectorias de varias semillas con un artista por capa
+        
+        Las trayectorias salen de la caché: solo se integra si la semilla es
+        nueva o si la vista creció más allá de lo ya integrado.
+        """
+        segmentos, origenes, direcciones = [], [], []
+        separador = np.full((1, 2), np.nan)
+        
+        for semilla in semillas:
+            solucion_fw = self.cache_trayectorias.obtener(self.sistema_actual, semilla, 1, xlim, ylim)
+            solucion_bw = self.cache_trayectorias.obtener(self.sistema_actual, semilla, -1, xlim, ylim)
+            
+            # Ambas ramas parten de la semilla: se unen en una sola línea decimada
+            puntos = np.vstack([solucion_bw.decimada()[::-1], solucion_fw.decimada()])
+            if len(puntos) > 2:
+                segmentos.extend([puntos, separador])
+            
+            # Flechas de ambas ramas (atrás invierte dirección)
+            for solucion, direccion in ((solucion_fw, 1), (solucion_bw, -1)):
+                o, d = calcular_flechas_trayectoria(solucion, 5, direccion=direccion)
+                origenes.append(o)
+                direcciones.append(d)
+        
+        # Todas las curvas en un único Line2D (NaN separa las trayectorias)
+        if segmentos:
+            puntos = np.vstack(segmentos)
+            self.ax.plot(puntos[:, 0], puntos[:, 1], 'b-', linewidth=2, alpha=0.8, gid='trayectoria')
+        
+        dibujar_flechas_lote(self.ax, np.vstack(origenes), np.vstack(direcciones), 'b',
+                             gid='trayectoria')
+        
+        # Marcar puntos iniciales
+        semillas = np.asarray(semillas, dtype=float)
+        marcar_puntos_lote(self.ax, semillas[:, 0], semillas[:, 1], 'ro', markersize=8,
+                           markeredgecolor='darkred', markeredgewidth=2, gid='trayectoria')
+    
+    def _sincronizar_slider_u(self):
+        """Muestra el deslizador si el sistema tiene u y lo centra en su valor"""
+        sistema = self.sistema_actual
+        if sistema is None or not sistema.funcion_personalizada or 'u' not in sistema.parametros:
+            self.slider_u_frame.grid_remove()
+            return
+        u = float(sistema.parametros['u'])
+        self.scale_u.configure(from_=min(-2.0, u - 1.0), to=max(2.0, u + 1.0))
+        self.u_slider_var.set(u)
+        self.label_u_vivo.config(text=f"{u:.3f}")
+        self.slider_u_frame.grid()
+    
+    def _on_slider_u(self, valor):
+        """
+        Movimiento del deslizador: agrupa los eventos en cuadros de 33 ms
+        
+        Durante el arrastre solo se actualizan campo, equilibrios y nuclinas;
+        400 ms después del último movimiento se redibujan las trayectorias.
+        """
+        sistema = self.sistema_actual
+        if sistema is None or 'u' not in sistema.parametros or self.grapher_actual is None:
+            return
+        self._u_pendiente = float(valor)
+        self.label_u_vivo.config(text=f"{self._u_pendiente:.3f}")
+        
+        if self._tarea_slider is None:
+            self._tarea_slider = self.root.after(33, self._aplicar_slider_u)
+        if self._tarea_slider_final is not None:
+            self.root.after_cancel(self._tarea_slider_final)
+        self._tarea_slider_final = self.root.after(400, self._finalizar_slider_u)
+    
+    def _iniciar_modo_vivo(self):
+        """Quita las trayectorias (de la u anterior) y guarda el fondo estático para blit"""
+        self._semillas_slider = self.cache_trayectorias.semillas(self.sistema_actual)
+        for artista in list(self.ax.lines) + list(self.ax.collections):
+            if artista.get_gid() == 'trayectoria':
+                artista.remove()
+        for artista in self.grapher_actual.artistas_dinamicos():
+            artista.set_animated(True)
+        self.canvas.draw()
+        self._fondo_slider = self.canvas.copy_from_bbox(self.ax.bbox)
+    
+    def _aplicar_slider_u(self):
+        """Un cuadro: campo con set_UVC, equilibrios desde los anteriores y blit"""
+        self._tarea_slider = None
+        grapher = self.grapher_actual
+        if grapher is None or self._u_pendiente is None or not grapher.admite_actualizacion(self.ax):
+            return
+        if self._fondo_slider is None:
+            self._iniciar_modo_vivo()
+        
+        self.sistema_actual = self.sistema_actual.con_parametros(u=self._u_pendiente)
+        self.parametros_expr.set(formatear_parametros(self.sistema_actual.parametros))
+        grapher.actualizar_parametros(self.ax, self.sistema_actual)
+        
+        self.canvas.restore_region(self._fondo_slider)
+        for artista in grapher.artistas_dinamicos():
+            artista.set_animated(True)
+            self.ax.draw_artist(artista)
+        self.canvas.blit(self.ax.bbox)
+    
+    def _finalizar_slider_u(self):
+        """Fin del arrastre: vuelve al dibujo normal e integra las trayectorias con la nueva u"""
+        self._tarea_slider_final = None
+        if self._tarea_slider is not None:
+            self.root.after_cancel(self._tarea_slider)
+            self._aplicar_slider_u()
+        if self._fondo_slider is None or self.grapher_actual is None:
+            return
+        
+        self._fondo_slider = None
+        for artista in self.grapher_actual.artistas_dinamicos():
+            artista.set_animated(False)
+        if self._semillas_slider:
+            self._dibujar_trayectorias(self._semillas_slider, self.ax.get_xlim(), self.ax.get_ylim())
+        self._semillas_slider = []
+        self.canvas.draw()
     
     def limpiar_trayectorias(self):
         """Limpia trayectorias y redibuja"""
         if self.sistema_actual:
+            self.cache_trayectorias.limpiar(self.sistema_actual)
             grapher = Grapher(self.sistema_actual)
             grapher.crear_grafica(self.ax, mostrar_nuclinas=self.mostrar_nuclinas.get())
+            self.grapher_actual = grapher
             self.canvas.draw()
     
     def actualizar_limites(self):
@@ -774,6 +977,8 @@ class InterfazGrafica:
                 grapher.establecer_limites(xlim, ylim)
                 grapher.crear_grafica(self.ax, xlim, ylim, 
                                      mostrar_nuclinas=self.mostrar_nuclinas.get())
+                self.grapher_actual = grapher
+                self._replotear_trayectorias_cacheadas()
                 self.canvas.draw()
         
         except ValueError:
@@ -798,3 +1003,162 @@ class InterfazGrafica:
         else:
             messagebox.showwarning("Advertencia", 
                                  "Por favor analice un sistema primero")
+    
+    def mostrar_animacion_campo(self):
+        """Abre la animación del campo f(x, t) con la trayectoria superpuesta"""
+        if self.sistema_actual is None:
+            messagebox.showwarning("Advertencia", 
+                                 "Por favor analice un sistema primero")
+            return
+        
+        try:
+            xlim = self.ax.get_xlim()
+            ylim = self.ax.get_ylim()
+            
+            # Última trayectoria agregada o, si no hay, un punto de la vista
+            semillas = self.cache_trayectorias.semillas(self.sistema_actual)
+            if semillas:
+                semilla = semillas[-1]
+            else:
+                semilla = (xlim[0] + 0.75 * (xlim[1] - xlim[0]), 0.5 * (ylim[0] + ylim[1]))
+            
+            VentanaAnimacionCampo(self._obtener_ventana_root(), self.sistema_actual,
+                                  xlim, ylim, semilla=semilla)
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al animar el campo:\n{str(e)}")
+    
+    def mostrar_sistema_disperso(self):
+        """Abre el análisis de sistemas lineales dispersos de gran dimensión"""
+        try:
+            VentanaSistemaLinealDisperso(self._obtener_ventana_root())
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al abrir el sistema disperso:\n{str(e)}")
+    
+    def mostrar_plano_traza_determinante(self):
+        """Abre el plano traza–determinante con la matriz actual"""
+        try:
+            matriz = [[float(self.a11_var.get() or 0), float(self.a12_var.get() or 0)],
+                      [float(self.a21_var.get() or 0), float(self.a22_var.get() or 0)]]
+            VentanaPlanoTrazaDeterminante(self._obtener_ventana_root(), matriz)
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al abrir el plano traza–determinante:\n{str(e)}")
+    
+    def mostrar_respuesta_frecuencia(self):
+        """Abre el diagrama de Bode del sistema lineal con el forzado aplicado"""
+        sistema = self.sistema_actual
+        if sistema is None or sistema.A is None or not sistema.termino_forzado:
+            messagebox.showwarning("Advertencia",
+                                 "Aplique un término forzado a un sistema de matriz")
+            return
+        
+        try:
+            VentanaRespuestaFrecuencia(self._obtener_ventana_root(), sistema)
+        except Exception as e:
+            messagebox.showerror("Error", f"Error en la respuesta en frecuencia:\n{str(e)}")
+    
+    def mostrar_continuacion_orbitas(self):
+        """Abre la continuación del ciclo límite que atrae a la última trayectoria"""
+        sistema = self.sistema_actual
+        if sistema is None or not sistema.funcion_personalizada or 'u' not in sistema.parametros:
+            messagebox.showwarning("Advertencia",
+                                 "Analice un sistema de funciones con un valor de u")
+            return
+        
+        semillas = self.cache_trayectorias.semillas(sistema)
+        if not semillas:
+            messagebox.showinfo("Continuación de ciclos",
+                              "Haga clic en la gráfica para elegir una trayectoria que "
+                              "converja al ciclo límite")
+            return
+        
+        try:
+            VentanaContinuacionOrbitas(self._obtener_ventana_root(), sistema, semillas[-1])
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al abrir la continuación:\n{str(e)}")
+    
+    def mostrar_bifurcacion_2d(self):
+        """Abre el diagrama de bifurcación de equilibrios en u (Hopf y pliegues)"""
+        sistema = self.sistema_actual
+        if sistema is None or not sistema.funcion_personalizada or 'u' not in sistema.parametros:
+            messagebox.showwarning("Advertencia",
+                                 "Analice un sistema de funciones con un valor de u")
+            return
+        
+        try:
+            VentanaBifurcacion2D(self._obtener_ventana_root(), sistema,
+                                 self.ax.get_xlim(), self.ax.get_ylim())
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al abrir el diagrama:\n{str(e)}")
+    
+    def mostrar_lyapunov(self):
+        """Estima λ sobre las trayectorias dibujadas (o una malla de la vista)"""
+        sistema = self.sistema_actual
+        if sistema is None:
+            messagebox.showwarning("Advertencia", "Primero debe analizar un sistema")
+            return
+        
+        semillas = self.cache_trayectorias.semillas(sistema)
+        if not semillas:
+            # Sin trayectorias: conjunto de 3x3 semillas repartidas en la vista
+            xs = np.linspace(*self.ax.get_xlim(), 5)[1:-1]
+            ys = np.linspace(*self.ax.get_ylim(), 5)[1:-1]
+            semillas = [(x, y) for x in xs for y in ys]
+        
+        try:
+            VentanaLyapunov(self._obtener_ventana_root(), sistema, semillas)
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al estimar el exponente:\n{str(e)}")
+    
+    def mostrar_mapa_poincare(self):
+        """Sección estroboscópica del sistema forzado sobre la vista actual"""
+        sistema = self.sistema_actual
+        if sistema is None:
+            messagebox.showwarning("Advertencia", "Primero debe analizar un sistema")
+            return
+        
+        try:
+            VentanaPoincare(self._obtener_ventana_root(), sistema,
+                            self.ax.get_xlim(), self.ax.get_ylim())
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al calcular el mapa de Poincaré:\n{str(e)}")
+    
+    def mostrar_conjunto_estocastico(self):
+        """Evolución de un conjunto de trayectorias con ruido sobre la vista actual"""
+        sistema = self.sistema_actual
+        if sistema is None:
+            messagebox.showwarning("Advertencia", "Primero debe analizar un sistema")
+            return
+        
+        # Parte de la última semilla dibujada, si la hay
+        semillas = self.cache_trayectorias.semillas(sistema)
+        try:
+            VentanaEstocastica(self._obtener_ventana_root(), sistema, self.ax.get_xlim(),
+                               self.ax.get_ylim(), semillas[-1] if semillas else None)
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al simular el conjunto:\n{str(e)}")
+    
+    def mostrar_fokker_planck(self):
+        """Evolución de la densidad de probabilidad con ruido aditivo sobre la vista actual"""
+        sistema = self.sistema_actual
+        if sistema is None:
+            messagebox.showwarning("Advertencia", "Primero debe analizar un sistema")
+            return
+        
+        try:
+            VentanaFokkerPlanck(self._obtener_ventana_root(), sistema,
+                                self.ax.get_xlim(), self.ax.get_ylim())
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al calcular la densidad:\n{str(e)}")
+    
+    def mostrar_clasificacion_local(self):
+        """Tipo de linealización y divergencia en cada punto de la vista actual"""
+        sistema = self.sistema_actual
+        if sistema is None:
+            messagebox.showwarning("Advertencia", "Primero debe analizar un sistema")
+            return
+        
+        try:
+            VentanaClasificacionLocal(self._obtener_ventana_root(), sistema,
+                                      self.ax.get_xlim(), self.ax.get_ylim())
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al clasificar la vista:\n{str(e)}")
@@ -15,6 +15,7 @@ from core.analizador_lv import AnalizadorLotkaVolterra
 from core.sistema import SistemaDinamico2D
 from visualization.lotka_volterra import GrapherLotkaVolterra
 from input_module.lotka_volterra import InputLotkaVolterra
+from gui.estocastico import VentanaEstocastica
 from ui.estilos import COLORES, FUENTES
 from ui.widget_utils import PanelAnalisisBase, ConstructorUI
 
@@ -36,6 +37,7 @@ class InterfazLotkaVolterra:
         self.sistema = None
         self.grapher = None
         self.analizador = None
+        self._tarea_vivo = None
         self._crear_layout()
     
     def _crear_layout(self):
@@ -62,6 +64,9 @@ class InterfazLotkaVolterra:
         
         # Sistema inicial
         self._actualizar_sistema()
+        
+        # Los deslizadores redibujan en vivo (agrupados a ~30 cuadros por segundo)
+        self.input_panel.al_cambiar(self._programar_actualizacion_vivo)
     
     def _crear_botones_control(self, parent):
         """Crea botones de control"""
@@ -81,6 +86,13 @@ class InterfazLotkaVolterra:
             bg='#2196F3'
         ).pack(fill=tk.X, pady=5)
         
+        ConstructorUI.crear_boton(
+            frame,
+            "🎲 Conjunto con Ruido",
+            self._mostrar_conjunto_estocastico,
+            bg='#9C27B0'
+        ).pack(fill=tk.X, pady=5)
+        
         ConstructorUI.crear_boton(
             frame,
             "🔄 Valores Predeterminados",
@@ -138,6 +150,35 @@ class InterfazLotkaVolterra:
         
         self._dibujar_campo()
     
+    def _programar_actualizacion_vivo(self):
+        """Agrupa los movimientos del deslizador en una actualización cada 33 ms"""
+        if self._tarea_vivo is None:
+            self._tarea_vivo = self.root.after(33, self._actualizar_en_vivo)
+    
+    def _actualizar_en_vivo(self):
+        """Actualiza campo, equilibrio e isoclinas sin reconstruir la figura"""
+        self._tarea_vivo = None
+        if self.input_panel.modo_personalizado.get() or not isinstance(self.sistema, SistemaLotkaVolterra):
+            return
+        
+        try:
+            params = self.input_panel.obtener_parametros()
+            sistema = SistemaLotkaVolterra(
+                alpha=params['alpha'], beta=params['beta'],
+                gamma=params['gamma'], delta=params['delta']
+            )
+        except (tk.TclError, ValueError, ZeroDivisionError):
+            return  # Entrada incompleta mientras se escribe
+        
+        if not self.grapher.admite_actualizacion(self.ax_campo):
+            self._actualizar_sistema()
+            return
+        
+        self.sistema = sistema
+        self.analizador = AnalizadorLotkaVolterra(sistema)
+        self.grapher.actualizar_parametros(self.ax_campo, sistema)
+        self.canvas_campo.draw_idle()
+    
     def _dibujar_campo(self):
         """Dibuja el campo de fase"""
         if self.sistema is None:
@@ -146,6 +187,19 @@ class InterfazLotkaVolterra:
         self.grapher.crear_grafica(self.ax_campo, n_puntos=12)
         self.canvas_campo.draw()
     
+    def _mostrar_conjunto_estocastico(self):
+        """Abre la simulación del conjunto con ruido sobre la vista actual"""
+        if self.sistema is None:
+            return
+        
+        punto = None
+        if isinstance(self.sistema, SistemaLotkaVolterra):
+            # Desplazado del equilibrio interior para partir sobre un ciclo
+            x_eq, y_eq = self.sistema.equilibrio_interior
+            punto = (1.5 * x_eq, y_eq)
+        VentanaEstocastica(self.root, self.sistema, self.ax_campo.get_xlim(),
+                           self.ax_campo.get_ylim(), punto)
+    
     def _mostrar_analisis(self):
         """Muestra ventana de análisis detallado"""
         if self.sistema is None:
@@ -0,0 +1,148 @@
+"""
+Ventana de exponentes de Lyapunov para sistemas 2D
+"""
+
+import numpy as np
+import tkinter as tk
+from tkinter import ttk, messagebox
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
+from core.lyapunov import EstimadorLyapunov
+from visualization.lyapunov import graficar_convergencia_lyapunov, graficar_mapa_lyapunov
+from ui.estilos import COLORES, FUENTES
+
+
+class VentanaLyapunov:
+    """Estimación de λ para un conjunto de semillas y mapas sobre parámetros"""
+
+    def __init__(self, parent, sistema, semillas):
+        """
+        Parámetros:
+        - parent: ventana padre
+        - sistema: SistemaDinamico2D
+        - semillas: array (N, 2) de condiciones iniciales del conjunto
+        """
+        self.sistema = sistema
+        self.semillas = np.asarray(semillas, dtype=float).reshape(-1, 2)
+
+        self.ventana = tk.Toplevel(parent)
+        self.ventana.title("Exponente de Lyapunov")
+        self.ventana.geometry("1100x760")
+        self.ventana.configure(bg=COLORES['fondo'])
+
+        self.t_total_var = tk.DoubleVar(value=200.0)
+        self.t_transitorio_var = tk.DoubleVar(value=50.0)
+        self.dt_var = tk.DoubleVar(value=0.02)
+
+        nombres = list(sistema.parametros)
+        self.param_x_var = tk.StringVar(value=nombres[0] if nombres else '')
+        self.param_y_var = tk.StringVar(value='(ninguno)')
+        self.parametros_malla = {'x': self.param_x_var, 'y': self.param_y_var}
+        self.rangos = {}
+
+        self._crear_widgets(nombres)
+        self._calcular_conjunto()
+
+    def _crear_widgets(self, nombres):
+        controles = ttk.Frame(self.ventana, padding="10")
+        controles.pack(fill=tk.X)
+
+        for texto, variable in (("T promedio:", self.t_total_var),
+                                ("Transitorio:", self.t_transitorio_var),
+                                ("dt:", self.dt_var)):
+            ttk.Label(controles, text=texto).pack(side=tk.LEFT)
+            ttk.Entry(controles, textvariable=variable, width=7).pack(side=tk.LEFT, padx=(2, 8))
+        ttk.Button(controles, text="Calcular λ", style='Accent.TButton',
+                   command=self._calcular_conjunto).pack(side=tk.LEFT, padx=5)
+        ttk.Button(controles, text="Cerrar",
+                   command=self.ventana.destroy).pack(side=tk.RIGHT, padx=5)
+
+        mapa_frame = ttk.Frame(self.ventana, padding="10 0 10 5")
+        mapa_frame.pack(fill=tk.X)
+        if nombres:
+            for fila, (eje, texto, opciones, n_defecto) in enumerate((
+                    ('x', "Parámetro horizontal:", nombres, 40),
+                    ('y', "Parámetro vertical:", ['(ninguno)'] + nombres, 20))):
+                variable = self.parametros_malla[eje]
+                ttk.Label(mapa_frame, text=texto).grid(row=fila, column=0, sticky=tk.W)
+                ttk.Combobox(mapa_frame, textvariable=variable, values=opciones,
+                             state='readonly', width=10).grid(row=fila, column=1, padx=5)
+                entradas = []
+                for columna, (etiqueta, valor) in enumerate((("min", None), ("max", None),
+                                                             ("n", n_defecto))):
+                    ttk.Label(mapa_frame, text=etiqueta).grid(row=fila, column=2 + 2 * columna)
+                    entrada = ttk.Entry(mapa_frame, width=7)
+                    entrada.grid(row=fila, column=3 + 2 * columna, padx=2)
+                    if valor is not None:
+                        entrada.insert(0, str(valor))
+                    entradas.append(entrada)
+                self.rangos[eje] = entradas
+            self._sugerir_rangos()
+            ttk.Button(mapa_frame, text="Calcular Mapa",
+                       command=self._calcular_mapa).grid(row=0, column=8, rowspan=2, padx=10)
+        else:
+            ttk.Label(mapa_frame, text="El sistema no tiene parámetros para el mapa",
+                      font=FUENTES['pequena']).grid(row=0, column=0, sticky=tk.W)
+
+        self.fig = Figure(figsize=(10, 6), dpi=100)
+        self.ax_convergencia = self.fig.add_subplot(1, 2, 1)
+        self.ax_mapa = self.fig.add_subplot(1, 2, 2)
+        self.cax = None
+        self.canvas = FigureCanvasTkAgg(self.fig, self.ventana)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10)
+        NavigationToolbar2Tk(self.canvas, self.ventana).update()
+
+    def _sugerir_rangos(self):
+        """Rango por defecto: ±50 % alrededor del valor actual de cada parámetro"""
+        for eje, entradas in self.rangos.items():
+            valor = self.sistema.parametros.get(self.parametros_malla[eje].get(), 1.0)
+            ancho = 0.5 * abs(valor) or 1.0
+            for entrada, extremo in zip(entradas[:2], (valor - ancho, valor + ancho)):
+                entrada.delete(0, tk.END)
+                entrada.insert(0, f"{extremo:.4g}")
+
+    def _estimador(self):
+        return EstimadorLyapunov(self.sistema, dt=self.dt_var.get())
+
+    def _opciones(self):
+        return {'t_total': self.t_total_var.get(), 't_transitorio': self.t_transitorio_var.get()}
+
+    def _ejecutar(self, tarea):
+        self.ventana.config(cursor='watch')
+        self.ventana.update_idletasks()
+        try:
+            tarea()
+            self.fig.tight_layout()
+            self.canvas.draw()
+        except (ValueError, tk.TclError) as e:
+            messagebox.showerror("Error", f"Valores inválidos:\n{str(e)}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Error en el cálculo:\n{str(e)}")
+        finally:
+            self.ventana.config(cursor='')
+
+    def _calcular_conjunto(self):
+        def tarea():
+            resultado = self._estimador().estimar(self.semillas, **self._opciones())
+            graficar_convergencia_lyapunov(self.ax_convergencia, resultado)
+        self._ejecutar(tarea)
+
+    def _leer_malla(self, eje):
+        minimo, maximo, n = (e.get() for e in self.rangos[eje])
+        return np.linspace(float(minimo), float(maximo), int(n))
+
+    def _calcular_mapa(self):
+        def tarea():
+            param_y = self.param_y_var.get()
+            param_y = None if param_y in ('(ninguno)', self.param_x_var.get()) else param_y
+            valores_y = self._leer_malla('y') if param_y else None
+            mapa = self._estimador().mapa(self.semillas[0], self.param_x_var.get(),
+                                          self._leer_malla('x'), param_y, valores_y,
+                                          **self._opciones())
+            if self.cax is not None:
+                self.cax.remove()
+                self.cax = None
+            if param_y:
+                self.cax = self.fig.add_axes([0.93, 0.15, 0.015, 0.7])
+            graficar_mapa_lyapunov(self.ax_mapa, mapa, self.cax)
+        self._ejecutar(tarea)
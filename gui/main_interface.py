@@ -8,10 +8,12 @@ from tkinter import ttk
 from ui.estilos import configurar_estilos_ttk, COLORES, FUENTES, ESPACIOS
 from gui.interfaz import InterfazGrafica
 from gui.bifurcacion import InterfazBifurcacion
+from gui.mapas import InterfazMapas
 from gui.sistema_1d import InterfazSistema1D
 from gui.hamilton import InterfazHamilton
 from gui.lotka_volterra import InterfazLotkaVolterra
 from gui.modelo_infeccion import InterfazModeloInfeccion
+from gui.sistema_nd import InterfazSistemaND
 
 
 class InterfazPrincipal:
@@ -29,11 +31,21 @@ class InterfazPrincipal:
             'clase': InterfazSistema1D,
             'descripcion': 'Análisis completo de sistemas dinámicos unidimensionales\nno lineales con campos de fase, trayectorias y equilibrios.'
         },
+        'nd': {
+            'titulo': '🧊 Sistemas nD',
+            'clase': InterfazSistemaND,
+            'descripcion': 'Sistemas de dimensión n como Lorenz o SIR con dinámica vital\ncon proyecciones y secciones 2D, equilibrios y su estabilidad.'
+        },
         'bifurcacion': {
             'titulo': '🔀 Bifurcaciones',
             'clase': InterfazBifurcacion,
             'descripcion': 'Análisis de bifurcaciones en sistemas dinámicos 1D\ncon diagramas de bifurcación y análisis de estabilidad.'
         },
+        'mapas': {
+            'titulo': '🌀 Mapas Discretos',
+            'clase': InterfazMapas,
+            'descripcion': 'Mapas discretos x(n+1) = g(x, r) como el logístico\ncon diagramas de órbitas de millones de puntos y telarañas.'
+        },
         'infeccion': {
             'titulo': '🦠 Modelo Infección',
             'clase': InterfazModeloInfeccion,
@@ -0,0 +1,279 @@
+"""
+Interfaz gráfica para mapas discretos 1D
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox, scrolledtext
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
+import matplotlib
+matplotlib.use('TkAgg')
+
+from core.mapas import AnalizadorMapa
+from visualization.mapas import VisualizadorMapa
+from input_module.mapas import obtener_nombres_ejemplos_mapas, obtener_ejemplo_mapa
+from ui.estilos import configurar_estilos_ttk, COLORES, FUENTES
+
+
+class InterfazMapas:
+    """Interfaz gráfica para diagramas de órbitas y telarañas de mapas discretos"""
+
+    # Espera tras un zoom antes de recalcular la vista (ms)
+    RETARDO_RECALCULO = 300
+
+    def __init__(self, root):
+        """
+        Inicializa la interfaz de mapas discretos
+
+        Parámetros:
+        - root: ventana raíz o frame principal de tkinter
+        """
+        self.root = root
+        self.analizador = None
+        self.visualizador = None
+        self.linea_r = None
+        self._recalculo_pendiente = None
+        self._ajustando_limites = False
+
+        if isinstance(root, tk.Tk):
+            root.title("Mapas Discretos 1D")
+            root.geometry("1400x800")
+            root.configure(bg=COLORES['fondo'])
+            configurar_estilos_ttk()
+        elif isinstance(root, tk.Frame):
+            root.configure(bg=COLORES['fondo'])
+
+        self._crear_widgets()
+
+    def _crear_widgets(self):
+        """Crea los widgets de la interfaz"""
+        main_frame = ttk.Frame(self.root, padding="10")
+        if isinstance(self.root, tk.Tk):
+            main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+            self.root.columnconfigure(0, weight=1)
+            self.root.rowconfigure(0, weight=1)
+        else:
+            main_frame.pack(fill=tk.BOTH, expand=True)
+
+        main_frame.columnconfigure(1, weight=1)
+        main_frame.rowconfigure(0, weight=1)
+
+        self._crear_panel_controles(main_frame)
+        self._crear_panel_graficos(main_frame)
+
+    def _crear_entrada(self, parent, fila, texto, valor, ancho=10):
+        ttk.Label(parent, text=texto, font=FUENTES['pequena']).grid(row=fila, column=0, sticky=tk.W)
+        entrada = ttk.Entry(parent, width=ancho)
+        entrada.grid(row=fila, column=1, padx=2, pady=1, sticky=tk.W)
+        entrada.insert(0, str(valor))
+        return entrada
+
+    def _crear_panel_controles(self, parent):
+        """Crea panel de controles"""
+        control_frame = ttk.LabelFrame(parent, text="Controles", padding="10")
+        control_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5)
+
+        ttk.Label(control_frame, text="Ejemplos Predefinidos:",
+                  font=FUENTES['titulo_seccion']).grid(row=0, column=0, sticky=tk.W, pady=5)
+
+        self.ejemplo_var = tk.StringVar()
+        ejemplo_combo = ttk.Combobox(control_frame, textvariable=self.ejemplo_var,
+                                     values=obtener_nombres_ejemplos_mapas(),
+                                     state='readonly', width=30)
+        ejemplo_combo.grid(row=1, column=0, pady=5, sticky=(tk.W, tk.E))
+
+        ttk.Button(control_frame, text="Cargar Ejemplo",
+                   command=self._cargar_ejemplo).grid(row=2, column=0, pady=5, sticky=(tk.W, tk.E))
+
+        ttk.Separator(control_frame, orient='horizontal').grid(row=3, column=0, sticky=(tk.W, tk.E), pady=10)
+
+        ttk.Label(control_frame, text="Mapa x(n+1) = g(x, r):",
+                  font=FUENTES['titulo_seccion']).grid(row=4, column=0, sticky=tk.W, pady=5)
+        self.funcion_entry = ttk.Entry(control_frame, width=35)
+        self.funcion_entry.grid(row=5, column=0, pady=5, sticky=(tk.W, tk.E))
+        self.funcion_entry.insert(0, "r*x*(1 - x)")
+
+        ttk.Label(control_frame, text="Parámetros:",
+                  font=FUENTES['titulo_seccion']).grid(row=6, column=0, sticky=tk.W, pady=(10, 5))
+
+        parametros = ttk.Frame(control_frame)
+        parametros.grid(row=7, column=0, sticky=(tk.W, tk.E))
+        self.r_min_entry = self._crear_entrada(parametros, 0, "r mínimo:", 2.5)
+        self.r_max_entry = self._crear_entrada(parametros, 1, "r máximo:", 4.0)
+        self.x0_entry = self._crear_entrada(parametros, 2, "x₀:", 0.5)
+        self.n_r_entry = self._crear_entrada(parametros, 3, "Valores de r:", 2000)
+        self.transitorio_entry = self._crear_entrada(parametros, 4, "Transitorio:", 1000)
+        self.iteraciones_entry = self._crear_entrada(parametros, 5, "Iteraciones:", 5000)
+        self.r_cobweb_entry = self._crear_entrada(parametros, 6, "r telaraña:", 3.83)
+        self.n_cobweb_entry = self._crear_entrada(parametros, 7, "Pasos telaraña:", 100)
+
+        ttk.Label(control_frame, text="Clic en el diagrama: elegir r de la telaraña\n"
+                                      "Zoom: recalcula la vista a la misma resolución",
+                  font=FUENTES['muy_pequena'], foreground=COLORES['texto_secundario']).grid(
+            row=8, column=0, sticky=tk.W, pady=(5, 0))
+
+        ttk.Button(control_frame, text="ANALIZAR",
+                   command=self._analizar, style='Accent.TButton').grid(row=9, column=0,
+                                                                        pady=15, sticky=(tk.W, tk.E))
+
+        ttk.Separator(control_frame, orient='horizontal').grid(row=10, column=0, sticky=(tk.W, tk.E), pady=5)
+
+        ttk.Label(control_frame, text="Resultados:",
+                  font=FUENTES['titulo_seccion']).grid(row=11, column=0, sticky=tk.W, pady=5)
+        self.resultados_text = scrolledtext.ScrolledText(control_frame, width=40, height=10,
+                                                         font=FUENTES['monoespaciada'], wrap=tk.WORD)
+        self.resultados_text.grid(row=12, column=0, pady=5, sticky=(tk.W, tk.E, tk.N, tk.S))
+        control_frame.rowconfigure(12, weight=1)
+
+    def _crear_panel_graficos(self, parent):
+        """Crea panel de gráficos"""
+        plot_frame = ttk.Frame(parent)
+        plot_frame.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5)
+        plot_frame.columnconfigure(0, weight=3)
+        plot_frame.columnconfigure(1, weight=2)
+        plot_frame.rowconfigure(0, weight=1)
+
+        orbitas_frame = ttk.LabelFrame(plot_frame, text="Diagrama de Órbitas", padding="5")
+        orbitas_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(0, 5))
+        orbitas_frame.columnconfigure(0, weight=1)
+        orbitas_frame.rowconfigure(0, weight=1)
+
+        self.orbitas_fig = Figure(figsize=(7, 5), dpi=100)
+        self.ax_orbitas = self.orbitas_fig.add_subplot(111)
+        self.orbitas_canvas = FigureCanvasTkAgg(self.orbitas_fig, master=orbitas_frame)
+        self.orbitas_canvas.get_tk_widget().grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        toolbar_frame = ttk.Frame(orbitas_frame)
+        toolbar_frame.grid(row=1, column=0, sticky=(tk.W, tk.E))
+        self.toolbar_orbitas = NavigationToolbar2Tk(self.orbitas_canvas, toolbar_frame)
+        self.toolbar_orbitas.update()
+        self.orbitas_canvas.mpl_connect('button_press_event', self._al_hacer_clic)
+
+        cobweb_frame = ttk.LabelFrame(plot_frame, text="Diagrama de Telaraña", padding="5")
+        cobweb_frame.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S))
+        cobweb_frame.columnconfigure(0, weight=1)
+        cobweb_frame.rowconfigure(0, weight=1)
+
+        self.cobweb_fig = Figure(figsize=(5, 5), dpi=100)
+        self.ax_cobweb = self.cobweb_fig.add_subplot(111)
+        self.cobweb_canvas = FigureCanvasTkAgg(self.cobweb_fig, master=cobweb_frame)
+        self.cobweb_canvas.get_tk_widget().grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+    def _cargar_ejemplo(self):
+        """Carga un ejemplo predefinido"""
+        nombre_ejemplo = self.ejemplo_var.get()
+        if not nombre_ejemplo:
+            messagebox.showwarning("Advertencia", "Por favor seleccione un ejemplo")
+            return
+
+        ejemplo = obtener_ejemplo_mapa(nombre_ejemplo)
+        if ejemplo:
+            valores = {
+                self.funcion_entry: ejemplo['funcion'],
+                self.r_min_entry: ejemplo['r_range'][0],
+                self.r_max_entry: ejemplo['r_range'][1],
+                self.x0_entry: ejemplo['x0'],
+                self.r_cobweb_entry: ejemplo['r_cobweb']
+            }
+            for entrada, valor in valores.items():
+                entrada.delete(0, tk.END)
+                entrada.insert(0, str(valor))
+
+            self.resultados_text.delete(1.0, tk.END)
+            self.resultados_text.insert(tk.END, f"Ejemplo cargado: {nombre_ejemplo}\n\n")
+            self.resultados_text.insert(tk.END, f"{ejemplo['descripcion']}\n\n")
+            self.resultados_text.insert(tk.END, "Presione ANALIZAR para ver los resultados.")
+
+    def _opciones_diagrama(self):
+        return {
+            'n_r': int(self.n_r_entry.get()),
+            'n_transitorio': int(self.transitorio_entry.get()),
+            'n_iteraciones': int(self.iteraciones_entry.get()),
+            'x0': float(self.x0_entry.get())
+        }
+
+    def _analizar(self):
+        """Calcula el diagrama de órbitas y la telaraña"""
+        try:
+            r_range = (float(self.r_min_entry.get()), float(self.r_max_entry.get()))
+            if r_range[0] >= r_range[1]:
+                raise ValueError("r mínimo debe ser menor que r máximo")
+            opciones = self._opciones_diagrama()
+
+            self.analizador = AnalizadorMapa(self.funcion_entry.get())
+            self.visualizador = VisualizadorMapa(self.analizador)
+
+            self.ax_orbitas.clear()
+            self.linea_r = None
+            self._ajustando_limites = True
+            resultado = self.visualizador.graficar_diagrama_orbitas(self.ax_orbitas, r_range, **opciones)
+            self._ajustando_limites = False
+            self.ax_orbitas.callbacks.connect('xlim_changed', self._al_cambiar_limites)
+            self.ax_orbitas.callbacks.connect('ylim_changed', self._al_cambiar_limites)
+            self.toolbar_orbitas.update()
+
+            self._dibujar_cobweb()
+
+            histograma = resultado['histograma']
+            self.resultados_text.delete(1.0, tk.END)
+            self.resultados_text.insert(tk.END, f"Mapa: x(n+1) = {self.funcion_entry.get()}\n")
+            self.resultados_text.insert(tk.END, "=" * 40 + "\n")
+            self.resultados_text.insert(tk.END, f"Puntos acumulados: {histograma.total:,}\n")
+            self.resultados_text.insert(tk.END, f"Fuera de la vista: {histograma.descartados:,}\n")
+            divergentes = int(resultado['divergentes'].sum())
+            if divergentes:
+                self.resultados_text.insert(tk.END, f"Valores de r con órbita divergente: {divergentes}\n")
+        except ValueError as e:
+            messagebox.showerror("Error", f"Error en los parámetros: {e}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Error durante el análisis: {e}")
+        finally:
+            self._ajustando_limites = False
+
+    def _dibujar_cobweb(self):
+        """Redibuja la telaraña y marca su r sobre el diagrama de órbitas"""
+        r_valor = float(self.r_cobweb_entry.get())
+        self.visualizador.graficar_cobweb(self.ax_cobweb, r_valor, float(self.x0_entry.get()),
+                                          int(self.n_cobweb_entry.get()))
+        self.cobweb_fig.tight_layout()
+        self.cobweb_canvas.draw_idle()
+
+        if self.linea_r is None:
+            self.linea_r = self.ax_orbitas.axvline(r_valor, color='red', linewidth=1, alpha=0.7)
+        else:
+            self.linea_r.set_xdata([r_valor, r_valor])
+        self.orbitas_canvas.draw_idle()
+
+    def _al_hacer_clic(self, event):
+        """Un clic sobre el diagrama (sin zoom/desplazamiento activo) elige el r de la telaraña"""
+        if event.inaxes is not self.ax_orbitas or self.visualizador is None:
+            return
+        if self.toolbar_orbitas.mode:
+            return
+        self.r_cobweb_entry.delete(0, tk.END)
+        self.r_cobweb_entry.insert(0, f"{event.xdata:.6g}")
+        try:
+            self._dibujar_cobweb()
+        except Exception as e:
+            messagebox.showerror("Error", f"Error en la telaraña: {e}")
+
+    def _al_cambiar_limites(self, ax):
+        """Tras un zoom se recalcula la vista a resolución completa (con espera)"""
+        if self._ajustando_limites or self.visualizador is None:
+            return
+        if self._recalculo_pendiente is not None:
+            self.root.after_cancel(self._recalculo_pendiente)
+        self._recalculo_pendiente = self.root.after(self.RETARDO_RECALCULO, self._recalcular_vista)
+
+    def _recalcular_vista(self):
+        self._recalculo_pendiente = None
+        r_range = self.ax_orbitas.get_xlim()
+        x_range = self.ax_orbitas.get_ylim()
+        self._ajustando_limites = True
+        try:
+            self.visualizador.graficar_diagrama_orbitas(self.ax_orbitas, r_range, x_range,
+                                                        **self._opciones_diagrama())
+            self.orbitas_canvas.draw_idle()
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al recalcular la vista: {e}")
+        finally:
+            self._ajustando_limites = False
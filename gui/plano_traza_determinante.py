@@ -0,0 +1,129 @@
+"""
+Ventana interactiva del plano traza–determinante con barrido de un elemento de la matriz
+"""
+
+import numpy as np
+import tkinter as tk
+from tkinter import ttk
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
+from core.clasificacion import clasificar_matrices, barrer_elemento
+from visualization.plano_traza_determinante import PlanoTrazaDeterminante
+from ui.estilos import COLORES, FUENTES
+
+ELEMENTOS = {'a₁₁': (0, 0), 'a₁₂': (0, 1), 'a₂₁': (1, 0), 'a₂₂': (1, 1)}
+
+
+class VentanaPlanoTrazaDeterminante:
+    """
+    Familia A(s) con un elemento recorriendo [mín, máx] ubicada en el plano (tr, det)
+
+    Toda la familia se clasifica en una sola llamada a clasificar_matrices.
+    El deslizador elige la matriz resaltada y editar cualquier elemento
+    vuelve a ubicar la familia en vivo (agrupado a ~30 cuadros por segundo).
+    """
+
+    def __init__(self, parent, matriz):
+        """
+        Parámetros:
+        - parent: ventana padre
+        - matriz: matriz 2×2 base
+        """
+        matriz = np.asarray(matriz, dtype=float)
+        self._tarea = None
+        self._resultado = None
+
+        self.ventana = tk.Toplevel(parent)
+        self.ventana.title("Plano Traza–Determinante")
+        self.ventana.geometry("850x820")
+        self.ventana.configure(bg=COLORES['fondo'])
+        self.ventana.protocol("WM_DELETE_WINDOW", self._cerrar)
+
+        self.elementos_vars = {nombre: tk.StringVar(value=f'{matriz[i, j]:g}')
+                               for nombre, (i, j) in ELEMENTOS.items()}
+        self.barrido_var = tk.StringVar(value='a₁₁')
+        valor = matriz[0, 0]
+        self.minimo_var = tk.StringVar(value=f'{valor - 3:g}')
+        self.maximo_var = tk.StringVar(value=f'{valor + 3:g}')
+        self.n_var = tk.StringVar(value='121')
+        self.posicion_var = tk.DoubleVar(value=0.5)
+        self.estado_var = tk.StringVar(value="")
+
+        self._crear_widgets()
+        for variable in (*self.elementos_vars.values(), self.barrido_var, self.minimo_var,
+                         self.maximo_var, self.n_var):
+            variable.trace_add('write', lambda *_: self._programar())
+        self._actualizar(ajustar_vista=True)
+
+    def _crear_widgets(self):
+        controles = ttk.Frame(self.ventana, padding="10")
+        controles.pack(fill=tk.X)
+
+        ttk.Label(controles, text="A =", font=FUENTES['normal']).grid(row=0, column=0, rowspan=2, padx=(0, 5))
+        for nombre, (i, j) in ELEMENTOS.items():
+            ttk.Entry(controles, textvariable=self.elementos_vars[nombre], width=8,
+                      justify='center').grid(row=i, column=1 + j, padx=2, pady=2)
+
+        ttk.Label(controles, text="Barrer:").grid(row=0, column=3, sticky=tk.W, padx=(15, 0))
+        ttk.Combobox(controles, textvariable=self.barrido_var, values=list(ELEMENTOS), state='readonly',
+                     width=5).grid(row=0, column=4, padx=(2, 10))
+        ttk.Label(controles, text="N:").grid(row=1, column=3, sticky=tk.W, padx=(15, 0))
+        ttk.Entry(controles, textvariable=self.n_var, width=6).grid(row=1, column=4, padx=(2, 10))
+        for columna, (texto, variable) in enumerate((("mín:", self.minimo_var), ("máx:", self.maximo_var))):
+            ttk.Label(controles, text=texto).grid(row=columna, column=5, sticky=tk.W)
+            ttk.Entry(controles, textvariable=variable, width=8).grid(row=columna, column=6, padx=(2, 10))
+        ttk.Button(controles, text="Cerrar", command=self._cerrar).grid(row=0, column=7, rowspan=2, padx=5)
+
+        ttk.Scale(self.ventana, from_=0.0, to=1.0, variable=self.posicion_var, orient=tk.HORIZONTAL,
+                  command=lambda _: self._mover_actual()).pack(fill=tk.X, padx=10)
+        ttk.Label(self.ventana, textvariable=self.estado_var,
+                  font=FUENTES['pequena']).pack(anchor=tk.W, padx=10)
+
+        self.fig = Figure(figsize=(8, 7), dpi=100)
+        self.plano = PlanoTrazaDeterminante(self.fig.add_subplot(111))
+        self.canvas = FigureCanvasTkAgg(self.fig, self.ventana)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        NavigationToolbar2Tk(self.canvas, self.ventana).update()
+
+    def _programar(self):
+        if self._tarea is None:
+            self._tarea = self.ventana.after(33, self._actualizar)
+
+    def _leer_familia(self):
+        matriz = np.zeros((2, 2))
+        for nombre, (i, j) in ELEMENTOS.items():
+            matriz[i, j] = float(self.elementos_vars[nombre].get())
+        n = int(self.n_var.get())
+        if n < 2:
+            raise ValueError("Se requieren al menos 2 matrices")
+        self.valores = np.linspace(float(self.minimo_var.get()), float(self.maximo_var.get()), n)
+        return barrer_elemento(matriz, *ELEMENTOS[self.barrido_var.get()], self.valores)
+
+    def _indice_actual(self):
+        return int(round(self.posicion_var.get() * (len(self.valores) - 1)))
+
+    def _actualizar(self, ajustar_vista=True):
+        """Reclasifica la familia completa y la reubica"""
+        self._tarea = None
+        try:
+            familia = self._leer_familia()
+        except (ValueError, tk.TclError):
+            return  # Entrada incompleta mientras se escribe
+        self._resultado = clasificar_matrices(familia)
+        self._mover_actual(ajustar_vista)
+
+    def _mover_actual(self, ajustar_vista=False):
+        if self._resultado is None:
+            return
+        k = self._indice_actual()
+        self.plano.actualizar(self._resultado, k, ajustar_vista=ajustar_vista)
+        autovalores = self._resultado['autovalores'][k]
+        self.estado_var.set(f"{self.barrido_var.get()} = {self.valores[k]:.4g} | "
+                            f"λ = {autovalores[0]:.4g}, {autovalores[1]:.4g}")
+        self.canvas.draw_idle()
+
+    def _cerrar(self):
+        if self._tarea is not None:
+            self.ventana.after_cancel(self._tarea)
+            self._tarea = None
+        self.ventana.destroy()
@@ -0,0 +1,147 @@
+"""
+Ventana del mapa de Poincaré estroboscópico para sistemas forzados
+"""
+
+import numpy as np
+import tkinter as tk
+from tkinter import ttk, messagebox
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
+from core.poincare import MapaPoincare
+from core.densidad import HistogramaDensidad
+from visualization.poincare import graficar_seccion_poincare
+from ui.estilos import COLORES, FUENTES
+
+
+class VentanaPoincare:
+    """
+    Sección estroboscópica de un conjunto de semillas repartidas en la vista
+
+    El cálculo avanza por bloques de períodos desde el bucle de Tk (after),
+    de modo que la imagen de densidad se va completando sin congelar la
+    ventana y puede detenerse en cualquier momento.
+    """
+
+    def __init__(self, parent, sistema, xlim, ylim):
+        """
+        Parámetros:
+        - parent: ventana padre
+        - sistema: SistemaDinamico2D con forzado periódico
+        - xlim, ylim: región de la sección (y de las semillas)
+        """
+        self.sistema = sistema
+        self.xlim = tuple(xlim)
+        self.ylim = tuple(ylim)
+        self._generador = None
+        self._tarea = None
+        self._imagen = None
+
+        periodo = MapaPoincare.periodo_forzado(sistema)
+
+        self.ventana = tk.Toplevel(parent)
+        self.ventana.title("Mapa de Poincaré Estroboscópico")
+        self.ventana.geometry("900x820")
+        self.ventana.configure(bg=COLORES['fondo'])
+        self.ventana.protocol("WM_DELETE_WINDOW", self._cerrar)
+
+        self.periodo_var = tk.DoubleVar(value=round(periodo if periodo else 2 * np.pi, 6))
+        self.fase_var = tk.DoubleVar(value=0.0)
+        self.pasos_var = tk.IntVar(value=64)
+        self.periodos_var = tk.IntVar(value=2000)
+        self.transitorio_var = tk.IntVar(value=50)
+        self.semillas_var = tk.IntVar(value=30)
+        self.estado_var = tk.StringVar(value="")
+
+        self._crear_widgets(periodo is not None)
+        self._iniciar()
+
+    def _crear_widgets(self, periodo_del_forzado):
+        controles = ttk.Frame(self.ventana, padding="10")
+        controles.pack(fill=tk.X)
+
+        for columna, (texto, variable) in enumerate((("Período T:", self.periodo_var),
+                                                     ("Fase t₀:", self.fase_var),
+                                                     ("Pasos/T:", self.pasos_var),
+                                                     ("Períodos:", self.periodos_var),
+                                                     ("Transitorio:", self.transitorio_var),
+                                                     ("Semillas/lado:", self.semillas_var))):
+            ttk.Label(controles, text=texto).grid(row=columna // 3, column=2 * (columna % 3),
+                                                  sticky=tk.W)
+            ttk.Entry(controles, textvariable=variable, width=9).grid(
+                row=columna // 3, column=2 * (columna % 3) + 1, padx=(2, 10), pady=2)
+
+        ttk.Button(controles, text="Calcular", style='Accent.TButton',
+                   command=self._iniciar).grid(row=0, column=6, padx=5)
+        ttk.Button(controles, text="Detener",
+                   command=self._detener).grid(row=1, column=6, padx=5)
+        ttk.Button(controles, text="Cerrar",
+                   command=self._cerrar).grid(row=0, column=7, rowspan=2, padx=5)
+
+        nota = ("T = 2π/ω tomado del término forzado" if periodo_del_forzado
+                else "Sin forzado seno/coseno: indique el período de la dependencia en t")
+        ttk.Label(self.ventana, text=nota, font=FUENTES['pequena']).pack(anchor=tk.W, padx=10)
+        ttk.Label(self.ventana, textvariable=self.estado_var,
+                  font=FUENTES['pequena']).pack(anchor=tk.W, padx=10)
+
+        self.fig = Figure(figsize=(8, 7), dpi=100)
+        self.ax = self.fig.add_subplot(111)
+        self.canvas = FigureCanvasTkAgg(self.fig, self.ventana)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        NavigationToolbar2Tk(self.canvas, self.ventana).update()
+
+    def _semillas(self, n):
+        xs = np.linspace(*self.xlim, n + 2)[1:-1]
+        ys = np.linspace(*self.ylim, n + 2)[1:-1]
+        X, Y = np.meshgrid(xs, ys)
+        return np.column_stack([X.ravel(), Y.ravel()])
+
+    def _iniciar(self):
+        self._detener()
+        try:
+            fase = self.fase_var.get()
+            mapa = MapaPoincare(self.sistema, self.periodo_var.get(), self.pasos_var.get())
+            semillas = self._semillas(max(self.semillas_var.get(), 1))
+            self._generador = mapa.iterar_bloques(semillas, self.periodos_var.get(),
+                                                  self.transitorio_var.get(), fase, bloque=20)
+        except (ValueError, tk.TclError) as e:
+            messagebox.showerror("Error", f"Valores inválidos:\n{str(e)}")
+            return
+
+        self.mapa = mapa
+        self.fase = fase
+        self.histograma = HistogramaDensidad(self.xlim, self.ylim, (600, 600))
+        self.ax.clear()
+        self._imagen = None
+        self.estado_var.set(f"Integrando {len(semillas)} semillas...")
+        self._tarea = self.ventana.after(10, self._avanzar)
+
+    def _avanzar(self):
+        """Consume un bloque de períodos y refresca la imagen"""
+        self._tarea = None
+        try:
+            muestras = next(self._generador)
+        except StopIteration:
+            self._generador = None
+            self.estado_var.set(f"Completo: {self.histograma.total:,} puntos en la vista, "
+                                f"{self.histograma.descartados:,} fuera")
+            return
+        except Exception as e:
+            self._generador = None
+            messagebox.showerror("Error", f"Error en el cálculo:\n{str(e)}")
+            return
+
+        self.histograma.agregar(muestras[..., 0], muestras[..., 1])
+        self._imagen = graficar_seccion_poincare(self.ax, self.histograma, self._imagen,
+                                                 self.mapa.periodo, self.fase)
+        self.canvas.draw_idle()
+        self._tarea = self.ventana.after(1, self._avanzar)
+
+    def _detener(self):
+        if self._tarea is not None:
+            self.ventana.after_cancel(self._tarea)
+            self._tarea = None
+        self._generador = None
+
+    def _cerrar(self):
+        self._detener()
+        self.ventana.destroy()
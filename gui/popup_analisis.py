@@ -6,6 +6,7 @@ import tkinter as tk
 from tkinter import ttk
 import numpy as np
 from ui.estilos import COLORES, FUENTES
+from core.floquet import AnalizadorFloquet
 
 
 class VentanaAnalisisPopup:
@@ -69,6 +70,12 @@ class VentanaAnalisisPopup:
                   command=self._mostrar_analisis_personalizado).pack(
             side=tk.LEFT, padx=5)
         
+        tf = self.sistema.termino_forzado
+        if not self.sistema.funcion_personalizada and tf and tf['tipo'] in ['seno', 'coseno']:
+            ttk.Button(controles, text="Floquet",
+                      command=self._mostrar_floquet).pack(
+                side=tk.LEFT, padx=5)
+        
         ttk.Button(controles, text="Cerrar",
                   command=self.popup.destroy).pack(
             side=tk.RIGHT, padx=5)
@@ -151,6 +158,66 @@ class VentanaAnalisisPopup:
         texto += "\n"
         return texto
     
+    def _mostrar_floquet(self):
+        """Muestra monodromía, multiplicadores y respuesta periódica del sistema forzado"""
+        self.text_widget.delete(1.0, tk.END)
+        
+        texto = "╔" + "═" * 58 + "╗\n"
+        texto += "║  ANÁLISIS DE FLOQUET (FORZADO PERIÓDICO)                   ║\n"
+        texto += "╚" + "═" * 58 + "╝\n\n"
+        
+        try:
+            floquet = AnalizadorFloquet(self.sistema)
+        except ValueError as e:
+            self.text_widget.insert(1.0, texto + f"⚠️ {e}\n")
+            return
+        
+        texto += self._generar_termino_forzado()
+        texto += f"Período del forzado: T = 2π/ω = {floquet.periodo:.6f}\n\n"
+        
+        M = floquet.monodromia
+        texto += "📊 MATRIZ DE MONODROMÍA\n"
+        texto += "─" * 60 + "\n\n"
+        texto += "Como A es constante:  Φ(T) = e^{A·T}\n\n"
+        texto += "       ⎡                ⎤\n"
+        texto += f"Φ(T) = ⎢ {M[0,0]:10.6f}  {M[0,1]:10.6f} ⎥\n"
+        texto += "       ⎢                ⎥\n"
+        texto += f"       ⎣ {M[1,0]:10.6f}  {M[1,1]:10.6f} ⎦\n\n"
+        
+        texto += "🔢 MULTIPLICADORES DE FLOQUET  μ = e^{λ·T}\n"
+        texto += "─" * 60 + "\n\n"
+        for i, (mu, exponente) in enumerate(zip(floquet.multiplicadores, floquet.exponentes), 1):
+            if abs(mu.imag) > 1e-12:
+                texto += f"    μ{i} = {mu.real:.6f} {'+' if mu.imag >= 0 else '-'} {abs(mu.imag):.6f}i"
+            else:
+                texto += f"    μ{i} = {mu.real:.6f}"
+            texto += f"    |μ{i}| = {abs(mu):.6f}   (Re λ{i} = {exponente:.6f})\n"
+        
+        estados = {
+            'estable': "✓ ESTABLE: toda trayectoria converge a la solución periódica",
+            'neutral': "○ NEUTRAL: |μ| = 1, la solución periódica no atrae",
+            'inestable': "✗ INESTABLE: la solución periódica repele las trayectorias",
+        }
+        texto += f"\n    Radio espectral: {floquet.radio_espectral:.6f}\n"
+        texto += f"    {estados[floquet.estabilidad()]}\n\n"
+        
+        texto += "🌊 RESPUESTA PERIÓDICA ESTACIONARIA\n"
+        texto += "─" * 60 + "\n\n"
+        if floquet.resonante:
+            texto += "⚠️ Resonancia exacta: iω es autovalor de A y no existe\n"
+            texto += "   una solución periódica acotada.\n"
+        else:
+            fn = "sin" if floquet.tipo == 'seno' else "cos"
+            texto += "Amplitud compleja:  c = (iωI − A)⁻¹·b\n\n"
+            amplitudes, fases = floquet.amplitudes_y_fases()
+            for i, (amp, fase) in enumerate(zip(amplitudes, fases), 1):
+                texto += f"    x{i}(t) = {amp:.6f}·{fn}({floquet.omega:.4f}t {'+' if fase >= 0 else '-'} {abs(fase):.4f})\n"
+            p = floquet.punto_fijo
+            texto += f"\nPunto fijo del mapa estroboscópico (t = kT):\n"
+            texto += f"    x* = ({p[0]:.6f}, {p[1]:.6f})\n"
+        
+        self.text_widget.insert(1.0, texto)
+    
     def _mostrar_autovalores(self):
         """Muestra cálculo detallado de autovalores"""
         self.text_widget.delete(1.0, tk.END)
@@ -0,0 +1,98 @@
+"""
+Ventana de respuesta en frecuencia para sistemas lineales forzados
+"""
+
+import numpy as np
+import tkinter as tk
+from tkinter import ttk, messagebox
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
+from core.respuesta_frecuencia import barrido_frecuencias, picos_resonancia
+from visualization.respuesta_frecuencia import graficar_bode
+from ui.estilos import COLORES, FUENTES
+
+
+class VentanaRespuestaFrecuencia:
+    """Diagrama de Bode de dx/dt = A·x + b·sin(ωt) sobre un rango de ω"""
+
+    def __init__(self, parent, sistema):
+        """
+        Parámetros:
+        - parent: ventana padre
+        - sistema: SistemaDinamico2D definido por matriz con término forzado
+        """
+        if sistema.A is None or not sistema.termino_forzado:
+            raise ValueError("Se requiere un sistema lineal con término forzado")
+
+        self.A = sistema.A
+        tf = sistema.termino_forzado
+        self.b = np.array([tf['coef1'], tf['coef2']], dtype=float)
+        self.omega_actual = abs(float(tf.get('param', 0))) if tf['tipo'] in ('seno', 'coseno') else None
+        if not self.omega_actual:
+            self.omega_actual = None
+
+        # Rango por defecto: una década y media alrededor de las frecuencias propias
+        escalas = [abs(l) for l in np.linalg.eigvals(self.A) if abs(l) > 1e-9]
+        if self.omega_actual:
+            escalas.append(self.omega_actual)
+        centro = np.exp(np.mean(np.log(escalas))) if escalas else 1.0
+
+        self.ventana = tk.Toplevel(parent)
+        self.ventana.title("Respuesta en Frecuencia")
+        self.ventana.geometry("900x760")
+        self.ventana.configure(bg=COLORES['fondo'])
+
+        self.w_min_var = tk.DoubleVar(value=float(f"{centro / 30:.3g}"))
+        self.w_max_var = tk.DoubleVar(value=float(f"{centro * 30:.3g}"))
+        self.n_var = tk.IntVar(value=4000)
+
+        self._crear_widgets()
+        self._calcular()
+
+    def _crear_widgets(self):
+        controles = ttk.Frame(self.ventana, padding="10")
+        controles.pack(fill=tk.X)
+
+        for texto, variable in (("ω mín:", self.w_min_var), ("ω máx:", self.w_max_var),
+                                ("Frecuencias:", self.n_var)):
+            ttk.Label(controles, text=texto).pack(side=tk.LEFT)
+            ttk.Entry(controles, textvariable=variable, width=8).pack(side=tk.LEFT, padx=(2, 8))
+        ttk.Button(controles, text="Calcular", style='Accent.TButton',
+                   command=self._calcular).pack(side=tk.LEFT, padx=5)
+        ttk.Button(controles, text="Cerrar",
+                   command=self.ventana.destroy).pack(side=tk.RIGHT, padx=5)
+
+        self.label_picos = ttk.Label(self.ventana, text="", font=FUENTES['pequena'])
+        self.label_picos.pack(anchor=tk.W, padx=10)
+
+        self.fig = Figure(figsize=(8, 7), dpi=100)
+        self.ax_amplitud = self.fig.add_subplot(2, 1, 1)
+        self.ax_fase = self.fig.add_subplot(2, 1, 2, sharex=self.ax_amplitud)
+        self.canvas = FigureCanvasTkAgg(self.fig, self.ventana)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        NavigationToolbar2Tk(self.canvas, self.ventana).update()
+
+    def _calcular(self):
+        try:
+            w_min, w_max = self.w_min_var.get(), self.w_max_var.get()
+            if not 0 < w_min < w_max:
+                raise ValueError("Se requiere 0 < ω mín < ω máx")
+            omegas = np.logspace(np.log10(w_min), np.log10(w_max), max(self.n_var.get(), 3))
+            resultado = barrido_frecuencias(self.A, self.b, omegas)
+        except (ValueError, tk.TclError) as e:
+            messagebox.showerror("Error", f"Valores inválidos:\n{str(e)}")
+            return
+
+        picos = picos_resonancia(omegas, resultado['amplitud'])
+        graficar_bode(self.ax_amplitud, self.ax_fase, resultado, picos, self.omega_actual)
+
+        if picos:
+            texto = "Resonancias: " + ", ".join(
+                f"x{p['componente'] + 1}: ω = {p['omega']:.4g} (|x| = {p['amplitud']:.4g})"
+                for p in picos)
+        else:
+            texto = "Sin picos de resonancia en el rango"
+        self.label_picos.config(text=texto)
+
+        self.fig.tight_layout()
+        self.canvas.draw()
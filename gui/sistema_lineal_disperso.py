@@ -0,0 +1,135 @@
+"""
+Ventana de análisis de sistemas lineales dispersos de gran dimensión
+"""
+
+import numpy as np
+import scipy.sparse as sparse
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
+from core.sistema_lineal_disperso import SistemaLinealDisperso
+from visualization.sistema_lineal_disperso import graficar_espectro, graficar_propagacion
+from ui.estilos import COLORES, FUENTES
+
+REDES = ('Anillo', 'Malla cuadrada', 'Aleatoria')
+
+
+class VentanaSistemaLinealDisperso:
+    """dx/dt = A·x con A dispersa: espectro dominante, estabilidad y propagación"""
+
+    def __init__(self, parent):
+        """
+        Parámetros:
+        - parent: ventana padre
+        """
+        self.sistema = None
+        self.archivo = None
+
+        self.ventana = tk.Toplevel(parent)
+        self.ventana.title("Sistema Lineal Disperso")
+        self.ventana.geometry("1000x820")
+        self.ventana.configure(bg=COLORES['fondo'])
+
+        self.red_var = tk.StringVar(value=REDES[1])
+        self.n_var = tk.IntVar(value=2500)
+        self.difusion_var = tk.DoubleVar(value=1.0)
+        self.decaimiento_var = tk.DoubleVar(value=0.05)
+        self.k_var = tk.IntVar(value=6)
+        self.t_max_var = tk.DoubleVar(value=20.0)
+        self.estado_var = tk.StringVar(value="")
+
+        self._crear_widgets()
+
+    def _crear_widgets(self):
+        controles = ttk.Frame(self.ventana, padding="10")
+        controles.pack(fill=tk.X)
+
+        ttk.Label(controles, text="Red:").grid(row=0, column=0, sticky=tk.W)
+        ttk.Combobox(controles, textvariable=self.red_var, values=REDES, state='readonly',
+                     width=14).grid(row=0, column=1, padx=(2, 10))
+        campos = (("Nodos:", self.n_var), ("Difusión D:", self.difusion_var),
+                  ("Decaimiento γ:", self.decaimiento_var))
+        for columna, (texto, variable) in enumerate(campos, start=1):
+            ttk.Label(controles, text=texto).grid(row=0, column=2 * columna, sticky=tk.W)
+            ttk.Entry(controles, textvariable=variable, width=8).grid(row=0, column=2 * columna + 1,
+                                                                     padx=(2, 10))
+        ttk.Button(controles, text="Generar red", style='Accent.TButton',
+                   command=self._generar).grid(row=0, column=8, padx=5)
+        ttk.Button(controles, text="Cargar .npz...",
+                   command=self._cargar).grid(row=0, column=9, padx=5)
+
+        for columna, (texto, variable) in enumerate((("Autovalores k:", self.k_var),
+                                                     ("t máx:", self.t_max_var))):
+            ttk.Label(controles, text=texto).grid(row=1, column=2 * columna, sticky=tk.W, pady=(5, 0))
+            ttk.Entry(controles, textvariable=variable, width=8).grid(row=1, column=2 * columna + 1,
+                                                                     padx=(2, 10), pady=(5, 0))
+        ttk.Button(controles, text="Analizar", command=self._analizar).grid(row=1, column=8, padx=5,
+                                                                            pady=(5, 0))
+        ttk.Button(controles, text="Cerrar", command=self.ventana.destroy).grid(row=1, column=9, padx=5,
+                                                                               pady=(5, 0))
+
+        ttk.Label(self.ventana, textvariable=self.estado_var, font=FUENTES['pequena']).pack(
+            anchor=tk.W, padx=10)
+
+        self.fig = Figure(figsize=(9, 7), dpi=100)
+        self.ax_espectro = self.fig.add_subplot(2, 1, 1)
+        self.ax_propagacion = self.fig.add_subplot(2, 1, 2)
+        self.canvas = FigureCanvasTkAgg(self.fig, self.ventana)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        NavigationToolbar2Tk(self.canvas, self.ventana).update()
+
+    def _generar(self):
+        try:
+            n = self.n_var.get()
+            opciones = {'difusion': self.difusion_var.get(), 'decaimiento': self.decaimiento_var.get()}
+            if n < 3:
+                raise ValueError("Se requieren al menos 3 nodos")
+            red = self.red_var.get()
+            if red == 'Anillo':
+                self.sistema = SistemaLinealDisperso.anillo(n, **opciones)
+            elif red == 'Malla cuadrada':
+                lado = max(int(round(np.sqrt(n))), 2)
+                self.sistema = SistemaLinealDisperso.malla(lado, lado, **opciones)
+            else:
+                self.sistema = SistemaLinealDisperso.aleatoria(n, **opciones)
+        except (ValueError, tk.TclError) as e:
+            messagebox.showerror("Error", f"Valores inválidos:\n{str(e)}")
+            return
+        self.archivo = None
+        self._analizar()
+
+    def _cargar(self):
+        ruta = filedialog.askopenfilename(parent=self.ventana, title="Matriz dispersa (scipy.sparse.save_npz)",
+                                          filetypes=[("Matriz dispersa", "*.npz")])
+        if not ruta:
+            return
+        try:
+            self.sistema = SistemaLinealDisperso(sparse.load_npz(ruta))
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudo cargar la matriz:\n{str(e)}")
+            return
+        self.archivo = ruta
+        self._analizar()
+
+    def _analizar(self):
+        if self.sistema is None:
+            self._generar()
+            return
+        try:
+            clasificacion = self.sistema.clasificar_estabilidad(k=max(self.k_var.get(), 1))
+            # Condición inicial: impulso aleatorio reproducible
+            x0 = np.random.default_rng(0).standard_normal(self.sistema.n)
+            t, X = self.sistema.propagar(x0, self.t_max_var.get(), t_puntos=101)
+        except (ValueError, tk.TclError) as e:
+            messagebox.showerror("Error", f"Error en el análisis:\n{str(e)}")
+            return
+
+        graficar_espectro(self.ax_espectro, clasificacion)
+        graficar_propagacion(self.ax_propagacion, t, X, alfa=clasificacion['abscisa'])
+        origen = f"Archivo: {self.archivo}" if self.archivo else f"Red: {self.red_var.get()}"
+        self.estado_var.set(f"{origen} | n = {self.sistema.n:,} | nnz = {self.sistema.nnz:,} | "
+                            f"tr(A) = {self.sistema.traza:.4g} | α(A) = {clasificacion['abscisa']:.6g} | "
+                            f"τ = {clasificacion['tiempo_caracteristico']:.4g}")
+        self.fig.tight_layout()
+        self.canvas.draw()
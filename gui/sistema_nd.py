@@ -0,0 +1,253 @@
+"""
+Interfaz gráfica para sistemas de dimensión n (Lorenz, SIR, ...)
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox
+import numpy as np
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
+import matplotlib
+matplotlib.use('TkAgg')
+
+from core.sistema_nd import SistemaDinamicoND
+from core.utils import parsear_parametros, formatear_parametros
+from visualization.proyecciones import GrapherProyecciones
+from input_module.ejemplos import EJEMPLOS_ND
+from ui.estilos import configurar_estilos_ttk, COLORES, FUENTES
+
+
+class InterfazSistemaND:
+    """Sistemas dx/dt = f(x) en Rⁿ vistos por proyecciones y secciones 2D"""
+
+    def __init__(self, root):
+        """
+        Inicializa la interfaz
+
+        Parámetros:
+        - root: ventana raíz o frame principal
+        """
+        self.root = root
+        if isinstance(root, tk.Tk):
+            self.root.title("Sistemas de Dimensión n")
+            self.root.geometry("1400x800")
+            self.root.configure(bg=COLORES['fondo'])
+        configurar_estilos_ttk()
+
+        self.sistema = None
+        self.equilibrios = None
+        self.trayectorias = []
+        self.limites = None
+        self._inicializar_variables()
+
+    def _inicializar_variables(self):
+        """Inicializa variables de control de la UI"""
+        self.ejemplo_var = tk.StringVar(value=EJEMPLOS_ND['lorenz']['nombre'])
+        self.variables_var = tk.StringVar()
+        self.parametros_var = tk.StringVar()
+        self.condiciones_var = tk.StringVar()
+        self.limites_var = tk.StringVar()
+        self.t_max_var = tk.StringVar()
+        self.eje_h_var = tk.StringVar()
+        self.eje_v_var = tk.StringVar()
+        self.vista_var = tk.StringVar(value='proyeccion')
+        self.corte_var = tk.StringVar()
+
+    def crear_widgets(self):
+        """Crea la estructura de widgets"""
+        main_frame = ttk.Frame(self.root, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        panel_izq = self._crear_panel_controles(main_frame)
+        panel_izq.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(0, 10))
+        panel_der = self._crear_panel_grafica(main_frame)
+        panel_der.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        main_frame.columnconfigure(1, weight=1)
+        main_frame.rowconfigure(0, weight=1)
+        self._cargar_ejemplo()
+
+    def _crear_panel_controles(self, parent):
+        """Crea el panel de controles"""
+        panel = ttk.Frame(parent, style='Card.TFrame', padding="15")
+        ttk.Label(panel, text="Sistema de Dimensión n", font=FUENTES['titulo']).grid(
+            row=0, column=0, columnspan=2, pady=(0, 10))
+
+        ttk.Label(panel, text="Ejemplo:", font=FUENTES['normal']).grid(row=1, column=0, sticky=tk.W)
+        combo = ttk.Combobox(panel, textvariable=self.ejemplo_var, state='readonly',
+                             values=[e['nombre'] for e in EJEMPLOS_ND.values()], width=24)
+        combo.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=5)
+        combo.bind('<<ComboboxSelected>>', lambda e: self._cargar_ejemplo())
+
+        ttk.Label(panel, text="Variables:", font=FUENTES['normal']).grid(row=2, column=0, sticky=tk.W)
+        ttk.Entry(panel, textvariable=self.variables_var, width=26,
+                  font=FUENTES['monoespaciada']).grid(row=2, column=1, sticky=(tk.W, tk.E), pady=5)
+
+        ttk.Label(panel, text="Ecuaciones\n(una por línea):", font=FUENTES['normal']).grid(
+            row=3, column=0, sticky=(tk.W, tk.N))
+        self.text_ecuaciones = tk.Text(panel, height=5, width=30, font=FUENTES['monoespaciada'])
+        self.text_ecuaciones.grid(row=3, column=1, sticky=(tk.W, tk.E), pady=5)
+
+        filas = (("Parámetros:", self.parametros_var),
+                 ("Condiciones iniciales\n(separadas por ;):", self.condiciones_var),
+                 ("Límites (min:max, ...):", self.limites_var),
+                 ("Tiempo máximo:", self.t_max_var))
+        for fila, (texto, variable) in enumerate(filas, start=4):
+            ttk.Label(panel, text=texto, font=FUENTES['normal']).grid(row=fila, column=0, sticky=tk.W)
+            ttk.Entry(panel, textvariable=variable, width=26,
+                      font=FUENTES['monoespaciada']).grid(row=fila, column=1, sticky=(tk.W, tk.E), pady=5)
+
+        ttk.Button(panel, text="Analizar", style='Accent.TButton',
+                   command=self.analizar).grid(row=8, column=0, columnspan=2, pady=10, sticky=(tk.W, tk.E))
+
+        vista = ttk.LabelFrame(panel, text="Vista 2D", padding="10")
+        vista.grid(row=9, column=0, columnspan=2, sticky=(tk.W, tk.E))
+        ttk.Label(vista, text="Horizontal:").grid(row=0, column=0, sticky=tk.W)
+        self.combo_h = ttk.Combobox(vista, textvariable=self.eje_h_var, state='readonly', width=8)
+        self.combo_h.grid(row=0, column=1, padx=5)
+        ttk.Label(vista, text="Vertical:").grid(row=0, column=2, sticky=tk.W)
+        self.combo_v = ttk.Combobox(vista, textvariable=self.eje_v_var, state='readonly', width=8)
+        self.combo_v.grid(row=0, column=3, padx=5)
+        ttk.Radiobutton(vista, text="Proyección", variable=self.vista_var,
+                        value='proyeccion').grid(row=1, column=0, columnspan=2, sticky=tk.W)
+        ttk.Radiobutton(vista, text="Sección en:", variable=self.vista_var,
+                        value='seccion').grid(row=2, column=0, columnspan=2, sticky=tk.W)
+        ttk.Entry(vista, textvariable=self.corte_var, width=18).grid(row=2, column=2, columnspan=2, sticky=tk.W)
+        ttk.Label(vista, text="Sección: valores de las demás coordenadas, ej: z=27",
+                  font=FUENTES['pequena'], foreground=COLORES['texto_secundario']).grid(
+            row=3, column=0, columnspan=4, sticky=tk.W)
+        ttk.Button(vista, text="Dibujar", command=self._dibujar).grid(
+            row=4, column=0, columnspan=4, pady=(5, 0), sticky=(tk.W, tk.E))
+
+        resultados = ttk.LabelFrame(panel, text="Equilibrios", padding="10")
+        resultados.grid(row=10, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
+        self.text_resultados = tk.Text(resultados, height=9, width=38, font=FUENTES['pequena'], wrap=tk.WORD)
+        self.text_resultados.pack(fill=tk.BOTH, expand=True)
+
+        panel.columnconfigure(1, weight=1)
+        return panel
+
+    def _crear_panel_grafica(self, parent):
+        """Crea el panel de gráfica"""
+        panel = ttk.Frame(parent, style='Card.TFrame', padding="15")
+        self.fig = Figure(figsize=(9, 7))
+        self.ax = self.fig.add_subplot(111)
+        self.canvas = FigureCanvasTkAgg(self.fig, master=panel)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        toolbar_frame = ttk.Frame(panel)
+        toolbar_frame.pack(fill=tk.X, pady=(5, 0))
+        NavigationToolbar2Tk(self.canvas, toolbar_frame).update()
+        return panel
+
+    def _cargar_ejemplo(self):
+        """Llena los campos con el ejemplo seleccionado y lo analiza"""
+        ejemplo = next(e for e in EJEMPLOS_ND.values() if e['nombre'] == self.ejemplo_var.get())
+        self.variables_var.set(', '.join(ejemplo['variables']))
+        self.text_ecuaciones.delete('1.0', tk.END)
+        self.text_ecuaciones.insert('1.0', '\n'.join(ejemplo['ecuaciones']))
+        self.parametros_var.set(formatear_parametros(ejemplo['parametros']))
+        self.condiciones_var.set(', '.join(f'{v:g}' for v in ejemplo['condicion_inicial']))
+        self.limites_var.set(', '.join(f'{a:g}:{b:g}' for a, b in ejemplo['limites']))
+        self.t_max_var.set(f"{ejemplo['t_max']:g}")
+        i, j = ejemplo['proyeccion']
+        self.eje_h_var.set(ejemplo['variables'][i])
+        self.eje_v_var.set(ejemplo['variables'][j])
+        self.analizar()
+
+    def _leer_entrada(self):
+        """Lee los campos y retorna (sistema, condiciones (K, n), limites (n, 2), t_max)"""
+        variables = [v.strip() for v in self.variables_var.get().split(',') if v.strip()]
+        ecuaciones = [e.strip() for e in self.text_ecuaciones.get('1.0', tk.END).splitlines() if e.strip()]
+        parametros = parsear_parametros(self.parametros_var.get())
+        if any(np.ndim(v) for v in parametros.values()):
+            raise ValueError("Los barridos de parámetros no se admiten en este módulo")
+        sistema = SistemaDinamicoND(ecuaciones, variables or None, parametros,
+                                    nombre=self.ejemplo_var.get())
+
+        condiciones = np.array([[float(c) for c in parte.split(',')]
+                                for parte in self.condiciones_var.get().split(';') if parte.strip()])
+        if condiciones.ndim != 2 or condiciones.shape[1] != sistema.n:
+            raise ValueError(f"Cada condición inicial debe tener {sistema.n} componentes")
+        limites = np.array([[float(a) for a in parte.split(':')]
+                            for parte in self.limites_var.get().split(',')])
+        if limites.shape != (sistema.n, 2) or np.any(limites[:, 0] >= limites[:, 1]):
+            raise ValueError(f"Indique {sistema.n} límites de la forma min:max")
+        return sistema, condiciones, limites, float(self.t_max_var.get())
+
+    def analizar(self):
+        """Compila el sistema, busca equilibrios, integra y dibuja"""
+        try:
+            sistema, condiciones, limites, t_max = self._leer_entrada()
+            self.equilibrios = sistema.encontrar_puntos_equilibrio(limites)
+            self.trayectorias = [sistema.integrar(x0, t_max, t_puntos=max(2000, int(200 * t_max)))[1]
+                                 for x0 in condiciones]
+        except ValueError as e:
+            messagebox.showerror("Error de validación", str(e))
+            return
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al analizar el sistema:\n{str(e)}")
+            return
+
+        self.sistema = sistema
+        self.limites = limites
+        self.grapher = GrapherProyecciones(sistema)
+        for combo in (self.combo_h, self.combo_v):
+            combo.configure(values=sistema.variables)
+        if self.eje_h_var.get() not in sistema.variables:
+            self.eje_h_var.set(sistema.variables[0])
+        if self.eje_v_var.get() not in sistema.variables:
+            self.eje_v_var.set(sistema.variables[min(1, sistema.n - 1)])
+        try:
+            self._leer_corte()
+        except ValueError:
+            self.corte_var.set('')
+        self._mostrar_equilibrios()
+        self._dibujar()
+
+    def _mostrar_equilibrios(self):
+        lineas = []
+        for punto in self.equilibrios:
+            clase = self.sistema.clasificar_equilibrio(punto)
+            coordenadas = ', '.join(f'{v} = {x:.4g}' for v, x in zip(self.sistema.variables, punto))
+            autovalores = ', '.join(f'{l.real:.3g}{l.imag:+.3g}i' if abs(l.imag) > 1e-12 else f'{l.real:.3g}'
+                                    for l in clase['autovalores'])
+            lineas.append(f"• ({coordenadas})\n  {clase['estabilidad']}\n  λ: {autovalores}")
+        self.text_resultados.config(state=tk.NORMAL)
+        self.text_resultados.delete('1.0', tk.END)
+        self.text_resultados.insert('1.0', '\n'.join(lineas) or 'Sin equilibrios en los límites')
+        self.text_resultados.config(state=tk.DISABLED)
+
+    def _leer_corte(self):
+        """Coordenadas del plano de sección: las indicadas (ej: z=27) o el centro de los límites"""
+        variables = self.sistema.variables
+        valores = self.limites.mean(axis=1)
+        for parte in self.corte_var.get().split(','):
+            if not parte.strip():
+                continue
+            nombre, _, valor = (s.strip() for s in parte.partition('='))
+            if nombre not in variables or not valor:
+                raise ValueError(f"Use variable=valor con variables de {', '.join(variables)}")
+            valores[variables.index(nombre)] = float(valor)
+        return valores
+
+    def _dibujar(self):
+        """Proyección o sección sobre el par de coordenadas elegido"""
+        if self.sistema is None:
+            return
+        variables = self.sistema.variables
+        ejes = (variables.index(self.eje_h_var.get()), variables.index(self.eje_v_var.get()))
+        if ejes[0] == ejes[1]:
+            messagebox.showwarning("Advertencia", "Elija dos coordenadas distintas")
+            return
+
+        if self.vista_var.get() == 'proyeccion':
+            self.grapher.graficar_proyeccion(self.ax, self.trayectorias, ejes, self.equilibrios, self.limites)
+        else:
+            try:
+                valores = self._leer_corte()
+            except ValueError as e:
+                messagebox.showerror("Error", f"Sección inválida:\n{str(e)}")
+                return
+            self.grapher.graficar_seccion(self.ax, valores, ejes, self.limites,
+                                          trayectorias=self.trayectorias, equilibrios=self.equilibrios)
+        self.canvas.draw()
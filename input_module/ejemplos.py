@@ -93,3 +93,28 @@ EJEMPLOS_NO_LINEALES = {
     }
 }
 
+
+EJEMPLOS_ND = {
+    'lorenz': {
+        'nombre': 'Lorenz',
+        'ecuaciones': ['sigma*(y - x)', 'x*(rho - z) - y', 'x*y - beta*z'],
+        'variables': ['x', 'y', 'z'],
+        'parametros': {'sigma': 10.0, 'rho': 28.0, 'beta': 8 / 3},
+        'condicion_inicial': [1.0, 1.0, 1.0],
+        'limites': [(-25, 25), (-30, 30), (0, 55)],
+        'proyeccion': (0, 2),
+        't_max': 40,
+        'descripcion': 'Atractor extraño: tres equilibrios inestables y órbitas caóticas'
+    },
+    'sir_vital': {
+        'nombre': 'SIR con Dinámica Vital',
+        'ecuaciones': ['mu - beta*S*I - mu*S', 'beta*S*I - (gamma + mu)*I', 'gamma*I - mu*R'],
+        'variables': ['S', 'I', 'R'],
+        'parametros': {'beta': 0.5, 'gamma': 0.1, 'mu': 0.01},
+        'condicion_inicial': [0.99, 0.01, 0.0],
+        'limites': [(0, 1), (0, 1), (0, 1)],
+        'proyeccion': (0, 1),
+        't_max': 400,
+        'descripcion': 'Nacimientos y muertes a tasa μ: espiral hacia el equilibrio endémico si R₀ = β/(γ+μ) > 1'
+    }
+}
@@ -126,6 +126,16 @@ class InputLotkaVolterra:
         )
         ayuda.grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=5)
     
+    def al_cambiar(self, callback):
+        """
+        Registra callback() para cada cambio de α, β, γ o δ (entrada o deslizador)
+        
+        Se llama en cada movimiento del deslizador: quien lo registre debe
+        agrupar las llamadas (ej: con after) antes de redibujar.
+        """
+        for var in self.variables.values():
+            var.trace_add('write', lambda *args: callback())
+    
     def obtener_parametros(self):
         """Retorna los parámetros actuales"""
         if self.modo_personalizado.get():
@@ -0,0 +1,56 @@
+"""
+Ejemplos predefinidos de mapas discretos
+"""
+
+EJEMPLOS_MAPAS = {
+    'Logístico': {
+        'funcion': 'r*x*(1 - x)',
+        'r_range': (2.5, 4.0),
+        'x0': 0.5,
+        'r_cobweb': 3.83,
+        'descripcion': 'Mapa logístico: cascada de duplicaciones de período hacia el caos '
+                       '(r∞ ≈ 3.5699) y ventana de período 3 en r ≈ 3.83.'
+    },
+    'Tienda': {
+        'funcion': 'r*min(x, 1 - x)',
+        'r_range': (1.0, 2.0),
+        'x0': 0.2,
+        'r_cobweb': 1.8,
+        'descripcion': 'Mapa de la tienda: lineal a trozos, caótico para todo r > 1 '
+                       'con bandas que se fusionan al crecer r.'
+    },
+    'Seno': {
+        'funcion': 'r*sin(pi*x)',
+        'r_range': (0.6, 1.0),
+        'x0': 0.5,
+        'r_cobweb': 0.9,
+        'descripcion': 'Mapa seno: unimodal como el logístico, con la misma constante '
+                       'de Feigenbaum δ ≈ 4.669.'
+    },
+    'Gauss': {
+        'funcion': 'exp(-6.2*x**2) + r',
+        'r_range': (-1.0, 1.0),
+        'x0': 0.0,
+        'r_cobweb': -0.5,
+        'descripcion': 'Mapa de Gauss: duplicaciones de período seguidas de cascadas '
+                       'inversas (diagrama de "pájaro").'
+    },
+    'Cúbico': {
+        'funcion': 'r*x - x**3',
+        'r_range': (1.0, 3.0),
+        'x0': 0.1,
+        'r_cobweb': 2.5,
+        'descripcion': 'Mapa cúbico simétrico: el atractor se divide y se vuelve a unir '
+                       'respetando la simetría x → -x.'
+    }
+}
+
+
+def obtener_nombres_ejemplos_mapas():
+    """Retorna lista de nombres de ejemplos"""
+    return list(EJEMPLOS_MAPAS.keys())
+
+
+def obtener_ejemplo_mapa(nombre: str):
+    """Retorna datos de un ejemplo específico"""
+    return EJEMPLOS_MAPAS.get(nombre, None)
@@ -0,0 +1,131 @@
+"""
+Tests para el almacén de mallas en disco por bloques
+"""
+
+import os
+import tempfile
+import unittest
+import numpy as np
+from matplotlib.figure import Figure
+from core.sistema import SistemaDinamico2D
+from core.almacen_malla import AlmacenMalla
+from core.clasificacion import (clasificar_invariantes, invariantes, nucleo_clasificacion, SILLA,
+                                NODO_ESTABLE)
+from visualization.raster import mostrar_almacen
+
+
+def nucleo_suma(x, y):
+    return (x[None, :] + y[:, None]).astype(np.float32)
+
+
+class TestAlmacenMalla(unittest.TestCase):
+
+    def setUp(self):
+        self._directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self._directorio.name, 'malla')
+
+    def tearDown(self):
+        self._directorio.cleanup()
+
+    def test_crear_calcular_y_reabrir(self):
+        almacen = AlmacenMalla.crear(self.ruta, (50, 70), (0, 7), (0, 5), bloque=(16, 16),
+                                     metadatos={'nucleo': 'suma'})
+        self.assertEqual(almacen.n_bloques, (4, 5))
+        self.assertTrue(np.isnan(almacen.datos).all())
+        almacen.calcular(nucleo_suma)
+        self.assertTrue(almacen.completo)
+
+        reabierto = AlmacenMalla.abrir(self.ruta, modo='r')
+        self.assertEqual(reabierto.metadatos, {'nucleo': 'suma'})
+        self.assertEqual(reabierto.extent, (0.0, 7.0, 0.0, 5.0))
+        esperado = reabierto.x()[None, :] + reabierto.y()[:, None]
+        np.testing.assert_allclose(reabierto.datos, esperado, rtol=1e-6)
+        np.testing.assert_allclose(reabierto.x()[:2], [0.05, 0.15])
+        with self.assertRaises(ValueError):
+            reabierto.calcular(nucleo_suma)
+
+    def test_reanudar_tras_interrupcion(self):
+        almacen = AlmacenMalla.crear(self.ruta, (40, 40), (-1, 1), (-1, 1), bloque=(10, 10))
+        generador = almacen.calcular_bloques(nucleo_suma)
+        for _ in range(6):
+            next(generador)
+        del generador, almacen  # Interrupción entre bloques
+
+        llamadas = []
+
+        def nucleo_contado(x, y):
+            llamadas.append((x[0], y[0]))
+            return nucleo_suma(x, y)
+
+        reanudado = AlmacenMalla.abrir(self.ruta)
+        self.assertAlmostEqual(reanudado.progreso, 6 / 16)
+        self.assertEqual(len(reanudado.pendientes()), 10)
+        reanudado.calcular(nucleo_contado)
+        self.assertEqual(len(llamadas), 10)
+        np.testing.assert_allclose(reanudado.datos, reanudado.x()[None, :] + reanudado.y()[:, None], rtol=1e-6)
+
+    def test_vista_decimada(self):
+        almacen = AlmacenMalla.crear(self.ruta, (100, 200), (0, 2), (0, 1), bloque=(32, 64))
+        almacen.calcular(nucleo_suma)
+
+        imagen, extent = almacen.vista_decimada((50, 25), reduccion='submuestreo')
+        self.assertEqual(imagen.shape, (25, 50))
+        np.testing.assert_array_equal(imagen, almacen.datos[::4, ::4])
+        self.assertEqual(extent, almacen.extent)
+
+        imagen, _ = almacen.vista_decimada((50, 25), reduccion='media')
+        esperado = np.asarray(almacen.datos, dtype=float).reshape(25, 4, 50, 4).mean(axis=(1, 3))
+        np.testing.assert_allclose(imagen, esperado, rtol=1e-6)
+
+        imagen, extent = almacen.vista_decimada((1000, 1000), region=(0.5, 1.0, 0.25, 0.5), reduccion='maximo')
+        self.assertEqual(imagen.shape, (25, 50))
+        np.testing.assert_allclose(extent, (0.5, 1.0, 0.25, 0.5))
+        with self.assertRaises(ValueError):
+            almacen.vista_decimada(reduccion='moda')
+
+    def test_vista_parcial_ignora_bloques_pendientes(self):
+        almacen = AlmacenMalla.crear(self.ruta, (20, 20), (0, 1), (0, 1), bloque=(10, 10))
+        next(almacen.calcular_bloques(nucleo_suma))
+        imagen, _ = almacen.vista_decimada((2, 2), reduccion='media')
+        self.assertTrue(np.isfinite(imagen[0, 0]))
+        self.assertEqual(int(np.isnan(imagen).sum()), 3)
+
+        # En enteros las celdas pendientes no deben leerse como clase 0 (silla)
+        sistema = SistemaDinamico2D([[-1, 0], [0, -1]])
+        almacen = AlmacenMalla.crear(self.ruta + '_clases', (20, 20), (-1, 1), (-1, 1), dtype='uint8',
+                                     bloque=(10, 10))
+        self.assertEqual(almacen.meta['relleno'], 255)
+        next(almacen.calcular_bloques(nucleo_clasificacion(sistema)))
+
+        imagen, _ = almacen.vista_decimada((20, 20))
+        self.assertEqual(int(np.ma.count_masked(imagen)), 300)
+        np.testing.assert_array_equal(imagen.compressed(), NODO_ESTABLE)
+        self.assertNotIn(SILLA, imagen.compressed())
+
+        imagen, _ = almacen.vista_decimada((2, 2), reduccion='maximo')
+        np.testing.assert_array_equal(imagen, [[NODO_ESTABLE, np.nan], [np.nan, np.nan]])
+
+        reabierto = AlmacenMalla.abrir(self.ruta + '_clases', modo='r')
+        imagen, _ = reabierto.vista_decimada((20, 20))
+        self.assertEqual(int(np.ma.count_masked(imagen)), 300)
+
+    def test_nucleo_clasificacion_y_dibujo(self):
+        sistema = SistemaDinamico2D(funcion_personalizada={'f1': 'y', 'f2': 'x - x**3 - 0.5*y',
+                                                           'es_lineal': False})
+        almacen = AlmacenMalla.crear(self.ruta, (60, 80), (-2, 2), (-2, 2), dtype='uint8', bloque=(25, 25))
+        almacen.calcular(nucleo_clasificacion(sistema))
+        J = sistema.evaluar_jacobiano(almacen.x()[None, :], almacen.y()[:, None], 0.0)
+        np.testing.assert_array_equal(almacen.datos, clasificar_invariantes(*invariantes(J)))
+
+        ax = Figure().add_subplot(111)
+        imagen = mostrar_almacen(ax, almacen, max_pixeles=(40, 30))
+        self.assertEqual(imagen.get_array().shape, (30, 40))
+        ax.set_xlim(0, 1)
+        ax.set_ylim(0, 1)
+        mostrar_almacen(ax, almacen, imagen=imagen, max_pixeles=(400, 400))
+        self.assertEqual(imagen.get_array().shape, (15, 20))
+        np.testing.assert_allclose(imagen.get_extent(), (0, 1, 0, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
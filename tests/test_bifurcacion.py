@@ -0,0 +1,56 @@
+"""
+Tests para la clasificación automática de bifurcaciones 1D
+"""
+
+import unittest
+import numpy as np
+from core.bifurcacion import AnalizadorBifurcacion
+from input_module.bifurcacion import EJEMPLOS_BIFURCACION
+
+
+class TestClasificacionBifurcaciones(unittest.TestCase):
+    """Las formas normales deben clasificarse como en sus descripciones"""
+
+    def test_ejemplos_predefinidos(self):
+        """Cada ejemplo predefinido tiene un único punto crítico en el origen, del tipo de su nombre"""
+        for nombre, ejemplo in EJEMPLOS_BIFURCACION.items():
+            with self.subTest(ejemplo=nombre):
+                analizador = AnalizadorBifurcacion(ejemplo['funcion'])
+                resultado = analizador.clasificar_bifurcaciones(ejemplo['r_range'], ejemplo['x_range'])
+                self.assertEqual(len(resultado), 1)
+                self.assertEqual(resultado[0]['nombre'], nombre)
+                self.assertAlmostEqual(resultado[0]['r'], 0.0, places=6)
+                self.assertAlmostEqual(resultado[0]['x'], 0.0, places=6)
+
+    def test_pliegues_desplazados(self):
+        """r + x - x³ tiene dos sillas-nodo en r = ∓2/(3√3), x = ±1/√3"""
+        analizador = AnalizadorBifurcacion("r + x - x**3")
+        resultado = analizador.clasificar_bifurcaciones((-2, 2), (-3, 3))
+        self.assertEqual([b['tipo'] for b in resultado], ['silla_nodo', 'silla_nodo'])
+        r_critico = 2 / (3 * np.sqrt(3))
+        self.assertAlmostEqual(resultado[0]['r'], -r_critico, places=8)
+        self.assertAlmostEqual(resultado[0]['x'], 1 / np.sqrt(3), places=8)
+        self.assertAlmostEqual(resultado[1]['r'], r_critico, places=8)
+
+    def test_tridente_fuera_del_origen(self):
+        """(r - 1)x - x³ es un tridente supercrítico en r = 1"""
+        analizador = AnalizadorBifurcacion("(r - 1)*x - x**3")
+        resultado = analizador.clasificar_bifurcaciones((-2, 3), (-3, 3))
+        self.assertEqual(len(resultado), 1)
+        self.assertEqual(resultado[0]['tipo'], 'tridente_supercritico')
+        self.assertAlmostEqual(resultado[0]['r'], 1.0, places=6)
+
+    def test_imperfeccion_rompe_tridente(self):
+        """Con imperfección el tridente se convierte en una silla-nodo"""
+        analizador = AnalizadorBifurcacion("r*x - x**3 + 0.1")
+        resultado = analizador.clasificar_bifurcaciones((-2, 2), (-3, 3))
+        self.assertEqual([b['tipo'] for b in resultado], ['silla_nodo'])
+        self.assertAlmostEqual(resultado[0]['x'], -np.cbrt(0.05), places=8)
+
+    def test_sin_puntos_criticos(self):
+        analizador = AnalizadorBifurcacion("r - x")
+        self.assertEqual(analizador.clasificar_bifurcaciones((-2, 2), (-3, 3)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Tests para la detección de bifurcaciones de equilibrios en sistemas 2D
+"""
+
+import unittest
+import numpy as np
+from core.sistema import SistemaDinamico2D
+from core.bifurcacion_2d import AnalizadorBifurcacion2D
+
+
+def crear_sistema(f1, f2, u=0.0):
+    return SistemaDinamico2D(
+        funcion_personalizada={'f1': f1, 'f2': f2, 'es_lineal': False},
+        parametros={'u': u})
+
+
+class TestBifurcacion2D(unittest.TestCase):
+    """Sistemas con bifurcaciones de ubicación conocida"""
+
+    def test_hopf_forma_normal(self):
+        """La forma normal de Hopf tiene la bifurcación en u = 0 con ω = 1"""
+        sistema = crear_sistema('u*x - y - x*(x**2 + y**2)', 'x + u*y - y*(x**2 + y**2)')
+        resultado = AnalizadorBifurcacion2D(sistema).continuar_equilibrios((-1, 1), (-2, 2), (-2, 2))
+        self.assertEqual(len(resultado['hopf']), 1)
+        hopf = resultado['hopf'][0]
+        self.assertAlmostEqual(hopf['parametro'], 0.0, places=6)
+        self.assertAlmostEqual(hopf['frecuencia'], 1.0, places=6)
+        self.assertEqual(resultado['pliegues'], [])
+
+    def test_pliegues_cubica(self):
+        """x' = y, y' = -x³ + x + u - y/2 tiene pliegues en u = ±2/(3√3)"""
+        sistema = crear_sistema('y', '-x**3 + x + u - 0.5*y')
+        resultado = AnalizadorBifurcacion2D(sistema).continuar_equilibrios((-1, 1), (-3, 3), (-3, 3))
+        valores = sorted(p['parametro'] for p in resultado['pliegues'])
+        esperado = 2 / (3 * np.sqrt(3))
+        self.assertEqual(len(valores), 2)
+        self.assertAlmostEqual(valores[0], -esperado, places=6)
+        self.assertAlmostEqual(valores[1], esperado, places=6)
+        # La rama en S se recorre entera a través de los pliegues
+        self.assertEqual(len(resultado['ramas']), 1)
+
+    def test_silla_nodo(self):
+        """x' = u - x², y' = -y: pliegue en u = 0 sobre el origen"""
+        sistema = crear_sistema('u - x**2', '-y', u=1.0)
+        resultado = AnalizadorBifurcacion2D(sistema).continuar_equilibrios((-1, 1), (-2, 2), (-2, 2))
+        self.assertEqual(len(resultado['pliegues']), 1)
+        pliegue = resultado['pliegues'][0]
+        self.assertAlmostEqual(pliegue['parametro'], 0.0, places=6)
+        np.testing.assert_allclose(pliegue['punto'], [0.0, 0.0], atol=1e-4)
+
+    def test_hopf_fitzhugh_nagumo(self):
+        """FitzHugh–Nagumo: Hopf donde 1 - x*² = 0.08·0.8"""
+        sistema = crear_sistema('x - x**3/3 - y + u', '0.08*(x + 0.7 - 0.8*y)', u=0.5)
+        resultado = AnalizadorBifurcacion2D(sistema).continuar_equilibrios((0, 1.5), (-3, 3), (-3, 3))
+        x_hopf = np.sqrt(1 - 0.064)
+        # Sobre la rama: y* = (x* + 0.7)/0.8 y u = y* - x* + x*³/3
+        esperados = sorted((x + 0.7) / 0.8 - x + x**3 / 3 for x in (-x_hopf, x_hopf))
+        valores = sorted(h['parametro'] for h in resultado['hopf'])
+        self.assertEqual(len(valores), 2)
+        np.testing.assert_allclose(valores, esperados, atol=1e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()
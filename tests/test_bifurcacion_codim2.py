@@ -0,0 +1,57 @@
+"""
+Tests para el análisis de bifurcaciones en dos parámetros
+"""
+
+import unittest
+import numpy as np
+from core.bifurcacion_codim2 import AnalizadorBifurcacionCodim2
+
+
+class TestBifurcacionCodim2(unittest.TestCase):
+    """Catástrofe cúspide f = h + r·x - x³: pliegues en r = 3x², h = -2x³"""
+
+    def setUp(self):
+        self.analizador = AnalizadorBifurcacionCodim2('h + r*x - x**3')
+
+    def test_curva_pliegue_exacta(self):
+        """Una sola curva, sobre la parametrización exacta y cerrada en el borde"""
+        resultado = self.analizador.curvas_pliegue((-1, 2), (-1, 1), (-2, 2))
+        self.assertEqual(len(resultado['curvas']), 1)
+        x, r, h = resultado['curvas'][0].T
+        np.testing.assert_allclose(r, 3 * x**2, atol=1e-9)
+        np.testing.assert_allclose(h, -2 * x**3, atol=1e-9)
+        self.assertAlmostEqual(abs(h[0]), 1.0, places=9)
+        self.assertAlmostEqual(abs(h[-1]), 1.0, places=9)
+
+    def test_cuspide(self):
+        """La cúspide está en el origen, donde f_xx cambia de signo"""
+        resultado = self.analizador.curvas_pliegue((-1, 2), (-1, 1), (-2, 2))
+        self.assertEqual(len(resultado['cuspides']), 1)
+        cuspide = resultado['cuspides'][0]
+        for clave in ('x', 'r', 'h'):
+            self.assertAlmostEqual(cuspide[clave], 0.0, places=8)
+
+    def test_mapa_regiones(self):
+        """Tres equilibrios dentro de la cúspide (27h² < 4r³) y uno fuera"""
+        mapa = self.analizador.mapa_regiones((-1, 2), (-1, 1), (-2, 2), resolucion=(60, 50))
+        self.assertEqual(mapa['conteo'].shape, (50, 60))
+        R, H = np.meshgrid(mapa['r'], mapa['h'])
+        discriminante = 4 * R**3 - 27 * H**2
+        lejos = np.abs(discriminante) > 0.2
+        esperado = np.where(discriminante > 0, 3, 1)
+        np.testing.assert_array_equal(mapa['conteo'][lejos], esperado[lejos])
+
+    def test_mapa_por_bloques(self):
+        """El resultado no depende del tamaño de los bloques"""
+        completo = self.analizador.mapa_regiones((-1, 2), (-1, 1), (-2, 2), resolucion=(40, 30))
+        bloques = self.analizador.mapa_regiones((-1, 2), (-1, 1), (-2, 2), resolucion=(40, 30),
+                                                max_elementos=1)
+        np.testing.assert_array_equal(completo['conteo'], bloques['conteo'])
+
+    def test_simbolo_desconocido(self):
+        with self.assertRaises(ValueError):
+            AnalizadorBifurcacionCodim2('h + r*x - k*x**3')
+
+
+if __name__ == '__main__':
+    unittest.main()
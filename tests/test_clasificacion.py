@@ -0,0 +1,117 @@
+"""
+Tests para la clasificación vectorizada de linealizaciones
+"""
+
+import time
+import unittest
+import numpy as np
+from matplotlib.figure import Figure
+from core.sistema import SistemaDinamico2D
+from core.clasificacion import (invariantes, clasificar_invariantes, clasificar_malla, clasificar_matrices,
+                                barrer_elemento, SILLA, NODO_ESTABLE, NODO_INESTABLE, ESPIRAL_ESTABLE,
+                                ESPIRAL_INESTABLE, CENTRO, DEGENERADO, ESTABLE, INESTABLE, NEUTRAL)
+from visualization.clasificacion import graficar_mapa_clasificacion, graficar_mapa_divergencia
+from visualization.plano_traza_determinante import PlanoTrazaDeterminante
+
+
+class TestClasificacionLocal(unittest.TestCase):
+
+    def test_invariantes_y_clases(self):
+        matrices = np.array([[[1, 0], [0, -1]], [[-1, 0], [0, -2]], [[2, 1], [0, 3]],
+                             [[-1, -2], [2, -1]], [[1, -2], [2, 1]], [[0, 1], [-1, 0]],
+                             [[1, 2], [2, 4]]], dtype=float)
+        traza, determinante, discriminante = invariantes(matrices)
+        autovalores = np.linalg.eigvals(matrices)
+        np.testing.assert_allclose(traza, autovalores.sum(axis=1).real)
+        np.testing.assert_allclose(determinante, autovalores.prod(axis=1).real, atol=1e-12)
+        np.testing.assert_allclose(discriminante, traza ** 2 - 4 * determinante, atol=1e-12)
+        clases = clasificar_invariantes(traza, determinante, discriminante)
+        np.testing.assert_array_equal(clases, [SILLA, NODO_ESTABLE, NODO_INESTABLE, ESPIRAL_ESTABLE,
+                                               ESPIRAL_INESTABLE, CENTRO, DEGENERADO])
+
+    def test_malla_duffing(self):
+        """J = [[0, 1], [1 − 3x², −δ]]: silla si |x| < 1/√3, espiral estable fuera"""
+        duffing = SistemaDinamico2D(funcion_personalizada={'f1': 'y', 'f2': 'x - x**3 - 0.5*y',
+                                                           'es_lineal': False})
+        mapa = clasificar_malla(duffing, (-2, 2), (-1, 1), (201, 11))
+        self.assertEqual(mapa['clases'].shape, (11, 201))
+        silla = np.abs(mapa['x']) < 1 / np.sqrt(3) - 1e-9
+        np.testing.assert_array_equal(mapa['clases'][:, silla], SILLA)
+        np.testing.assert_array_equal(mapa['clases'][:, np.abs(mapa['x']) > 0.7], ESPIRAL_ESTABLE)
+        np.testing.assert_allclose(mapa['traza'], -0.5)
+
+    def test_millon_de_celdas(self):
+        pendulo = SistemaDinamico2D(funcion_personalizada={'f1': 'y', 'f2': '-sin(x)', 'es_lineal': False})
+        clasificar_malla(pendulo, (-1, 1), (-1, 1), (4, 4))
+        inicio = time.perf_counter()
+        mapa = clasificar_malla(pendulo, (-4, 4), (-2, 2), (1000, 1000))
+        self.assertLess(time.perf_counter() - inicio, 1.0)
+        # Hamiltoniano: tr J = 0, así que solo hay centros y sillas
+        conteo = np.bincount(mapa['clases'].ravel(), minlength=7)
+        self.assertEqual(conteo[CENTRO] + conteo[SILLA], 10 ** 6)
+
+    def test_mapas(self):
+        mapa = clasificar_malla(SistemaDinamico2D([[1, 2], [-2, -3]]), (-1, 1), (-1, 1), (20, 20))
+        fig = Figure()
+        ax1, ax2 = fig.add_subplot(121), fig.add_subplot(122)
+        graficar_mapa_clasificacion(ax1, mapa)
+        self.assertEqual([t.get_text() for t in ax1.get_legend().get_texts()], ['Nodo estable'])
+        imagen = graficar_mapa_divergencia(ax2, mapa)
+        self.assertEqual(imagen.norm.vcenter, 0.0)
+
+
+class TestClasificacionPorLotes(unittest.TestCase):
+
+    def test_coincide_con_clasificacion_escalar(self):
+        """Mismo tipo y estabilidad que clasificar_punto_equilibrio (matrices con det ≠ 0)"""
+        M = np.random.default_rng(0).integers(-3, 4, size=(400, 2, 2)).astype(float)
+        M = M[np.abs(np.linalg.det(M)) > 0.5]
+        resultado = clasificar_matrices(M)
+
+        def esperada(tipo, estabilidad):
+            if tipo == 'Punto Silla':
+                return SILLA, INESTABLE
+            if tipo == 'Centro':
+                return CENTRO, NEUTRAL
+            estable = estabilidad.startswith('Estable')
+            if tipo.startswith('Espiral'):
+                return (ESPIRAL_ESTABLE, ESTABLE) if estable else (ESPIRAL_INESTABLE, INESTABLE)
+            return (NODO_ESTABLE, ESTABLE) if estable else (NODO_INESTABLE, INESTABLE)
+
+        for k, matriz in enumerate(M):
+            tipo, estabilidad = SistemaDinamico2D(matriz).clasificar_punto_equilibrio()
+            self.assertEqual((resultado['clase'][k], resultado['estabilidad'][k]),
+                             esperada(tipo, estabilidad), msg=f"{matriz.tolist()}: {tipo}, {estabilidad}")
+            np.testing.assert_allclose(np.sort_complex(resultado['autovalores'][k]),
+                                       np.sort_complex(np.linalg.eigvals(matriz)), atol=1e-9)
+
+    def test_barrido_cruza_fronteras(self):
+        """[[s, 1], [-1, 0]]: tr = s, det = 1; espiral hasta |s| = 2 y nodo después"""
+        valores = np.linspace(-3, 3, 61)
+        familia = barrer_elemento([[0, 1], [-1, 0]], 0, 0, valores)
+        self.assertEqual(familia.shape, (61, 2, 2))
+        resultado = clasificar_matrices(familia)
+        np.testing.assert_allclose(resultado['determinante'], 1)
+        clases = resultado['clase']
+        self.assertEqual(clases[30], CENTRO)
+        np.testing.assert_array_equal(clases[valores < -2], NODO_ESTABLE)
+        np.testing.assert_array_equal(clases[(valores > -2) & (valores < 0)], ESPIRAL_ESTABLE)
+        np.testing.assert_array_equal(clases[valores > 2], NODO_INESTABLE)
+        self.assertTrue(resultado['repetidos'][10] and resultado['repetidos'][50])
+
+    def test_plano_reutiliza_artistas(self):
+        ax = Figure().add_subplot(111)
+        plano = PlanoTrazaDeterminante(ax)
+        n_artistas = len(ax.lines) + len(ax.collections)
+        for desplazamiento in (0.0, 5.0):
+            resultado = clasificar_matrices(barrer_elemento([[0, 1], [-1, 0]], 1, 1,
+                                                            np.linspace(-3, 3, 11) + desplazamiento))
+            plano.actualizar(resultado, indice_actual=5, ajustar_vista=True)
+        self.assertEqual(len(ax.lines) + len(ax.collections), n_artistas)
+        self.assertEqual(len(plano.puntos.get_offsets()), 11)
+        self.assertGreaterEqual(ax.get_xlim()[1], 8)
+        self.assertIn('Nodo inestable', ax.get_title())
+
+
+if __name__ == '__main__':
+    unittest.main()
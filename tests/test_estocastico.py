@@ -0,0 +1,81 @@
+"""
+Tests para conjuntos de trayectorias estocásticas
+"""
+
+import unittest
+import numpy as np
+from matplotlib.figure import Figure
+from core.sistema import SistemaDinamico2D
+from core.lotka_volterra import SistemaLotkaVolterra
+from core.estocastico import IntegradorEstocastico, crear_integrador_estocastico
+from visualization.estocastico import graficar_conjunto_estocastico
+
+
+class TestIntegradorEstocastico(unittest.TestCase):
+
+    def test_ornstein_uhlenbeck_estacionario(self):
+        """dx = −k·x dt + σ dW tiende a varianza σ²/(2k)"""
+        sistema = SistemaDinamico2D([[-1, 0], [0, -2]])
+        integrador = IntegradorEstocastico.para_sistema(sistema, 0.5, semilla=1)
+        instantes = list(integrador.histogramas(np.zeros((10000, 2)), 8, 0.01, (-2, 2), (-2, 2), cada=100))
+        self.assertEqual(len(instantes), 9)
+        t, histograma, resumen = instantes[-1]
+        self.assertAlmostEqual(t, 8.0)
+        self.assertEqual(histograma.total + histograma.descartados, 10000)
+        np.testing.assert_allclose(resumen['desviacion'], [0.5 / np.sqrt(2), 0.25], rtol=0.05)
+        np.testing.assert_allclose(resumen['media'], 0, atol=0.02)
+
+    def test_reproducible_con_semilla(self):
+        campo = lambda X, t: -X
+        finales = []
+        for _ in range(2):
+            integrador = IntegradorEstocastico(campo, 0.3, semilla=7)
+            for _, X in integrador.iterar(np.ones((50, 2)), 1.0, 0.01, cada=100):
+                pass
+            finales.append(X.copy())
+        np.testing.assert_array_equal(*finales)
+
+    def test_milstein_converge_mejor(self):
+        """Con ruido multiplicativo Milstein se acerca más a la solución exacta del MBG"""
+        mu, sigma, dt, n_pasos, N = 0.5, 0.8, 0.01, 100, 4000
+        generador = np.random.default_rng(3)
+        W = sum(generador.standard_normal((N, 2)) * np.sqrt(dt) for _ in range(n_pasos))
+        exacta = np.exp((mu - sigma ** 2 / 2) * n_pasos * dt + sigma * W)
+
+        errores = {}
+        for metodo in ('euler_maruyama', 'milstein'):
+            integrador = IntegradorEstocastico(lambda X, t: mu * X, sigma, ruido='multiplicativo',
+                                               metodo=metodo, semilla=3)
+            for _, X in integrador.iterar(np.ones((N, 2)), n_pasos * dt, dt, cada=n_pasos):
+                pass
+            errores[metodo] = np.abs(X - exacta).mean()
+        self.assertLess(errores['milstein'], errores['euler_maruyama'] / 4)
+
+    def test_lotka_volterra_y_errores(self):
+        modelo = SistemaLotkaVolterra()
+        integrador = crear_integrador_estocastico(modelo, 0.05, semilla=0)
+        self.assertEqual(integrador.ruido, 'multiplicativo')
+        ocupacion = integrador.ocupacion(np.tile([7.5, 10.0], (500, 1)), 10, 0.005,
+                                         (0, 20), (0, 30), resolucion=(50, 50), cada=20, t_transitorio=2)
+        self.assertEqual(ocupacion.total + ocupacion.descartados, 500 * 81)
+        self.assertGreater(ocupacion.total, 0.99 * 500 * 81)
+
+        with self.assertRaises(ValueError):
+            IntegradorEstocastico(lambda X, t: X, 0.1, ruido='coloreado')
+        with self.assertRaises(ValueError):
+            IntegradorEstocastico(lambda X, t: X, -0.1)
+
+    def test_graficar_reutiliza_artistas(self):
+        integrador = IntegradorEstocastico(lambda X, t: -X, 0.2, semilla=0)
+        ax = Figure().add_subplot(111)
+        artistas = None
+        for t, histograma, resumen in integrador.histogramas(np.zeros((200, 2)), 0.5, 0.01,
+                                                             (-1, 1), (-1, 1), (20, 20), cada=25):
+            artistas = graficar_conjunto_estocastico(ax, histograma, artistas, t, resumen)
+        self.assertEqual(len(ax.images), 1)
+        self.assertEqual(len(ax.lines), 1)
+        self.assertIn('t = 0.5', ax.get_title())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Tests para el análisis de Floquet de sistemas lineales forzados
+"""
+
+import unittest
+import numpy as np
+from scipy.linalg import expm
+from core.sistema import SistemaDinamico2D
+from core.floquet import AnalizadorFloquet, analizar_floquet_lote, exponencial_2x2
+from core.poincare import MapaPoincare
+
+
+class TestFloquet(unittest.TestCase):
+
+    def test_exponencial_cerrada(self):
+        """e^{At} coincide con expm en focos, nodos y el caso degenerado"""
+        matrices = np.array([[[-0.5, 1.0], [-1.0, -0.5]],
+                             [[1.0, 2.0], [0.5, -1.0]],
+                             [[1.0, 1.0], [0.0, 1.0]],
+                             [[0.0, 1.0], [-4.0, 0.0]]])
+        t = np.array([1.0, 0.7, 2.0, 3.0])
+        esperado = np.array([expm(A * ti) for A, ti in zip(matrices, t)])
+        np.testing.assert_allclose(exponencial_2x2(matrices, t), esperado, rtol=1e-10, atol=1e-12)
+
+    def test_punto_fijo_coincide_con_poincare(self):
+        """El punto fijo analítico es el límite del mapa estroboscópico integrado"""
+        sistema = SistemaDinamico2D(matriz=np.array([[-0.3, 2.0], [-2.0, -0.3]]), termino_forzado={
+            'tipo': 'coseno', 'coef1': 1.0, 'coef2': 0.5, 'param': 1.5})
+        floquet = AnalizadorFloquet(sistema)
+        puntos = MapaPoincare(sistema, pasos_por_periodo=256).calcular([[2.0, -1.0]], 60)['puntos']
+        np.testing.assert_allclose(puntos[-1, 0], floquet.punto_fijo, atol=1e-6)
+        self.assertEqual(floquet.estabilidad(), 'estable')
+
+    def test_solucion_periodica(self):
+        """x_p satisface x' = Ax + b·sin(ωt) y es T-periódica"""
+        A = np.array([[0.2, 1.0], [-3.0, 0.1]])
+        sistema = SistemaDinamico2D(matriz=A, termino_forzado={
+            'tipo': 'seno', 'coef1': 0.0, 'coef2': 1.0, 'param': 0.8})
+        floquet = AnalizadorFloquet(sistema)
+        t = np.linspace(0, 5, 7)
+        h = 1e-6
+        derivada = (floquet.estado_periodico(t + h) - floquet.estado_periodico(t - h)) / (2 * h)
+        esperado = floquet.estado_periodico(t) @ A.T + np.outer(np.sin(0.8 * t), [0.0, 1.0])
+        np.testing.assert_allclose(derivada, esperado, atol=1e-6)
+        np.testing.assert_allclose(floquet.estado_periodico(t + floquet.periodo),
+                                   floquet.estado_periodico(t), atol=1e-12)
+        self.assertEqual(floquet.estabilidad(), 'inestable')
+
+    def test_lote_y_resonancia(self):
+        """El lote reproduce los casos individuales y marca la resonancia exacta"""
+        A = np.array([[0.0, 1.0], [-4.0, 0.0]])
+        resultado = analizar_floquet_lote(np.array([A, A]), np.array([[0, 1.0], [0, 1.0]]),
+                                          np.array([2.0, 1.0]))
+        self.assertTrue(np.all(np.isnan(resultado['amplitud'][0])))
+        np.testing.assert_allclose(resultado['radio_espectral'], 1.0)
+        np.testing.assert_allclose(resultado['punto_fijo'][1], [0.0, 1.0 / 3.0], atol=1e-12)
+
+    def test_requiere_forzado_periodico(self):
+        with self.assertRaises(ValueError):
+            AnalizadorFloquet(SistemaDinamico2D(matriz=np.eye(2)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+Tests para la ecuación de Fokker–Planck por volúmenes finitos
+"""
+
+import unittest
+import numpy as np
+from matplotlib.figure import Figure
+from core.sistema import SistemaDinamico2D
+from core.fokker_planck import FokkerPlanck2D
+from visualization.fokker_planck import graficar_densidad
+
+
+class TestFokkerPlanck(unittest.TestCase):
+
+    def setUp(self):
+        # Ornstein–Uhlenbeck: estacionaria gaussiana con varianza σ²/(2k)
+        self.ou = FokkerPlanck2D(SistemaDinamico2D([[-1, 0], [0, -2]]), 0.5, (-2, 2), (-2, 2), (80, 80))
+
+    def test_operador_conserva_masa(self):
+        """Las columnas de L suman cero (sin flujo por el borde)"""
+        np.testing.assert_allclose(np.asarray(self.ou.L.sum(axis=0)).ravel(), 0, atol=1e-9)
+        self.assertLessEqual(self.ou.L.nnz, 5 * 80 * 80)
+
+    def test_estacionaria_ornstein_uhlenbeck(self):
+        P = self.ou.estacionaria()
+        momentos = self.ou.momentos(P)
+        self.assertAlmostEqual(momentos['masa'], 1.0)
+        np.testing.assert_allclose(momentos['media'], 0, atol=1e-10)
+        np.testing.assert_allclose(momentos['desviacion'], [0.5 / np.sqrt(2), 0.25], rtol=5e-3)
+
+    def test_evolucion_converge_a_estacionaria(self):
+        P0 = self.ou.gaussiana((1.0, -0.5), 0.2)
+        instantes = list(self.ou.evolucionar(P0, 10, 0.05, cada=50))
+        self.assertEqual([t for t, _ in instantes], [0.0, 2.5, 5.0, 7.5, 10.0])
+        for _, P in instantes:
+            self.assertAlmostEqual(self.ou.momentos(P)['masa'], 1.0, places=9)
+            self.assertGreaterEqual(P.min(), 0)
+        # La media decae como e^{−t}, e^{−2t}
+        np.testing.assert_allclose(self.ou.momentos(instantes[1][1])['media'],
+                                   [np.exp(-2.5), -0.5 * np.exp(-5)], atol=0.01)
+        np.testing.assert_allclose(instantes[-1][1], self.ou.estacionaria(), atol=1e-3)
+
+    def test_doble_pozo_bimodal(self):
+        """Oscilador de Duffing amortiguado con ruido: masa en los dos pozos x = ±1"""
+        duffing = SistemaDinamico2D(funcion_personalizada={'f1': 'y', 'f2': 'x - x**3 - 0.5*y',
+                                                           'es_lineal': False})
+        modelo = FokkerPlanck2D(duffing, (0.0, 0.6), (-2.5, 2.5), (-2.5, 2.5), (60, 60))
+        P = modelo.estacionaria()
+        marginal = P.sum(axis=0)
+        pozos = modelo.x[np.argsort(marginal)[-2:]]
+        np.testing.assert_allclose(sorted(np.abs(pozos)), [1, 1], atol=0.1)
+        # Exacta: p(0)/p(±1) = exp(−(2γ/σ²)·ΔV) = exp(−0.25/0.36) ≈ 0.5
+        self.assertLess(marginal[np.argmin(np.abs(modelo.x))], 0.7 * marginal.max())
+
+        with self.assertRaises(ValueError):
+            FokkerPlanck2D(duffing, 0.1, (1, -1), (-1, 1))
+        with self.assertRaises(ValueError):
+            list(modelo.evolucionar(P, 1, 0.1, theta=0.2))
+
+    def test_graficar_reutiliza_imagen(self):
+        ax = Figure().add_subplot(111)
+        imagen = None
+        for t, P in self.ou.evolucionar(self.ou.gaussiana((0, 0), 0.3), 0.2, 0.1):
+            imagen = graficar_densidad(ax, self.ou, P, imagen, t=t)
+        self.assertEqual(len(ax.images), 1)
+        self.assertIn('t = 0.2', ax.get_title())
+
+
+if __name__ == '__main__':
+    unittest.main()
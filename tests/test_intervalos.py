@@ -0,0 +1,81 @@
+"""
+Tests para aritmética de intervalos y equilibrios certificados
+"""
+
+import unittest
+import numpy as np
+import sympy as sp
+from core.intervalos import Intervalo, evaluar_intervalo
+from core.sistema import SistemaDinamico2D
+
+
+class TestIntervalo(unittest.TestCase):
+    """Tests para la aritmética de intervalos"""
+
+    def test_inclusion_del_rango(self):
+        """El intervalo evaluado contiene los valores puntuales"""
+        x = sp.Symbol('x', real=True)
+        expr = sp.sin(x) * x ** 2 - sp.exp(-x) / (2 + x ** 2)
+        lo, hi = np.array([-2.0, 0.5]), np.array([1.5, 4.0])
+        resultado = evaluar_intervalo(expr, {x: Intervalo(lo, hi)})
+
+        f = sp.lambdify(x, expr, 'numpy')
+        for k in range(2):
+            valores = f(np.linspace(lo[k], hi[k], 2001))
+            self.assertLessEqual(resultado.lo[k], valores.min())
+            self.assertGreaterEqual(resultado.hi[k], valores.max())
+
+    def test_potencia_par_no_negativa(self):
+        """X**2 sobre un intervalo que contiene al 0 empieza en 0"""
+        cuadrado = Intervalo(-1.0, 2.0).potencia_entera(2)
+        self.assertEqual(cuadrado.lo, 0.0)
+        self.assertGreaterEqual(cuadrado.hi, 4.0)
+
+
+class TestEquilibriosCertificados(unittest.TestCase):
+    """Tests para la búsqueda por ramificación y poda"""
+
+    def test_pendulo_amortiguado_completo(self):
+        """Encuentra todos los k·π de una caja ancha"""
+        sistema = SistemaDinamico2D(funcion_personalizada={
+            'f1': 'y', 'f2': '-sin(x) - 0.1*y', 'es_lineal': False})
+        resultado = sistema.encontrar_equilibrios_certificados((-20, 20), (-5, 5))
+        self.assertTrue(resultado['completo'])
+
+        xs = sorted(e['punto'][0] for e in resultado['equilibrios'])
+        np.testing.assert_allclose(xs, np.pi * np.arange(-6, 7), atol=1e-8)
+        for eq in resultado['equilibrios']:
+            self.assertTrue(eq['unico'])
+            (x0, x1), (y0, y1) = eq['caja']
+            self.assertTrue(x0 <= eq['punto'][0] <= x1 and y0 <= eq['punto'][1] <= y1)
+
+    def test_parametros_y_equilibrios_en_aristas(self):
+        """Raíces con coordenadas enteras y parámetros sustituidos"""
+        sistema = SistemaDinamico2D(
+            funcion_personalizada={'f1': 'x*(3 - x - 2*y)', 'f2': 'y*(u - x - y)', 'es_lineal': False},
+            parametros={'u': 2})
+        resultado = sistema.encontrar_equilibrios_certificados()
+        puntos = sorted((round(e['punto'][0], 6), round(e['punto'][1], 6))
+                        for e in resultado['equilibrios'])
+        self.assertEqual(puntos, [(0, 0), (0, 2), (1, 1), (3, 0)])
+        self.assertTrue(all(e['unico'] for e in resultado['equilibrios']))
+
+    def test_raiz_doble_no_es_unica(self):
+        """Una raíz degenerada se reporta sin certificado de unicidad"""
+        sistema = SistemaDinamico2D(funcion_personalizada={
+            'f1': 'x**2', 'f2': 'y', 'es_lineal': False})
+        resultado = sistema.encontrar_equilibrios_certificados((-1, 1), (-1, 1))
+        self.assertEqual(len(resultado['equilibrios']), 1)
+        self.assertFalse(resultado['equilibrios'][0]['unico'])
+
+    def test_sistema_lineal_forzado(self):
+        """El término constante desplaza el equilibrio a -A⁻¹c"""
+        sistema = SistemaDinamico2D([[1, 2], [3, 4]],
+                                    {'tipo': 'constante', 'coef1': 1, 'coef2': 1, 'param': 1})
+        resultado = sistema.encontrar_equilibrios_certificados()
+        self.assertEqual(len(resultado['equilibrios']), 1)
+        np.testing.assert_allclose(resultado['equilibrios'][0]['punto'], (1, -1), atol=1e-10)
+
+
+if __name__ == '__main__':
+    unittest.main()
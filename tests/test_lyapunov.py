@@ -0,0 +1,100 @@
+"""
+Tests para el estimador del mayor exponente de Lyapunov
+"""
+
+import tkinter as tk
+import unittest
+from unittest import mock
+import numpy as np
+from core.sistema import SistemaDinamico2D
+from core.lyapunov import EstimadorLyapunov
+from core.integradores import integrar_rk4
+
+
+class TestIntegradores(unittest.TestCase):
+
+    def test_rk4_orden_cuatro(self):
+        """x' = -x: el error final escala como dt⁴"""
+        errores = []
+        for dt in (0.1, 0.05):
+            _, x = integrar_rk4(lambda t, x: -x, 0.0, np.array([[1.0]]), dt, int(round(2 / dt)))
+            errores.append(abs(x[0, 0] - np.exp(-2)))
+        self.assertAlmostEqual(errores[0] / errores[1], 16, delta=1.5)
+
+
+class TestEstimadorLyapunov(unittest.TestCase):
+
+    def test_sistema_lineal(self):
+        """En un sistema lineal λ es la mayor parte real de los autovalores"""
+        sistema = SistemaDinamico2D(matriz=np.array([[0.3, 1.0], [-1.0, 0.3]]))
+        resultado = EstimadorLyapunov(sistema).estimar([[1, 0], [0, 2]], t_total=40, t_transitorio=1)
+        np.testing.assert_allclose(resultado['exponentes'], 0.3, atol=1e-6)
+        self.assertTrue(np.all(resultado['convergido']))
+
+    def test_forzado_lineal(self):
+        """El forzado no cambia la dinámica tangente"""
+        sistema = SistemaDinamico2D(matriz=np.array([[-0.5, 0.0], [0.0, -2.0]]),
+                                    termino_forzado={'tipo': 'seno', 'coef1': 1, 'coef2': 1, 'param': 2})
+        resultado = EstimadorLyapunov(sistema).estimar([[1, 1]], t_total=40, t_transitorio=1)
+        self.assertAlmostEqual(resultado['exponentes'][0], -0.5, delta=0.02)
+
+    def test_ciclo_limite(self):
+        """Sobre un ciclo límite estable λ = 0"""
+        sistema = SistemaDinamico2D(
+            funcion_personalizada={'f1': 'x - y - x*(x**2 + y**2)',
+                                   'f2': 'x + y - y*(x**2 + y**2)', 'es_lineal': False})
+        resultado = EstimadorLyapunov(sistema, dt=0.02).estimar([[0.5, 0], [0, 2]], t_total=200)
+        np.testing.assert_allclose(resultado['exponentes'], 0.0, atol=0.02)
+
+    def test_mapa_coincide_con_estimaciones_individuales(self):
+        """La malla de parámetros se integra en lote con el mismo resultado"""
+        sistema = SistemaDinamico2D(
+            funcion_personalizada={'f1': 'u*x - y', 'f2': 'x + u*y', 'es_lineal': False},
+            parametros={'u': 0.0})
+        estimador = EstimadorLyapunov(sistema)
+        valores = np.array([-0.5, 0.0, 0.25])
+        mapa = estimador.mapa((1.0, 0.0), 'u', valores, t_total=20, t_transitorio=0)
+        np.testing.assert_allclose(mapa['exponentes'], valores, atol=1e-6)
+
+    def test_mapa_dos_parametros(self):
+        sistema = SistemaDinamico2D(
+            funcion_personalizada={'f1': 'a*x', 'f2': 'b*y', 'es_lineal': False},
+            parametros={'a': 0.0, 'b': 0.0})
+        mapa = EstimadorLyapunov(sistema).mapa((1.0, 1.0), 'a', [-1.0, 0.5], 'b', [-0.5, 0.0, 1.0],
+                                               t_total=200, t_transitorio=0)
+        self.assertEqual(mapa['exponentes'].shape, (3, 2))
+        # El sesgo de tiempo finito es log|w₀ proyectado| / T
+        esperado = np.maximum.outer([-0.5, 0.0, 1.0], [-1.0, 0.5])
+        np.testing.assert_allclose(mapa['exponentes'], esperado, atol=0.02)
+
+
+
+class TestVentanaLyapunov(unittest.TestCase):
+
+    def setUp(self):
+        try:
+            self.root = tk.Tk()
+        except tk.TclError:
+            self.skipTest("Sin pantalla para Tk")
+        self.root.withdraw()
+
+    def tearDown(self):
+        self.root.destroy()
+
+    def test_tabla_de_rangos_con_parametros(self):
+        from gui.lyapunov import VentanaLyapunov
+        sistema = SistemaDinamico2D(
+            funcion_personalizada={'f1': 'a*x', 'f2': 'b*y', 'es_lineal': False},
+            parametros={'a': 2.0, 'b': -1.0})
+        with mock.patch.object(VentanaLyapunov, '_calcular_conjunto'):
+            ventana = VentanaLyapunov(self.root, sistema, [[1.0, 1.0]])
+        self.assertEqual(set(ventana.rangos), {'x', 'y'})
+        np.testing.assert_allclose(ventana._leer_malla('x'), np.linspace(1.0, 3.0, 40))
+        ventana.param_y_var.set('b')
+        ventana._sugerir_rangos()
+        np.testing.assert_allclose(ventana._leer_malla('y'), np.linspace(-1.5, -0.5, 20))
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Tests para mapas discretos y el histograma de densidad
+"""
+
+import unittest
+import numpy as np
+from core.mapas import AnalizadorMapa
+from core.densidad import HistogramaDensidad
+
+
+class TestHistogramaDensidad(unittest.TestCase):
+
+    def test_coincide_con_histogram2d(self):
+        rng = np.random.default_rng(0)
+        xs, ys = rng.normal(size=(2, 10000))
+        histograma = HistogramaDensidad((-2, 2), (-3, 3), (40, 30))
+        histograma.agregar(xs[:5000], ys[:5000])
+        histograma.agregar(xs[5000:], ys[5000:])
+        esperado, _, _ = np.histogram2d(ys, xs, bins=(30, 40), range=((-3, 3), (-2, 2)))
+        np.testing.assert_array_equal(histograma.conteos, esperado)
+        self.assertEqual(histograma.total + histograma.descartados, 10000)
+
+    def test_descarta_no_finitos(self):
+        histograma = HistogramaDensidad((0, 1), (0, 1), (10, 10))
+        histograma.agregar([0.5, np.nan, np.inf, 2.0], [0.5, 0.5, 0.5, 0.5])
+        self.assertEqual(histograma.total, 1)
+        self.assertEqual(histograma.descartados, 3)
+
+
+class TestAnalizadorMapa(unittest.TestCase):
+
+    def setUp(self):
+        self.logistico = AnalizadorMapa('r*x*(1 - x)')
+
+    def test_punto_fijo_y_periodo_dos(self):
+        """r = 2.8: punto fijo 1 - 1/r; r = 3.2: ciclo de período 2"""
+        orbita = self.logistico.iterar(0.3, np.array([2.8, 3.2]), 2000)
+        self.assertAlmostEqual(orbita[-1, 0], 1 - 1 / 2.8, places=10)
+        ciclo = np.unique(np.round(orbita[-10:, 1], 8))
+        self.assertEqual(len(ciclo), 2)
+        # Los puntos del 2-ciclo son raíces de r²x² - r(r+1)x + (r+1) = 0
+        r = 3.2
+        np.testing.assert_allclose(ciclo, np.sort(np.roots([r**2, -r * (r + 1), r + 1])), atol=1e-8)
+
+    def test_diagrama_orbitas(self):
+        """Una columna por r y todos los puntos acumulados"""
+        resultado = self.logistico.diagrama_orbitas((2.8, 4.0), n_r=300, n_transitorio=500,
+                                                    n_iteraciones=400, resolucion_x=200)
+        histograma = resultado['histograma']
+        self.assertEqual(histograma.conteos.shape, (200, 300))
+        self.assertEqual(histograma.total + histograma.descartados, 300 * 400)
+        # Antes de la primera duplicación cada columna es un único píxel
+        self.assertEqual(np.count_nonzero(histograma.conteos[:, 0]), 1)
+        self.assertFalse(np.any(resultado['divergentes']))
+
+    def test_divergencia(self):
+        mapa = AnalizadorMapa('r*x - x**3')
+        resultado = mapa.diagrama_orbitas((1.0, 4.0), x_range=(-3, 3), n_r=31, x0=0.1,
+                                          n_transitorio=200, n_iteraciones=50)
+        divergentes = resultado['divergentes']
+        self.assertFalse(np.any(divergentes[resultado['r'] < 2.5]))
+        self.assertTrue(np.all(divergentes[resultado['r'] > 3.5]))
+
+    def test_cobweb(self):
+        xs, ys = self.logistico.cobweb(2.5, 0.2, 3)
+        x1 = 2.5 * 0.2 * 0.8
+        self.assertEqual(len(xs), 7)
+        np.testing.assert_allclose(xs[:4], [0.2, 0.2, x1, x1])
+        np.testing.assert_allclose(ys[:4], [0.0, x1, x1, 2.5 * x1 * (1 - x1)])
+
+    def test_simbolo_desconocido(self):
+        with self.assertRaises(ValueError):
+            AnalizadorMapa('a*x*(1 - x)')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+Tests para la continuación de órbitas periódicas
+"""
+
+import unittest
+import numpy as np
+from core.sistema import SistemaDinamico2D
+from core.orbitas_periodicas import ContinuacionOrbitas
+
+
+class TestContinuacionOrbitas(unittest.TestCase):
+    """Tests sobre la forma normal de Hopf (ciclo de radio √u y período 2π)"""
+
+    def setUp(self):
+        self.sistema = SistemaDinamico2D(
+            funcion_personalizada={'f1': 'u*x - y - x*(x**2 + y**2)',
+                                   'f2': 'x + u*y - y*(x**2 + y**2)', 'es_lineal': False},
+            parametros={'u': 1.0})
+        self.continuacion = ContinuacionOrbitas(self.sistema)
+
+    def test_rama_coincide_con_solucion_exacta(self):
+        """Período, amplitud y multiplicador de Floquet a lo largo de la rama"""
+        resultado = self.continuacion.continuar(1.0, 0.25, semilla=(0.5, 0.0))
+        self.assertEqual(resultado['motivo_fin'], 'completado')
+        self.assertAlmostEqual(resultado['rama'][-1]['parametro'], 0.25)
+
+        for orbita in resultado['rama']:
+            u = orbita['parametro']
+            self.assertAlmostEqual(orbita['periodo'], 2 * np.pi, places=6)
+            self.assertAlmostEqual(orbita['amplitud'][0], np.sqrt(u), places=4)
+            self.assertAlmostEqual(abs(orbita['multiplicadores'][0]), 1.0, places=6)
+            self.assertAlmostEqual(abs(orbita['multiplicadores'][1]),
+                                   np.exp(-4 * np.pi * u), delta=1e-6)
+            self.assertTrue(orbita['estable'])
+
+    def test_arranque_en_caliente(self):
+        """Los pasos de continuación convergen en pocas iteraciones de Newton"""
+        resultado = self.continuacion.continuar(1.0, 0.5, semilla=(0.5, 0.0))
+        iteraciones = [o['iteraciones'] for o in resultado['rama'][1:]]
+        self.assertLessEqual(max(iteraciones), 4)
+
+    def test_detecta_colapso_en_hopf(self):
+        """La rama termina al encogerse hasta el punto de Hopf u = 0"""
+        resultado = self.continuacion.continuar(0.5, -0.5, semilla=(0.5, 0.0))
+        self.assertEqual(resultado['motivo_fin'], 'colapso')
+        self.assertLess(resultado['rama'][-1]['parametro'], 0.01)
+
+    def test_requiere_sistema_autonomo(self):
+        """Un sistema con t explícito se rechaza"""
+        forzado = SistemaDinamico2D(
+            funcion_personalizada={'f1': 'y', 'f2': '-x + u*sin(t)', 'es_lineal': False},
+            parametros={'u': 1.0})
+        with self.assertRaises(ValueError):
+            ContinuacionOrbitas(forzado)
+
+
+if __name__ == '__main__':
+    unittest.main()
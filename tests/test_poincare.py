@@ -0,0 +1,56 @@
+"""
+Tests para el mapa de Poincaré estroboscópico
+"""
+
+import unittest
+import numpy as np
+from core.sistema import SistemaDinamico2D
+from core.poincare import MapaPoincare
+
+
+class TestMapaPoincare(unittest.TestCase):
+
+    def setUp(self):
+        self.A = np.array([[-0.5, 1.0], [-1.0, -0.5]])
+        self.b = np.array([0.0, 1.0])
+        self.omega = 2.0
+        self.sistema = SistemaDinamico2D(matriz=self.A, termino_forzado={
+            'tipo': 'seno', 'coef1': self.b[0], 'coef2': self.b[1], 'param': self.omega})
+
+    def test_periodo_del_forzado(self):
+        """Con forzado seno/coseno el período es 2π/ω"""
+        self.assertAlmostEqual(MapaPoincare(self.sistema).periodo, np.pi)
+        with self.assertRaises(ValueError):
+            MapaPoincare(SistemaDinamico2D(matriz=self.A))
+
+    def test_punto_fijo_lineal(self):
+        """Todas las semillas convergen a la solución periódica Im[(iωI - A)⁻¹ b]"""
+        esperado = np.linalg.solve(1j * self.omega * np.eye(2) - self.A, self.b).imag
+        resultado = MapaPoincare(self.sistema).calcular([[1, 1], [-2, 0], [3, -3]], 40)
+        self.assertEqual(resultado['puntos'].shape, (40, 3, 2))
+        np.testing.assert_allclose(resultado['puntos'][-1], np.tile(esperado, (3, 1)), atol=1e-6)
+        self.assertFalse(np.any(resultado['divergentes']))
+
+    def test_bloques_equivalen_a_calcular(self):
+        """La densidad acumula exactamente las mismas muestras que calcular"""
+        mapa = MapaPoincare(self.sistema, pasos_por_periodo=32)
+        semillas = [[0.5, 0.5], [-0.5, 0.2]]
+        puntos = mapa.calcular(semillas, 30, n_transitorio=2)['puntos']
+        histograma = mapa.densidad(semillas, 30, (-3, 3), (-3, 3), (50, 50), n_transitorio=2)
+        self.assertEqual(histograma.total + histograma.descartados, puntos.shape[0] * puntos.shape[1])
+        self.assertEqual(histograma.descartados, int(np.count_nonzero(np.any(np.abs(puntos) >= 3, axis=2))))
+
+    def test_duffing_forzado(self):
+        """El Duffing forzado con período explícito llena un atractor extendido"""
+        sistema = SistemaDinamico2D(funcion_personalizada={
+            'f1': 'y', 'f2': 'x - x**3 - 0.25*y + 0.3*cos(t)', 'es_lineal': False}, parametros={})
+        mapa = MapaPoincare(sistema, periodo=2 * np.pi)
+        puntos = mapa.calcular([[0.1, 0.1], [1.0, 0.0]], 300, n_transitorio=20)['puntos']
+        self.assertTrue(np.all(np.isfinite(puntos)))
+        # Una órbita periódica repetiría unos pocos puntos; el atractor caótico no
+        distintos = np.unique(np.round(puntos[:, 0], 3), axis=0)
+        self.assertGreater(len(distintos), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+Tests para el barrido de respuesta en frecuencia
+"""
+
+import unittest
+import numpy as np
+from core.respuesta_frecuencia import barrido_frecuencias, picos_resonancia
+
+
+class TestRespuestaFrecuencia(unittest.TestCase):
+
+    def setUp(self):
+        # Oscilador amortiguado x'' + 2ζω₀x' + ω₀²x = sin(ωt)
+        self.w0, self.zeta = 2.0, 0.05
+        self.A = np.array([[0.0, 1.0], [-self.w0 ** 2, -2 * self.zeta * self.w0]])
+        self.b = np.array([0.0, 1.0])
+
+    def test_coincide_con_solve(self):
+        """La inversa 2×2 explícita coincide con np.linalg.solve en cada ω"""
+        omegas = np.logspace(-1, 1, 50)
+        resultado = barrido_frecuencias(self.A, self.b, omegas)
+        esperado = np.array([np.linalg.solve(1j * w * np.eye(2) - self.A, self.b) for w in omegas])
+        np.testing.assert_allclose(resultado['respuesta'], esperado, rtol=1e-12)
+        self.assertEqual(resultado['amplitud'].shape, (50, 2))
+
+    def test_amplitud_y_fase_analiticas(self):
+        """|x| = 1/√((ω₀² − ω²)² + (2ζω₀ω)²) y la fase baja de 0° a −180°"""
+        omegas = np.logspace(-2, 2, 3000)
+        resultado = barrido_frecuencias(self.A, self.b, omegas)
+        esperado = 1 / np.sqrt((self.w0 ** 2 - omegas ** 2) ** 2 + (2 * self.zeta * self.w0 * omegas) ** 2)
+        np.testing.assert_allclose(resultado['amplitud'][:, 0], esperado, rtol=1e-10)
+        fase = -np.degrees(np.arctan2(2 * self.zeta * self.w0 * omegas, self.w0 ** 2 - omegas ** 2))
+        np.testing.assert_allclose(resultado['fase'][:, 0], fase, atol=1e-8)
+
+    def test_pico_de_resonancia(self):
+        """El pico de x está en ω₀√(1 − 2ζ²) aunque la malla sea gruesa"""
+        omegas = np.logspace(-1, 1, 400)
+        resultado = barrido_frecuencias(self.A, self.b, omegas)
+        picos = [p for p in picos_resonancia(omegas, resultado['amplitud']) if p['componente'] == 0]
+        self.assertEqual(len(picos), 1)
+        self.assertAlmostEqual(picos[0]['omega'], self.w0 * np.sqrt(1 - 2 * self.zeta ** 2), delta=2e-3)
+        pico_teorico = 1 / (2 * self.zeta * self.w0 ** 2 * np.sqrt(1 - self.zeta ** 2))
+        self.assertAlmostEqual(picos[0]['amplitud'], pico_teorico, delta=0.02 * pico_teorico)
+
+    def test_sin_resonancia_sobreamortiguado(self):
+        A = np.array([[0.0, 1.0], [-1.0, -3.0]])
+        omegas = np.logspace(-2, 2, 500)
+        resultado = barrido_frecuencias(A, self.b, omegas)
+        self.assertEqual([p for p in picos_resonancia(omegas, resultado['amplitud'])
+                          if p['componente'] == 0], [])
+
+    def test_frecuencias_invalidas(self):
+        with self.assertRaises(ValueError):
+            barrido_frecuencias(self.A, self.b, np.array([0.0, 1.0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
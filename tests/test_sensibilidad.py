@@ -0,0 +1,68 @@
+"""
+Tests para la integración de sensibilidades
+"""
+
+import unittest
+import numpy as np
+from scipy.integrate import odeint
+from scipy.linalg import expm
+from core.sistema import SistemaDinamico2D
+from core.lotka_volterra import SistemaLotkaVolterra
+from core.sensibilidad import IntegradorSensibilidad
+
+
+class TestSensibilidad(unittest.TestCase):
+
+    def test_lineal_matriz(self):
+        """∂x/∂x0 = e^{At} y ∂x/∂a11 coincide con diferencias finitas"""
+        A = np.array([[-0.2, 1.0], [-1.0, -0.3]])
+        sistema = SistemaDinamico2D(matriz=A)
+        tiempos = np.linspace(0, 3, 31)
+        x0 = np.array([1.0, 0.5])
+        resultado = IntegradorSensibilidad(sistema, parametros=['a11']).integrar(x0, tiempos)
+
+        np.testing.assert_allclose(resultado['sensibilidad_x0'][-1], expm(A * 3), atol=1e-8)
+        h = 1e-6
+        Ah = A.copy()
+        Ah[0, 0] += h
+        diferencia = (expm(Ah * 3) @ x0 - expm(A * 3) @ x0) / h
+        np.testing.assert_allclose(resultado['sensibilidad_parametros'][-1, :, 0], diferencia, atol=1e-5)
+
+    def test_parametro_simbolico(self):
+        """x' = u·x, y' = -y: ∂x/∂u = t·x0·e^{ut}"""
+        sistema = SistemaDinamico2D(funcion_personalizada={'f1': 'u*x', 'f2': '-y', 'es_lineal': False},
+                                    parametros={'u': 0.4})
+        tiempos = np.linspace(0, 2, 5)
+        resultado = IntegradorSensibilidad(sistema).integrar([2.0, 1.0], tiempos)
+        self.assertEqual(resultado['parametros'], ('u',))
+        np.testing.assert_allclose(resultado['sensibilidad_parametros'][:, 0, 0],
+                                   tiempos * 2.0 * np.exp(0.4 * tiempos), rtol=1e-7)
+        np.testing.assert_allclose(resultado['sensibilidad_parametros'][:, 1, 0], 0.0, atol=1e-12)
+
+    def test_lotka_volterra_contra_diferencias_finitas(self):
+        """Las cuatro sensibilidades α..δ coinciden con diferencias centradas"""
+        modelo = SistemaLotkaVolterra(alpha=1.0, beta=0.1, gamma=0.075, delta=1.5)
+        integrador = IntegradorSensibilidad.para_lotka_volterra(modelo)
+        tiempos = np.linspace(0, 5, 11)
+        x0 = [10.0, 5.0]
+        resultado = integrador.integrar(x0, tiempos)
+
+        for k, nombre in enumerate(('alpha', 'beta', 'gamma', 'delta')):
+            h = 1e-5 * getattr(modelo, nombre)
+            trayectorias = []
+            for signo in (1, -1):
+                valores = {p: getattr(modelo, p) for p in ('alpha', 'beta', 'gamma', 'delta')}
+                valores[nombre] += signo * h
+                trayectorias.append(odeint(SistemaLotkaVolterra(**valores).ecuaciones, x0, tiempos,
+                                           rtol=1e-11, atol=1e-11))
+            diferencia = (trayectorias[0] - trayectorias[1]) / (2 * h)
+            np.testing.assert_allclose(resultado['sensibilidad_parametros'][:, :, k], diferencia,
+                                       rtol=1e-4, atol=1e-4)
+
+    def test_parametro_desconocido(self):
+        with self.assertRaises(ValueError):
+            IntegradorSensibilidad(SistemaDinamico2D(matriz=np.eye(2)), parametros=['u'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+Tests para sistemas lineales dispersos
+"""
+
+import unittest
+import numpy as np
+import scipy.sparse as sparse
+from unittest import mock
+from scipy.linalg import expm
+from core.sistema_lineal_disperso import SistemaLinealDisperso
+
+
+class TestSistemaLinealDisperso(unittest.TestCase):
+
+    def test_abscisa_anillo_analitica(self):
+        """Anillo difusivo: λ_k = -γ - 2D(1 - cos(2πk/n)), α = -γ"""
+        sistema = SistemaLinealDisperso.anillo(200, difusion=0.5, decaimiento=0.2)
+        self.assertEqual(sistema.nnz, 600)
+        autovalores = sistema.autovalores_dominantes(k=3)
+        esperados = -0.2 - 2 * 0.5 * (1 - np.cos(2 * np.pi * np.array([0, 1, 1]) / 200))
+        np.testing.assert_allclose(autovalores.real, esperados, atol=1e-8)
+        clasificacion = sistema.clasificar_estabilidad()
+        self.assertEqual(clasificacion['estabilidad'], 'Asintóticamente estable')
+        self.assertAlmostEqual(clasificacion['tiempo_caracteristico'], 5.0, places=6)
+
+    def test_inestable_por_nodo_excitado(self):
+        """Un nodo con autoexcitación fuerte vuelve inestable la malla"""
+        excitacion = np.zeros(900)
+        excitacion[450] = 5.0
+        sistema = SistemaLinealDisperso.malla(30, 30, decaimiento=0.1, autoexcitacion=excitacion)
+        self.assertEqual(sistema.clasificar_estabilidad()['estabilidad'], 'Inestable')
+
+    def test_nunca_forma_matriz_densa(self):
+        sistema = SistemaLinealDisperso.aleatoria(3000, semilla=1)
+        with mock.patch.object(sparse.csr_matrix, 'toarray', side_effect=AssertionError), \
+                mock.patch.object(sparse.csr_matrix, 'todense', side_effect=AssertionError):
+            sistema.clasificar_estabilidad()
+            sistema.propagar(np.ones(3000), t_max=2, t_puntos=5)
+
+    def test_propagar_coincide_con_expm(self):
+        generador = np.random.default_rng(0)
+        A = sparse.random(40, 40, density=0.1, random_state=1) - 2 * sparse.eye(40)
+        sistema = SistemaLinealDisperso(A)
+        x0 = generador.standard_normal((40, 2))
+        t, X = sistema.propagar(x0, t_max=1.5, t_puntos=4)
+        self.assertEqual(X.shape, (4, 40, 2))
+        np.testing.assert_allclose(X[-1], expm(A.toarray() * 1.5) @ x0, rtol=1e-8, atol=1e-10)
+
+    def test_dimension_pequena_y_errores(self):
+        centro = SistemaLinealDisperso([[0, 1], [-1, 0]])
+        self.assertEqual(centro.clasificar_estabilidad()['estabilidad'],
+                         'Marginal (no concluyente a orden lineal)')
+        with self.assertRaises(ValueError):
+            SistemaLinealDisperso(np.ones((2, 3)))
+        with self.assertRaises(ValueError):
+            centro.propagar(np.ones(3), 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
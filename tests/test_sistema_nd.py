@@ -0,0 +1,110 @@
+"""
+Tests para sistemas de dimensión n y sus vistas 2D
+"""
+
+import unittest
+import numpy as np
+from matplotlib.figure import Figure
+from core.sistema_nd import SistemaDinamicoND
+from input_module.ejemplos import EJEMPLOS_ND
+from visualization.proyecciones import GrapherProyecciones, cruces_hiperplano
+
+
+def crear_ejemplo(clave):
+    e = EJEMPLOS_ND[clave]
+    return SistemaDinamicoND(e['ecuaciones'], e['variables'], e['parametros'], e['nombre'])
+
+
+class TestSistemaND(unittest.TestCase):
+
+    def setUp(self):
+        self.lorenz = crear_ejemplo('lorenz')
+
+    def test_campo_por_lotes(self):
+        """El campo sobre (N, n) coincide con la función compilada punto a punto"""
+        X = np.random.default_rng(0).normal(size=(4, 5, 3)) * 10
+        F = self.lorenz.evaluar_campo(X)
+        campo, _ = self.lorenz.compilar_funciones()
+        self.assertEqual(F.shape, X.shape)
+        np.testing.assert_allclose(F[2, 3], campo(X[2, 3], 0))
+        x, y, z = X[1, 1]
+        np.testing.assert_allclose(F[1, 1], [10 * (y - x), x * (28 - z) - y, x * y - 8 / 3 * z])
+
+    def test_jacobiano_contra_diferencias_finitas(self):
+        x0 = np.array([1.3, -0.7, 20.0])
+        J = self.lorenz.evaluar_jacobiano(x0)
+        h = 1e-6
+        numerico = np.column_stack([(self.lorenz.evaluar_campo(x0 + h * e) -
+                                     self.lorenz.evaluar_campo(x0 - h * e)) / (2 * h) for e in np.eye(3)])
+        np.testing.assert_allclose(J, numerico, atol=1e-6)
+
+    def test_equilibrios_lorenz(self):
+        """Origen y C± = (±√(β(ρ−1)), ±√(β(ρ−1)), ρ−1), todos inestables para ρ = 28"""
+        equilibrios = self.lorenz.encontrar_puntos_equilibrio(EJEMPLOS_ND['lorenz']['limites'])
+        c = np.sqrt(8 / 3 * 27)
+        esperados = [[-c, -c, 27], [0, 0, 0], [c, c, 27]]
+        np.testing.assert_allclose(sorted(equilibrios.tolist()), esperados, atol=1e-8)
+        dimensiones = sorted(self.lorenz.clasificar_equilibrio(e)['dimension_inestable'] for e in equilibrios)
+        self.assertEqual(dimensiones, [1, 2, 2])
+
+    def test_sir_equilibrio_endemico(self):
+        """S* = (γ+μ)/β y la trayectoria converge a él"""
+        sir = crear_ejemplo('sir_vital')
+        beta, gamma, mu = 0.5, 0.1, 0.01
+        S = (gamma + mu) / beta
+        I = mu * (1 - S) / (beta * S)
+        endemico = [S, I, gamma * I / mu]
+        equilibrios = sir.encontrar_puntos_equilibrio(EJEMPLOS_ND['sir_vital']['limites'])
+        self.assertTrue(any(np.allclose(e, endemico, atol=1e-9) for e in equilibrios))
+        self.assertEqual(sir.clasificar_equilibrio(endemico)['estabilidad'], 'Estable')
+        _, X = sir.integrar([0.99, 0.01, 0.0], t_max=3000, t_puntos=500)
+        np.testing.assert_allclose(X[-1], endemico, atol=1e-4)
+
+    def test_integrar_lote_coincide_con_odeint(self):
+        semillas = np.array([[1.0, 1.0, 1.0], [-2.0, 3.0, 20.0]])
+        t, X = self.lorenz.integrar_lote(semillas, t_max=0.5, n_pasos=500, guardar_cada=100)
+        self.assertEqual(X.shape, (6, 2, 3))
+        _, referencia = self.lorenz.integrar(semillas[1], t_max=0.5, t_puntos=6)
+        np.testing.assert_allclose(X[:, 1], referencia, atol=1e-5)
+
+    def test_dimension_mayor_y_errores(self):
+        n = 6
+        sistema = SistemaDinamicoND([f'-x{i + 1} + x{(i + 1) % n + 1}' for i in range(n)])
+        self.assertEqual(sistema.variables[-1], 'x6')
+        self.assertEqual(sistema.evaluar_jacobiano(np.zeros((10, n))).shape, (10, n, n))
+        with self.assertRaises(ValueError):
+            SistemaDinamicoND(['x*k', '-y'])
+        with self.assertRaises(ValueError):
+            SistemaDinamicoND(['x', 'y'], variables=['x', 'y', 'z'])
+
+
+class TestProyecciones(unittest.TestCase):
+
+    def test_cruces_hiperplano(self):
+        t = np.linspace(0.1, 4 * np.pi + 0.1, 2001)
+        X = np.column_stack([np.cos(t), np.sin(t), t])
+        cruces = cruces_hiperplano(X, 1, 0.0, direccion=1)
+        self.assertEqual(len(cruces), 2)
+        np.testing.assert_allclose(cruces[:, 0], 1.0, atol=1e-5)
+
+    def test_proyeccion_y_seccion(self):
+        sistema = crear_ejemplo('lorenz')
+        limites = EJEMPLOS_ND['lorenz']['limites']
+        _, X = sistema.integrar([1, 1, 1], t_max=5, t_puntos=1000)
+        fig = Figure()
+        ax = fig.add_subplot(111)
+        grapher = GrapherProyecciones(sistema)
+
+        grapher.graficar_proyeccion(ax, [X, X[::2]], (0, 2), limites=limites)
+        self.assertEqual(np.isnan(grapher.linea.get_xdata()).sum(), 1)
+
+        grapher.graficar_seccion(ax, [0, 0, 27], (0, 1), limites, n_puntos=6, trayectorias=[X])
+        grapher.graficar_seccion(ax, [0, 0, 27], (0, 1), limites, n_puntos=6)
+        self.assertEqual(len(fig.axes), 2)
+        self.assertIn('z = 27', ax.get_title())
+        grapher.graficar_proyeccion(ax, [X], (0, 2))
+        self.assertEqual(len(fig.axes), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
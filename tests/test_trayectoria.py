@@ -0,0 +1,204 @@
+"""
+Tests para el almacén compacto de trayectorias
+"""
+
+import unittest
+import numpy as np
+from core.sistema import SistemaDinamico2D
+from core.trayectoria import Trayectoria, decimar_douglas_peucker
+from visualization.plotter import integrate_trajectory_limited
+from visualization.cache_trayectorias import CacheTrayectorias
+from core.integradores import estimar_rigidez, seleccionar_metodo, integrar_con_seleccion
+
+
+class TestDecimacion(unittest.TestCase):
+    """Tests para Douglas-Peucker"""
+
+    def test_recta_queda_con_extremos(self):
+        """Una recta se reduce a sus dos extremos"""
+        puntos = np.column_stack([np.linspace(0, 1, 500), np.linspace(0, 2, 500)])
+        reducidos = decimar_douglas_peucker(puntos, 1e-6)
+        self.assertEqual(len(reducidos), 2)
+        np.testing.assert_array_equal(reducidos[0], puntos[0])
+        np.testing.assert_array_equal(reducidos[-1], puntos[-1])
+
+    def test_respeta_tolerancia(self):
+        """Ningún punto original queda a más de la tolerancia de la polilínea"""
+        t = np.linspace(0, 2 * np.pi, 2000)
+        puntos = np.column_stack([np.cos(t), np.sin(3 * t)])
+        reducidos = decimar_douglas_peucker(puntos, 1e-3)
+        self.assertLess(len(reducidos), len(puntos))
+
+        # Distancia de cada punto original al segmento más cercano
+        a, b = reducidos[:-1], reducidos[1:]
+        ab = b - a
+        ap = puntos[:, None, :] - a[None, :, :]
+        s = np.clip(np.sum(ap * ab, axis=2) / np.maximum(np.sum(ab * ab, axis=1), 1e-30), 0, 1)
+        proyeccion = a[None, :, :] + s[:, :, None] * ab[None, :, :]
+        distancias = np.min(np.linalg.norm(puntos[:, None, :] - proyeccion, axis=2), axis=1)
+        self.assertLessEqual(distancias.max(), 1e-3 + 1e-12)
+
+
+class TestTrayectoria(unittest.TestCase):
+    """Tests para el buffer de la trayectoria"""
+
+    def test_crecimiento_por_duplicacion(self):
+        """El buffer crece y conserva los datos"""
+        tray = Trayectoria((0, 0), capacidad=4)
+        for i in range(10):
+            tray.agregar((i, -i))
+        self.assertEqual(len(tray), 10)
+        self.assertGreaterEqual(tray.capacidad, 10)
+        np.testing.assert_array_equal(tray[:, 0], np.arange(10))
+        np.testing.assert_array_equal(np.asarray(tray)[:, 1], -np.arange(10))
+
+    def test_memoria_acotada(self):
+        """Al superar la capacidad máxima se compacta"""
+        tray = Trayectoria((1, 0), capacidad=64, capacidad_maxima=1000)
+        t = np.linspace(0, 200, 50000)
+        for x, y in zip(np.cos(t), np.sin(t)):
+            tray.agregar((x, y))
+        self.assertLessEqual(len(tray), 1000)
+        self.assertLessEqual(tray.capacidad, 2048)
+
+    def test_compactar_rechaza_tolerancia_no_positiva(self):
+        """Una tolerancia nula haría que la duplicación no terminara"""
+        with self.assertRaises(ValueError):
+            Trayectoria((0, 0), tolerancia_compactacion=0)
+        tray = Trayectoria((1, 0), capacidad_maxima=100)
+        t = np.linspace(0, 20, 400)
+        for x, y in zip(np.cos(t), np.sin(t)):
+            tray.agregar((x, y))
+        for tolerancia in (0, -1e-3):
+            with self.assertRaises(ValueError):
+                tray.compactar(tolerancia)
+        tray.compactar(1e-6)
+        self.assertLessEqual(len(tray), 50)
+
+    def test_integracion_registra_metadatos(self):
+        """integrate_trajectory_limited retorna semilla, dirección y motivo"""
+        sistema = SistemaDinamico2D([[1, 0], [0, 1]])
+        tray = integrate_trajectory_limited(sistema, [0.5, 0.5], direccion=1,
+                                            xlim=(-1, 1), ylim=(-1, 1))
+        self.assertEqual(tray.semilla, (0.5, 0.5))
+        self.assertEqual(tray.direccion, 1)
+        self.assertEqual(tray.motivo_fin, Trayectoria.MOTIVO_FUERA_LIMITES)
+        self.assertGreater(len(tray), 1)
+
+
+class TestSeleccionIntegrador(unittest.TestCase):
+    """Tests para la detección de rigidez y la elección de método"""
+
+    def setUp(self):
+        self.van_der_pol = SistemaDinamico2D(
+            funcion_personalizada={'f1': 'y', 'f2': 'mu*(1-x**2)*y - x', 'es_lineal': False},
+            parametros={'mu': 1000.0})
+
+    def test_estimacion_por_espectro(self):
+        """Los modos oscilatorios no cuentan como rígidos; los disipativos rápidos sí"""
+        centro = estimar_rigidez([[0, 1000], [-1000, 0]], horizonte=10, paso=0.01)
+        self.assertEqual(centro['radio_espectral'], 1000)
+        self.assertEqual(seleccionar_metodo(centro), 'RK45')
+        rigido = estimar_rigidez([[-1000, 0], [0, -1]], horizonte=10, paso=0.01)
+        self.assertFalse(rigido['euler_estable'])
+        self.assertEqual(seleccionar_metodo(rigido), 'LSODA')
+        self.assertEqual(seleccionar_metodo(estimar_rigidez(np.diag([-1e4, -1.0]), 10)), 'Radau')
+        self.assertEqual(seleccionar_metodo(estimar_rigidez(np.diag([-1e4] * 12), 10), 12), 'BDF')
+        self.assertEqual(seleccionar_metodo(estimar_rigidez([[np.nan, 0], [0, 1]], 10)), 'LSODA')
+
+    def test_van_der_pol_rigido(self):
+        """μ = 1000 se resuelve con Radau y Jacobiano analítico en pocos pasos"""
+        campo, jacobiano = self.van_der_pol.compilar_funciones()
+        t, X, info = integrar_con_seleccion(campo, jacobiano, [2, 0], np.linspace(0, 3000, 301))
+        self.assertEqual(info['metodo'], 'Radau')
+        self.assertTrue(info['exito'])
+        self.assertGreater(info['njev'], 0)
+        self.assertLess(info['pasos'], 5000)
+        self.assertEqual(X.shape, (301, 2))
+        # La relajación mantiene |x| <= 2 (cota del ciclo límite)
+        self.assertLess(np.abs(X[:, 0]).max(), 2.01)
+
+    def test_trayectoria_cambia_de_metodo(self):
+        """Euler diverge con μ = 1000; la trayectoria se integra con un método implícito"""
+        tray = integrate_trajectory_limited(self.van_der_pol, [2, 0], xlim=(-3, 3), ylim=(-3, 3))
+        self.assertIn(tray.metodo, ('LSODA', 'Radau', 'BDF'))
+        self.assertEqual(tray.motivo_fin, Trayectoria.MOTIVO_MAX_PASOS)
+        self.assertEqual(len(tray), 1000)
+        self.assertGreater(tray.estadisticas['indice_rigidez'], 1000)
+        # Sobre la variedad lenta x' ≈ x/(μ(1 - x²)), y queda pequeño
+        self.assertLess(np.abs(tray.puntos[:, 1]).max(), 0.01)
+
+        suave = integrate_trajectory_limited(self.van_der_pol.con_parametros(mu=1.0), [2, 0],
+                                             xlim=(-3, 3), ylim=(-3, 3))
+        self.assertEqual(suave.metodo, 'euler')
+        self.assertEqual(suave.estadisticas['pasos'], 1000)
+
+    def test_eventos_cortan_en_la_caja(self):
+        """La rama implícita respeta los límites de la vista igual que Euler"""
+        sistema = SistemaDinamico2D([[-1000, 0], [0, 1]])
+        tray = integrate_trajectory_limited(sistema, [1, 0.5], xlim=(-1, 1), ylim=(-1, 1))
+        self.assertNotEqual(tray.metodo, 'euler')
+        self.assertEqual(tray.motivo_fin, Trayectoria.MOTIVO_FUERA_LIMITES)
+        self.assertLessEqual(tray.ultimo[1], 3)
+        np.testing.assert_allclose(tray.ultimo[1], 0.5 * np.exp(tray.t_final), rtol=1e-4)
+
+
+class TestCacheTrayectorias(unittest.TestCase):
+    """Tests para la caché de trayectorias"""
+
+    def setUp(self):
+        self.sistema = SistemaDinamico2D([[1, 0], [0, 1]])
+        self.cache = CacheTrayectorias()
+
+    def test_reutiliza_al_redibujar(self):
+        """La misma vista no vuelve a integrar"""
+        primera = self.cache.obtener(self.sistema, (0.5, 0.5), 1, (-1, 1), (-1, 1))
+        segunda = self.cache.obtener(SistemaDinamico2D([[1, 0], [0, 1]]), (0.5, 0.5), 1,
+                                     (-0.5, 0.5), (-0.5, 0.5))
+        self.assertIs(primera, segunda)
+        self.assertEqual(self.cache.integraciones, 1)
+
+    def test_extiende_cuando_crece_la_vista(self):
+        """Al ampliar la vista se continúa desde el último punto"""
+        tray = self.cache.obtener(self.sistema, (0.5, 0.5), 1, (-1, 1), (-1, 1))
+        n_inicial = len(tray)
+        inicio = tray[:n_inicial].copy()
+
+        tray = self.cache.obtener(self.sistema, (0.5, 0.5), 1, (-4, 4), (-4, 4))
+        self.assertEqual(self.cache.integraciones, 2)
+        self.assertGreater(len(tray), n_inicial)
+        np.testing.assert_array_equal(tray[:n_inicial], inicio)
+        self.assertGreater(tray.ultimo[0], 4)
+
+        # Igual resultado que integrar de cero con la vista grande
+        directa = integrate_trajectory_limited(self.sistema, [0.5, 0.5], direccion=1,
+                                               xlim=(-4, 4), ylim=(-4, 4))
+        self.assertEqual(len(tray), len(directa))
+        np.testing.assert_allclose(tray.puntos, directa.puntos)
+
+    def test_limpiar_por_sistema(self):
+        """Limpiar un sistema no afecta a los demás"""
+        otro = SistemaDinamico2D([[-1, 0], [0, -2]])
+        self.cache.obtener(self.sistema, (0.5, 0.5), 1, (-1, 1), (-1, 1))
+        self.cache.obtener(otro, (0.5, 0.5), 1, (-1, 1), (-1, 1))
+        self.cache.limpiar(self.sistema)
+        self.assertEqual(self.cache.semillas(self.sistema), [])
+        self.assertEqual(self.cache.semillas(otro), [(0.5, 0.5)])
+        self.assertEqual(len(self.cache), 1)
+
+    def test_descarte_lru_actualiza_semillas(self):
+        """Las semillas de trayectorias descartadas dejan de listarse"""
+        cache = CacheTrayectorias(max_entradas=3)
+        cache.obtener(self.sistema, (0.5, 0.5), 1, (-1, 1), (-1, 1))
+        cache.obtener(self.sistema, (0.5, 0.5), -1, (-1, 1), (-1, 1))
+        cache.obtener(self.sistema, (0.2, 0.3), 1, (-1, 1), (-1, 1))
+        cache.obtener(self.sistema, (0.1, 0.4), 1, (-1, 1), (-1, 1))
+        # Se descartó (0.5, 0.5) hacia adelante pero sigue la dirección inversa
+        self.assertEqual(cache.semillas(self.sistema), [(0.5, 0.5), (0.2, 0.3), (0.1, 0.4)])
+        cache.obtener(self.sistema, (0.3, 0.1), 1, (-1, 1), (-1, 1))
+        self.assertEqual(cache.semillas(self.sistema), [(0.2, 0.3), (0.1, 0.4), (0.3, 0.1)])
+        self.assertEqual(len(cache), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,7 +7,7 @@ import numpy as np
 from core.utils import (
     normalizar_funciones, validar_expresion_matematica,
     evaluar_expresion, calcular_jacobiano, analizar_estabilidad_punto,
-    clasificar_equilibrio
+    clasificar_equilibrio, parsear_parametros, separar_barridos, formatear_parametros
 )
 
 
@@ -102,5 +102,38 @@ class TestEvaluacionSegura(unittest.TestCase):
             evaluar_expresion("sqrt(x)", {'x': -1})
 
 
+class TestParametros(unittest.TestCase):
+    """Tests para la entrada de parámetros con nombre y barridos"""
+    
+    def test_numero_solo_es_u(self):
+        self.assertEqual(parsear_parametros("0.5"), {'u': 0.5})
+        self.assertEqual(parsear_parametros("  "), {})
+    
+    def test_parametros_con_nombre(self):
+        self.assertEqual(parsear_parametros("u=0.5, k=2"), {'u': 0.5, 'k': 2.0})
+    
+    def test_barridos(self):
+        parametros = parsear_parametros("u=-1:1:3, k=[0.5, 2], c=4")
+        np.testing.assert_allclose(parametros['u'], [-1, 0, 1])
+        np.testing.assert_allclose(parametros['k'], [0.5, 2])
+        
+        base, barrido, forma = separar_barridos(parametros)
+        self.assertEqual(base, {'u': -1.0, 'k': 0.5, 'c': 4.0})
+        self.assertEqual(forma, (3, 2))
+        # El primer parámetro varía más rápido
+        np.testing.assert_allclose(barrido['u'], [-1, 0, 1, -1, 0, 1])
+        np.testing.assert_allclose(barrido['k'], [0.5, 0.5, 0.5, 2, 2, 2])
+    
+    def test_errores(self):
+        for texto in ("u", "x=1", "u=1, u=2", "u=abc", "u=1:2", "k=[]", "lambda=1"):
+            with self.assertRaises(ValueError):
+                parsear_parametros(texto)
+    
+    def test_formatear_es_inverso(self):
+        for texto in ("0.5", "u=0.5, k=2"):
+            self.assertEqual(parsear_parametros(formatear_parametros(parsear_parametros(texto))),
+                             parsear_parametros(texto))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -55,6 +55,195 @@ class TestDatosVisualizacion(unittest.TestCase):
         
         self.assertEqual(X.shape, (20, 20))
         self.assertEqual(Y.shape, (20, 20))
+    
+    def test_integrar_trayectoria_forma_fija(self):
+        """Siempre retorna t_puntos filas, también en sistemas rígidos"""
+        from core.sistema import SistemaDinamico2D
+        from visualization.math_utils import integrar_trayectoria
+        
+        sistema = SistemaDinamico2D([[-1, 0], [0, -2]])
+        solucion = integrar_trayectoria(sistema, [1.0, 1.0], t_max=2, t_puntos=50)
+        self.assertEqual(solucion.shape, (50, 2))
+        np.testing.assert_allclose(solucion[-1], [np.exp(-2), np.exp(-4)], rtol=1e-6)
+        
+        rigido = SistemaDinamico2D([[-1000, 0], [0, 1]])
+        self.assertEqual(integrar_trayectoria(rigido, [1.0, 1.0], t_max=5, t_puntos=80).shape, (80, 2))
+
+
+class TestArtistasLote(unittest.TestCase):
+    """Tests para la creación de artistas por lotes"""
+    
+    def test_flechas_en_un_solo_quiver(self):
+        """Todas las flechas de una trayectoria generan un único artista"""
+        from visualization.math_utils import agregar_flechas_trayectoria
+        
+        fig = Figure(figsize=(8, 6), dpi=100)
+        ax = fig.add_subplot(111)
+        t = np.linspace(0, 10, 1000)
+        trayectoria = np.column_stack([np.cos(t), np.sin(t)])
+        
+        agregar_flechas_trayectoria(ax, trayectoria, num_flechas=20)
+        self.assertEqual(len(ax.collections), 1)
+        self.assertEqual(len(ax.collections[0].U), 20)
+        self.assertEqual(len(ax.texts), 0)
+    
+    def test_equilibrios_en_un_solo_marcador(self):
+        """Varios equilibrios se marcan con un único Line2D"""
+        from core.sistema import SistemaDinamico2D
+        from visualization.grapher import Grapher
+        
+        sistema = SistemaDinamico2D(funcion_personalizada={
+            'f1': 'x - x**3', 'f2': '-y', 'es_lineal': False})
+        fig = Figure(figsize=(8, 6), dpi=100)
+        ax = fig.add_subplot(111)
+        Grapher(sistema)._marcar_puntos_equilibrio(ax, (-2, 2), (-2, 2))
+        
+        self.assertEqual(len(ax.lines), 1)
+        self.assertEqual(len(ax.lines[0].get_xdata()), 3)
+
+
+class TestCampoTemporal(unittest.TestCase):
+    """Tests para el campo por cortes temporales"""
+    
+    def setUp(self):
+        from core.sistema import SistemaDinamico2D
+        self.sistema = SistemaDinamico2D([[0, 1], [-1, -0.3]],
+                                         {'tipo': 'seno', 'coef1': 0, 'coef2': 2, 'param': 1.5})
+    
+    def test_campo_temporal_coincide_con_ecuaciones(self):
+        """Cada corte (t, y, x) coincide con sistema_ecuaciones en ese instante"""
+        from visualization.math_utils import calcular_campo_vectorial_temporal
+        
+        X, Y = np.meshgrid(np.linspace(-2, 2, 5), np.linspace(-1, 1, 4))
+        tiempos = np.array([0.0, 0.7, 2.1])
+        U, V = calcular_campo_vectorial_temporal(self.sistema, X, Y, tiempos)
+        self.assertEqual(U.shape, (3, 4, 5))
+        
+        for k, t in enumerate(tiempos):
+            esperado = self.sistema.sistema_ecuaciones([X[2, 3], Y[2, 3]], t)
+            np.testing.assert_allclose([U[k, 2, 3], V[k, 2, 3]], esperado)
+    
+    def test_animacion_reutiliza_buffer(self):
+        """Mover el tiempo solo copia cuadros precalculados al quiver"""
+        from unittest import mock
+        from visualization.animacion_campo import AnimadorCampoTemporal
+        
+        fig = Figure(figsize=(6, 5), dpi=80)
+        ax = fig.add_subplot(111)
+        animador = AnimadorCampoTemporal(ax, self.sistema, (-3, 3), (-3, 3),
+                                         n_cuadros=30, n_puntos=8, semilla=(1, 0))
+        self.assertEqual(animador.buffer_u.shape, (30, 8, 8))
+        
+        with mock.patch.object(self.sistema, 'evaluar_campo') as evaluar:
+            animador.mostrar_cuadro(17)
+            animador.siguiente_cuadro()
+            evaluar.assert_not_called()
+        
+        self.assertEqual(animador.cuadro_actual, 18)
+        np.testing.assert_allclose(animador.quiver.U, animador.buffer_u[18].ravel())
+        np.testing.assert_allclose(animador.marcador.get_xdata(), [animador.trayectoria[18, 0]])
+
+
+
+class TestActualizacionEnVivo(unittest.TestCase):
+    """Tests para la actualización en el lugar al mover un parámetro"""
+    
+    def setUp(self):
+        from core.sistema import SistemaDinamico2D
+        self.sistema = SistemaDinamico2D(
+            funcion_personalizada={'f1': 'u*x - x**3', 'f2': '-y', 'es_lineal': False},
+            parametros={'u': -0.5})
+    
+    def test_con_parametros_no_reparsea(self):
+        """La copia comparte las funciones compiladas y evalúa con la nueva u"""
+        copia = self.sistema.con_parametros(u=1.0)
+        self.assertIs(copia._campo_lambda, self.sistema._campo_lambda)
+        self.assertEqual(self.sistema.parametros['u'], -0.5)
+        U, _ = copia.evaluar_campo(np.array([0.5]), np.array([0.0]))
+        self.assertAlmostEqual(U[0], 0.5 - 0.125)
+        with self.assertRaises(ValueError):
+            self.sistema.con_parametros(k=1.0)
+    
+    def test_refinar_equilibrios_en_caliente(self):
+        """Newton por lotes converge desde los equilibrios de una u cercana"""
+        u = 0.81
+        equilibrios = self.sistema.con_parametros(u=u).refinar_equilibrios(
+            [[0.85, 0.01], [-0.85, 0.0], [0.05, -0.02]])
+        np.testing.assert_allclose(sorted(equilibrios), [(-0.9, 0.0), (0.0, 0.0), (0.9, 0.0)], atol=1e-10)
+    
+    def test_grapher_actualiza_en_el_lugar(self):
+        """El quiver y el marcador se reutilizan y los equilibrios siguen a u"""
+        from visualization.grapher import Grapher
+        
+        fig = Figure(figsize=(6, 5), dpi=80)
+        ax = fig.add_subplot(111)
+        grapher = Grapher(self.sistema)
+        grapher.crear_grafica(ax, (-2, 2), (-2, 2))
+        quiver, marcador = grapher.quiver, grapher.marcador_equilibrios
+        n_artistas = len(ax.lines) + len(ax.collections)
+        
+        grapher.actualizar_parametros(ax, self.sistema.con_parametros(u=1.0))
+        self.assertIs(grapher.quiver, quiver)
+        self.assertEqual(len(ax.lines) + len(ax.collections), n_artistas)
+        np.testing.assert_allclose(sorted(marcador.get_xdata()), [-1.0, 0.0, 1.0], atol=1e-9)
+        
+        X, Y = grapher.malla
+        U, V = grapher.sistema.evaluar_campo(X, Y, 0, incluir_forzado=False)
+        M = np.hypot(U, V)
+        M[M == 0] = 1
+        np.testing.assert_allclose(quiver.U, (U / M).ravel())
+    
+    def test_lotka_volterra_actualiza_en_el_lugar(self):
+        from core.lotka_volterra import SistemaLotkaVolterra
+        from visualization.lotka_volterra import GrapherLotkaVolterra
+        
+        fig = Figure(figsize=(6, 5), dpi=80)
+        ax = fig.add_subplot(111)
+        grapher = GrapherLotkaVolterra(SistemaLotkaVolterra(1.0, 0.5, 0.5, 1.0))
+        grapher.crear_grafica(ax, n_puntos=8)
+        grapher.actualizar_parametros(ax, SistemaLotkaVolterra(1.0, 0.5, 0.5, 1.5))
+        np.testing.assert_allclose(grapher.marcador_interior.get_xdata(), [3.0])
+        self.assertTrue(grapher.marcador_interior.get_visible())
+        self.assertEqual(grapher.isoclinas[1].get_xdata()[0], 3.0)
+
+
+class TestBarridoParametros(unittest.TestCase):
+    """Tests para la evaluación conjunta sobre una cuadrícula de parámetros"""
+    
+    def setUp(self):
+        from core.sistema import SistemaDinamico2D
+        from core.utils import parsear_parametros, separar_barridos
+        self.sistema = SistemaDinamico2D(
+            funcion_personalizada={'f1': 'u*x - x**3', 'f2': '-k*y', 'es_lineal': False},
+            parametros={'u': 0.0, 'k': 1.0})
+        _, self.barrido, self.forma = separar_barridos(parsear_parametros('u=-1:1:3, k=[0.5, 2]'))
+    
+    def test_campo_barrido_coincide_con_cada_sistema(self):
+        """Cada corte (P, y, x) coincide con el sistema de esa combinación"""
+        from visualization.math_utils import calcular_campo_barrido
+        
+        X, Y = np.meshgrid(np.linspace(-2, 2, 5), np.linspace(-1, 1, 4))
+        U, V = calcular_campo_barrido(self.sistema, X, Y, self.barrido)
+        self.assertEqual(U.shape, (6, 4, 5))
+        for p in range(6):
+            copia = self.sistema.con_parametros(u=self.barrido['u'][p], k=self.barrido['k'][p])
+            esperado = copia.evaluar_campo(X, Y)
+            np.testing.assert_allclose(U[p], esperado[0])
+            np.testing.assert_allclose(V[p], esperado[1])
+    
+    def test_cuadricula_de_paneles(self):
+        """u recorre las columnas, k las filas; un quiver por panel"""
+        from visualization.barrido_parametros import graficar_barrido
+        
+        fig = Figure(figsize=(8, 6), dpi=80)
+        ejes = graficar_barrido(fig, self.sistema, self.barrido, self.forma, (-2, 2), (-2, 2), n_puntos=6)
+        self.assertEqual(ejes.shape, (2, 3))
+        self.assertTrue(all(len(ax.collections) == 1 for ax in ejes.ravel()))
+        self.assertIn('u = 1', ejes[1, 2].get_title())
+        self.assertIn('k = 2', ejes[1, 2].get_title())
+        # u = 1 tiene equilibrios en x = -1, 0, 1
+        marcador = [l for l in ejes[0, 2].lines if l.get_marker() == 'o'][0]
+        np.testing.assert_allclose(sorted(marcador.get_xdata()), [-1.0, 0.0, 1.0], atol=1e-9)
 
 
 if __name__ == '__main__':
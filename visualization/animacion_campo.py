@@ -0,0 +1,158 @@
+"""
+Animación por cortes temporales del campo de sistemas forzados
+El campo se precalcula como un array (t, y, x) y cada cuadro solo actualiza artistas
+"""
+
+import numpy as np
+from scipy.integrate import odeint
+from visualization.math_utils import calcular_campo_vectorial_temporal, normalizar_vectores
+
+
+class AnimadorCampoTemporal:
+    """
+    Reproduce el campo f(x, y, t) cuadro a cuadro con blitting
+
+    Todos los cuadros se calculan una sola vez en un buffer (nt, ny, nx) y
+    la trayectoria se integra sobre la misma grilla de tiempos, por lo que
+    mover el deslizador de tiempo no vuelve a evaluar el campo: solo se
+    copian los valores al quiver (set_UVC) y se mueve el marcador.
+    """
+
+    def __init__(self, ax, sistema, xlim, ylim, t_final=10.0, n_cuadros=120,
+                 n_puntos=20, semilla=None):
+        """
+        Parámetros:
+        - ax: eje de matplotlib donde se anima
+        - sistema: SistemaDinamico2D
+        - xlim, ylim: límites de la vista
+        - t_final: tiempo final de la animación
+        - n_cuadros: cantidad de cortes temporales
+        - n_puntos: resolución de la malla del campo
+        - semilla: condición inicial de la trayectoria superpuesta (opcional)
+        """
+        self.ax = ax
+        self.sistema = sistema
+        self.xlim = xlim
+        self.ylim = ylim
+        self.tiempos = np.linspace(0, t_final, n_cuadros)
+        self.cuadro_actual = 0
+        self._fondo = None
+
+        x = np.linspace(xlim[0], xlim[1], n_puntos)
+        y = np.linspace(ylim[0], ylim[1], n_puntos)
+        self.X, self.Y = np.meshgrid(x, y)
+
+        self._precalcular_cuadros()
+        self.trayectoria = self._integrar_trayectoria(semilla) if semilla is not None else None
+        self._crear_artistas()
+
+        self.ax.figure.canvas.mpl_connect('draw_event', self._al_dibujar)
+
+    def _precalcular_cuadros(self):
+        """Evalúa el campo en todos los tiempos y guarda direcciones y magnitudes"""
+        U, V = calcular_campo_vectorial_temporal(self.sistema, self.X, self.Y, self.tiempos)
+        U = np.nan_to_num(U)
+        V = np.nan_to_num(V)
+        U_norm, V_norm, M = normalizar_vectores(U, V)
+
+        self.buffer_u = U_norm
+        self.buffer_v = V_norm
+        # Color por magnitud relativa con una escala común a todos los cuadros
+        self.buffer_color = np.log1p(M)
+        self.color_max = float(self.buffer_color.max()) or 1.0
+
+    def _integrar_trayectoria(self, semilla):
+        """Trayectoria muestreada en los mismos instantes que los cuadros"""
+        try:
+            return odeint(self.sistema.sistema_ecuaciones, np.asarray(semilla, dtype=float),
+                          self.tiempos)
+        except Exception as e:
+            print(f"Error integrando trayectoria para la animación: {e}")
+            return None
+
+    def _crear_artistas(self):
+        """Crea una vez los artistas estáticos y los animados"""
+        ax = self.ax
+        ax.clear()
+
+        self.quiver = ax.quiver(
+            self.X, self.Y, self.buffer_u[0], self.buffer_v[0], self.buffer_color[0],
+            cmap='viridis', clim=(0, self.color_max), pivot='mid', alpha=0.8,
+            angles='xy', animated=True
+        )
+
+        self.marcador = None
+        if self.trayectoria is not None:
+            ax.plot(self.trayectoria[:, 0], self.trayectoria[:, 1], '-',
+                    color='gray', linewidth=1, alpha=0.5)
+            self.estela, = ax.plot([], [], 'b-', linewidth=2, alpha=0.8, animated=True)
+            self.marcador, = ax.plot([], [], 'ro', markersize=8, markeredgecolor='darkred',
+                                     markeredgewidth=2, animated=True)
+
+        self.texto_tiempo = ax.text(0.02, 0.95, '', transform=ax.transAxes,
+                                    fontsize=11, fontweight='bold',
+                                    bbox=dict(facecolor='white', alpha=0.8, edgecolor='none'),
+                                    animated=True)
+
+        ax.set_xlim(self.xlim)
+        ax.set_ylim(self.ylim)
+        ax.set_xlabel('x₁', fontsize=11)
+        ax.set_ylabel('x₂', fontsize=11)
+        ax.set_title('Campo vectorial f(x, t) por cortes temporales', fontsize=12,
+                     fontweight='bold')
+        ax.grid(True, alpha=0.3)
+        ax.axhline(0, color='k', linewidth=0.5)
+        ax.axvline(0, color='k', linewidth=0.5)
+
+    @property
+    def artistas_animados(self):
+        artistas = [self.quiver, self.texto_tiempo]
+        if self.marcador is not None:
+            artistas += [self.estela, self.marcador]
+        return artistas
+
+    @property
+    def n_cuadros(self):
+        return len(self.tiempos)
+
+    def _al_dibujar(self, event):
+        """Guarda el fondo estático tras cada redibujado completo"""
+        canvas = self.ax.figure.canvas
+        self._fondo = canvas.copy_from_bbox(self.ax.bbox)
+        self._dibujar_animados()
+
+    def actualizar_artistas(self, indice):
+        """Copia el cuadro `indice` del buffer a los artistas (sin recalcular)"""
+        indice = int(np.clip(indice, 0, self.n_cuadros - 1))
+        self.cuadro_actual = indice
+
+        self.quiver.set_UVC(self.buffer_u[indice], self.buffer_v[indice],
+                            self.buffer_color[indice])
+        self.texto_tiempo.set_text(f't = {self.tiempos[indice]:.2f}')
+        if self.marcador is not None:
+            self.estela.set_data(self.trayectoria[:indice + 1, 0], self.trayectoria[:indice + 1, 1])
+            self.marcador.set_data([self.trayectoria[indice, 0]], [self.trayectoria[indice, 1]])
+        return self.artistas_animados
+
+    def _dibujar_animados(self):
+        for artista in self.artistas_animados:
+            self.ax.draw_artist(artista)
+
+    def mostrar_cuadro(self, indice):
+        """
+        Muestra un cuadro restaurando el fondo guardado y redibujando solo
+        los artistas animados (blitting)
+        """
+        self.actualizar_artistas(indice)
+        canvas = self.ax.figure.canvas
+        if self._fondo is None:
+            canvas.draw()
+            return
+        canvas.restore_region(self._fondo)
+        self._dibujar_animados()
+        canvas.blit(self.ax.bbox)
+
+    def siguiente_cuadro(self):
+        """Avanza un cuadro (vuelve al inicio al terminar) y lo muestra"""
+        self.mostrar_cuadro((self.cuadro_actual + 1) % self.n_cuadros)
+        return self.cuadro_actual
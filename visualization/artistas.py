@@ -0,0 +1,90 @@
+"""
+Creación de artistas por lotes
+Un único quiver/Line2D por capa en lugar de un artista por flecha o marcador
+"""
+
+import numpy as np
+
+
+def dibujar_flechas_lote(ax, origenes, direcciones, color='b', longitud_pulgadas=0.22,
+                         **kwargs):
+    """
+    Dibuja todas las flechas de una capa con un solo quiver
+
+    Las direcciones se normalizan y la longitud se fija en pulgadas de
+    pantalla, de modo que las flechas conservan su tamaño al hacer zoom
+    (igual que las anotaciones a las que reemplaza).
+
+    Parámetros:
+    - ax: eje de matplotlib
+    - origenes: array (N, 2) con la posición de cada flecha
+    - direcciones: array (N, 2) con la dirección de cada flecha
+    - color: color único o secuencia de N colores
+    - longitud_pulgadas: largo de las flechas en pantalla
+
+    Retorna: Quiver creado (o None si no hay flechas)
+    """
+    origenes = np.asarray(origenes, dtype=float).reshape(-1, 2)
+    direcciones = np.asarray(direcciones, dtype=float).reshape(-1, 2)
+    if len(origenes) == 0:
+        return None
+
+    normas = np.hypot(direcciones[:, 0], direcciones[:, 1])
+    normas[normas == 0] = 1
+    unitarias = direcciones / normas[:, None]
+
+    opciones = {
+        'angles': 'xy', 'scale_units': 'inches', 'scale': 1.0 / longitud_pulgadas,
+        'pivot': 'mid', 'units': 'dots', 'width': 2.0, 'headwidth': 4, 'headlength': 5,
+        'alpha': 0.8, 'zorder': 4
+    }
+    opciones.update(kwargs)
+
+    return ax.quiver(origenes[:, 0], origenes[:, 1], unitarias[:, 0], unitarias[:, 1],
+                     color=color, **opciones)
+
+
+def dibujar_vectores_lote(ax, origenes, vectores, color='red', **kwargs):
+    """
+    Dibuja vectores en coordenadas de datos (longitud real) con un solo quiver
+
+    Parámetros:
+    - ax: eje de matplotlib
+    - origenes: array (N, 2)
+    - vectores: array (N, 2) en unidades de los ejes
+
+    Retorna: Quiver creado (o None si no hay vectores)
+    """
+    origenes = np.asarray(origenes, dtype=float).reshape(-1, 2)
+    vectores = np.asarray(vectores, dtype=float).reshape(-1, 2)
+    if len(origenes) == 0:
+        return None
+
+    opciones = {
+        'angles': 'xy', 'scale_units': 'xy', 'scale': 1, 'units': 'dots',
+        'width': 2.0, 'headwidth': 4, 'headlength': 5, 'alpha': 0.8, 'zorder': 3
+    }
+    opciones.update(kwargs)
+
+    return ax.quiver(origenes[:, 0], origenes[:, 1], vectores[:, 0], vectores[:, 1],
+                     color=color, **opciones)
+
+
+def marcar_puntos_lote(ax, xs, ys, formato='ko', **kwargs):
+    """
+    Marca un conjunto de puntos con un único Line2D sin línea
+
+    Parámetros:
+    - ax: eje de matplotlib
+    - xs, ys: coordenadas de los puntos
+    - formato: formato de marcador de matplotlib (ej: 'ko', 'bs')
+
+    Retorna: Line2D creado (o None si no hay puntos)
+    """
+    xs = np.atleast_1d(np.asarray(xs, dtype=float))
+    ys = np.atleast_1d(np.asarray(ys, dtype=float))
+    if xs.size == 0:
+        return None
+
+    linea, = ax.plot(xs, ys, formato, linestyle='none', **kwargs)
+    return linea
@@ -0,0 +1,72 @@
+"""
+Visualización de barridos de parámetros como cuadrícula de retratos de fase
+El campo de todos los paneles se evalúa en una sola llamada vectorizada
+"""
+
+import numpy as np
+from visualization.math_utils import calcular_campo_barrido, normalizar_vectores
+from visualization.artistas import marcar_puntos_lote
+
+MAX_PANELES = 36
+
+
+def graficar_barrido(fig, sistema, barrido, forma, xlim, ylim, n_puntos=15):
+    """
+    Dibuja un retrato de fase por combinación de parámetros (small multiples)
+
+    El primer parámetro barrido recorre las columnas y el segundo las filas.
+    El campo se calcula como un único array (P, ny, nx) y cada panel recibe
+    su corte; los equilibrios se refinan con Newton por lotes en cada panel.
+
+    Parámetros:
+    - fig: Figure de matplotlib (se limpia)
+    - sistema: SistemaDinamico2D con funciones personalizadas
+    - barrido, forma: resultado de separar_barridos (hasta 2 parámetros)
+    - xlim, ylim: límites comunes a todos los paneles
+    - n_puntos: flechas por lado en cada panel
+
+    Retorna: array (filas, columnas) con los ejes
+    """
+    if not barrido:
+        raise ValueError("No hay parámetros con barrido")
+    if len(forma) > 2:
+        raise ValueError("La cuadrícula admite como máximo dos parámetros barridos")
+    if int(np.prod(forma)) > MAX_PANELES:
+        raise ValueError(f"Demasiadas combinaciones ({int(np.prod(forma))}); máximo {MAX_PANELES}")
+
+    columnas = forma[0]
+    filas = forma[1] if len(forma) == 2 else 1
+    nombres = list(barrido)
+
+    X, Y = np.meshgrid(np.linspace(*xlim, n_puntos), np.linspace(*ylim, n_puntos))
+    U, V = calcular_campo_barrido(sistema, X, Y, barrido)
+    U_norm, V_norm, M = normalizar_vectores(U, V)
+
+    # Semillas de Newton comunes a todos los paneles
+    gx, gy = np.meshgrid(np.linspace(*xlim, 7), np.linspace(*ylim, 7))
+    semillas = np.column_stack([gx.ravel(), gy.ravel()])
+
+    fig.clear()
+    ejes = fig.subplots(filas, columnas, sharex=True, sharey=True, squeeze=False)
+    for k in range(columnas * filas):
+        ax = ejes[k // columnas, k % columnas]
+        valores = {nombre: float(barrido[nombre][k]) for nombre in nombres}
+
+        ax.quiver(X, Y, U_norm[k], V_norm[k], M[k], cmap='viridis', alpha=0.6)
+        equilibrios = sistema.con_parametros(**valores).refinar_equilibrios(semillas, xlim, ylim)
+        if equilibrios:
+            xs, ys = zip(*equilibrios)
+            marcar_puntos_lote(ax, xs, ys, 'ko', markersize=6, markeredgecolor='white', zorder=5)
+
+        ax.axhline(y=0, color='k', linewidth=0.5)
+        ax.axvline(x=0, color='k', linewidth=0.5)
+        ax.set_xlim(xlim)
+        ax.set_ylim(ylim)
+        ax.set_title(', '.join(f'{n} = {v:.3g}' for n, v in valores.items()), fontsize=9)
+        ax.tick_params(labelsize=7)
+
+    for ax in ejes[-1]:
+        ax.set_xlabel('x', fontsize=9)
+    for ax in ejes[:, 0]:
+        ax.set_ylabel('y', fontsize=9)
+    return ejes
@@ -8,6 +8,7 @@ import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 from typing import Dict, Tuple
 from core.bifurcacion import AnalizadorBifurcacion
+from visualization.artistas import dibujar_vectores_lote, marcar_puntos_lote
 
 
 class VisualizadorBifurcacion:
@@ -23,7 +24,8 @@ class VisualizadorBifurcacion:
         self.analizador = analizador
         
     def graficar_diagrama_bifurcacion(self, r_range: Tuple[float, float], 
-                                       fig: Figure = None, num_points: int = 200) -> Figure:
+                                       fig: Figure = None, num_points: int = 200,
+                                       x_range: Tuple[float, float] = None) -> Figure:
         """
         Genera el diagrama de bifurcación
         
@@ -31,6 +33,8 @@ class VisualizadorBifurcacion:
             r_range: Rango de valores de r (r_min, r_max)
             fig: Figura de matplotlib (opcional)
             num_points: Número de puntos a evaluar
+            x_range: Rango de x donde se buscan y clasifican los puntos críticos
+                     (por defecto, la extensión de las ramas)
             
         Returns:
             Figura de matplotlib
@@ -59,6 +63,13 @@ class VisualizadorBifurcacion:
                 ax.plot(r_branch, x_branch, 'r--', linewidth=2, label=label)
                 has_data = True
         
+        if x_range is None and has_data:
+            todos_x = np.concatenate([data['estable']['x'], data['inestable']['x']])
+            margen = 0.1 * (np.ptp(todos_x) or 1.0)
+            x_range = (todos_x.min() - margen, todos_x.max() + margen)
+        if x_range is not None:
+            self._marcar_bifurcaciones(ax, self.analizador.clasificar_bifurcaciones(r_range, x_range))
+        
         ax.axhline(y=0, color='k', linestyle='-', linewidth=0.5, alpha=0.3)
         ax.axvline(x=0, color='k', linestyle='-', linewidth=0.5, alpha=0.3)
         ax.set_xlabel('Parámetro r', fontsize=12)
@@ -76,6 +87,32 @@ class VisualizadorBifurcacion:
         
         return fig
     
+    def _marcar_bifurcaciones(self, ax, bifurcaciones: list):
+        """
+        Marca los puntos críticos clasificados, un artista por tipo, con su nombre
+        
+        Args:
+            ax: Eje de matplotlib
+            bifurcaciones: Lista devuelta por clasificar_bifurcaciones
+        """
+        estilos = {
+            'silla_nodo': 'ks',
+            'transcritica': 'gD',
+            'tridente_supercritico': 'm^',
+            'tridente_subcritico': 'cv',
+            'degenerada': 'kx'
+        }
+        for tipo, formato in estilos.items():
+            puntos = [b for b in bifurcaciones if b['tipo'] == tipo]
+            if not puntos:
+                continue
+            marcar_puntos_lote(ax, [b['r'] for b in puntos], [b['x'] for b in puntos], formato,
+                               markersize=9, label=puntos[0]['nombre'], zorder=6)
+            for b in puntos:
+                ax.annotate(b['nombre'], (b['r'], b['x']), textcoords='offset points',
+                            xytext=(8, 8), fontsize=9, fontweight='bold',
+                            bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.8))
+    
     def _separar_ramas(self, r_data: np.ndarray, x_data: np.ndarray) -> list:
         """
         Separa los datos en ramas continuas para graficar correctamente
@@ -144,70 +181,22 @@ class VisualizadorBifurcacion:
             
             eq_data = self.analizador.obtener_equilibrios_con_estabilidad(r_val)
             
-            # Marcar TODOS los puntos de equilibrio encontrados
-            estables_mostrados = False
-            inestables_mostrados = False
-            neutrales_mostrados = False
-            
-            for eq in eq_data:
-                x_eq = eq['x']
-                if x_range[0] <= x_eq <= x_range[1]:
-                    mult = eq.get('multiplicidad', 1)
-                    
-                    # Tamaño mayor para puntos con multiplicidad > 1
-                    markersize = 10 if mult == 1 else 14
-                    
-                    if eq['estabilidad'] == 'estable':
-                        label = 'Estable' if not estables_mostrados else ''
-                        ax.plot(x_eq, 0, 'bo', markersize=markersize, 
-                               markerfacecolor='blue', label=label, zorder=5)
-                        estables_mostrados = True
-                        
-                        # Marcar multiplicidad si es mayor que 1
-                        if mult > 1:
-                            ax.plot(x_eq, 0, 'bo', markersize=markersize+4, 
-                                   markerfacecolor='none', markeredgecolor='blue',
-                                   markeredgewidth=2, zorder=4)
-                                   
-                    elif eq['estabilidad'] == 'inestable':
-                        label = 'Inestable' if not inestables_mostrados else ''
-                        ax.plot(x_eq, 0, 'ro', markersize=markersize, 
-                               markerfacecolor='white', markeredgewidth=2,
-                               markeredgecolor='red', label=label, zorder=5)
-                        inestables_mostrados = True
-                        
-                        # Marcar multiplicidad si es mayor que 1
-                        if mult > 1:
-                            ax.plot(x_eq, 0, 'ro', markersize=markersize+4, 
-                                   markerfacecolor='none', markeredgecolor='red',
-                                   markeredgewidth=3, zorder=4)
-                                   
-                    elif eq['estabilidad'] == 'neutral':
-                        label = 'Neutral' if not neutrales_mostrados else ''
-                        ax.plot(x_eq, 0, 'ko', markersize=markersize, 
-                               markerfacecolor='yellow', markeredgewidth=2,
-                               markeredgecolor='black', label=label, zorder=5)
-                        neutrales_mostrados = True
-                        
-                        # Marcar multiplicidad si es mayor que 1
-                        if mult > 1:
-                            ax.plot(x_eq, 0, 'ko', markersize=markersize+4, 
-                                   markerfacecolor='none', markeredgecolor='black',
-                                   markeredgewidth=3, zorder=4)
+            # Marcar TODOS los puntos de equilibrio: un artista por estilo
+            self._marcar_equilibrios_fase(ax, eq_data, x_range)
             
+            # Flechas de flujo: f y f' evaluadas en bloque, un solo quiver
             arrow_x = np.linspace(x_range[0], x_range[1], 15)
-            for x_pos in arrow_x:
-                f_val = float(self.analizador.evaluar_funcion(np.array([x_pos]), r_val)[0])
-                arrow_size = 0.3 * np.sign(f_val) * min(abs(f_val), 1.0)
-                
-                if abs(f_val) > 0.01:
-                    color = 'blue' if self._es_region_estable(x_pos, r_val) else 'red'
-                    style = '-' if self._es_region_estable(x_pos, r_val) else '--'
-                    
-                    ax.arrow(x_pos, -0.5, arrow_size, 0, 
-                            head_width=0.15, head_length=0.1,
-                            fc=color, ec=color, linewidth=1.5,
-                            linestyle=style, alpha=0.7)
+            f_arrows = np.broadcast_to(self.analizador.evaluar_funcion(arrow_x, r_val), arrow_x.shape)
+            con_flujo = np.abs(f_arrows) > 0.01
+            arrow_size = 0.3 * np.sign(f_arrows[con_flujo]) * np.minimum(np.abs(f_arrows[con_flujo]), 1.0)
+            estables = self.analizador.evaluar_derivada(arrow_x[con_flujo], r_val) < 0
+            dibujar_vectores_lote(
+                ax,
+                np.column_stack([arrow_x[con_flujo], np.full(arrow_size.shape, -0.5)]),
+                np.column_stack([arrow_size, np.zeros_like(arrow_size)]),
+                color=np.where(estables, 'blue', 'red').tolist(),
+                alpha=0.7
+            )
             
             ax.set_xlabel('x', fontsize=11)
             ax.set_ylabel('f(x)', fontsize=11)
@@ -221,6 +210,46 @@ class VisualizadorBifurcacion:
         fig.tight_layout()
         return fig
     
+    def _marcar_equilibrios_fase(self, ax, eq_data: list, x_range: Tuple[float, float]):
+        """
+        Marca equilibrios agrupados por estabilidad y multiplicidad
+        
+        Args:
+            ax: Eje de matplotlib
+            eq_data: Lista de dicts con 'x', 'estabilidad' y 'multiplicidad'
+            x_range: Rango visible de x
+        """
+        estilos = {
+            'estable': ('bo', {'markerfacecolor': 'blue'}, 'Estable', 'blue', 2),
+            'inestable': ('ro', {'markerfacecolor': 'white', 'markeredgewidth': 2,
+                                 'markeredgecolor': 'red'}, 'Inestable', 'red', 3),
+            'neutral': ('ko', {'markerfacecolor': 'yellow', 'markeredgewidth': 2,
+                               'markeredgecolor': 'black'}, 'Neutral', 'black', 3)
+        }
+        visibles = [eq for eq in eq_data if x_range[0] <= eq['x'] <= x_range[1]]
+        
+        for estabilidad, (formato, kwargs, label, color_borde, ancho_borde) in estilos.items():
+            simples = [eq['x'] for eq in visibles
+                       if eq['estabilidad'] == estabilidad and eq.get('multiplicidad', 1) == 1]
+            multiples = [eq['x'] for eq in visibles
+                         if eq['estabilidad'] == estabilidad and eq.get('multiplicidad', 1) > 1]
+            
+            # Tamaño mayor para puntos con multiplicidad > 1
+            etiqueta_usada = False
+            for xs, markersize in ((simples, 10), (multiples, 14)):
+                if not xs:
+                    continue
+                marcar_puntos_lote(ax, xs, np.zeros(len(xs)), formato, markersize=markersize,
+                                   label=None if etiqueta_usada else label, zorder=5, **kwargs)
+                etiqueta_usada = True
+            
+            # Anillo exterior que marca multiplicidad
+            if multiples:
+                marcar_puntos_lote(ax, multiples, np.zeros(len(multiples)), formato,
+                                   markersize=18, markerfacecolor='none',
+                                   markeredgecolor=color_borde, markeredgewidth=ancho_borde,
+                                   zorder=4)
+    
     def _es_region_estable(self, x_val: float, r_val: float) -> bool:
         """
         Determina si una región es estable (f'(x) < 0)
@@ -0,0 +1,58 @@
+"""
+Visualización del diagrama de bifurcación de equilibrios 2D
+"""
+
+import numpy as np
+
+
+def graficar_diagrama_bifurcacion_2d(ax, resultado, componente=0, nombre_parametro='u'):
+    """
+    Dibuja las ramas de equilibrios (una coordenada vs el parámetro)
+
+    Las ramas estables van en línea continua azul y las inestables en rojo
+    discontinuo; Hopf (H) y pliegues (LP) se marcan con un único artista cada uno.
+
+    Parámetros:
+    - ax: eje de matplotlib (se limpia)
+    - resultado: dict de AnalizadorBifurcacion2D.continuar_equilibrios
+    - componente: 0 para x₁, 1 para x₂
+    - nombre_parametro: etiqueta del eje horizontal
+    """
+    ax.clear()
+    separador = np.array([np.nan])
+    estables_p, estables_x, inestables_p, inestables_x = [], [], [], []
+
+    for rama in resultado['ramas']:
+        p = rama['puntos'][:, 2]
+        x = rama['puntos'][:, componente]
+        estable = rama['estable']
+        # Se repite el punto de cambio en ambas capas para que no queden huecos
+        borde = np.concatenate([[False], estable[1:] != estable[:-1]])
+        estables_p += [np.where(estable | borde, p, np.nan), separador]
+        estables_x += [np.where(estable | borde, x, np.nan), separador]
+        inestables_p += [np.where(~estable | borde, p, np.nan), separador]
+        inestables_x += [np.where(~estable | borde, x, np.nan), separador]
+
+    if estables_p:
+        ax.plot(np.concatenate(estables_p), np.concatenate(estables_x), 'b-',
+                linewidth=2, label='Estable')
+        ax.plot(np.concatenate(inestables_p), np.concatenate(inestables_x), 'r--',
+                linewidth=2, label='Inestable')
+
+    etiquetas = (('hopf', 'H', 'mo', 'Hopf'), ('pliegues', 'LP', 'ks', 'Pliegue'))
+    for clave, texto, formato, nombre in etiquetas:
+        puntos = resultado[clave]
+        if not puntos:
+            continue
+        ps = [b['parametro'] for b in puntos]
+        xs = [b['punto'][componente] for b in puntos]
+        ax.plot(ps, xs, formato, markersize=8, linestyle='none', label=nombre, zorder=5)
+        for p, x in zip(ps, xs):
+            ax.annotate(texto, (p, x), textcoords='offset points', xytext=(6, 6),
+                        fontsize=9, fontweight='bold')
+
+    ax.set_xlabel(nombre_parametro, fontsize=11)
+    ax.set_ylabel(f"x{'₁₂'[componente]}*", fontsize=11)
+    ax.grid(True, alpha=0.3)
+    if estables_p:
+        ax.legend(fontsize=8, loc='best')
@@ -0,0 +1,112 @@
+"""
+Visualización de bifurcaciones de codimensión 2 en sistemas dinámicos 1D
+Mapa de regiones en el plano (r, h) con las curvas de pliegue superpuestas
+"""
+
+import numpy as np
+import matplotlib
+import matplotlib.pyplot as plt
+from matplotlib.colors import BoundaryNorm, ListedColormap
+from matplotlib.figure import Figure
+from scipy import ndimage
+from typing import Tuple
+from core.bifurcacion_codim2 import AnalizadorBifurcacionCodim2
+
+
+class VisualizadorBifurcacionCodim2:
+    """Clase para visualizar el mapa de regiones de f(x, r, h)"""
+
+    def __init__(self, analizador: AnalizadorBifurcacionCodim2):
+        """
+        Inicializa el visualizador
+
+        Args:
+            analizador: Instancia de AnalizadorBifurcacionCodim2
+        """
+        self.analizador = analizador
+
+    def graficar_mapa_regiones(self, r_range: Tuple[float, float], h_range: Tuple[float, float],
+                               x_range: Tuple[float, float], fig: Figure = None,
+                               resolucion: Tuple[int, int] = (200, 200)) -> Figure:
+        """
+        Genera el mapa de regiones en (r, h)
+
+        Cada región se colorea y se rotula con su número de equilibrios; las
+        curvas de pliegue se dibujan como una única línea y las cúspides como
+        un único conjunto de marcadores.
+
+        Args:
+            r_range: Rango de r (r_min, r_max)
+            h_range: Rango de h (h_min, h_max)
+            x_range: Intervalo de estados donde se cuentan equilibrios
+            fig: Figura de matplotlib (opcional)
+            resolucion: Puntos (n_r, n_h) del mapa
+
+        Returns:
+            Figura de matplotlib
+        """
+        if fig is None:
+            fig = plt.figure(figsize=(8, 6))
+
+        ax = fig.add_subplot(111)
+        nombre_h = str(self.analizador.h)
+
+        mapa = self.analizador.mapa_regiones(r_range, h_range, x_range, resolucion)
+        conteo = mapa['conteo']
+        maximo = int(conteo.max()) if conteo.size else 0
+
+        colores = matplotlib.colormaps['Pastel1'](np.arange(maximo + 1) % 9)
+        norma = BoundaryNorm(np.arange(-0.5, maximo + 1.5), maximo + 1)
+        imagen = ax.imshow(conteo, origin='lower', aspect='auto', interpolation='nearest',
+                           extent=(r_range[0], r_range[1], h_range[0], h_range[1]),
+                           cmap=ListedColormap(colores), norm=norma)
+        barra = fig.colorbar(imagen, ax=ax, ticks=np.arange(maximo + 1))
+        barra.set_label('Número de equilibrios', fontsize=10)
+
+        self._rotular_regiones(ax, mapa)
+
+        resultado = self.analizador.curvas_pliegue(r_range, h_range, x_range)
+        if resultado['curvas']:
+            separador = np.full((1, 3), np.nan)
+            trazos = np.vstack([np.vstack([c, separador]) for c in resultado['curvas']])
+            ax.plot(trazos[:, 1], trazos[:, 2], 'k-', linewidth=2, label='Pliegue (f = f\' = 0)')
+        if resultado['cuspides']:
+            ax.plot([c['r'] for c in resultado['cuspides']], [c['h'] for c in resultado['cuspides']],
+                    'r*', markersize=14, linestyle='none', label='Cúspide', zorder=5)
+
+        ax.set_xlim(r_range)
+        ax.set_ylim(h_range)
+        ax.set_xlabel('Parámetro r', fontsize=12)
+        ax.set_ylabel(f'Parámetro {nombre_h}', fontsize=12)
+        ax.set_title('Mapa de Regiones (codimensión 2)', fontsize=14, fontweight='bold')
+        if resultado['curvas'] or resultado['cuspides']:
+            ax.legend(loc='best', fontsize=9)
+
+        return fig
+
+    def _rotular_regiones(self, ax, mapa: dict, fraccion_minima: float = 0.01):
+        """
+        Escribe el número de equilibrios dentro de cada región conexa
+
+        El rótulo va en el punto más alejado del borde de la región, que a
+        diferencia del centro de masa siempre cae dentro aunque no sea convexa.
+
+        Args:
+            ax: Eje de matplotlib
+            mapa: Diccionario devuelto por mapa_regiones
+            fraccion_minima: Regiones más chicas que esta fracción no se rotulan
+        """
+        conteo = mapa['conteo']
+        minimo = fraccion_minima * conteo.size
+        for valor in np.unique(conteo):
+            etiquetas, n = ndimage.label(conteo == valor)
+            for etiqueta in range(1, n + 1):
+                region = etiquetas == etiqueta
+                if np.count_nonzero(region) < minimo:
+                    continue
+                # El borde de la imagen cuenta como frontera (rótulo siempre visible)
+                distancia = ndimage.distance_transform_edt(np.pad(region, 1))[1:-1, 1:-1]
+                fila, columna = np.unravel_index(np.argmax(distancia), region.shape)
+                ax.text(mapa['r'][columna], mapa['h'][fila], str(valor), ha='center', va='center',
+                        fontsize=14, fontweight='bold',
+                        bbox=dict(boxstyle='circle', facecolor='white', alpha=0.8))
@@ -0,0 +1,135 @@
+"""
+Caché de trayectorias integradas
+Evita reintegrar al redibujar: solo se integra de nuevo cuando la vista crece
+"""
+
+from collections import OrderedDict
+from core.trayectoria import Trayectoria
+from visualization.plotter import integrate_trajectory_limited, calcular_caja_integracion
+
+
+class CacheTrayectorias:
+    """
+    Caché LRU de trayectorias indexada por (sistema, semilla, dirección)
+
+    Cada entrada guarda la Trayectoria y la caja de integración cubierta. Si
+    una vista nueva cae dentro de esa caja se reutiliza tal cual; si la excede
+    y la integración había terminado por salir de los límites, se continúa
+    desde el último punto almacenado en lugar de empezar de cero.
+    """
+
+    MAX_ENTRADAS = 200
+    DECIMALES_SEMILLA = 9
+
+    def __init__(self, max_entradas=None):
+        """
+        Parámetros:
+        - max_entradas: cantidad de trayectorias retenidas antes de descartar las más viejas
+        """
+        self.max_entradas = max_entradas or self.MAX_ENTRADAS
+        self._entradas = OrderedDict()
+        self._semillas = {}
+        self.integraciones = 0
+
+    def _clave(self, sistema, semilla, direccion):
+        semilla = (round(float(semilla[0]), self.DECIMALES_SEMILLA),
+                   round(float(semilla[1]), self.DECIMALES_SEMILLA))
+        return sistema.clave_cache(), semilla, direccion
+
+    @staticmethod
+    def _contiene(caja, otra):
+        """True si `caja` contiene completamente a `otra`"""
+        return (caja[0] <= otra[0] and caja[1] >= otra[1] and
+                caja[2] <= otra[2] and caja[3] >= otra[3])
+
+    def obtener(self, sistema, semilla, direccion, xlim, ylim, max_steps=1000):
+        """
+        Retorna la trayectoria para la vista dada, integrando solo lo necesario
+
+        Parámetros:
+        - sistema: SistemaDinamico2D
+        - semilla: condición inicial (x0, y0)
+        - direccion: 1 (adelante) o -1 (atrás)
+        - xlim, ylim: límites de la vista actual
+        - max_steps: pasos máximos por integración (o por extensión)
+
+        Retorna: Trayectoria
+        """
+        clave = self._clave(sistema, semilla, direccion)
+        caja = calcular_caja_integracion(xlim, ylim)
+        entrada = self._entradas.get(clave)
+
+        if entrada is None:
+            trayectoria = integrate_trajectory_limited(
+                sistema, semilla, direccion=direccion, max_steps=max_steps,
+                xlim=xlim, ylim=ylim
+            )
+            self.integraciones += 1
+            entrada = {'trayectoria': trayectoria, 'caja': caja}
+            self._entradas[clave] = entrada
+            self._registrar_semilla(clave)
+        else:
+            self._entradas.move_to_end(clave)
+            trayectoria = entrada['trayectoria']
+            # Solo se extiende si la curva se cortó por la caja y la vista creció
+            if (trayectoria.motivo_fin == Trayectoria.MOTIVO_FUERA_LIMITES and
+                    not self._contiene(entrada['caja'], caja)):
+                caja = (min(caja[0], entrada['caja'][0]), max(caja[1], entrada['caja'][1]),
+                        min(caja[2], entrada['caja'][2]), max(caja[3], entrada['caja'][3]))
+                # La caja de integración es 3x la vista: se pasa la vista equivalente
+                ancho, alto = (caja[1] - caja[0]) / 3, (caja[3] - caja[2]) / 3
+                integrate_trajectory_limited(
+                    sistema, semilla, max_steps=max_steps,
+                    xlim=(caja[0] + ancho, caja[1] - ancho),
+                    ylim=(caja[2] + alto, caja[3] - alto),
+                    trayectoria=trayectoria
+                )
+                self.integraciones += 1
+                entrada['caja'] = caja
+
+        self._recortar()
+        return trayectoria
+
+    def _registrar_semilla(self, clave):
+        clave_sistema, semilla, _ = clave
+        semillas = self._semillas.setdefault(clave_sistema, [])
+        if semilla not in semillas:
+            semillas.append(semilla)
+
+    def _recortar(self):
+        """Descarta las entradas menos usadas si se supera el máximo"""
+        while len(self._entradas) > self.max_entradas:
+            clave, _ = self._entradas.popitem(last=False)
+            self._olvidar_semilla(clave)
+
+    def _olvidar_semilla(self, clave):
+        """Quita la semilla de la lista si ya no queda ninguna dirección cacheada"""
+        clave_sistema, semilla, _ = clave
+        if any(c[0] == clave_sistema and c[1] == semilla for c in self._entradas):
+            return
+        semillas = self._semillas.get(clave_sistema, [])
+        if semilla in semillas:
+            semillas.remove(semilla)
+        if not semillas:
+            self._semillas.pop(clave_sistema, None)
+
+    def semillas(self, sistema):
+        """Semillas registradas para el sistema, en el orden en que se agregaron"""
+        return list(self._semillas.get(sistema.clave_cache(), []))
+
+    def limpiar(self, sistema=None):
+        """
+        Olvida las trayectorias de un sistema (o todas si sistema es None)
+        """
+        if sistema is None:
+            self._entradas.clear()
+            self._semillas.clear()
+            return
+
+        clave_sistema = sistema.clave_cache()
+        self._semillas.pop(clave_sistema, None)
+        for clave in [c for c in self._entradas if c[0] == clave_sistema]:
+            del self._entradas[clave]
+
+    def __len__(self):
+        return len(self._entradas)
@@ -0,0 +1,62 @@
+"""
+Mapas de clasificación local y de divergencia
+Una imagen categórica por tipo de linealización y un mapa de ∇·f con color divergente
+"""
+
+import numpy as np
+from matplotlib.colors import ListedColormap, BoundaryNorm, TwoSlopeNorm
+from matplotlib.patches import Patch
+from core.clasificacion import NOMBRES_CLASES
+
+COLORES_CLASES = ('#d62728', '#2ca02c', '#ff7f0e', '#1f77b4', '#9467bd', '#17becf', '#7f7f7f')
+
+
+def graficar_mapa_clasificacion(ax, mapa, leyenda=True):
+    """
+    Imagen categórica de las clases de clasificar_malla
+
+    Parámetros:
+    - ax: eje de matplotlib (se limpia)
+    - mapa: dict de clasificar_malla
+    - leyenda: agregar una entrada por clase presente
+
+    Retorna: AxesImage
+    """
+    ax.clear()
+    n = len(NOMBRES_CLASES)
+    imagen = ax.imshow(mapa['clases'], origin='lower', aspect='auto', interpolation='nearest',
+                       extent=mapa['extent'], cmap=ListedColormap(COLORES_CLASES),
+                       norm=BoundaryNorm(np.arange(n + 1) - 0.5, n))
+    if leyenda:
+        presentes = np.flatnonzero(np.bincount(mapa['clases'].ravel(), minlength=n))
+        ax.legend(handles=[Patch(color=COLORES_CLASES[k], label=NOMBRES_CLASES[k]) for k in presentes],
+                  loc='upper right', fontsize=8, framealpha=0.85)
+    ax.set_xlabel('x', fontsize=12)
+    ax.set_ylabel('y', fontsize=12)
+    ax.set_title('Linealización local', fontsize=12, fontweight='bold')
+    return imagen
+
+
+def graficar_mapa_divergencia(ax, mapa, cmap='RdBu_r'):
+    """
+    Divergencia ∇·f = tr(J): rojo expande áreas, azul las contrae
+
+    Parámetros:
+    - ax: eje de matplotlib (se limpia)
+    - mapa: dict de clasificar_malla
+    - cmap: mapa de colores divergente
+
+    Retorna: AxesImage (para colorbar)
+    """
+    ax.clear()
+    traza = mapa['traza']
+    finitos = traza[np.isfinite(traza)]
+    limite = float(np.max(np.abs(finitos))) if finitos.size else 0.0
+    limite = limite or 1.0
+    imagen = ax.imshow(traza, origin='lower', aspect='auto', interpolation='nearest',
+                       extent=mapa['extent'], cmap=cmap,
+                       norm=TwoSlopeNorm(vcenter=0.0, vmin=-limite, vmax=limite))
+    ax.set_xlabel('x', fontsize=12)
+    ax.set_ylabel('y', fontsize=12)
+    ax.set_title('Divergencia ∇·f = tr J', fontsize=12, fontweight='bold')
+    return imagen
@@ -0,0 +1,43 @@
+"""
+Visualización de conjuntos estocásticos
+La distribución de las trayectorias se dibuja como imagen de densidad en cada instante
+"""
+
+from visualization.raster import mostrar_densidad
+
+
+def graficar_conjunto_estocastico(ax, histograma, artistas=None, t=None, resumen=None, cmap='viridis'):
+    """
+    Dibuja (o actualiza) la densidad del conjunto en un instante
+
+    Parámetros:
+    - ax: eje de matplotlib
+    - histograma: HistogramaDensidad del instante
+    - artistas: par (AxesImage, Line2D de la media) a reutilizar entre cuadros
+    - t: instante representado (para el título)
+    - resumen: dict de IntegradorEstocastico.histogramas (marca la media)
+    - cmap: mapa de colores
+
+    Retorna: (imagen, media) para la siguiente actualización
+    """
+    if artistas is None:
+        imagen = mostrar_densidad(ax, histograma, cmap=cmap)
+        media, = ax.plot([], [], 'r+', markersize=12, markeredgewidth=2)
+        ax.set_xlim(histograma.xlim)
+        ax.set_ylim(histograma.ylim)
+        ax.set_xlabel('x', fontsize=12)
+        ax.set_ylabel('y', fontsize=12)
+    else:
+        imagen, media = artistas
+        mostrar_densidad(ax, histograma, imagen=imagen)
+
+    titulo = 'Conjunto estocástico'
+    if t is not None:
+        titulo += f'  (t = {t:.3g})'
+    detalle = f'{histograma.total:,} trayectorias en la vista'
+    if resumen is not None:
+        media.set_data([resumen['media'][0]], [resumen['media'][1]])
+        if resumen['divergentes']:
+            detalle += f', {resumen["divergentes"]:,} divergentes'
+    ax.set_title(f'{titulo}\n{detalle}', fontsize=11, fontweight='bold')
+    return imagen, media
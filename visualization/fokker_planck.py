@@ -0,0 +1,41 @@
+"""
+Visualización de densidades de Fokker–Planck
+"""
+
+import numpy as np
+
+
+def graficar_densidad(ax, modelo, P, imagen=None, t=None, titulo=None, cmap='magma'):
+    """
+    Dibuja (o actualiza) una densidad (ny, nx) sobre la malla del modelo
+
+    Parámetros:
+    - ax: eje de matplotlib
+    - modelo: FokkerPlanck2D (aporta extent y momentos)
+    - P: densidad (ny, nx)
+    - imagen: AxesImage a reutilizar entre cuadros de la animación
+    - t: instante representado (para el título)
+    - titulo: título alternativo (ej. 'Densidad estacionaria')
+    - cmap: mapa de colores
+
+    Retorna: AxesImage
+    """
+    maximo = float(np.max(P)) or 1.0
+    if imagen is None:
+        imagen = ax.imshow(P, origin='lower', aspect='auto', interpolation='bilinear',
+                           cmap=cmap, extent=modelo.extent, vmin=0.0, vmax=maximo)
+        ax.set_xlim(modelo.xlim)
+        ax.set_ylim(modelo.ylim)
+        ax.set_xlabel('x', fontsize=12)
+        ax.set_ylabel('y', fontsize=12)
+    else:
+        imagen.set_data(P)
+        imagen.set_clim(0.0, maximo)
+
+    momentos = modelo.momentos(P)
+    media = momentos['media']
+    if titulo is None:
+        titulo = 'Densidad de Fokker–Planck' + (f'  (t = {t:.3g})' if t is not None else '')
+    ax.set_title(f'{titulo}\nmedia = ({media[0]:.3g}, {media[1]:.3g}), masa = {momentos["masa"]:.6f}',
+                 fontsize=11, fontweight='bold')
+    return imagen
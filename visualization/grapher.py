@@ -8,6 +8,7 @@ from visualization.math_utils import (
     calcular_campo_vectorial, normalizar_vectores, 
     encontrar_limites_automaticos
 )
+from visualization.artistas import dibujar_vectores_lote, marcar_puntos_lote
 
 
 class Grapher:
@@ -21,6 +22,14 @@ class Grapher:
         self.sistema = sistema
         self.xlim = self.DEFAULT_XLIM
         self.ylim = self.DEFAULT_YLIM
+        
+        # Artistas que actualizar_parametros modifica en el lugar
+        self.quiver = None
+        self.malla = None
+        self.marcador_equilibrios = None
+        self.equilibrios = []
+        self.nuclinas = []
+        self.limites_vista = None
     
     def establecer_limites(self, xlim=None, ylim=None):
         """Establece los límites de la visualización"""
@@ -57,9 +66,12 @@ class Grapher:
         self._dibujar_campo_direcciones(ax, xlim_extended, ylim_extended, n_puntos_extended)
         
         # Dibujar nuclinas si está activado
+        self.nuclinas = []
         if mostrar_nuclinas:
             self._dibujar_nuclinas(ax, xlim, ylim)
         
+        self.limites_vista = (tuple(xlim), tuple(ylim))
+        
         self._dibujar_autovectores(ax)
         self._marcar_puntos_equilibrio(ax, xlim, ylim)
         self._configurar_ejes(ax, xlim, ylim)
@@ -74,7 +86,8 @@ class Grapher:
         U, V = calcular_campo_vectorial(self.sistema, X, Y)
         U_norm, V_norm, M = normalizar_vectores(U, V)
         
-        ax.quiver(X, Y, U_norm, V_norm, M, cmap='viridis', alpha=0.6)
+        self.malla = (X, Y)
+        self.quiver = ax.quiver(X, Y, U_norm, V_norm, M, cmap='viridis', alpha=0.6)
     
     def _dibujar_nuclinas(self, ax, xlim, ylim, n_puntos=100):
         """Dibuja las nuclinas (isolíneas donde dx/dt=0 y dy/dt=0)"""
@@ -89,6 +102,7 @@ class Grapher:
         try:
             contour_u = ax.contour(X, Y, U, levels=[0], colors='red', 
                                    linestyles='--', linewidths=2, alpha=0.7)
+            self.nuclinas.append(contour_u)
             # Etiqueta para la primera nuclina
             if len(contour_u.collections) > 0:
                 ax.plot([], [], 'r--', linewidth=2, label='dx/dt = 0', alpha=0.7)
@@ -99,6 +113,7 @@ class Grapher:
         try:
             contour_v = ax.contour(X, Y, V, levels=[0], colors='blue', 
                                    linestyles='--', linewidths=2, alpha=0.7)
+            self.nuclinas.append(contour_v)
             # Etiqueta para la segunda nuclina
             if len(contour_v.collections) > 0:
                 ax.plot([], [], 'b--', linewidth=2, label='dy/dt = 0', alpha=0.7)
@@ -117,30 +132,30 @@ class Grapher:
         if not si_dibujar:
             return
         
-        for i in range(2):
-            v = self.sistema.autovectores[:, i].real
-            if abs(self.sistema.autovalores[i]) > 1e-10:
-                scale = 2.5
-                ax.arrow(0, 0, scale*v[0], scale*v[1], 
-                        head_width=0.2, head_length=0.15, 
-                        fc='red', ec='red', linewidth=2, alpha=0.8)
-                ax.arrow(0, 0, -scale*v[0], -scale*v[1], 
-                        head_width=0.2, head_length=0.15, 
-                        fc='red', ec='red', linewidth=2, alpha=0.8)
+        # Ambos sentidos de cada autovector no nulo en un único quiver
+        scale = 2.5
+        vectores = [
+            signo * scale * self.sistema.autovectores[:, i].real
+            for i in range(2) if abs(self.sistema.autovalores[i]) > 1e-10
+            for signo in (1, -1)
+        ]
+        if vectores:
+            dibujar_vectores_lote(ax, np.zeros((len(vectores), 2)), vectores,
+                                  color='red', width=3.0)
     
     def _marcar_puntos_equilibrio(self, ax, xlim, ylim):
-        """Marca puntos de equilibrio"""
+        """Marca puntos de equilibrio (un solo artista para todos)"""
         puntos_eq = self.sistema.encontrar_puntos_equilibrio(xlim, ylim)
+        self.equilibrios = list(puntos_eq)
         
+        estilo = dict(markersize=12, markeredgecolor='white', markeredgewidth=2, zorder=5)
         if puntos_eq:
-            for i, (px, py) in enumerate(puntos_eq):
-                kwargs = {
-                    'markersize': 12, 'markeredgecolor': 'white',
-                    'markeredgewidth': 2, 'zorder': 5
-                }
-                if i == 0:
-                    kwargs['label'] = 'Punto de equilibrio'
-                ax.plot(px, py, 'ko', **kwargs)
+            xs, ys = zip(*puntos_eq)
+            self.marcador_equilibrios = marcar_puntos_lote(ax, xs, ys, 'ko',
+                                                           label='Punto de equilibrio', **estilo)
+        else:
+            # Marcador vacío para que actualizar_parametros pueda llenarlo
+            self.marcador_equilibrios, = ax.plot([], [], 'ko', linestyle='none', **estilo)
     
     def _configurar_ejes(self, ax, xlim, ylim):
         """Configura apariencia de los ejes"""
@@ -172,3 +187,53 @@ class Grapher:
         
         ax.set_title(titulo, fontsize=12, fontweight='bold')
         ax.legend(loc='upper right')
+    
+    def artistas_dinamicos(self):
+        """Artistas que cambian en actualizar_parametros (para redibujar con blit)"""
+        return [a for a in [self.quiver, self.marcador_equilibrios, *self.nuclinas] if a is not None]
+    
+    def admite_actualizacion(self, ax):
+        """True si los artistas de la última crear_grafica siguen en el eje"""
+        return self.quiver is not None and self.quiver in ax.collections
+    
+    def actualizar_parametros(self, ax, sistema):
+        """
+        Cambia el sistema y actualiza el gráfico en el lugar (modo en vivo)
+        
+        Reutiliza la malla y los artistas de crear_grafica: el campo se
+        reevalúa con la función compilada y se pasa a set_UVC, los
+        equilibrios se refinan con Newton desde los anteriores y las
+        nuclinas (si estaban visibles) se recalculan. No se limpia el eje.
+        
+        Parámetros:
+        - ax: eje donde se llamó a crear_grafica
+        - sistema: SistemaDinamico2D con la misma definición y otros parámetros
+        """
+        if not self.admite_actualizacion(ax):
+            raise ValueError("Llame primero a crear_grafica sobre este eje")
+        self.sistema = sistema
+        
+        X, Y = self.malla
+        U, V = calcular_campo_vectorial(sistema, X, Y)
+        U_norm, V_norm, M = normalizar_vectores(U, V)
+        self.quiver.set_UVC(U_norm, V_norm, M)
+        
+        xlim, ylim = self.limites_vista
+        # Semillas: equilibrios anteriores más una malla gruesa para captar los que nacen
+        gx, gy = np.meshgrid(np.linspace(*xlim, 5), np.linspace(*ylim, 5))
+        semillas = np.vstack([np.reshape(self.equilibrios, (-1, 2)),
+                              np.column_stack([gx.ravel(), gy.ravel()])])
+        self.equilibrios = sistema.refinar_equilibrios(semillas, xlim, ylim)
+        xs, ys = zip(*self.equilibrios) if self.equilibrios else ([], [])
+        self.marcador_equilibrios.set_data(xs, ys)
+        
+        if self.nuclinas:
+            for contorno in self.nuclinas:
+                contorno.remove()
+            Xn, Yn = np.meshgrid(np.linspace(*xlim, 100), np.linspace(*ylim, 100))
+            Un, Vn = calcular_campo_vectorial(sistema, Xn, Yn)
+            self.nuclinas = [
+                ax.contour(Xn, Yn, campo, levels=[0], colors=color, linestyles='--',
+                           linewidths=2, alpha=0.7)
+                for campo, color in ((Un, 'red'), (Vn, 'blue'))
+            ]
@@ -3,6 +3,7 @@ Visualización del sistema Lotka-Volterra
 """
 
 import numpy as np
+from core.trayectoria import decimar_douglas_peucker
 from visualization.math_utils import normalizar_vectores
 
 
@@ -11,12 +12,20 @@ class GrapherLotkaVolterra:
     
     DEFAULT_XLIM = (0, 5)
     DEFAULT_YLIM = (0, 5)
+    PUNTOS_POR_UNIDAD_TIEMPO = 50
     
     def __init__(self, sistema):
         """Inicializa el graficador"""
         self.sistema = sistema
         self.xlim = self.DEFAULT_XLIM
         self.ylim = self.DEFAULT_YLIM
+        
+        # Artistas que actualizar_parametros modifica en el lugar
+        self.quiver = None
+        self.malla = None
+        self.marcador_interior = None
+        self.isoclinas = None
+        self.limites_vista = None
     
     def crear_grafica(self, ax, xlim=None, ylim=None, n_puntos=15):
         """Crea gráfica completa del sistema"""
@@ -30,6 +39,7 @@ class GrapherLotkaVolterra:
         self._dibujar_isoclinas(ax, xlim, ylim)
         self._configurar_ejes(ax, xlim, ylim)
         self._agregar_titulo(ax)
+        self.limites_vista = (tuple(xlim), tuple(ylim))
     
     def _dibujar_campo_vectorial(self, ax, xlim, ylim, n_puntos):
         """Dibuja el campo de direcciones"""
@@ -40,7 +50,8 @@ class GrapherLotkaVolterra:
         U, V = self.sistema.campo_vectorial(X, Y)
         U_norm, V_norm, M = normalizar_vectores(U, V)
         
-        ax.quiver(X, Y, U_norm, V_norm, M, cmap='plasma', alpha=0.6)
+        self.malla = (X, Y)
+        self.quiver = ax.quiver(X, Y, U_norm, V_norm, M, cmap='plasma', alpha=0.6)
     
     def _marcar_equilibrios(self, ax, xlim, ylim):
         """Marca los puntos de equilibrio"""
@@ -49,24 +60,25 @@ class GrapherLotkaVolterra:
             ax.plot(0, 0, 'rx', markersize=12, markeredgewidth=2, 
                    label='Extinción (0,0)', zorder=5)
         
-        # Equilibrio interior
+        # Equilibrio interior (se crea siempre; fuera de la vista queda oculto)
         eq = self.sistema.equilibrio_interior
-        if xlim[0] <= eq[0] <= xlim[1] and ylim[0] <= eq[1] <= ylim[1]:
-            ax.plot(eq[0], eq[1], 'ko', markersize=10, 
-                   markeredgecolor='white', markeredgewidth=2,
-                   label=f'Centro ({eq[0]:.2f}, {eq[1]:.2f})', zorder=5)
+        self.marcador_interior, = ax.plot(eq[0], eq[1], 'ko', markersize=10, 
+                                          markeredgecolor='white', markeredgewidth=2,
+                                          label=f'Centro ({eq[0]:.2f}, {eq[1]:.2f})', zorder=5)
+        self.marcador_interior.set_visible(xlim[0] <= eq[0] <= xlim[1] and ylim[0] <= eq[1] <= ylim[1])
     
     def _dibujar_isoclinas(self, ax, xlim, ylim):
         """Dibuja las isoclinas (líneas nulas)"""
         y_iso_presa = self.sistema.alpha / self.sistema.beta
-        if ylim[0] <= y_iso_presa <= ylim[1]:
-            ax.axhline(y=y_iso_presa, color='blue', linestyle='--', 
-                      alpha=0.5, linewidth=1.5, label='Isoclina presas')
-        
         x_iso_depr = self.sistema.delta / self.sistema.gamma
-        if xlim[0] <= x_iso_depr <= xlim[1]:
-            ax.axvline(x=x_iso_depr, color='green', linestyle='--', 
-                      alpha=0.5, linewidth=1.5, label='Isoclina depredadores')
+        
+        iso_presa = ax.axhline(y=y_iso_presa, color='blue', linestyle='--', 
+                               alpha=0.5, linewidth=1.5, label='Isoclina presas')
+        iso_depr = ax.axvline(x=x_iso_depr, color='green', linestyle='--', 
+                              alpha=0.5, linewidth=1.5, label='Isoclina depredadores')
+        iso_presa.set_visible(ylim[0] <= y_iso_presa <= ylim[1])
+        iso_depr.set_visible(xlim[0] <= x_iso_depr <= xlim[1])
+        self.isoclinas = (iso_presa, iso_depr)
     
     def _configurar_ejes(self, ax, xlim, ylim):
         """Configura los ejes"""
@@ -78,21 +90,66 @@ class GrapherLotkaVolterra:
     
     def _agregar_titulo(self, ax):
         """Agrega título con parámetros"""
+        ax.set_title(self._titulo(), fontsize=12, fontweight='bold')
+        ax.legend(loc='upper right', fontsize=9)
+    
+    def _titulo(self):
         titulo = 'Sistema Lotka-Volterra: Depredador-Presa\n'
         titulo += f'α={self.sistema.alpha:.2f}, β={self.sistema.beta:.3f}, '
         titulo += f'γ={self.sistema.gamma:.3f}, δ={self.sistema.delta:.2f}'
-        ax.set_title(titulo, fontsize=12, fontweight='bold')
-        ax.legend(loc='upper right', fontsize=9)
+        return titulo
+    
+    def admite_actualizacion(self, ax):
+        """True si los artistas de la última crear_grafica siguen en el eje"""
+        return self.quiver is not None and self.quiver in ax.collections
+    
+    def actualizar_parametros(self, ax, sistema):
+        """
+        Cambia los parámetros y actualiza el gráfico en el lugar
+        
+        El campo se reevalúa sobre la misma malla (set_UVC) y se mueven el
+        equilibrio interior y las isoclinas, sin limpiar el eje.
+        
+        Parámetros:
+        - ax: eje donde se llamó a crear_grafica
+        - sistema: SistemaLotkaVolterra con los nuevos parámetros
+        """
+        if not self.admite_actualizacion(ax):
+            raise ValueError("Llame primero a crear_grafica sobre este eje")
+        self.sistema = sistema
+        (xmin, xmax), (ymin, ymax) = self.limites_vista
+        
+        X, Y = self.malla
+        U_norm, V_norm, M = normalizar_vectores(*sistema.campo_vectorial(X, Y))
+        self.quiver.set_UVC(U_norm, V_norm, M)
+        
+        eq = sistema.equilibrio_interior
+        self.marcador_interior.set_data([eq[0]], [eq[1]])
+        self.marcador_interior.set_label(f'Centro ({eq[0]:.2f}, {eq[1]:.2f})')
+        self.marcador_interior.set_visible(xmin <= eq[0] <= xmax and ymin <= eq[1] <= ymax)
+        
+        iso_presa, iso_depr = self.isoclinas
+        y_iso, x_iso = sistema.alpha / sistema.beta, sistema.delta / sistema.gamma
+        iso_presa.set_ydata([y_iso, y_iso])
+        iso_depr.set_xdata([x_iso, x_iso])
+        iso_presa.set_visible(ymin <= y_iso <= ymax)
+        iso_depr.set_visible(xmin <= x_iso <= xmax)
+        
+        ax.set_title(self._titulo(), fontsize=12, fontweight='bold')
     
     def dibujar_trayectoria(self, ax, estado_inicial, t_final=100, color='red'):
         """Dibuja una trayectoria específica sobre la gráfica"""
-        t, trayectoria = self.sistema.integrar_trayectoria(estado_inicial, t_final)
+        # Muestreo proporcional a la duración; la decimación por curvatura
+        # deja sólo los vértices necesarios para graficar
+        n_puntos = max(1000, int(self.PUNTOS_POR_UNIDAD_TIEMPO * t_final))
+        t, trayectoria = self.sistema.integrar_trayectoria(estado_inicial, t_final, n_puntos)
         
-        x = trayectoria[:, 0]
-        y = trayectoria[:, 1]
+        extension = np.ptp(trayectoria, axis=0)
+        tolerancia = 1e-3 * float(np.hypot(extension[0], extension[1]))
+        puntos = decimar_douglas_peucker(trayectoria, tolerancia)
         
-        ax.plot(x, y, color=color, alpha=0.7, linewidth=2, label='Trayectoria')
-        ax.plot(x[0], y[0], 'go', markersize=10, markeredgecolor='white',
+        ax.plot(puntos[:, 0], puntos[:, 1], color=color, alpha=0.7, linewidth=2, label='Trayectoria')
+        ax.plot(puntos[0, 0], puntos[0, 1], 'go', markersize=10, markeredgecolor='white',
                markeredgewidth=2, label='Inicio', zorder=5)
-        ax.plot(x[-1], y[-1], 'bo', markersize=10, markeredgecolor='white',
+        ax.plot(puntos[-1, 0], puntos[-1, 1], 'bo', markersize=10, markeredgecolor='white',
                markeredgewidth=2, label='Fin', zorder=5)
@@ -0,0 +1,87 @@
+"""
+Visualización de exponentes de Lyapunov
+Convergencia de la estimación y mapas sobre parámetros
+"""
+
+import numpy as np
+from matplotlib.colors import TwoSlopeNorm
+
+
+def graficar_convergencia_lyapunov(ax, resultado):
+    """
+    Estimación acumulada λ(t) de cada miembro del conjunto y su media
+
+    Parámetros:
+    - ax: eje de matplotlib (se limpia)
+    - resultado: dict de EstimadorLyapunov.estimar
+    """
+    ax.clear()
+    tiempos = resultado['tiempos']
+    historia = resultado['historia']
+
+    # Todos los miembros en un único Line2D separado por NaN
+    n = historia.shape[1]
+    ts = np.concatenate([np.append(tiempos, np.nan)] * n)
+    ls = np.concatenate([np.append(historia[:, i], np.nan) for i in range(n)])
+    ax.plot(ts, ls, color='gray', linewidth=0.8, alpha=0.6, label='Miembros')
+    with np.errstate(all='ignore'):
+        media = np.nanmean(np.where(np.isfinite(historia), historia, np.nan), axis=1)
+    ax.plot(tiempos, media, 'b-', linewidth=2, label='Media')
+    ax.axhline(0.0, color='k', linewidth=0.8, linestyle=':')
+
+    validos = np.isfinite(resultado['exponentes'])
+    error = np.nanmax(resultado['error_estandar'][validos]) if np.any(validos) else np.nan
+    convergidos = int(np.count_nonzero(resultado['convergido']))
+    ax.set_title(f"λ = {resultado['media']:.4f} ± {error:.4f}  "
+                 f"({convergidos}/{n} convergidos)", fontsize=11, fontweight='bold')
+    ax.set_xlabel('t')
+    ax.set_ylabel('λ(t)')
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=8, loc='best')
+
+
+def graficar_mapa_lyapunov(ax, mapa, colorbar_ax=None):
+    """
+    Mapa de λ sobre uno o dos parámetros
+
+    En 1D se dibuja λ contra el parámetro con las zonas caóticas (λ > 0)
+    sombreadas; en 2D una imagen con escala divergente centrada en 0.
+
+    Parámetros:
+    - ax: eje de matplotlib (se limpia)
+    - mapa: dict de EstimadorLyapunov.mapa
+    - colorbar_ax: eje opcional para la barra de color (mapas 2D)
+
+    Retorna: el artista principal (Line2D o AxesImage)
+    """
+    ax.clear()
+    exponentes = mapa['exponentes']
+
+    if mapa['y'] is None:
+        x = mapa['x']
+        artista, = ax.plot(x, exponentes, 'k.-', markersize=3, linewidth=1)
+        ax.fill_between(x, 0, np.where(exponentes > 0, exponentes, 0), color='red', alpha=0.3,
+                        label='Caótico (λ > 0)')
+        ax.axhline(0.0, color='k', linewidth=0.8, linestyle=':')
+        ax.set_xlabel(mapa['parametro_x'])
+        ax.set_ylabel('λ')
+        ax.grid(True, alpha=0.3)
+        ax.legend(fontsize=8, loc='best')
+    else:
+        finitos = exponentes[np.isfinite(exponentes)]
+        extremo = float(np.max(np.abs(finitos))) if finitos.size else 1.0
+        extremo = extremo or 1.0
+        # Cada valor de la malla queda en el centro de su píxel
+        dx = 0.5 * (mapa['x'][-1] - mapa['x'][0]) / max(len(mapa['x']) - 1, 1)
+        dy = 0.5 * (mapa['y'][-1] - mapa['y'][0]) / max(len(mapa['y']) - 1, 1)
+        artista = ax.imshow(exponentes, origin='lower', aspect='auto', interpolation='nearest',
+                            cmap='RdBu_r', norm=TwoSlopeNorm(0.0, -extremo, extremo),
+                            extent=(mapa['x'][0] - dx, mapa['x'][-1] + dx,
+                                    mapa['y'][0] - dy, mapa['y'][-1] + dy))
+        if colorbar_ax is not None:
+            colorbar_ax.figure.colorbar(artista, cax=colorbar_ax, label='λ')
+        ax.set_xlabel(mapa['parametro_x'])
+        ax.set_ylabel(mapa['parametro_y'])
+
+    ax.set_title('Mapa de Lyapunov', fontsize=11, fontweight='bold')
+    return artista
@@ -0,0 +1,92 @@
+"""
+Visualización de mapas discretos 1D
+Diagrama de órbitas como imagen de densidad y diagramas de telaraña
+"""
+
+import numpy as np
+from typing import Tuple
+from core.mapas import AnalizadorMapa
+from visualization.raster import mostrar_densidad
+
+
+class VisualizadorMapa:
+    """Clase para visualizar diagramas de órbitas y de telaraña"""
+
+    def __init__(self, analizador: AnalizadorMapa):
+        """
+        Inicializa el visualizador
+
+        Args:
+            analizador: Instancia de AnalizadorMapa
+        """
+        self.analizador = analizador
+        self.imagen = None
+
+    def graficar_diagrama_orbitas(self, ax, r_range: Tuple[float, float],
+                                  x_range: Tuple[float, float] = None, **opciones) -> dict:
+        """
+        Dibuja el diagrama de órbitas en ax
+
+        Si ya existe una imagen en el eje se reutiliza con set_data, de modo
+        que recalcular tras un zoom no agrega artistas.
+
+        Args:
+            ax: Eje de matplotlib
+            r_range: Rango de r (r_min, r_max)
+            x_range: Rango de x (opcional, por defecto el del atractor)
+            **opciones: Se pasan a AnalizadorMapa.diagrama_orbitas
+
+        Returns:
+            Diccionario devuelto por diagrama_orbitas
+        """
+        resultado = self.analizador.diagrama_orbitas(r_range, x_range, **opciones)
+        histograma = resultado['histograma']
+
+        if self.imagen is not None and self.imagen.axes is not ax:
+            self.imagen = None
+        self.imagen = mostrar_densidad(ax, histograma, imagen=self.imagen)
+
+        ax.set_xlim(histograma.xlim)
+        ax.set_ylim(histograma.ylim)
+        ax.set_xlabel('Parámetro r', fontsize=12)
+        ax.set_ylabel('x', fontsize=12)
+        ax.set_title(f'Diagrama de Órbitas ({histograma.total:,} puntos)'.replace(',', '.'),
+                     fontsize=13, fontweight='bold')
+        return resultado
+
+    def graficar_cobweb(self, ax, r_value: float, x0: float, n_iteraciones: int = 100,
+                        x_range: Tuple[float, float] = None):
+        """
+        Dibuja g(x, r), la diagonal y la telaraña desde x0
+
+        Args:
+            ax: Eje de matplotlib (se limpia)
+            r_value: Valor del parámetro
+            x0: Condición inicial
+            n_iteraciones: Número de iteraciones
+            x_range: Rango de x (por defecto, el que recorre la órbita)
+        """
+        ax.clear()
+        xs, ys = self.analizador.cobweb(r_value, x0, n_iteraciones)
+        finitos = np.isfinite(xs) & np.isfinite(ys)
+
+        if x_range is None:
+            valores = xs[finitos]
+            minimo, maximo = (valores.min(), valores.max()) if valores.size else (-1.0, 1.0)
+            margen = 0.1 * ((maximo - minimo) or 1.0)
+            x_range = (minimo - margen, maximo + margen)
+
+        x_curva = np.linspace(x_range[0], x_range[1], 500)
+        ax.plot(x_curva, self.analizador.evaluar(x_curva, r_value), 'k-', linewidth=1.8,
+                label='g(x, r)')
+        ax.plot(x_range, x_range, color='gray', linestyle='--', linewidth=1, label='x = y')
+        ax.plot(xs[finitos], ys[finitos], 'r-', linewidth=0.8, alpha=0.8, label='Órbita')
+        ax.plot([x0], [0.0], 'go', markersize=7, zorder=5)
+
+        ax.set_xlim(x_range)
+        ax.set_ylim(x_range)
+        ax.set_xlabel(r'$x_n$', fontsize=11)
+        ax.set_ylabel(r'$x_{n+1}$', fontsize=11)
+        ax.set_title(f'Telaraña (r = {r_value:.4f})', fontsize=12, fontweight='bold')
+        ax.grid(True, alpha=0.3)
+        ax.legend(loc='best', fontsize=8)
@@ -5,6 +5,7 @@ Aplicación de principio DRY
 
 import numpy as np
 from scipy.integrate import odeint
+from visualization.artistas import dibujar_flechas_lote
 
 
 def calcular_campo_vectorial(sistema, X, Y):
@@ -19,22 +20,42 @@ def calcular_campo_vectorial(sistema, X, Y):
     Returns:
         (U, V): componentes del campo
     """
-    U = np.zeros_like(X)
-    V = np.zeros_like(Y)
+    # Evaluación vectorizada en t=0 (el campo lineal se dibuja sin forzado)
+    return sistema.evaluar_campo(X, Y, 0, incluir_forzado=False)
+
+
+def calcular_campo_vectorial_temporal(sistema, X, Y, tiempos):
+    """
+    Calcula el campo en varios instantes como un único array 3D
     
-    for i in range(X.shape[0]):
-        for j in range(X.shape[1]):
-            if sistema.funcion_personalizada:
-                derivadas = sistema.sistema_ecuaciones([X[i,j], Y[i,j]], 0)
-            else:
-                # Sistema lineal: dx/dt = Ax
-                estado = np.array([X[i,j], Y[i,j]])
-                derivadas = sistema.A @ estado
-            
-            U[i,j] = derivadas[0]
-            V[i,j] = derivadas[1]
+    Args:
+        sistema: SistemaDinamico2D (con término forzado dependiente de t)
+        X, Y: malla de puntos (ny, nx)
+        tiempos: array (nt,) de instantes
     
-    return U, V
+    Returns:
+        (U, V): arrays (nt, ny, nx), incluyendo el término forzado
+    """
+    t = np.asarray(tiempos, dtype=float)[:, None, None]
+    return sistema.evaluar_campo(X[None, :, :], Y[None, :, :], t)
+
+
+def calcular_campo_barrido(sistema, X, Y, barrido):
+    """
+    Calcula el campo para todas las combinaciones de parámetros de una vez
+
+    Args:
+        sistema: SistemaDinamico2D con funciones personalizadas
+        X, Y: malla de puntos (ny, nx)
+        barrido: dict nombre -> array (P,) (ver separar_barridos)
+
+    Returns:
+        (U, V): arrays (P, ny, nx), sin término forzado
+    """
+    parametros = {nombre: np.asarray(valores, dtype=float)[:, None, None]
+                  for nombre, valores in barrido.items()}
+    return sistema.evaluar_campo(X[None, :, :], Y[None, :, :], 0,
+                                 incluir_forzado=False, parametros=parametros)
 
 
 def normalizar_vectores(U, V):
@@ -114,36 +135,49 @@ def encontrar_limites_automaticos(sistema, rango_busqueda=(-10, 10)):
     return xlim, ylim
 
 
-def agregar_flechas_trayectoria(ax, trayectoria, color='b', num_flechas=5, direccion=1):
+def calcular_flechas_trayectoria(trayectoria, num_flechas=5, direccion=1):
     """
-    Agrega flechas direccionales a una trayectoria
+    Calcula posición y dirección de las flechas de una trayectoria
     
     Args:
-        ax: eje de matplotlib
-        trayectoria: array de puntos
-        color: color de las flechas
+        trayectoria: array de puntos (N, 2)
         num_flechas: cantidad de flechas
         direccion: 1 para adelante, -1 para atrás (invierte las flechas)
+    
+    Returns:
+        (origenes, direcciones): arrays (K, 2)
     """
     if len(trayectoria) < 10:
-        return
+        return np.empty((0, 2)), np.empty((0, 2))
     
     num_flechas = min(num_flechas, len(trayectoria) // 20)
     if num_flechas < 1:
         num_flechas = 1
     
     indices = np.linspace(10, len(trayectoria)-10, num_flechas, dtype=int)
+    indices = indices[indices < len(trayectoria) - 1]
+    
+    puntos = np.asarray(trayectoria)
+    origenes = puntos[indices]
+    # Para direccion=-1 (atrás) la flecha apunta de idx+1 -> idx (invertida)
+    direcciones = (puntos[indices + 1] - puntos[indices]) * direccion
     
-    for idx in indices:
-        if idx < len(trayectoria) - 1:
-            # Para direccion=1 (adelante): flecha de idx -> idx+1
-            # Para direccion=-1 (atrás): flecha de idx+1 -> idx (invertida)
-            if direccion == 1:
-                x_start, y_start = trayectoria[idx]
-                x_end, y_end = trayectoria[idx + 1]
-            else:  # direccion == -1
-                x_start, y_start = trayectoria[idx + 1]
-                x_end, y_end = trayectoria[idx]
-            
-            ax.annotate('', xy=(x_end, y_end), xytext=(x_start, y_start),
-                       arrowprops=dict(arrowstyle='->', color=color, lw=2, alpha=0.8))
+    return origenes, direcciones
+
+
+def agregar_flechas_trayectoria(ax, trayectoria, color='b', num_flechas=5, direccion=1):
+    """
+    Agrega flechas direccionales a una trayectoria (un único quiver)
+    
+    Args:
+        ax: eje de matplotlib
+        trayectoria: array de puntos
+        color: color de las flechas
+        num_flechas: cantidad de flechas
+        direccion: 1 para adelante, -1 para atrás (invierte las flechas)
+    
+    Returns:
+        Quiver creado o None
+    """
+    origenes, direcciones = calcular_flechas_trayectoria(trayectoria, num_flechas, direccion)
+    return dibujar_flechas_lote(ax, origenes, direcciones, color)
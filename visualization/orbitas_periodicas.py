@@ -0,0 +1,75 @@
+"""
+Visualización de familias de órbitas periódicas
+Ciclos en el plano de fase y período, amplitud y multiplicadores vs parámetro
+"""
+
+import numpy as np
+import matplotlib
+from matplotlib.collections import LineCollection
+
+
+def graficar_continuacion_orbitas(fig, resultado, nombre_parametro='u'):
+    """
+    Dibuja una rama de ciclos calculada por ContinuacionOrbitas.continuar
+
+    Parámetros:
+    - fig: figura de matplotlib (se limpia)
+    - resultado: dict con 'rama' y 'motivo_fin'
+    - nombre_parametro: etiqueta del eje del parámetro
+
+    Retorna: dict con los ejes creados
+    """
+    fig.clear()
+    ax_fase = fig.add_subplot(2, 2, 1)
+    ax_periodo = fig.add_subplot(2, 2, 2)
+    ax_amplitud = fig.add_subplot(2, 2, 3)
+    ax_floquet = fig.add_subplot(2, 2, 4)
+    ejes = {'fase': ax_fase, 'periodo': ax_periodo, 'amplitud': ax_amplitud,
+            'floquet': ax_floquet}
+
+    rama = resultado['rama']
+    if not rama:
+        ax_fase.text(0.5, 0.5, 'No se encontró un ciclo límite\n(pruebe otra semilla)',
+                     ha='center', va='center', transform=ax_fase.transAxes)
+        return ejes
+
+    valores = np.array([o['parametro'] for o in rama])
+    periodos = np.array([o['periodo'] for o in rama])
+    amplitudes = np.array([max(o['amplitud']) for o in rama])
+    modulo = np.array([abs(o['multiplicadores'][1]) for o in rama])
+    estables = np.array([o['estable'] for o in rama])
+
+    # Todos los ciclos en una sola LineCollection coloreada por el parámetro
+    cmap = matplotlib.colormaps['viridis']
+    normalizado = (valores - valores.min()) / (np.ptp(valores) or 1.0)
+    coleccion = LineCollection([o['orbita'] for o in rama], colors=cmap(normalizado),
+                               linewidths=1.2)
+    ax_fase.add_collection(coleccion)
+    ax_fase.autoscale()
+    ax_fase.set_aspect('equal', adjustable='datalim')
+    ax_fase.set_xlabel('x₁')
+    ax_fase.set_ylabel('x₂')
+    ax_fase.set_title('Familia de ciclos', fontweight='bold')
+
+    for ax, datos, titulo in ((ax_periodo, periodos, 'Período T'),
+                              (ax_amplitud, amplitudes, 'Amplitud')):
+        ax.plot(valores, np.where(estables, datos, np.nan), 'b-', linewidth=2, label='Estable')
+        ax.plot(valores, np.where(estables, np.nan, datos), 'r--', linewidth=2, label='Inestable')
+        ax.set_xlabel(nombre_parametro)
+        ax.set_title(titulo, fontweight='bold')
+
+    ax_periodo.ticklabel_format(axis='y', useOffset=False)
+
+    ax_floquet.semilogy(valores, np.maximum(modulo, 1e-300), 'k.-')
+    ax_floquet.axhline(1.0, color='gray', linestyle=':')
+    ax_floquet.set_xlabel(nombre_parametro)
+    ax_floquet.set_title('|μ₂| (multiplicador de Floquet)', fontweight='bold')
+
+    for ax in ejes.values():
+        ax.grid(True, alpha=0.3)
+    ax_periodo.legend(fontsize=8)
+
+    fig.suptitle(f"Continuación en {nombre_parametro}: {resultado['motivo_fin'].replace('_', ' ')}",
+                 fontsize=11)
+    fig.tight_layout()
+    return ejes
@@ -0,0 +1,95 @@
+"""
+Plano traza–determinante
+Ubica familias de matrices 2×2 sobre las regiones de clasificación y las mueve sin redibujar la figura
+"""
+
+import numpy as np
+from core.clasificacion import NOMBRES_CLASES, NOMBRES_ESTABILIDAD
+from visualization.clasificacion import COLORES_CLASES
+
+
+class PlanoTrazaDeterminante:
+    """
+    Plano (tr, det) con la parábola det = tr²/4 y los ejes como fronteras
+
+    Los artistas se crean una vez; actualizar() solo cambia los datos del
+    barrido (una curva y un PathCollection coloreado por clase) y del punto
+    actual, de modo que un deslizador puede mover la familia en vivo.
+    """
+
+    def __init__(self, ax, limite_traza=4.0, limite_determinante=4.0):
+        """
+        Parámetros:
+        - ax: eje de matplotlib (se limpia)
+        - limite_traza, limite_determinante: semiancho inicial de la vista
+        """
+        self.ax = ax
+        ax.clear()
+        tr = np.linspace(-limite_traza, limite_traza, 400)
+        self.parabola, = ax.plot(tr, tr ** 2 / 4, 'k-', linewidth=1.2, label='det = tr²/4')
+        ax.axhline(0.0, color='k', linewidth=1.0)
+        self.centros, = ax.plot([0, 0], [0, limite_determinante], 'k--', linewidth=1.0)
+
+        rotulos = ((0.0, -0.6, 'Sillas'), (-0.75, 0.12, 'Nodos\nestables'), (0.75, 0.12, 'Nodos\ninestables'),
+                   (-0.35, 0.8, 'Espirales\nestables'), (0.35, 0.8, 'Espirales\ninestables'),
+                   (0.0, 0.95, 'Centros'))
+        for fx, fy, texto in rotulos:
+            ax.text(fx * limite_traza, fy * limite_determinante, texto, ha='center', va='center',
+                    fontsize=8, color='dimgray')
+
+        self.curva, = ax.plot([], [], '-', color='gray', linewidth=0.8, alpha=0.7)
+        self.puntos = ax.scatter([], [], s=18, zorder=4)
+        self.actual, = ax.plot([], [], 'o', markersize=11, markerfacecolor='none',
+                               markeredgecolor='black', markeredgewidth=2, zorder=5)
+        ax.set_xlim(-limite_traza, limite_traza)
+        ax.set_ylim(-limite_determinante, limite_determinante)
+        ax.set_xlabel('tr A', fontsize=12)
+        ax.set_ylabel('det A', fontsize=12)
+        ax.grid(True, alpha=0.3)
+
+    def actualizar(self, resultado, indice_actual=None, ajustar_vista=False):
+        """
+        Coloca una familia de matrices ya clasificada
+
+        Parámetros:
+        - resultado: dict de clasificar_matrices
+        - indice_actual: matriz a resaltar (opcional)
+        - ajustar_vista: ampliar los límites si la familia sale de la vista
+        """
+        traza = np.ravel(resultado['traza'])
+        determinante = np.ravel(resultado['determinante'])
+        clase = np.ravel(resultado['clase'])
+
+        self.curva.set_data(traza, determinante)
+        self.puntos.set_offsets(np.column_stack([traza, determinante]))
+        self.puntos.set_facecolors(np.asarray(COLORES_CLASES)[clase])
+
+        titulo = 'Plano traza–determinante'
+        if indice_actual is not None:
+            k = int(indice_actual)
+            self.actual.set_data([traza[k]], [determinante[k]])
+            estabilidad = np.ravel(resultado['estabilidad'])[k]
+            titulo += f'\n{NOMBRES_CLASES[clase[k]]} ({NOMBRES_ESTABILIDAD[estabilidad]}): ' \
+                      f'tr = {traza[k]:.3g}, det = {determinante[k]:.3g}'
+        else:
+            self.actual.set_data([], [])
+        self.ax.set_title(titulo, fontsize=11, fontweight='bold')
+
+        if ajustar_vista:
+            self._ajustar_vista(traza, determinante)
+
+    def _ajustar_vista(self, traza, determinante):
+        finitos = np.isfinite(traza) & np.isfinite(determinante)
+        if not np.any(finitos):
+            return
+        x_min, x_max = self.ax.get_xlim()
+        y_min, y_max = self.ax.get_ylim()
+        tr_max = float(np.abs(traza[finitos]).max()) * 1.1
+        det_max = float(np.abs(determinante[finitos]).max()) * 1.1
+        if tr_max > x_max or det_max > y_max:
+            tr_max, det_max = max(tr_max, x_max), max(det_max, y_max)
+            self.ax.set_xlim(-tr_max, tr_max)
+            self.ax.set_ylim(-det_max, det_max)
+            tr = np.linspace(-tr_max, tr_max, 400)
+            self.parabola.set_data(tr, tr ** 2 / 4)
+            self.centros.set_data([0, 0], [0, det_max])
@@ -5,14 +5,129 @@ calculate_vector_field se reemplazó con math_utils.calcular_campo_vectorial
 
 import numpy as np
 from scipy.integrate import odeint
+from core.trayectoria import Trayectoria
+from core.integradores import estimar_rigidez, seleccionar_metodo, integrar_con_seleccion
+
+
+def calcular_caja_integracion(xlim, ylim, margen=1.0):
+    """
+    Caja donde se integra para una vista dada
+    
+    Parámetros:
+    - xlim, ylim: límites de la vista
+    - margen: fracción extra de cada lado (1.0 = 3x el área visible)
+    
+    Retorna: (x_min, x_max, y_min, y_max)
+    """
+    rango_x = xlim[1] - xlim[0]
+    rango_y = ylim[1] - ylim[0]
+    return (xlim[0] - margen * rango_x, xlim[1] + margen * rango_x,
+            ylim[0] - margen * rango_y, ylim[1] + margen * rango_y)
+
+
+def _acumular_estadisticas(trayectoria, metodo, **contadores):
+    """Registra el método y suma los contadores a los de integraciones previas"""
+    trayectoria.metodo = metodo
+    for clave, valor in contadores.items():
+        trayectoria.estadisticas[clave] = trayectoria.estadisticas.get(clave, 0) + valor
+
+
+def seleccionar_metodo_trayectoria(sistema, estado, dt, max_steps):
+    """
+    Decide si el Euler de paso fijo sirve para esta semilla
+
+    Euler explícito con paso dt es estable solo si |1 + dt·λ| <= 1 para los
+    autovalores disipativos del Jacobiano; si no, la curva diverge y se
+    cambia a un método de solve_ivp con el Jacobiano analítico.
+
+    Retorna: (metodo, rigidez) con metodo 'euler' o un nombre de solve_ivp
+    """
+    try:
+        _, jacobiano = sistema.compilar_funciones()
+        J = jacobiano(estado, 0.0)
+    except Exception:
+        return 'euler', None
+    rigidez = estimar_rigidez(J, horizonte=max_steps * dt, paso=dt)
+    if rigidez['euler_estable'] is not False:
+        return 'euler', rigidez
+    return seleccionar_metodo(rigidez), rigidez
+
+
+def _eventos_limites(limites, max_distance, min_distance):
+    """Eventos terminales equivalentes a los cortes del bucle de Euler"""
+    if limites is not None:
+        x_min, x_max, y_min, y_max = limites
+
+        def fuera_de_caja(t, X):
+            return min(X[0] - x_min, x_max - X[0], X[1] - y_min, y_max - X[1])
+
+        eventos = [(fuera_de_caja, Trayectoria.MOTIVO_FUERA_LIMITES)]
+    else:
+        def lejos(t, X):
+            return max_distance - np.hypot(X[0], X[1])
+
+        def cerca(t, X):
+            return np.hypot(X[0], X[1]) - min_distance
+
+        eventos = [(lejos, Trayectoria.MOTIVO_FUERA_LIMITES),
+                   (cerca, Trayectoria.MOTIVO_DISTANCIA_MINIMA)]
+    for evento, _ in eventos:
+        evento.terminal = True
+        evento.direction = -1
+    return eventos
+
+
+def _integrar_implicito(sistema, trayectoria, estado, t_actual, dt, max_steps, continuar, eventos):
+    """
+    Rama rígida de integrate_trajectory_limited
+
+    Muestrea la solución en la misma malla t_actual + k·dt que Euler, de
+    modo que el resto del código (caché, decimación) no distingue la rama.
+    """
+    for evento, motivo in eventos:
+        if evento(t_actual, estado) < 0:
+            trayectoria.motivo_fin = motivo
+            return
+
+    campo, jacobiano = sistema.compilar_funciones()
+    tiempos = t_actual + dt * np.arange(max_steps + 1)
+    try:
+        t, X, info = integrar_con_seleccion(campo, jacobiano, estado, tiempos,
+                                            metodo=trayectoria.metodo,
+                                            eventos=[evento for evento, _ in eventos])
+    except Exception:
+        trayectoria.motivo_fin = Trayectoria.MOTIVO_ERROR
+        return
+
+    t, X = t[:max_steps], X[:max_steps]
+    if continuar:
+        t, X = t[1:], X[1:]
+    if len(X):
+        trayectoria.extender(X)
+        trayectoria.t_final = float(t[-1])
+    _acumular_estadisticas(trayectoria, info['metodo'], pasos=info['pasos'], nfev=info['nfev'],
+                           njev=info['njev'], nlu=info['nlu'])
+
+    if info['evento'] is not None:
+        trayectoria.motivo_fin = eventos[info['evento']][1]
+    elif not info['exito']:
+        trayectoria.motivo_fin = Trayectoria.MOTIVO_ERROR
+    else:
+        trayectoria.motivo_fin = Trayectoria.MOTIVO_MAX_PASOS
 
 
 def integrate_trajectory_limited(sistema, condicion_inicial, max_distance=100, 
                                 min_distance=0.01, max_steps=1000, direccion=1,
-                                xlim=None, ylim=None):
+                                xlim=None, ylim=None, trayectoria=None):
     """
     Integra trayectoria con límites para evitar inestabilidades numéricas
     
+    Por defecto usa Euler de paso fijo; si el Jacobiano en la semilla indica
+    que Euler sería inestable (sistema rígido) integra con Radau/BDF/LSODA
+    (ver seleccionar_metodo_trayectoria). El método elegido y los contadores
+    de pasos y evaluaciones quedan en trayectoria.metodo y
+    trayectoria.estadisticas.
+    
     Parámetros:
     - sistema: SistemaDinamico2D
     - condicion_inicial: [x0, y0]
@@ -21,48 +136,81 @@ def integrate_trajectory_limited(sistema, condicion_inicial, max_distance=100,
     - max_steps: número máximo de pasos
     - direccion: 1 (adelante) o -1 (atrás)
     - xlim, ylim: límites de la vista actual (opcional, pero recomendado)
+    - trayectoria: Trayectoria existente a continuar desde su último punto
+      (se ignora condicion_inicial)
+    
+    Retorna: Trayectoria (se indexa como array (N, 2)) con semilla, dirección
+    y motivo de finalización
     """
-    puntos = []
-    t_actual = 0
-    estado = np.array(condicion_inicial, dtype=float)
+    continuar = trayectoria is not None and len(trayectoria) > 0
+    if continuar:
+        direccion = trayectoria.direccion
+        estado = trayectoria.ultimo
+        t_actual = trayectoria.t_final
+    else:
+        trayectoria = Trayectoria(condicion_inicial, direccion, capacidad=max_steps + 1)
+        estado = np.array(condicion_inicial, dtype=float)
+        t_actual = 0
     dt = 0.01 * direccion
     
     # Determinar límites efectivos
     if xlim and ylim:
         # Usar los límites de la vista actual con un margen generoso
-        # Margen de 1.0 = 100% extra de cada lado (3x el área visible)
-        margen = 1.0
-        rango_x = xlim[1] - xlim[0]
-        rango_y = ylim[1] - ylim[0]
-        
-        x_min = xlim[0] - margen * rango_x
-        x_max = xlim[1] + margen * rango_x
-        y_min = ylim[0] - margen * rango_y
-        y_max = ylim[1] + margen * rango_y
+        x_min, x_max, y_min, y_max = calcular_caja_integracion(xlim, ylim)
         usar_limites_vista = True
     else:
         usar_limites_vista = False
     
-    for _ in range(max_steps):
+    # La rama se decide una vez por semilla; las extensiones reutilizan el método
+    if trayectoria.metodo is None:
+        trayectoria.metodo, rigidez = seleccionar_metodo_trayectoria(sistema, estado, dt, max_steps)
+        if rigidez is not None:
+            trayectoria.estadisticas['indice_rigidez'] = rigidez['indice']
+    
+    if trayectoria.metodo != 'euler':
+        limites = (x_min, x_max, y_min, y_max) if usar_limites_vista else None
+        _integrar_implicito(sistema, trayectoria, estado, t_actual, dt, max_steps, continuar,
+                            _eventos_limites(limites, max_distance, min_distance))
+        if len(trayectoria) == 0:
+            trayectoria.agregar(condicion_inicial)
+        return trayectoria
+    
+    trayectoria.motivo_fin = Trayectoria.MOTIVO_MAX_PASOS
+    pasos = 0
+    for paso in range(max_steps):
         # Verificar si está fuera de los límites
         if usar_limites_vista:
             # Verificar límites de la vista
             if (estado[0] < x_min or estado[0] > x_max or 
                 estado[1] < y_min or estado[1] > y_max):
+                trayectoria.motivo_fin = Trayectoria.MOTIVO_FUERA_LIMITES
                 break
         else:
             # Usar distancia desde origen (comportamiento original)
             distancia = np.sqrt(estado[0]**2 + estado[1]**2)
-            if distancia > max_distance or distancia < min_distance:
+            if distancia > max_distance:
+                trayectoria.motivo_fin = Trayectoria.MOTIVO_FUERA_LIMITES
+                break
+            if distancia < min_distance:
+                trayectoria.motivo_fin = Trayectoria.MOTIVO_DISTANCIA_MINIMA
                 break
         
-        puntos.append(estado.copy())
+        # Al continuar, el primer estado ya está almacenado
+        if not (continuar and paso == 0):
+            trayectoria.agregar(estado)
+            trayectoria.t_final = t_actual
         
         try:
             derivada = sistema.sistema_ecuaciones(estado, t_actual)
             estado = estado + dt * derivada
             t_actual += dt
+            pasos += 1
         except:
+            trayectoria.motivo_fin = Trayectoria.MOTIVO_ERROR
             break
+    _acumular_estadisticas(trayectoria, 'euler', pasos=pasos, nfev=pasos)
+    
+    if len(trayectoria) == 0:
+        trayectoria.agregar(condicion_inicial)
     
-    return np.array(puntos) if puntos else np.array([condicion_inicial])
+    return trayectoria
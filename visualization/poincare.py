@@ -0,0 +1,34 @@
+"""
+Visualización de secciones de Poincaré
+La sección se dibuja como imagen de densidad, no como un marcador por punto
+"""
+
+from visualization.raster import mostrar_densidad
+
+
+def graficar_seccion_poincare(ax, histograma, imagen=None, periodo=None, fase=0.0, cmap='magma_r'):
+    """
+    Dibuja (o actualiza) la densidad de la sección estroboscópica
+
+    Parámetros:
+    - ax: eje de matplotlib
+    - histograma: HistogramaDensidad acumulado por MapaPoincare
+    - imagen: AxesImage a reutilizar en actualizaciones progresivas
+    - periodo, fase: datos de la sección para el título
+    - cmap: mapa de colores
+
+    Retorna: AxesImage
+    """
+    nueva = imagen is None
+    imagen = mostrar_densidad(ax, histograma, imagen=imagen, cmap=cmap)
+    if nueva:
+        ax.set_xlim(histograma.xlim)
+        ax.set_ylim(histograma.ylim)
+        ax.set_xlabel('x', fontsize=12)
+        ax.set_ylabel('y', fontsize=12)
+
+    titulo = 'Mapa de Poincaré estroboscópico'
+    if periodo is not None:
+        titulo += f'  (T = {periodo:.4g}, t₀ = {fase:.3g})'
+    ax.set_title(f'{titulo}\n{histograma.total:,} puntos', fontsize=11, fontweight='bold')
+    return imagen
@@ -0,0 +1,189 @@
+"""
+Vistas 2D de sistemas de dimensión n: proyecciones y secciones planas
+"""
+
+import numpy as np
+from visualization.math_utils import normalizar_vectores
+from visualization.artistas import marcar_puntos_lote
+
+COLORES_ESTABILIDAD = {'Estable': 'green', 'Inestable': 'red'}
+
+
+def unir_con_separadores(trayectorias, ejes):
+    """
+    Concatena las columnas `ejes` de varias trayectorias separadas por NaN
+
+    Parámetros:
+    - trayectorias: lista de arrays (T_k, n)
+    - ejes: par de índices de las coordenadas a proyectar
+
+    Retorna: array (sum(T_k) + K - 1, 2) listo para un único ax.plot
+    """
+    i, j = ejes
+    partes = []
+    for X in trayectorias:
+        if partes:
+            partes.append(np.full((1, 2), np.nan))
+        partes.append(np.asarray(X)[:, [i, j]])
+    return np.concatenate(partes) if partes else np.empty((0, 2))
+
+
+def cruces_hiperplano(X, indice, valor, direccion=1):
+    """
+    Puntos donde una trayectoria cruza el hiperplano x[indice] = valor
+
+    Parámetros:
+    - X: trayectoria (T, n)
+    - indice: coordenada que define el plano
+    - valor: posición del plano
+    - direccion: 1 (creciente), -1 (decreciente) o 0 (ambas)
+
+    Retorna: array (M, n) interpolado linealmente entre muestras
+    """
+    X = np.asarray(X, dtype=float)
+    d = X[:, indice] - valor
+    a, b = d[:-1], d[1:]
+    if direccion > 0:
+        cruza = (a < 0) & (b >= 0)
+    elif direccion < 0:
+        cruza = (a > 0) & (b <= 0)
+    else:
+        cruza = (a * b < 0) | ((a != 0) & (b == 0))
+    k = np.flatnonzero(cruza)
+    s = (a[k] / (a[k] - b[k]))[:, None]
+    return X[k] + s * (X[k + 1] - X[k])
+
+
+class GrapherProyecciones:
+    """Grafica un SistemaDinamicoND sobre pares de coordenadas"""
+
+    def __init__(self, sistema):
+        """
+        Parámetros:
+        - sistema: SistemaDinamicoND
+        """
+        self.sistema = sistema
+        self.quiver = None
+        self.linea = None
+        self.barra_color = None
+
+    def _quitar_barra_color(self, ax):
+        if self.barra_color is not None and self.barra_color.ax in ax.figure.axes:
+            self.barra_color.remove()
+        self.barra_color = None
+
+    def _etiquetas(self, ax, ejes):
+        ax.set_xlabel(self.sistema.variables[ejes[0]], fontsize=11)
+        ax.set_ylabel(self.sistema.variables[ejes[1]], fontsize=11)
+        ax.grid(True, alpha=0.3)
+
+    def _marcar_equilibrios(self, ax, equilibrios, ejes):
+        """Un marcador por clase de estabilidad (no uno por punto)"""
+        if equilibrios is None or len(equilibrios) == 0:
+            return
+        clases = {}
+        for punto in equilibrios:
+            estabilidad = self.sistema.clasificar_equilibrio(punto)['estabilidad']
+            clase = estabilidad if estabilidad in COLORES_ESTABILIDAD else 'Silla / no hiperbólico'
+            clases.setdefault(clase, []).append(punto)
+        for clase, puntos in clases.items():
+            puntos = np.asarray(puntos)
+            marcar_puntos_lote(ax, puntos[:, ejes[0]], puntos[:, ejes[1]], 'o',
+                               color=COLORES_ESTABILIDAD.get(clase, 'orange'), markersize=9,
+                               markeredgecolor='black', zorder=5, label=clase)
+
+    def graficar_proyeccion(self, ax, trayectorias, ejes=(0, 1), equilibrios=None, limites=None):
+        """
+        Proyecta trayectorias y equilibrios sobre el plano de dos coordenadas
+
+        Todas las trayectorias van en un solo Line2D con separadores NaN.
+
+        Parámetros:
+        - ax: eje de matplotlib (se limpia)
+        - trayectorias: lista de arrays (T, n)
+        - ejes: índices (i, j) de las coordenadas horizontal y vertical
+        - equilibrios: array (M, n) opcional
+        - limites: lista de n pares (min, max) opcional para fijar la vista
+        """
+        self._quitar_barra_color(ax)
+        ax.clear()
+        i, j = ejes
+        puntos = unir_con_separadores(trayectorias, ejes)
+        self.linea, = ax.plot(puntos[:, 0], puntos[:, 1], color='#1f77b4', linewidth=0.6, alpha=0.9)
+        if trayectorias:
+            inicios = np.array([X[0] for X in trayectorias])
+            marcar_puntos_lote(ax, inicios[:, i], inicios[:, j], 'o', color='#1f77b4', markersize=4)
+        self._marcar_equilibrios(ax, equilibrios, ejes)
+
+        if limites is not None:
+            ax.set_xlim(limites[i])
+            ax.set_ylim(limites[j])
+        self._etiquetas(ax, ejes)
+        v = self.sistema.variables
+        ax.set_title(f'{self.sistema.nombre}: proyección ({v[i]}, {v[j]})', fontsize=12, fontweight='bold')
+        if ax.get_legend_handles_labels()[0]:
+            ax.legend(loc='upper right', fontsize=8)
+
+    def graficar_seccion(self, ax, valores, ejes=(0, 1), limites=None, n_puntos=20,
+                         trayectorias=None, equilibrios=None):
+        """
+        Campo sobre el plano que pasa por `valores` variando solo las coordenadas `ejes`
+
+        Las flechas muestran las componentes dentro del plano y el color la
+        componente normal (solo n = 3) o la magnitud de las restantes. Si
+        n = 3 se marcan además los cruces de las trayectorias con el plano.
+
+        Parámetros:
+        - ax: eje de matplotlib (se limpia)
+        - valores: array (n,) con las coordenadas fijas del plano
+        - ejes: índices (i, j) de las coordenadas que varían
+        - limites: lista de n pares (min, max)
+        - n_puntos: flechas por lado
+        - trayectorias: lista de arrays (T, n) opcional
+        - equilibrios: array (M, n) opcional (se marcan los que están en el plano)
+        """
+        self._quitar_barra_color(ax)
+        ax.clear()
+        n = self.sistema.n
+        i, j = ejes
+        valores = np.asarray(valores, dtype=float)
+        limites = np.asarray(limites, dtype=float)
+
+        A, B = np.meshgrid(np.linspace(*limites[i], n_puntos), np.linspace(*limites[j], n_puntos))
+        estados = np.broadcast_to(valores, A.shape + (n,)).copy()
+        estados[..., i] = A
+        estados[..., j] = B
+        F = self.sistema.evaluar_campo(estados)
+
+        resto = [k for k in range(n) if k not in ejes]
+        if len(resto) == 1:
+            color, etiqueta, cmap = F[..., resto[0]], f'd{self.sistema.variables[resto[0]]}/dt', 'coolwarm'
+        else:
+            color = np.linalg.norm(F[..., resto], axis=-1) if resto else np.hypot(F[..., i], F[..., j])
+            etiqueta, cmap = '|f| fuera del plano' if resto else '|f|', 'viridis'
+        U, V, _ = normalizar_vectores(F[..., i], F[..., j])
+        self.quiver = ax.quiver(A, B, U, V, color, cmap=cmap, alpha=0.8)
+        if len(resto) == 1:
+            limite = np.nanmax(np.abs(color)) or 1.0
+            self.quiver.set_clim(-limite, limite)
+        self.barra_color = ax.figure.colorbar(self.quiver, ax=ax, label=etiqueta, shrink=0.8)
+
+        if trayectorias and len(resto) == 1:
+            cruces = [cruces_hiperplano(X, resto[0], valores[resto[0]], direccion=0) for X in trayectorias]
+            cruces = np.concatenate(cruces) if cruces else np.empty((0, n))
+            marcar_puntos_lote(ax, cruces[:, i], cruces[:, j], 'k.', markersize=3, alpha=0.6,
+                               label='Cruces de trayectorias')
+
+        if equilibrios is not None and len(equilibrios):
+            en_plano = np.all(np.isclose(np.asarray(equilibrios)[:, resto], valores[resto], atol=1e-6), axis=1)
+            self._marcar_equilibrios(ax, np.asarray(equilibrios)[en_plano], ejes)
+
+        ax.set_xlim(limites[i])
+        ax.set_ylim(limites[j])
+        self._etiquetas(ax, ejes)
+        v = self.sistema.variables
+        fijas = ', '.join(f'{v[k]} = {valores[k]:.3g}' for k in resto)
+        ax.set_title(f'Sección ({v[i]}, {v[j]})' + (f' con {fijas}' if fijas else ''),
+                     fontsize=12, fontweight='bold')
+        if ax.get_legend_handles_labels()[0]:
+            ax.legend(loc='upper right', fontsize=8)
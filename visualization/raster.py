@@ -0,0 +1,72 @@
+"""
+Imágenes de densidad
+Un único AxesImage para millones de puntos en lugar de un artista por punto
+"""
+
+import numpy as np
+
+
+def mostrar_densidad(ax, histograma, imagen=None, cmap='binary', escala_log=True, **kwargs):
+    """
+    Dibuja (o actualiza) un HistogramaDensidad como imagen
+
+    Parámetros:
+    - ax: eje de matplotlib
+    - histograma: HistogramaDensidad ya acumulado
+    - imagen: AxesImage existente a reutilizar (set_data en lugar de un imshow nuevo)
+    - cmap: mapa de colores
+    - escala_log: usar log(1 + conteo) para que se vean las zonas poco visitadas
+
+    Retorna: AxesImage
+    """
+    datos = np.log1p(histograma.conteos) if escala_log else histograma.conteos.astype(float)
+    maximo = float(datos.max()) or 1.0
+
+    if imagen is not None:
+        imagen.set_data(datos)
+        imagen.set_extent(histograma.extent)
+        imagen.set_clim(0.0, maximo)
+        return imagen
+
+    opciones = {'origin': 'lower', 'aspect': 'auto', 'interpolation': 'nearest',
+                'cmap': cmap, 'vmin': 0.0, 'vmax': maximo, 'extent': histograma.extent}
+    opciones.update(kwargs)
+    return ax.imshow(datos, **opciones)
+
+
+def mostrar_almacen(ax, almacen, imagen=None, reduccion='submuestreo', max_pixeles=None, **kwargs):
+    """
+    Dibuja (o actualiza) la porción visible de un AlmacenMalla sin leerlo entero
+
+    Solo se leen del disco las celdas necesarias para la vista actual del eje
+    con la resolución en píxeles del eje, así que se puede recorrer una malla
+    de 20000×20000 y volver a llamar tras cada zoom.
+
+    Parámetros:
+    - ax: eje de matplotlib
+    - almacen: AlmacenMalla
+    - imagen: AxesImage existente a reutilizar
+    - reduccion: ver AlmacenMalla.vista_decimada ('submuestreo' para clases)
+    - max_pixeles: (ancho, alto); por defecto el tamaño del eje en pantalla
+
+    Retorna: AxesImage
+    """
+    if imagen is None:
+        region = None
+    else:
+        x_min, x_max = sorted(ax.get_xlim())
+        y_min, y_max = sorted(ax.get_ylim())
+        region = (x_min, x_max, y_min, y_max)
+    if max_pixeles is None:
+        caja = ax.get_window_extent()
+        max_pixeles = (max(int(caja.width), 1), max(int(caja.height), 1))
+
+    datos, extent = almacen.vista_decimada(max_pixeles, region=region, reduccion=reduccion)
+    if imagen is not None:
+        imagen.set_data(datos)
+        imagen.set_extent(extent)
+        return imagen
+
+    opciones = {'origin': 'lower', 'aspect': 'auto', 'interpolation': 'nearest', 'extent': extent}
+    opciones.update(kwargs)
+    return ax.imshow(datos, **opciones)
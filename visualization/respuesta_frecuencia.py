@@ -0,0 +1,54 @@
+"""
+Visualización de la respuesta en frecuencia (diagramas de Bode)
+"""
+
+import numpy as np
+
+COLORES_COMPONENTES = ('#1f77b4', '#d62728')
+
+
+def graficar_bode(ax_amplitud, ax_fase, resultado, picos=None, omega_actual=None):
+    """
+    Amplitud (log-log) y fase (semilog) de ambas componentes
+
+    Parámetros:
+    - ax_amplitud, ax_fase: ejes de matplotlib (se limpian)
+    - resultado: dict de barrido_frecuencias
+    - picos: lista de picos_resonancia a marcar (opcional)
+    - omega_actual: frecuencia del forzado aplicado, marcada con una vertical
+    """
+    ax_amplitud.clear()
+    ax_fase.clear()
+    omegas = resultado['omega']
+
+    for i, color in enumerate(COLORES_COMPONENTES):
+        ax_amplitud.loglog(omegas, resultado['amplitud'][:, i], color=color, linewidth=1.5,
+                           label=f'|x{i + 1}|')
+        ax_fase.semilogx(omegas, resultado['fase'][:, i], color=color, linewidth=1.5,
+                         label=f'∠x{i + 1}')
+
+    if picos:
+        # Todos los picos en un único conjunto de marcadores
+        ax_amplitud.plot([p['omega'] for p in picos], [p['amplitud'] for p in picos],
+                         'kv', markersize=8, linestyle='none', label='Resonancia', zorder=5)
+        for p in picos:
+            ax_amplitud.annotate(f"ω = {p['omega']:.4g}", (p['omega'], p['amplitud']),
+                                 textcoords='offset points', xytext=(6, 6), fontsize=8,
+                                 color=COLORES_COMPONENTES[p['componente'] % 2])
+
+    if omega_actual is not None:
+        for ax in (ax_amplitud, ax_fase):
+            ax.axvline(omega_actual, color='gray', linestyle='--', linewidth=1,
+                       label='ω aplicado' if ax is ax_amplitud else None)
+
+    ax_amplitud.set_ylabel('Amplitud', fontsize=11)
+    ax_amplitud.set_title('Respuesta en Frecuencia', fontsize=13, fontweight='bold')
+    ax_fase.set_xlabel('ω', fontsize=11)
+    ax_fase.set_ylabel('Fase (°)', fontsize=11)
+    finitas = resultado['fase'][np.isfinite(resultado['fase'])]
+    if finitas.size:
+        # Ticks cada 90° dentro del rango recorrido
+        ax_fase.set_yticks(np.arange(np.floor(finitas.min() / 90), np.ceil(finitas.max() / 90) + 1) * 90)
+    for ax in (ax_amplitud, ax_fase):
+        ax.grid(True, which='both', alpha=0.3)
+        ax.legend(fontsize=8, loc='best')
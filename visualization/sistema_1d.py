@@ -7,6 +7,7 @@ import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 from typing import Tuple, Optional
 from core.sistema_1d import SistemaDinamico1D
+from visualization.artistas import dibujar_vectores_lote, marcar_puntos_lote
 
 
 class VisualizadorSistema1D:
@@ -41,25 +42,27 @@ class VisualizadorSistema1D:
         # Encontrar y graficar equilibrios
         equilibrios = self.sistema.encontrar_equilibrios(xlim)
         
-        for x_eq in equilibrios:
-            estab = self.sistema.clasificar_estabilidad(x_eq)
-            marker = 'o' if estab == 'estable' else 's'
-            color = 'green' if estab == 'estable' else 'red'
-            label = 'Estable' if x_eq == equilibrios[0] and estab == 'estable' else None
-            ax.plot(x_eq, 0, marker=marker, markersize=10, color=color, 
-                   label=label, markerfacecolor='white' if estab == 'inestable' else color,
-                   markeredgewidth=2 if estab == 'inestable' else 0)
+        # Un marcador por clase de estabilidad en lugar de uno por punto
+        estables = [x for x in equilibrios if self.sistema.clasificar_estabilidad(x) == 'estable']
+        inestables = [x for x in equilibrios if self.sistema.clasificar_estabilidad(x) != 'estable']
+        marcar_puntos_lote(ax, estables, np.zeros(len(estables)), 'o', markersize=10,
+                           color='green', markeredgewidth=0, label='Estable')
+        marcar_puntos_lote(ax, inestables, np.zeros(len(inestables)), 's', markersize=10,
+                           color='red', markerfacecolor='white', markeredgewidth=2)
         
-        # Flechas de dirección
+        # Flechas de dirección (un único quiver, f evaluada una sola vez)
         x_arrows = np.linspace(xlim[0], xlim[1], 20)
-        for x_pos in x_arrows:
-            f_val = float(self.sistema.evaluar_funcion(np.array([x_pos]))[0])
-            if abs(f_val) > 0.01:
-                arrow_dx = np.sign(f_val) * 0.3
-                color = 'green' if f_val < 0 else 'red'
-                ax.arrow(x_pos - arrow_dx/2, -max(abs(f_vals))*0.1, arrow_dx, 0,
-                        head_width=max(abs(f_vals))*0.05, head_length=0.15,
-                        fc=color, ec=color, alpha=0.6)
+        f_arrows = np.broadcast_to(self.sistema.evaluar_funcion(x_arrows), x_arrows.shape)
+        con_flujo = np.abs(f_arrows) > 0.01
+        arrow_dx = np.sign(f_arrows[con_flujo]) * 0.3
+        y_flechas = -max(abs(f_vals)) * 0.1
+        dibujar_vectores_lote(
+            ax,
+            np.column_stack([x_arrows[con_flujo] - arrow_dx/2, np.full(arrow_dx.shape, y_flechas)]),
+            np.column_stack([arrow_dx, np.zeros_like(arrow_dx)]),
+            color=np.where(f_arrows[con_flujo] < 0, 'green', 'red').tolist(),
+            alpha=0.6
+        )
         
         ax.set_xlabel('x', fontsize=12)
         ax.set_ylabel('dx/dt', fontsize=12)
@@ -0,0 +1,63 @@
+"""
+Visualización del análisis de sistemas lineales dispersos
+"""
+
+import numpy as np
+
+
+def graficar_espectro(ax, clasificacion):
+    """
+    Autovalores dominantes en el plano complejo con la abscisa espectral
+
+    Parámetros:
+    - ax: eje de matplotlib (se limpia)
+    - clasificacion: dict de SistemaLinealDisperso.clasificar_estabilidad
+    """
+    ax.clear()
+    autovalores = clasificacion['autovalores']
+    alfa = clasificacion['abscisa']
+    color = 'green' if alfa < 0 else ('red' if clasificacion['estabilidad'] == 'Inestable' else 'orange')
+
+    ax.axvspan(0, max(abs(alfa), 1e-3) * 2, color='red', alpha=0.08, label='Re(λ) > 0')
+    ax.axvline(0, color='k', linewidth=0.8)
+    ax.axvline(alfa, color=color, linestyle='--', linewidth=1.5, label=f'α(A) = {alfa:.4g}')
+    ax.plot(autovalores.real, autovalores.imag, 'o', color=color, markersize=7,
+            markeredgecolor='black', linestyle='none', label=f'{len(autovalores)} autovalores dominantes')
+
+    ax.set_xlabel('Re(λ)', fontsize=11)
+    ax.set_ylabel('Im(λ)', fontsize=11)
+    ax.set_title(f"Espectro dominante: {clasificacion['estabilidad']}", fontsize=12, fontweight='bold')
+    ax.grid(True, alpha=0.3)
+    ax.legend(loc='best', fontsize=8)
+
+
+def graficar_propagacion(ax, t, X, alfa=None, n_componentes=5):
+    """
+    Norma de x(t) en escala logarítmica y algunas componentes
+
+    Parámetros:
+    - ax: eje de matplotlib (se limpia)
+    - t: instantes (T,)
+    - X: estados (T, n) de SistemaLinealDisperso.propagar
+    - alfa: abscisa espectral; si se indica se dibuja la envolvente exp(αt)
+    - n_componentes: componentes individuales a mostrar (las de mayor |x0|)
+    """
+    ax.clear()
+    norma = np.linalg.norm(X, axis=1)
+    ax.semilogy(t, norma, color='black', linewidth=2, label='‖x(t)‖')
+    if alfa is not None and norma[0] > 0:
+        ax.semilogy(t, norma[0] * np.exp(alfa * t), color='gray', linestyle='--',
+                    label='‖x₀‖·exp(αt)')
+
+    indices = np.argsort(-np.abs(X[0]))[:n_componentes]
+    # Todas las componentes en un solo Line2D con separadores NaN
+    tiempos = np.concatenate([np.append(t, np.nan) for _ in indices])
+    valores = np.concatenate([np.append(np.abs(X[:, i]), np.nan) for i in indices])
+    ax.semilogy(tiempos[:-1], valores[:-1], color='#1f77b4', linewidth=0.8, alpha=0.6,
+                label=f'|x_i(t)| ({len(indices)} componentes)')
+
+    ax.set_xlabel('t', fontsize=11)
+    ax.set_ylabel('Magnitud', fontsize=11)
+    ax.set_title(f'Propagación e^(At)·x₀ ({X.shape[1]} estados)', fontsize=12, fontweight='bold')
+    ax.grid(True, which='both', alpha=0.3)
+    ax.legend(loc='best', fontsize=8)